@@ -10,6 +10,20 @@ Original COBOL Program: 02_variables.cbl
 Converted from specification: 02_variables-spec.md
 """
 
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.layout import load_layout  # noqa: E402
+from cobol_runtime.output import RecordWriter  # noqa: E402
+from cobol_runtime.report import edit_rows  # noqa: E402
+
+# struct-row from CopyBooks/SampleDataRow.cpy:
+# var-lp 9(2), var-number z(10), var-decimal +z(7).zz, var-currency $z(7).zz
+STRUCT_ROW = load_layout("SampleDataRow")
+
 
 class VariablesDemo:
     """
@@ -26,8 +40,8 @@ class VariablesDemo:
         """Initialize variables with default values."""
         self.lp: int = 0
         self.number: int = 0
-        self.decimal: float = -317.21
-        self.currency: float = 317.21
+        self.decimal: Decimal = Decimal("-317.21")
+        self.currency: Decimal = Decimal("317.21")
     
     def display_table(self) -> None:
         """
@@ -38,20 +52,26 @@ class VariablesDemo:
         - Signed decimal
         - Currency with dollar sign
         """
-        # Display headers
-        print("lp|    number|   decimal|  currency")
-        
-        # Display separator line (80 dashes)
-        print("-" * 80)
-        
         # Update values
         self.lp = 1
         self.number = 3721
         
-        # Display formatted data row
-        # Format: lp (2 digits), number (10 chars right-aligned), 
-        #         decimal (10 chars with sign), currency ($ + 9 chars)
-        print(f"{self.lp:02d}|{self.number:>10}|{self.decimal:>+10.2f}|${self.currency:>9.2f}")
+        # Data rows in the struct-row layout, each column edited by its PICTURE
+        rows = edit_rows(STRUCT_ROW, {
+            "var-lp": [self.lp],
+            "var-number": [self.number],
+            "var-decimal": [self.decimal],
+            "var-currency": [self.currency],
+        })
+        
+        with RecordWriter() as out:
+            # Display headers
+            out.write_text("lp|    number|   decimal|  currency")
+            
+            # Display separator line (80 dashes)
+            out.write_text("-" * 80)
+            
+            out.write_raw(rows, records=1)
 
 
 def main() -> None:
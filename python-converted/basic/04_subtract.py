@@ -10,6 +10,25 @@ Original COBOL Program: 04_subtract.cbl
 Converted from specification: 04_subtract-spec.md
 """
 
+import argparse
+import sys
+from pathlib import Path
+from typing import Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.batch import run_batch, within  # noqa: E402
+from cobol_runtime.compute import compile_compute  # noqa: E402
+
+# Batch mode: SUBTRACT var-num1 FROM var-num2 GIVING var-result over whole
+# columns. Operands and result are signed 18-digit items.
+SUBTRACT = compile_compute("var-result = var-num2 - var-num1", {
+    "var-num1": "S9(18)", "var-num2": "S9(18)", "var-result": "S9(18)",
+})
+# Operands below 10**17 can't overflow the difference, so their batch
+# results match subtract_numbers
+BATCH_LIMIT = 10 ** 17
+
 
 def subtract_numbers() -> None:
     """
@@ -47,9 +66,41 @@ def subtract_numbers() -> None:
         print(f"Error: {e}")
 
 
+def subtract_one(num1: int, num2: int) -> str:
+    """The line subtract_numbers displays for one pair."""
+    return f"Result : {num2 - num1}\n"
+
+
+def subtract_batch(num1: Sequence[int], num2: Sequence[int]) -> str:
+    """
+    Subtract whole columns of operand pairs: num2 - num1.
+    
+    Args:
+        num1: First numbers (subtracted)
+        num2: Second numbers
+        
+    Returns:
+        One "Result : n" line per pair ("Error: Result too large" if the
+        difference doesn't fit the result item)
+    """
+    result = SUBTRACT.evaluate_columns({"var-num1": num1, "var-num2": num2})
+    return "".join(
+        f"Result : {text}\n" if text is not None else "Error: Result too large\n"
+        for text in result.strings()
+    )
+
+
 def main() -> None:
     """Main entry point for the subtraction program."""
-    subtract_numbers()
+    parser = argparse.ArgumentParser(description="Subtract two numbers")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="FILE",
+                        help="subtract the number pairs in FILE (default: stdin), one pair per line")
+    args = parser.parse_args()
+    
+    if args.batch is None:
+        subtract_numbers()
+    else:
+        run_batch(args.batch, 2, subtract_batch, subtract_one, fits=within(BATCH_LIMIT))
 
 
 if __name__ == "__main__":
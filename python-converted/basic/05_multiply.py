@@ -10,6 +10,25 @@ Original COBOL Program: 05_multiply.cbl
 Converted from specification: 05_multiply-spec.md
 """
 
+import argparse
+import sys
+from pathlib import Path
+from typing import Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.batch import run_batch, within  # noqa: E402
+from cobol_runtime.compute import compile_compute  # noqa: E402
+
+# Batch mode: MULTIPLY var-num1 BY var-num2 GIVING var-result over whole
+# columns. Operands and result are signed 18-digit items.
+MULTIPLY = compile_compute("var-result = var-num1 * var-num2", {
+    "var-num1": "S9(18)", "var-num2": "S9(18)", "var-result": "S9(18)",
+})
+# Operands below 10**9 can't overflow the product, so their batch
+# results match multiply_numbers
+BATCH_LIMIT = 10 ** 9
+
 
 def multiply_numbers() -> None:
     """
@@ -48,9 +67,41 @@ def multiply_numbers() -> None:
         print(f"Error: {e}")
 
 
+def multiply_one(num1: int, num2: int) -> str:
+    """The line multiply_numbers displays for one pair."""
+    return f"Result : {num1 * num2}\n"
+
+
+def multiply_batch(num1: Sequence[int], num2: Sequence[int]) -> str:
+    """
+    Multiply whole columns of operand pairs.
+    
+    Args:
+        num1: First numbers
+        num2: Second numbers
+        
+    Returns:
+        One "Result : n" line per pair ("Error: Result too large" if the
+        product doesn't fit the result item)
+    """
+    result = MULTIPLY.evaluate_columns({"var-num1": num1, "var-num2": num2})
+    return "".join(
+        f"Result : {text}\n" if text is not None else "Error: Result too large\n"
+        for text in result.strings()
+    )
+
+
 def main() -> None:
     """Main entry point for the multiplication program."""
-    multiply_numbers()
+    parser = argparse.ArgumentParser(description="Multiply two numbers")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="FILE",
+                        help="multiply the number pairs in FILE (default: stdin), one pair per line")
+    args = parser.parse_args()
+    
+    if args.batch is None:
+        multiply_numbers()
+    else:
+        run_batch(args.batch, 2, multiply_batch, multiply_one, fits=within(BATCH_LIMIT))
 
 
 if __name__ == "__main__":
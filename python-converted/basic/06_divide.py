@@ -9,6 +9,37 @@ Original COBOL Program: 06_divide.cbl
 Converted from specification: 06_divide-spec.md
 """
 
+import argparse
+import sys
+from pathlib import Path
+from typing import Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.batch import run_batch, within  # noqa: E402
+from cobol_runtime.compute import compile_compute  # noqa: E402
+from cobol_runtime.fixed import FixedSpec, divide_remainder  # noqa: E402
+
+# Receiving items: var-result PIC z(9)9, the others PIC z(9)9.99
+# (kept signed, as this version accepts negative operands)
+RESULT_INT = FixedSpec(10, 0)
+RESULT_DEC = FixedSpec(12, 2)
+
+# Batch mode: both DIVIDE ... REMAINDER statements as COMPUTEs over whole
+# columns; the remainder uses the quotient as stored, as DIVIDE does
+FIELDS = {
+    "var-num1": "S9(18)", "var-num2": "S9(18)",
+    "var-result": RESULT_INT, "var-remainder": RESULT_DEC,
+    "var-result-dec": RESULT_DEC, "var-remainder-dec": RESULT_DEC,
+}
+QUOTIENT_INT = compile_compute("var-result = var-num1 / var-num2", FIELDS)
+REMAINDER_INT = compile_compute("var-remainder = var-num1 - var-result * var-num2", FIELDS)
+QUOTIENT_DEC = compile_compute("var-result-dec = var-num1 / var-num2", FIELDS)
+REMAINDER_DEC = compile_compute(
+    "var-remainder-dec = var-num1 - var-result-dec * var-num2", FIELDS)
+# Larger operands don't fit the S9(18) items and go through divide_one
+BATCH_LIMIT = 10 ** 18
+
 
 def divide_numbers() -> None:
     """
@@ -39,19 +70,18 @@ def divide_numbers() -> None:
             print("Error: Cannot divide by zero")
             return
         
-        # Integer division
-        result_int = num1 // num2
-        remainder_int = num1 % num2
+        # Integer division: DIVIDE ... GIVING var-result REMAINDER var-remainder
+        # (the quotient is truncated toward zero, as COBOL does)
+        result_int, remainder_int = divide_remainder(num1, num2, RESULT_INT, RESULT_DEC)
         
         print("Divide as integers:")
         print(f"Result : {result_int}")
-        print(f"Remainder : {remainder_int}")
+        print(f"Remainder : {int(remainder_int)}")
         print()
         
-        # Decimal division
-        result_dec = num1 / num2
-        # Remainder after considering decimal result
-        remainder_dec = num1 - (int(result_dec) * num2)
+        # Decimal division: the quotient is truncated to 2 places and the
+        # remainder is what that quotient leaves (10 / 3 = 3.33 rem 0.01)
+        result_dec, remainder_dec = divide_remainder(num1, num2, RESULT_DEC, RESULT_DEC)
         
         print("Divide as decimals:")
         print(f"Result : {result_dec:.2f}")
@@ -66,9 +96,69 @@ def divide_numbers() -> None:
         print(f"Error: {e}")
 
 
+DIVISION_BLOCK = (
+    "Divide as integers:\nResult : %s\nRemainder : %s\n\n"
+    "Divide as decimals:\nResult : %s\nRemainder : %s\n\n"
+)
+
+
+def divide_one(num1: int, num2: int) -> str:
+    """What divide_numbers displays for one pair."""
+    if num2 == 0:
+        return "Error: Cannot divide by zero\n"
+    result_int, remainder_int = divide_remainder(num1, num2, RESULT_INT, RESULT_DEC)
+    result_dec, remainder_dec = divide_remainder(num1, num2, RESULT_DEC, RESULT_DEC)
+    return DIVISION_BLOCK % (result_int, int(remainder_int), f"{result_dec:.2f}", f"{remainder_dec:.2f}")
+
+
+def divide_batch(num1: Sequence[int], num2: Sequence[int]) -> str:
+    """
+    Divide whole columns of operand pairs, integer and decimal.
+    
+    Rows whose results don't fit the receiving items are redone one at a
+    time with divide_remainder, so they print exactly what divide_numbers
+    prints for them.
+    
+    Args:
+        num1: Dividends
+        num2: Divisors
+        
+    Returns:
+        The same blocks divide_numbers displays, one per pair
+        ("Error: Cannot divide by zero" for a zero divisor)
+    """
+    columns = {"var-num1": num1, "var-num2": num2}
+    quotient = QUOTIENT_INT.evaluate_columns(columns)
+    columns["var-result"] = quotient
+    remainder = REMAINDER_INT.evaluate_columns(columns)
+    quotient_dec = QUOTIENT_DEC.evaluate_columns(columns)
+    columns["var-result-dec"] = quotient_dec
+    remainder_dec = REMAINDER_DEC.evaluate_columns(columns)
+    errors = quotient.size_error | remainder.size_error | quotient_dec.size_error | remainder_dec.size_error
+    
+    # The integer remainder is a whole number: display it without ".00"
+    remainders = [text and text[:-3] for text in remainder.strings()]
+    blocks = []
+    for row, texts in enumerate(zip(quotient.strings(), remainders, quotient_dec.strings(),
+                                    remainder_dec.strings())):
+        if errors[row]:
+            blocks.append(divide_one(num1[row], num2[row]))
+        else:
+            blocks.append(DIVISION_BLOCK % texts)
+    return "".join(blocks)
+
+
 def main() -> None:
     """Main entry point for the division program."""
-    divide_numbers()
+    parser = argparse.ArgumentParser(description="Divide two numbers with remainder")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="FILE",
+                        help="divide the number pairs in FILE (default: stdin), one pair per line")
+    args = parser.parse_args()
+    
+    if args.batch is None:
+        divide_numbers()
+    else:
+        run_batch(args.batch, 2, divide_batch, divide_one, fits=within(BATCH_LIMIT))
 
 
 if __name__ == "__main__":
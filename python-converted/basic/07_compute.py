@@ -10,6 +10,29 @@ Original COBOL Program: 07_compute.cbl
 Converted from specification: 07_compute-spec.md
 """
 
+import argparse
+import sys
+from pathlib import Path
+from typing import Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.batch import run_batch  # noqa: E402
+from cobol_runtime.compute import compile_compute  # noqa: E402
+from cobol_runtime.fixed import Fixed, FixedSpec  # noqa: E402
+
+# var-result PIC z(15)9.99, kept signed as this version accepts negative input
+RESULT = FixedSpec(18, 2)
+
+# Batch mode: the same COMPUTE over whole columns. Operands are PIC 9(11)
+# items given two decimal places, as the interactive version accepts them
+QUADRATIC = compile_compute("var-result = var-a * var-x ** 2 + var-b * var-x + var-c", {
+    "var-a": "S9(11)V99", "var-b": "S9(11)V99", "var-c": "S9(11)V99",
+    "var-x": "S9(11)V99", "var-result": RESULT,
+})
+# Values with more decimal places or digits go through compute_one
+OPERAND = FixedSpec(13, 2)
+
 
 def compute_quadratic() -> None:
     """
@@ -34,20 +57,22 @@ def compute_quadratic() -> None:
         
         # Prompt and accept coefficients
         print("a = ", end="")
-        a = float(input())
+        a = Fixed.of(input())
         
         print("b = ", end="")
-        b = float(input())
+        b = Fixed.of(input())
         
         print("c = ", end="")
-        c = float(input())
+        c = Fixed.of(input())
         
         print("x = ", end="")
-        x = float(input())
+        x = Fixed.of(input())
         
         # Compute quadratic function: y = ax² + bx + c
-        # Order of operations: exponentiation, then multiplication, then addition
-        result = a * (x ** 2) + b * x + c
+        # Order of operations: exponentiation, then multiplication, then addition.
+        # Exact fixed-point arithmetic, truncated to 2 places on store;
+        # a result wider than the 16 integer digits is a size error
+        result = RESULT.store(a * (x ** 2) + b * x + c, on_size_error=True)
         
         # Display result with 2 decimal places
         print(f"y = {result:.2f}")
@@ -60,9 +85,52 @@ def compute_quadratic() -> None:
         print(f"Error: {e}")
 
 
+def batch_operand(value: Fixed) -> bool:
+    """True if a value fits the batch operand items exactly."""
+    if value.scale > OPERAND.scale:
+        return False
+    return abs(value.units) * 10 ** (OPERAND.scale - value.scale) < OPERAND.limit
+
+
+def compute_one(a: Fixed, b: Fixed, c: Fixed, x: Fixed) -> str:
+    """The line compute_quadratic displays for one set of values."""
+    try:
+        result = RESULT.store(a * (x ** 2) + b * x + c, on_size_error=True)
+    except OverflowError:
+        return "Error: Result too large\n"
+    return f"y = {result:.2f}\n"
+
+
+def compute_batch(a: Sequence, b: Sequence, c: Sequence, x: Sequence) -> str:
+    """
+    Evaluate y = ax² + bx + c for whole columns of coefficients.
+    
+    Args:
+        a, b, c: Coefficients, one per calculation
+        x: Values of x
+        
+    Returns:
+        The "y = ..." line compute_quadratic displays, one per calculation
+        ("Error: Result too large" where the result doesn't fit)
+    """
+    results = QUADRATIC.evaluate_columns({"var-a": a, "var-b": b, "var-c": c, "var-x": x})
+    return "".join(
+        f"y = {result}\n" if result is not None else "Error: Result too large\n"
+        for result in results.strings()
+    )
+
+
 def main() -> None:
     """Main entry point for the compute program."""
-    compute_quadratic()
+    parser = argparse.ArgumentParser(description="Evaluate y = ax^2 + bx + c")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="FILE",
+                        help="evaluate the 'a b c x' lines in FILE (default: stdin)")
+    args = parser.parse_args()
+    
+    if args.batch is None:
+        compute_quadratic()
+    else:
+        run_batch(args.batch, 4, compute_batch, compute_one, parse=Fixed.of, fits=batch_operand)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+08_REDEFINES - Python Implementation
+
+A program demonstrating the REDEFINES clause: the division results are
+stored in numeric-edited items and displayed again through numeric items
+that redefine the same bytes.
+
+Original COBOL Program: 08_redefines.cbl
+Converted from specification: 08_redefines-spec.md
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.fixed import FixedSpec, divide_remainder  # noqa: E402
+from cobol_runtime.storage import WorkingStorage  # noqa: E402
+
+WORKING_STORAGE = """
+       01 var-num1   PIC 9(10) VALUE zero.
+       01 var-num2   PIC 9(10) VALUE zero.
+       01 var-result-dec PIC z(9)9.99 VALUE zero.
+       01 var-result REDEFINES var-result-dec PIC 9(12).
+       01 var-remainder-dec PIC z(9)9.99 VALUE zero.
+       01 var-remainder REDEFINES var-remainder-dec PIC 9(12).
+"""
+
+# DIVIDE ... GIVING var-result-dec REMAINDER var-remainder-dec
+RESULT_DEC = FixedSpec.from_picture("z(9)9.99")
+
+
+def demonstrate_redefines() -> None:
+    """
+    Divide two numbers and display the results through two PICTUREs.
+    
+    Process:
+    1. Accept dividend and divisor (PIC 9(10))
+    2. DIVIDE GIVING var-result-dec REMAINDER var-remainder-dec
+    3. Display the edited results
+    4. Display the same bytes through the PIC 9(12) redefinitions
+    
+    COBOL behavior:
+    - var-result shares the first 12 of var-result-dec's 13 bytes, so
+      it shows the edited text cut before the last digit (3.33 is
+      displayed as "         3.3"): no conversion takes place
+    - The remainder is what the stored quotient leaves (10 / 3 gives
+      3.33 remainder 0.01)
+    - Negative input loses its sign in the unsigned PIC 9(10) items
+    """
+    try:
+        storage = WorkingStorage.parse(WORKING_STORAGE)
+        
+        print("Enter number 1: ", end="")
+        storage.var_num1.move(input())
+        print("Enter number 2: ", end="")
+        storage.var_num2.move(input())
+        
+        if storage.var_num2.value == 0:
+            print("Error: Cannot divide by zero")
+            return
+        
+        result, remainder = divide_remainder(storage.var_num1.value, storage.var_num2.value,
+                                             RESULT_DEC, RESULT_DEC)
+        storage.var_result_dec.move(result)
+        storage.var_remainder_dec.move(remainder)
+        
+        print("Divide as decimals: ")
+        print(f"Result : {storage.var_result_dec}")
+        print(f"Reminder : {storage.var_remainder_dec}")
+        print()
+        
+        print("Divide as integers: ")
+        print(f"Result : {storage.var_result}")
+        print(f"Reminder : {storage.var_remainder}")
+        print()
+        
+    except ValueError:
+        print("Error: Please enter valid numbers")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def main() -> None:
+    """Main entry point for the REDEFINES program."""
+    demonstrate_redefines()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+09_RENAME - Python Implementation
+
+A program demonstrating the RENAMES clause: a level-66 item that
+regroups the first three numbers of a record.
+
+Original COBOL Program: 09_rename.cbl
+Converted from specification: 09_rename-spec.md
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.storage import WorkingStorage  # noqa: E402
+
+WORKING_STORAGE = """
+       01 var-record.
+           02 var-num1   PIC 9(10) VALUE zero.
+           02 filler     PIC X VALUE " ".
+           02 var-num2   PIC 9(10) VALUE zero.
+           02 filler     PIC X VALUE " ".
+           02 var-num3   PIC 9(10) VALUE zero.
+           02 filler     PIC X VALUE " ".
+           02 var-num4   PIC 9(10) VALUE zero.
+           02 filler     PIC X VALUE " ".
+           02 var-num5   PIC 9(10) VALUE zero.
+           02 filler     PIC X VALUE " ".
+           02 var-num6   PIC 9(10) VALUE zero.
+       66 var-group RENAMES var-num1 THRU var-num3.
+"""
+
+
+def demonstrate_renames() -> None:
+    """
+    Accept six numbers and display the group renaming the first three.
+    
+    Process:
+    1. Accept var-num1 .. var-num6 (PIC 9(10) each)
+    2. Display var-group
+    
+    COBOL behavior:
+    - var-group RENAMES var-num1 THRU var-num3: the 32 bytes from
+      var-num1 to the end of var-num3, fillers included
+    - Each number is shown zero-padded to 10 digits
+    - Negative input loses its sign in the unsigned items
+    """
+    try:
+        storage = WorkingStorage.parse(WORKING_STORAGE)
+        
+        for number in range(1, 7):
+            print(f"Enter number {number}: ", end="")
+            storage[f"var-num{number}"].move(input())
+        
+        print("var-group : ")
+        print(storage.var_group)
+        
+    except ValueError:
+        print("Error: Please enter valid numbers")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def main() -> None:
+    """Main entry point for the RENAMES program."""
+    demonstrate_renames()
+
+
+if __name__ == "__main__":
+    main()
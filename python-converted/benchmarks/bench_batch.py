@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Batch mode benchmark for the arithmetic programs.
+
+Pushes N operand lines through the ADD, DIVIDE and COMPUTE programs:
+- one process per calculation, as the interactive programs need
+  (timed on a sample and extrapolated)
+- in one process, calculation by calculation (``*_one`` and print)
+- ``--batch`` mode (``run_batch`` with the int64 column functions),
+  whose output is checked against the line-by-line output
+
+Usage:
+    python3 benchmarks/bench_batch.py              # 1M calculations
+    python3 benchmarks/bench_batch.py 200000
+"""
+
+import importlib.util
+import io
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from cobol_runtime.batch import run_batch  # noqa: E402
+from cobol_runtime.output import RecordWriter  # noqa: E402
+
+SAMPLE_PROCESSES = 20
+
+
+def load(name: str):
+    spec = importlib.util.spec_from_file_location(name, ROOT / "basic" / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def per_process(program: str, line: str, count: int) -> None:
+    start = time.perf_counter()
+    for _ in range(SAMPLE_PROCESSES):
+        subprocess.run([sys.executable, str(ROOT / "basic" / f"{program}.py")],
+                       input=line.replace(" ", "\n") + "\n", capture_output=True, text=True)
+    elapsed = (time.perf_counter() - start) / SAMPLE_PROCESSES * count
+    print(f"{'process per calculation':<26} {elapsed:8.1f}s (estimated)")
+
+
+def compare(program: str, lines: list, operands: int, bulk, single, **options) -> None:
+    count = len(lines)
+    print(f"{count} calculations, {program}")
+    per_process(program, lines[0], count)
+
+    parse = options.get("parse", int)
+    start = time.perf_counter()
+    expected = "".join(single(*map(parse, line.split())) for line in lines)
+    elapsed = time.perf_counter() - start
+    print(f"{'one by one, in process':<26} {elapsed:8.3f}s {elapsed / count * 1e9:8.0f} ns/op")
+
+    sink = io.BytesIO()
+    start = time.perf_counter()
+    with RecordWriter(sink) as out:
+        run_batch(io.StringIO("\n".join(lines) + "\n"), operands, bulk, single, out=out, **options)
+    elapsed = time.perf_counter() - start
+    same = sink.getvalue().decode() == expected
+    print(f"{'--batch':<26} {elapsed:8.3f}s {elapsed / count * 1e9:8.0f} ns/op"
+          f"   {'ok' if same else 'MISMATCH'}")
+    print()
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    random.seed(42)
+    add = load("03_add")
+    divide = load("06_divide")
+    compute = load("07_compute")
+
+    pairs = [f"{random.randint(-10 ** 9, 10 ** 9)} {random.randint(-10 ** 6, 10 ** 6) or 1}"
+             for _ in range(count)]
+    quadratics = [" ".join(f"{random.randint(-99_999, 99_999) / 100:.2f}" for _ in range(4))
+                  for _ in range(count)]
+
+    compare("03_add", pairs, 2, add.add_batch, add.add_one,
+            fits=lambda number: abs(number) < add.BATCH_LIMIT)
+    compare("06_divide", pairs, 2, divide.divide_batch, divide.divide_one,
+            fits=lambda number: abs(number) < divide.BATCH_LIMIT)
+    compare("07_compute", quadratics, 4, compute.compute_batch, compute.compute_one,
+            parse=compute.Fixed.of, fits=compute.batch_operand)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+CALL benchmark.
+
+Runs N calls of a subprogram that adds 1 to the number it is given:
+- a plain Python function doing the same MOVE on the caller's field
+  (no LINKAGE, no CALL semantics: the speed to aim for)
+- the Program itself, with the caller's fields
+- CALL ... USING through a compiled plan, BY REFERENCE and BY CONTENT
+- the same CALL alternating between two callers' records, so every
+  call rebinds the LINKAGE views
+
+Usage:
+    python3 benchmarks/bench_call.py              # 1M calls
+    python3 benchmarks/bench_call.py 200000
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.call import Program, ProgramRegistry, compile_call  # noqa: E402
+from cobol_runtime.storage import WorkingStorage  # noqa: E402
+
+CALLER = """
+       01 ws-record.
+          05 ws-number PIC 9(9) COMP VALUE 0.
+          05 ws-name   PIC X(20) VALUE 'Some string'.
+"""
+
+SUBPROGRAM = Program("ADD-ONE", linkage="""
+       01 ls-record.
+          05 ls-number PIC 9(9) COMP.
+          05 ls-name   PIC X(20).
+""")
+LS_NUMBER = SUBPROGRAM.linkage.ls_number
+
+
+@SUBPROGRAM.procedure_division
+def add_one(linkage: WorkingStorage, storage: WorkingStorage) -> None:
+    LS_NUMBER.move(LS_NUMBER.value + 1)
+
+
+PROGRAMS = ProgramRegistry([])
+PROGRAMS.register(SUBPROGRAM)
+BY_REFERENCE = compile_call("CALL 'ADD-ONE' USING ws-record", PROGRAMS)
+BY_CONTENT = compile_call("CALL 'ADD-ONE' USING BY CONTENT ws-record", PROGRAMS)
+
+
+def timed(label: str, count: int, run) -> None:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed:8.3f}s {elapsed / count * 1e9:8.0f} ns/call")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    first, second = WorkingStorage.parse(CALLER), WorkingStorage.parse(CALLER)
+    record, other = first.ws_record, second.ws_record
+    number = first.ws_number
+
+    def function(field) -> None:
+        field.move(field.value + 1)
+
+    def calls() -> None:
+        for _ in range(count):
+            function(number)
+
+    def program() -> None:
+        for _ in range(count):
+            SUBPROGRAM(record)
+
+    def by_reference() -> None:
+        for _ in range(count):
+            BY_REFERENCE(record)
+
+    def by_content() -> None:
+        for _ in range(count):
+            BY_CONTENT(record)
+
+    def alternating() -> None:
+        for _ in range(count // 2):
+            BY_REFERENCE(record)
+            BY_REFERENCE(other)
+
+    print(f"{count} calls")
+    timed("plain function", count, calls)
+    timed("Program(ws-record)", count, program)
+    timed("CALL BY REFERENCE", count, by_reference)
+    timed("CALL BY CONTENT", count, by_content)
+    timed("CALL BY REFERENCE, two callers", count, alternating)
+    print(f"ws-number: {first.ws_number.value} (first), {second.ws_number.value} (second)")
+
+
+if __name__ == "__main__":
+    main()
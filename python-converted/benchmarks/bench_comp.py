@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+COMP-3 / COMP codec benchmark.
+
+Decodes N packed-decimal (PIC S9(7)V99 COMP-3) and binary (PIC S9(9)
+COMP) fields one value at a time and with the column codecs.
+
+Usage:
+    python3 benchmarks/bench_comp.py              # 1M fields
+    python3 benchmarks/bench_comp.py 200000
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.comp import (  # noqa: E402
+    decode_binary,
+    decode_binary_column,
+    decode_packed,
+    decode_packed_column,
+    encode_binary_column,
+    encode_packed_column,
+)
+
+
+def timed(label: str, count: int, run) -> None:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed:8.3f}s {elapsed / count * 1e9:8.0f} ns/field")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    random.seed(42)
+    units = np.array([random.randint(-999_999_999, 999_999_999) for _ in range(count)])
+    packed = encode_packed_column(units, 5)
+    binary = encode_binary_column(units, 4)
+    packed_fields = [row.tobytes() for row in packed]
+    binary_fields = [row.tobytes() for row in binary]
+
+    assert decode_packed_column(packed).tolist() == [decode_packed(f) for f in packed_fields]
+    print(f"{count} fields")
+    timed("COMP-3 decode_packed, per value", count, lambda: [decode_packed(f) for f in packed_fields])
+    timed("COMP-3 decode_packed_column", count, lambda: decode_packed_column(packed))
+    timed("COMP decode_binary, per value", count, lambda: [decode_binary(f) for f in binary_fields])
+    timed("COMP decode_binary_column", count, lambda: decode_binary_column(binary))
+
+
+if __name__ == "__main__":
+    main()
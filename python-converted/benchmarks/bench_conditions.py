@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Condition-name benchmark.
+
+Evaluates level-88 conditions and class tests over N values:
+- ``100 <= n <= 9999`` in a Python loop, as control/01_if.py used to
+- the compiled VALUE list, value by value and over a whole column
+- a multi-range VALUE list (bitmask) and a text THRU list (bisect)
+- the NUMERIC class test: try/float, is_numeric (bytes.isdigit), and a byte table
+  over a uint8 matrix
+
+Usage:
+    python3 benchmarks/bench_conditions.py              # 1M values
+    python3 benchmarks/bench_conditions.py 200000
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.conditions import NUMERIC_TABLE, class_column, compile_condition, is_numeric  # noqa: E402
+from cobol_runtime.copybook import parse_picture  # noqa: E402
+
+WIDTH = 9
+
+PASS = compile_condition((("100", "9999"),), parse_picture("S9(9)"))
+BANDS = compile_condition((("1", "10"), ("200", "300"), ("5000", "5999"), ("9000", None)), parse_picture("S9(9)"))
+CODES = compile_condition((("AAA", "CZZ"), ("M00", "M99"), ("X", "ZZZ")), parse_picture("X(3)"))
+
+
+def timed(label: str, count: int, run) -> None:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed:8.3f}s {elapsed / count * 1e9:8.0f} ns/value")
+
+
+def float_numeric(text: str) -> bool:
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    random.seed(42)
+    numbers = [random.randint(-100, 12000) for _ in range(count)]
+    column = np.array(numbers, dtype=np.int64)
+    codes = [bytes(random.choice(b"ABCMXZ") for _ in range(3)) for _ in range(count)]
+    code_matrix = np.frombuffer(b"".join(codes), dtype=np.uint8).reshape(count, 3)
+    fields = [str(n).encode() if n % 3 else b"12A" + str(n).encode() for n in numbers]
+    fields = [field[:WIDTH].rjust(WIDTH, b"0") for field in fields]
+    field_matrix = np.frombuffer(b"".join(fields), dtype=np.uint8).reshape(count, WIDTH)
+    texts = [field.decode() for field in fields]
+
+    def range_python() -> None:
+        for n in numbers:
+            100 <= n <= 9999
+
+    def range_each() -> None:
+        test = PASS.test
+        for n in numbers:
+            test(n)
+
+    def bands_each() -> None:
+        test = BANDS.test
+        for n in numbers:
+            test(n)
+
+    def codes_each() -> None:
+        test = CODES.test
+        for code in codes:
+            test(code)
+
+    def numeric_float() -> None:
+        for text in texts:
+            float_numeric(text)
+
+    def numeric_bytes() -> None:
+        for field in fields:
+            is_numeric(field)
+
+    print(f"{count} values")
+    print("88 var-pass1 VALUES ARE 100 THRU 9999")
+    timed("Python comparison", count, range_python)
+    timed("plan, value by value", count, range_each)
+    timed("plan.test_column", count, lambda: PASS.test_column(column))
+
+    print()
+    print("88 VALUE 1 THRU 10, 200 THRU 300, 5000 THRU 5999, 9000")
+    timed("plan, value by value", count, bands_each)
+    timed("plan.test_column", count, lambda: BANDS.test_column(column))
+
+    print()
+    print("88 VALUE 'AAA' THRU 'CZZ', 'M00' THRU 'M99', 'X' THRU 'ZZZ'")
+    timed("plan, value by value", count, codes_each)
+    timed("plan.test_column over a uint8 matrix", count, lambda: CODES.test_column(code_matrix))
+
+    print()
+    print(f"PIC X({WIDTH}) IS NUMERIC")
+    timed("try/float", count, numeric_float)
+    timed("is_numeric", count, numeric_bytes)
+    timed("byte table over a uint8 matrix", count, lambda: class_column(field_matrix, NUMERIC_TABLE))
+
+
+if __name__ == "__main__":
+    main()
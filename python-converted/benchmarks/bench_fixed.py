@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Fixed-point arithmetic benchmark.
+
+Evaluates the 07_compute formula ``a * x**2 + b * x + c`` and the
+06_divide quotient/remainder for N operand sets, storing each result
+in a PIC S9(16)V99 item, with:
+- plain ints on pre-scaled units (the lower bound)
+- plain ints stored with ``FixedSpec.store_units``
+- ``Fixed`` with ``FixedSpec.store``
+- ``decimal.Decimal`` with ``quantize(ROUND_DOWN)``
+- floats (fast but inexact: the last column counts results that differ
+  from the exact fixed-point ones)
+
+Usage:
+    python3 benchmarks/bench_fixed.py              # 1M operand sets
+    python3 benchmarks/bench_fixed.py 200000
+"""
+
+import gc
+import random
+import sys
+import time
+from decimal import ROUND_DOWN, Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.fixed import Fixed, FixedSpec, divide_remainder  # noqa: E402
+
+RESULT = FixedSpec(18, 2)
+CENT = Decimal("0.01")
+
+
+def timed(label: str, count: int, run) -> list:
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    results = run()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    print(f"{label:<28} {elapsed:8.3f}s {elapsed / count * 1e9:8.0f} ns/op", end="")
+    return results
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    random.seed(42)
+    # Two decimal places per operand
+    rows = [tuple(random.randint(-99_999, 99_999) for _ in range(4)) for _ in range(count)]
+    fixed = [tuple(Fixed(u, 2) for u in row) for row in rows]
+    decimals = [tuple(Decimal(u).scaleb(-2) for u in row) for row in rows]
+    floats = [tuple(u / 100 for u in row) for row in rows]
+
+    def ints() -> list:
+        # a*x**2 is at scale 6, b*x at 4, c at 2: align and drop 4 places
+        out = []
+        for a, b, c, x in rows:
+            y = a * x * x + b * x * 100 + c * 10000
+            out.append(y // 10000 if y >= 0 else -(-y // 10000))
+        return out
+
+    print(f"{count} operand sets, y = a*x**2 + b*x + c")
+    exact = timed("int (scaled units)", count, ints)
+    print()
+    store = RESULT.store_units
+    result = timed("int + store_units", count, lambda: [
+        store(a * x * x + b * x * 100 + c * 10000, 6) for a, b, c, x in rows])
+    print(f"   {'ok' if result == exact else 'MISMATCH'}")
+    result = timed("Fixed", count, lambda: [RESULT.store(a * x ** 2 + b * x + c).units
+                                            for a, b, c, x in fixed])
+    print(f"   {'ok' if result == exact else 'MISMATCH'}")
+    result = timed("Decimal", count, lambda: [
+        int((a * x ** 2 + b * x + c).quantize(CENT, ROUND_DOWN).scaleb(2))
+        for a, b, c, x in decimals])
+    print(f"   {'ok' if result == exact else 'MISMATCH'}")
+    result = timed("float", count, lambda: [int((a * x ** 2 + b * x + c) * 100)
+                                            for a, b, c, x in floats])
+    print(f"   {sum(r != e for r, e in zip(result, exact))} differ")
+
+    print()
+    print(f"{count} divisions with remainder, 2 decimal places")
+    spec = FixedSpec(12, 2)
+    pairs = [(a, b or 1) for a, b, _, _ in rows]
+    timed("int (scaled units)", count, lambda: [
+        (q, a * 100 - q * b) for a, b in pairs
+        for q in ((abs(a) * 100 // abs(b)) * (1 if (a < 0) == (b < 0) else -1),)])
+    print()
+    timed("Fixed", count, lambda: [divide_remainder(a, b, spec, spec) for a, b in pairs])
+    print()
+    timed("Decimal", count, lambda: [
+        (q, Decimal(a) - q * b) for a, b in pairs
+        for q in ((Decimal(a) / b).quantize(CENT, ROUND_DOWN),)])
+    print()
+    timed("float", count, lambda: [(a / b, a - int(a / b * 100) / 100 * b) for a, b in pairs])
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+INSPECT benchmark.
+
+Runs INSPECT statements over N 20-byte fields: per value (the compiled
+plan's kernel), over a list with ``replace_column`` / ``tally_column``,
+and over a uint8 matrix of fixed-width fields.
+
+Usage:
+    python3 benchmarks/bench_inspect.py              # 1M fields
+    python3 benchmarks/bench_inspect.py 200000
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.inspect import compile_inspect  # noqa: E402
+
+WIDTH = 20
+
+STATEMENTS = (
+    "INSPECT F TALLYING N FOR ALL SPACE",
+    "INSPECT F TALLYING N FOR LEADING SPACE",
+    "INSPECT F REPLACING ALL 'a' BY 'z' ALL ' ' BY '_'",
+    "INSPECT F REPLACING LEADING '0' BY SPACE",
+    "INSPECT F CONVERTING 'abcdefghij' TO 'ABCDEFGHIJ' AFTER INITIAL ':'",
+)
+
+
+def timed(label: str, count: int, run) -> None:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed:8.3f}s {elapsed / count * 1e9:8.0f} ns/field")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    random.seed(42)
+    alphabet = "abcdefghij0 :"
+    values = ["".join(random.choice(alphabet) for _ in range(WIDTH)) for _ in range(count)]
+    encoded = [v.encode() for v in values]
+    matrix = np.frombuffer(b"".join(encoded), dtype=np.uint8).reshape(count, WIDTH)
+
+    print(f"{count} fields")
+    for statement in STATEMENTS:
+        plan = compile_inspect(statement)
+        print()
+        print(statement)
+        if plan.counters:
+            expected = plan.tally_column(encoded)["N"]
+            assert (plan.tally_column(matrix)["N"] == expected).all()
+            timed("tally, per value", count, lambda: [plan.tally(v) for v in values])
+            timed("tally_column, list of str", count, lambda: plan.tally_column(values))
+            timed("tally_column, uint8 matrix", count, lambda: plan.tally_column(matrix))
+        else:
+            assert plan.replace_column(matrix).tobytes() == b"".join(plan.replace_column(encoded))
+            timed("replace, per value", count, lambda: [plan.replace(v) for v in values])
+            timed("replace_column, list of str", count, lambda: plan.replace_column(values))
+            timed("replace_column, uint8 matrix", count, lambda: plan.replace_column(matrix))
+
+
+if __name__ == "__main__":
+    main()
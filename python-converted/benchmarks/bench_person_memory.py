@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Person record memory benchmark.
+
+Compares the memory needed to hold N person records as:
+- the original plain ``@dataclass`` Person (one ``__dict__`` per record)
+- the ``__slots__`` Person from cobol_runtime.person
+- a PersonTable (parallel array/bytes columns)
+
+Usage:
+    python3 benchmarks/bench_person_memory.py            # 1M and 10M records
+    python3 benchmarks/bench_person_memory.py 100000     # custom sizes
+"""
+
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.person import Person, PersonTable  # noqa: E402
+
+
+@dataclass
+class DictPerson:
+    """The original Person dataclass, without __slots__."""
+    person_id: int
+    name: str
+    surname: str
+
+
+NAMES = [b"Gabriel", b"Maciej", b"Stanis\xc5\x82aw", b"Ignacy", b"Edward Bernard"]
+SURNAMES = [b"Narutowicz", b"Rataj", b"Wojciechowski", b"Mo\xc5\x9bcicki", b"Raczy\xc5\x84ski"]
+
+
+def build_list(cls: type, count: int) -> List:
+    # Decode per record so every instance owns its strings, as when
+    # parsing a file
+    return [
+        cls(i % 1000, NAMES[i % 5].decode("utf-8"), SURNAMES[i % 5].decode("utf-8"))
+        for i in range(count)
+    ]
+
+
+def build_table(count: int) -> PersonTable:
+    table = PersonTable()
+    for i in range(count):
+        table.append(Person(i % 1000, NAMES[i % 5].decode("utf-8"), SURNAMES[i % 5].decode("utf-8")))
+    return table
+
+
+def measure(label: str, count: int, build: Callable[[], object]) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    data = build()
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:22s} {count:>12,d} {current / 2**20:>12.1f} MiB "
+          f"{current / count:>10.1f} B/rec {elapsed:>8.2f} s")
+    del data
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000_000, 10_000_000]
+    print(f"{'representation':22s} {'records':>12s} {'memory':>16s} {'per record':>14s} {'build':>10s}")
+    for count in sizes:
+        measure("dataclass (__dict__)", count, lambda: build_list(DictPerson, count))
+        measure("dataclass (__slots__)", count, lambda: build_list(Person, count))
+        measure("PersonTable", count, lambda: build_table(count))
+
+
+if __name__ == "__main__":
+    main()
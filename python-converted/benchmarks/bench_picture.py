@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+PICTURE editing benchmark.
+
+Edits N values with the pictures of struct-row (SampleDataRow.cpy) and
+compares the compiled formatters with the f-strings that used to imitate
+them in basic/02_variables.py. The f-strings are not COBOL-exact (they
+are one position narrower); they only set the speed to aim for.
+
+The second table builds whole struct-row report lines, one value at a
+time with the formatters versus one ``edit_rows`` call over NumPy
+columns.
+
+Usage:
+    python3 benchmarks/bench_picture.py              # 1M values
+    python3 benchmarks/bench_picture.py 200000
+"""
+
+import random
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.layout import load_layout  # noqa: E402
+from cobol_runtime.picture import compile_picture  # noqa: E402
+from cobol_runtime.report import edit_rows  # noqa: E402
+
+
+def timed(label: str, count: int, run) -> None:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed:8.3f}s {elapsed / count * 1e9:8.0f} ns/value")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    random.seed(42)
+    cents = [random.randint(-99_999_999, 99_999_999) for _ in range(count)]
+    floats = [c / 100 for c in cents]
+    decimals = [Decimal(c).scaleb(-2) for c in cents]
+    integers = [c // 100 for c in cents]
+
+    edit_decimal = compile_picture("+z(7).zz")
+    edit_currency = compile_picture("$z(7).zz")
+
+    print(f"{count} values")
+    timed("f-string {:>+10.2f}", count, lambda: [f"{v:>+10.2f}" for v in floats])
+    timed("f-string ${:>9.2f}", count, lambda: [f"${v:>9.2f}" for v in floats])
+    timed("PIC +z(7).zz, int", count, lambda: [edit_decimal(v) for v in integers])
+    timed("PIC +z(7).zz, Decimal", count, lambda: [edit_decimal(v) for v in decimals])
+    timed("PIC +z(7).zz, float", count, lambda: [edit_decimal(v) for v in floats])
+    timed("PIC $z(7).zz, Decimal", count, lambda: [edit_currency(v) for v in decimals])
+
+    layout = load_layout("SampleDataRow")
+    edit_lp = compile_picture("9(2)")
+    edit_number = compile_picture("z(10)")
+    lps = [i % 100 for i in range(count)]
+    numbers = [abs(c) for c in cents]
+    amounts = np.array(floats)
+
+    def one_at_a_time() -> bytes:
+        return "".join(
+            f"{edit_lp(lp)}|{edit_number(n)}|{edit_decimal(v)}|{edit_currency(v)}\n"
+            for lp, n, v in zip(lps, numbers, floats)
+        ).encode()
+
+    def batch() -> bytes:
+        return edit_rows(layout, {"var-lp": np.array(lps), "var-number": np.array(numbers),
+                                  "var-decimal": amounts, "var-currency": amounts})
+
+    assert one_at_a_time() == batch()
+    print()
+    print("struct-row report lines")
+    timed("formatters, one value at a time", count, one_at_a_time)
+    timed("edit_rows over NumPy columns", count, batch)
+
+
+if __name__ == "__main__":
+    main()
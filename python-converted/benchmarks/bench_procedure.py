@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Paragraph dispatch benchmark.
+
+Runs N transfers of control:
+- plain Python calls of a paragraph function, the way control/02_loops.py
+  used to model PERFORM (no fall-through or GO TO possible)
+- PERFORM para N TIMES through the dispatch table
+- PERFORM para UNTIL, from a paragraph that loops with GO TO
+- a GO TO DEPENDING ON loop cycling through three paragraphs
+
+Usage:
+    python3 benchmarks/bench_procedure.py              # 1M transfers
+    python3 benchmarks/bench_procedure.py 200000
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.procedure import STOP_RUN, Procedure, go_to, perform  # noqa: E402
+
+
+def timed(label: str, count: int, run) -> None:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed:8.3f}s {elapsed / count * 1e9:8.0f} ns/transfer")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    state = {"n": 0}
+
+    def add_one(state) -> None:
+        state["n"] += 1
+
+    def calls() -> None:
+        for _ in range(count):
+            add_one(state)
+
+    times = Procedure("TIMES")
+
+    @times.paragraph("MAIN")
+    def times_main(state):
+        yield perform("ADD-ONE", times=count)
+        yield STOP_RUN
+
+    times.paragraph("ADD-ONE")(add_one)
+
+    until = Procedure("UNTIL")
+
+    @until.paragraph("MAIN")
+    def until_main(state):
+        yield perform("ADD-ONE", until=lambda: state["n"] >= count)
+        yield STOP_RUN
+
+    until.paragraph("ADD-ONE")(add_one)
+
+    depending = Procedure("DEPENDING")
+
+    @depending.paragraph("CHOOSE")
+    def choose(state):
+        state["n"] += 1
+        if state["n"] < count:
+            return go_to("P1", "P2", "P3", depending_on=state["n"] % 3 + 1)
+        return STOP_RUN
+
+    for name in ("P1", "P2", "P3"):
+        depending.paragraph(name)(lambda state: go_to("CHOOSE"))
+
+    def run(procedure: Procedure) -> None:
+        state["n"] = 0
+        procedure.run(state)
+        assert state["n"] == count
+
+    print(f"{count} transfers")
+    timed("plain function calls", count, calls)
+    timed("PERFORM ... TIMES", count, lambda: run(times))
+    timed("PERFORM ... UNTIL", count, lambda: run(until))
+    # Two transfers per round: DEPENDING ON, then GO TO back
+    timed("GO TO ... DEPENDING ON loop", 2 * count, lambda: run(depending))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+STRING / UNSTRING benchmark.
+
+Splits N 40-byte "name surname city" fields and concatenates N
+surname/name pairs:
+- with ``str.split`` / ``+``, as string/02_concatenation.py and
+  03_split.py used to (not COBOL-exact; they only set the speed to aim
+  for)
+- with the compiled plans, one record at a time into bytearray fields
+- with the bulk forms over uint8 matrices of fixed-width fields
+
+Usage:
+    python3 benchmarks/bench_strings.py              # 1M records
+    python3 benchmarks/bench_strings.py 200000
+"""
+
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.strings import compile_string, compile_unstring  # noqa: E402
+
+WIDTH = 40
+
+SPLIT = compile_unstring("UNSTRING s DELIMITED BY SPACE INTO name surname city")
+CONCATENATE = compile_string("STRING surname DELIMITED BY SPACE ', ' name DELIMITED BY SPACE INTO out")
+
+
+def timed(label: str, count: int, run) -> None:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed:8.3f}s {elapsed / count * 1e9:8.0f} ns/record")
+
+
+def word(low: int, high: int) -> str:
+    return "".join(random.choice(string.ascii_letters) for _ in range(random.randint(low, high)))
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    random.seed(42)
+    records = [f"{word(2, 12)} {word(2, 14)} {word(2, 10)}".encode().ljust(WIDTH) for _ in range(count)]
+    matrix = np.frombuffer(b"".join(records), dtype=np.uint8).reshape(count, WIDTH)
+    texts = [r.decode() for r in records]
+
+    def split_str() -> None:
+        for text in texts:
+            text.split()
+
+    def split_each() -> None:
+        name, surname, city = bytearray(16), bytearray(16), bytearray(12)
+        for record in records:
+            SPLIT(record, name, surname, city)
+
+    print(f"{count} records")
+    print("UNSTRING ... DELIMITED BY SPACE INTO name surname city")
+    timed("str.split", count, split_str)
+    timed("plan, record by record", count, split_each)
+    timed("plan.rows over a uint8 matrix", count, lambda: SPLIT.rows(matrix, [16, 16, 12]))
+
+    names, surnames, _ = SPLIT.rows(matrix, [16, 16, 12]).targets
+    name_list = [row.tobytes() for row in names]
+    surname_list = [row.tobytes() for row in surnames]
+
+    def concatenate_str() -> None:
+        for name, surname in zip(name_list, surname_list):
+            surname.split(b" ", 1)[0] + b", " + name.split(b" ", 1)[0]
+
+    def concatenate_each() -> None:
+        out = bytearray(30)
+        for name, surname in zip(name_list, surname_list):
+            CONCATENATE(out, surname, name)
+
+    print()
+    print("STRING surname DELIMITED BY SPACE ', ' name DELIMITED BY SPACE INTO out")
+    timed("bytes split and +", count, concatenate_str)
+    timed("plan, record by record", count, concatenate_each)
+    timed("plan.rows over uint8 matrices", count, lambda: CONCATENATE.rows([surnames, names], 30))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""
+COBOL runtime support for the converted programs.
+
+Shared building blocks used by the Python implementations under
+``basic/``, ``control/``, ``string/``, ``file/`` and friends. The
+numbered program scripts cannot import each other, so anything more than
+one program needs lives here.
+"""
@@ -0,0 +1,177 @@
+"""
+Non-interactive batch runs of the arithmetic programs.
+
+The interactive programs ACCEPT one operand per prompt and do one
+calculation per process. A batch run reads the operands of many
+calculations from a file or stdin instead, one calculation per line
+(operands separated by spaces or commas), and pushes them through the
+program's column function a chunk at a time. Output goes through one
+``RecordWriter``, so millions of calculations cost one process and a
+handful of ``write`` calls.
+
+Every line prints exactly what the interactive program prints for the
+same input, minus the prompts. Lines that don't parse print the
+programs' "Error: Please enter valid numbers". Operands the column
+function can't take exactly (``fits`` is false, e.g. beyond int64)
+go through the program's single-calculation function instead.
+
+Usage:
+    run_batch("pairs.txt", 2, add_batch, add_one, fits=within(10 ** 17))
+"""
+
+import sys
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TextIO, Union
+
+from .output import DEFAULT_BUFFER_SIZE, RecordWriter
+
+DEFAULT_CHUNK_ROWS = 65536
+
+INVALID = "Error: Please enter valid numbers\n"
+
+PathLike = Union[str, Path]
+
+
+def _always(value: Any) -> bool:
+    return True
+
+
+def within(limit: int) -> Callable[[Any], bool]:
+    """``fits`` test for int operands: -limit < n < limit, without a Python call per value."""
+    return range(1 - limit, limit).__contains__
+
+
+def calculate_lines(
+    lines: Iterable[str],
+    operands: int,
+    bulk: Callable[..., str],
+    single: Callable[..., str],
+    parse: Callable[[str], Any] = int,
+    fits: Callable[[Any], bool] = _always,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Iterator[str]:
+    """
+    Calculate every line of operands, yielding the output a chunk at a time.
+
+    Args:
+        lines: Input lines, one calculation each; blank lines are skipped
+        operands: Operands per line
+        bulk: Column function: one sequence per operand in, the output
+            text of all those calculations out
+        single: The same for one calculation's operands
+        parse: Converts one operand, raising ValueError if it isn't valid
+        fits: True if an operand can go through ``bulk``
+        chunk_rows: Lines per ``bulk`` call
+
+    Yields:
+        Output text, in input order
+    """
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, chunk_rows))
+        if not chunk:
+            return
+        text = _calculate_chunk(chunk, operands, bulk, parse, fits)
+        if text is None:
+            text = "".join(_calculate_each(chunk, operands, bulk, single, parse, fits))
+        yield text
+
+
+def _calculate_chunk(
+    chunk: List[str],
+    operands: int,
+    bulk: Callable[..., str],
+    parse: Callable[[str], Any],
+    fits: Callable[[Any], bool],
+) -> Optional[str]:
+    """Calculate a chunk in one ``bulk`` call; None unless every line is a good one."""
+    text = "".join(chunk)
+    if "," in text:
+        text = text.replace(",", " ")
+    counts = list(map(len, map(str.split, text.splitlines())))
+    if counts.count(operands) != len(counts):
+        return None
+    try:
+        values = list(map(parse, text.split()))
+    except ValueError:
+        return None
+    if not all(map(fits, values)):
+        return None
+    return bulk(*(values[i::operands] for i in range(operands)))
+
+
+def _calculate_each(
+    chunk: List[str],
+    operands: int,
+    bulk: Callable[..., str],
+    single: Callable[..., str],
+    parse: Callable[[str], Any],
+    fits: Callable[[Any], bool],
+) -> Iterator[str]:
+    """Calculate a chunk line by line, batching the runs of good lines."""
+    columns: List[List[Any]] = [[] for _ in range(operands)]
+    for line in chunk:
+        tokens = line.replace(",", " ").split()
+        if not tokens:
+            continue
+        try:
+            if len(tokens) != operands:
+                raise ValueError(line)
+            values = [parse(token) for token in tokens]
+        except ValueError:
+            values = None
+        if values is not None and all(fits(value) for value in values):
+            for column, value in zip(columns, values):
+                column.append(value)
+            continue
+        # Calculate the run so far first to keep the output in order
+        if columns[0]:
+            yield bulk(*columns)
+            columns = [[] for _ in range(operands)]
+        yield INVALID if values is None else single(*values)
+    if columns[0]:
+        yield bulk(*columns)
+
+
+def run_batch(
+    source: Union[PathLike, TextIO],
+    operands: int,
+    bulk: Callable[..., str],
+    single: Callable[..., str],
+    parse: Callable[[str], Any] = int,
+    fits: Callable[[Any], bool] = _always,
+    out: Optional[RecordWriter] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> int:
+    """
+    Batch-run a program over a file or stream of operands (see ``calculate_lines``).
+
+    Args:
+        source: Path, ``-`` for stdin, or an open text stream
+        out: Writer for the results (defaults to a buffered stdout writer)
+        buffer_size: Output buffer size when ``out`` is not given
+
+    Returns:
+        Number of output lines written
+    """
+    writer = out if out is not None else RecordWriter(buffer_size=buffer_size)
+    stream: TextIO
+    if isinstance(source, (str, Path)):
+        stream = sys.stdin if str(source) == "-" else open(source, encoding="utf-8")
+    else:
+        stream = source
+    lines_written = 0
+    try:
+        for text in calculate_lines(stream, operands, bulk, single, parse, fits, chunk_rows):
+            block = text.encode("utf-8")
+            count = block.count(b"\n")
+            writer.write_raw(block, count)
+            lines_written += count
+    finally:
+        if stream is not source and stream is not sys.stdin:
+            stream.close()
+        if out is None:
+            writer.flush()
+    return lines_written
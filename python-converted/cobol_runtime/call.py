@@ -0,0 +1,356 @@
+"""
+CALL statements and the subprograms of a run unit.
+
+A ``Program`` is a subprogram: its LINKAGE SECTION, its own
+WORKING-STORAGE and its PROCEDURE DIVISION body. A ``ProgramRegistry``
+resolves each program name once and keeps every program it has loaded,
+so a subprogram's WORKING-STORAGE persists from one CALL to the next,
+as in COBOL, until it is cancelled. Programs are registered explicitly
+or loaded on their first CALL from ``<name>.py`` in the registry's
+search path (by default ``COB_LIBRARY_PATH``, like GnuCOBOL's dynamic
+CALL): a module that defines ``PROGRAM``.
+
+``compile_call`` compiles a CALL statement once into a plan that
+resolves its program on first use and is then called with the caller's
+fields, in USING order:
+- BY REFERENCE (the default) passes the caller's bytes: the LINKAGE
+  record is rebound to the field's ``memoryview``, so a MOVE in the
+  subprogram changes the caller's storage
+- BY CONTENT passes a copy made at the CALL (into a buffer the plan
+  keeps for that argument), so the caller's storage is left alone;
+  literals are always passed this way
+A BY phrase applies to every following argument until the next one.
+The program name must be a literal; BY VALUE, RETURNING and ON
+EXCEPTION are not supported (the body's return value is returned
+instead, and a program that cannot be found raises ValueError).
+
+A CALL does no name lookup, parsing or field creation: a program
+rebinds its LINKAGE views only when it is given a different buffer than
+on its previous CALL, then calls its body. The LINKAGE fields are the
+same objects on every CALL, so a body may look them up once.
+
+Usage:
+    subroutine = Program("SUB", linkage="       01 ls-number PIC 9(4).")
+
+    @subroutine.procedure_division
+    def sub(linkage, storage):
+        linkage.ls_number.move(3721)
+
+    registry = ProgramRegistry()
+    registry.register(subroutine)
+    call = compile_call("CALL 'SUB' USING ws-number", registry)
+    call(storage.ws_number)                  # ws-number is now 3721
+"""
+
+import importlib.util
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .copybook import parse_copybook
+from .inspect import _tokenize
+from .storage import Field, WorkingStorage
+from .strings import _StatementParser
+
+Buffer = Union[bytearray, memoryview]
+
+# Phrases ending the USING list (none of them is supported)
+_PHRASES = ("RETURNING", "GIVING", "ON", "NOT", "EXCEPTION", "OVERFLOW", "END-CALL")
+
+
+def _no_procedure(linkage: WorkingStorage, storage: WorkingStorage) -> None:
+    raise ValueError("CALL: program has no PROCEDURE DIVISION")
+
+
+class Program:
+    """
+    A subprogram of the run unit.
+
+    Attributes:
+        name: PROGRAM-ID
+        using: LINKAGE records named in PROCEDURE DIVISION USING, in order
+        linkage: LINKAGE SECTION items, rebound to the caller's buffers
+            on every CALL
+        storage: WORKING-STORAGE, kept from one CALL to the next until
+            ``cancel``
+    """
+
+    def __init__(self, name: str, linkage: str = "", working_storage: str = "",
+                 using: Optional[Sequence[str]] = None, encoding: str = "utf-8"):
+        """
+        Lay out a subprogram's data.
+
+        Args:
+            name: PROGRAM-ID
+            linkage: LINKAGE SECTION source text
+            working_storage: WORKING-STORAGE SECTION source text
+            using: PROCEDURE DIVISION USING names (default: every LINKAGE
+                record, in order)
+            encoding: Character encoding of alphanumeric data
+
+        Raises:
+            ValueError: If a USING name is not a LINKAGE record
+        """
+        self.name = name
+        self.encoding = encoding
+        self.linkage = WorkingStorage.parse(linkage, encoding)
+        if using is None:
+            self.using: Tuple[str, ...] = tuple(self.linkage.records)
+        else:
+            self.using = tuple(record.upper() for record in using)
+        for record in self.using:
+            if record not in self.linkage.records:
+                raise ValueError(f"{name}: USING {record} is not a LINKAGE record")
+        # Per USING record: its size, the records sharing its bytes, and
+        # every (field, start, end) view to point at the caller's buffer
+        self._bindings = tuple(self._binding(record) for record in self.using)
+        # The buffer each USING record is bound to: a CALL passing the
+        # same buffers again rebinds nothing
+        self._bound: List[Optional[Buffer]] = [None] * len(self.using)
+        self._working_storage = parse_copybook(working_storage)
+        self.storage = WorkingStorage(self._working_storage, encoding)
+        self._body: Callable[[WorkingStorage, WorkingStorage], Any] = _no_procedure
+        self._active = False
+
+    def procedure_division(self, body: Callable[[WorkingStorage, WorkingStorage], Any]) -> Callable[..., Any]:
+        """
+        Decorator setting the program's body, called as ``body(linkage, storage)``.
+
+        A ``Procedure``'s ``run`` method can be given as well. EXIT
+        PROGRAM / GOBACK is the end of the body; what it returns is what
+        the CALL returns.
+        """
+        self._body = body
+        return body
+
+    def __call__(self, *args: Union[Field, Buffer]) -> Any:
+        """
+        Run the program with one field or buffer per USING record, BY REFERENCE.
+
+        Raises:
+            ValueError: If the number of arguments does not match USING, a
+                buffer is shorter than its record, or the program is
+                already active (COBOL programs are not recursive)
+        """
+        if len(args) != len(self._bindings):
+            raise ValueError(f"CALL {self.name}: {len(self._bindings)} arguments expected, {len(args)} given")
+        if self._active:
+            raise ValueError(f"CALL {self.name}: program is already active")
+        bound = self._bound
+        index = 0
+        for arg in args:
+            buffer = arg.view if arg.__class__ is Field else arg
+            if buffer is not bound[index]:
+                self._bind(index, buffer)
+            index += 1
+        self._active = True
+        try:
+            return self._body(self.linkage, self.storage)
+        finally:
+            self._active = False
+
+    def _bind(self, index: int, buffer: Buffer) -> None:
+        """Point the views of USING record ``index`` at ``buffer``."""
+        size, names, views = self._bindings[index]
+        view = buffer if buffer.__class__ is memoryview else memoryview(buffer)
+        if len(view) < size:
+            raise ValueError(f"CALL {self.name}: {len(view)} bytes given for {names[0]} ({size} bytes)")
+        for field, start, end in views:
+            field.view = view if start == 0 and end == len(view) else view[start:end]
+        for name in names:
+            self.linkage.records[name] = view
+        self._bound[index] = buffer
+
+    def _binding(self, record: str) -> Tuple[int, Tuple[str, ...], Tuple[Tuple[Field, int, int], ...]]:
+        linkage = self.linkage
+        owner = linkage._owner[record]
+        names = tuple(name for name, name_owner in linkage._owner.items() if name_owner == owner)
+        return linkage._sizes[owner], names, tuple(linkage._views[owner])
+
+    def cancel(self) -> None:
+        """CANCEL: the next CALL finds WORKING-STORAGE in its initial state."""
+        self.storage = WorkingStorage(self._working_storage, self.encoding)
+
+    def __repr__(self) -> str:
+        return f"Program({self.name!r}, using={list(self.using)})"
+
+
+class ProgramRegistry:
+    """
+    The programs of a run unit, by upper-case name.
+
+    Attributes:
+        paths: Directories searched for ``<name>.py`` on a first CALL
+        programs: Every registered or loaded program
+    """
+
+    def __init__(self, paths: Optional[Sequence[Union[str, Path]]] = None):
+        """
+        Args:
+            paths: Search path (default: ``COB_LIBRARY_PATH``, else the
+                current directory)
+        """
+        if paths is None:
+            paths = [p for p in os.environ.get("COB_LIBRARY_PATH", "").split(os.pathsep) if p] or ["."]
+        self.paths = [Path(p) for p in paths]
+        self.programs: Dict[str, Program] = {}
+
+    def register(self, program: Program) -> Program:
+        """
+        Add a program to the run unit.
+
+        Raises:
+            ValueError: If another program already has its name
+        """
+        key = program.name.upper()
+        if self.programs.setdefault(key, program) is not program:
+            raise ValueError(f"CALL: program {program.name} is already loaded")
+        return program
+
+    def resolve(self, name: str) -> Program:
+        """
+        The program called ``name``, loaded from the search path on first use.
+
+        Raises:
+            ValueError: If it is not registered and cannot be loaded
+        """
+        program = self.programs.get(name.upper())
+        if program is None:
+            program = self.register(self._load(name))
+        return program
+
+    def _load(self, name: str) -> Program:
+        for directory in self.paths:
+            for candidate in dict.fromkeys((name, name.lower())):
+                path = directory / f"{candidate}.py"
+                if path.is_file():
+                    spec = importlib.util.spec_from_file_location(f"cobol_program_{candidate}", path)
+                    module = importlib.util.module_from_spec(spec)
+                    spec.loader.exec_module(module)
+                    program = getattr(module, "PROGRAM", None)
+                    if not isinstance(program, Program) or program.name.upper() != name.upper():
+                        raise ValueError(f"CALL: {path} does not define PROGRAM {name}")
+                    return program
+        raise ValueError(f"CALL: program {name} not found")
+
+    def cancel(self, name: str) -> None:
+        """CANCEL a program: its next CALL starts from its initial state."""
+        program = self.programs.get(name.upper())
+        if program is not None:
+            program.cancel()
+
+
+# The run unit used when a CALL is compiled without a registry
+PROGRAMS = ProgramRegistry()
+
+
+class CallPlan:
+    """
+    Compiled CALL statement.
+
+    Attributes:
+        statement: Statement as written
+        program_name: Name of the called program
+        arguments: Data names passed, in order (literals are part of the
+            plan and not passed in)
+        registry: Run unit the program is resolved in
+    """
+
+    def __init__(self, statement: str, registry: Optional[ProgramRegistry] = None, encoding: str = "utf-8"):
+        """
+        Compile a statement.
+
+        Raises:
+            ValueError: On a syntax error or an unsupported phrase
+        """
+        parser = _StatementParser(_tokenize(statement, "CALL"), "CALL")
+        if parser.peek() == "CALL":
+            parser.take()
+        token = parser.take()
+        if token[0] not in "'\"":
+            raise ValueError(f"CALL: expected a program name literal, found {token}")
+        self.statement = statement
+        self.program_name = token[1:-1]
+        self.registry = registry if registry is not None else PROGRAMS
+        self.arguments: List[str] = []
+        # (argument index or literal bytes, BY CONTENT)
+        self._slots: List[Tuple[Union[int, bytes], bool]] = []
+        if parser.peek() == "USING":
+            parser.take()
+            by_content = False
+            while parser.peek() and parser.peek() not in _PHRASES:
+                if parser.peek() == "BY":
+                    parser.take()
+                    by_content = parser.take("REFERENCE", "CONTENT").upper() == "CONTENT"
+                elif parser.is_literal():
+                    self._slots.append((parser.literal().text.encode(encoding), True))
+                else:
+                    self._slots.append((len(self.arguments), by_content))
+                    self.arguments.append(parser.identifier())
+        parser.end()
+        self._by_reference = all(not by_content for _, by_content in self._slots)
+        # BY CONTENT copies go to one buffer per argument, reused by every CALL
+        self._copies: List[Optional[memoryview]] = [None] * len(self._slots)
+        self._program: Optional[Program] = None
+
+    @property
+    def program(self) -> Program:
+        """The called program, resolved on first use."""
+        if self._program is None:
+            self._program = self.registry.resolve(self.program_name)
+        return self._program
+
+    def __call__(self, *args: Union[Field, Buffer]) -> Any:
+        """
+        Execute the CALL.
+
+        Args:
+            *args: One field (or writable buffer) per data name, in order
+
+        Returns:
+            What the program's body returns
+
+        Raises:
+            ValueError: If the program cannot be found, or the arguments
+                do not match the statement or the program's USING
+        """
+        program = self._program
+        if program is None:
+            program = self.program
+        if len(args) != len(self.arguments):
+            raise ValueError(f"CALL {self.program_name}: {len(self.arguments)} arguments expected, {len(args)} given")
+        if self._by_reference:
+            return program(*args)
+        return program(*[self._pass(index, args) for index in range(len(self._slots))])
+
+    def _pass(self, index: int, args: Tuple[Union[Field, Buffer], ...]) -> Buffer:
+        """The buffer passed for argument ``index``: the caller's, or a copy."""
+        source, by_content = self._slots[index]
+        if source.__class__ is int:
+            arg = args[source]
+            data = arg.view if arg.__class__ is Field else arg
+            if not by_content:
+                return data
+        else:
+            data = source
+        copy = self._copies[index]
+        if copy is None or len(copy) != len(data):
+            copy = self._copies[index] = memoryview(bytearray(data))
+        else:
+            copy[:] = data
+        return copy
+
+    def __repr__(self) -> str:
+        return f"CallPlan({self.statement!r})"
+
+
+@lru_cache(maxsize=None)
+def compile_call(statement: str, registry: Optional[ProgramRegistry] = None, encoding: str = "utf-8") -> CallPlan:
+    """
+    Compile a CALL statement once (cached).
+
+    Raises:
+        ValueError: On a syntax error or an unsupported phrase
+    """
+    return CallPlan(statement, registry, encoding)
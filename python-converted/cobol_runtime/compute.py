@@ -0,0 +1,473 @@
+"""
+COMPUTE statement compiler.
+
+Parses a COBOL COMPUTE statement such as::
+
+    COMPUTE var-result ROUNDED = var-a * var-x ** 2 + var-b * var-x + var-c
+
+once, works out the decimal scale of every intermediate result from the
+PICTUREs of the data items, and generates two Python functions for it:
+- a scalar one on plain scaled ints (exact, as fast as int arithmetic)
+- a batch one on NumPy int64 columns that evaluates the whole file's
+  worth of operands in a few array operations and flags, per element,
+  intermediate overflow, division by zero and results too large for the
+  receiving item (ON SIZE ERROR)
+
+Scales follow the operands: ``+`` and ``-`` align to the larger scale,
+``*`` adds scales, ``**`` takes a non-negative integer literal exponent
+and division keeps ``DIVISION_GUARD`` more decimal places than the
+receiver or its operands. The result is stored with COBOL rules
+(truncation or ROUNDED, high-order truncation) like ``FixedSpec.store``.
+
+Usage:
+    compute = compile_compute(
+        "var-result = var-a * var-x ** 2 + var-b * var-x + var-c",
+        {"var-a": "S9(11)", "var-b": "S9(11)", "var-c": "S9(11)",
+         "var-x": "S9(11)", "var-result": "S9(16)V99"})
+    y = compute.evaluate({"var-a": 2, "var-b": 3, "var-c": 4, "var-x": 5})
+    batch = compute.evaluate_columns({"var-a": a, "var-b": b, "var-c": c, "var-x": x})
+    batch.units, batch.size_error
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from .fixed import Fixed, FixedSpec, Number, SizeError
+from .report import Values, scaled_column
+
+# Extra decimal places kept by intermediate quotients
+DIVISION_GUARD = 2
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<number>\d+(?:\.\d+)?|\.\d+)
+      | (?P<name>[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?)
+      | (?P<op>\*\*|[-+*/()=])
+    )""", re.VERBOSE)
+
+FieldSpec = Union[str, FixedSpec]
+
+
+class ComputeResult(NamedTuple):
+    """
+    Result of a batch COMPUTE.
+
+    Attributes:
+        units: int64 results in units of 10**-scale, as stored in the
+            receiving item (unspecified where ``size_error`` is set)
+        scale: Decimal places of the receiving item
+        size_error: True where ON SIZE ERROR would be raised
+    """
+    units: np.ndarray
+    scale: int
+    size_error: np.ndarray
+
+    def fixed(self, row: int) -> Fixed:
+        """One result as a ``Fixed``."""
+        return Fixed(int(self.units[row]), self.scale)
+
+    def strings(self) -> List[Optional[str]]:
+        """Results as text like ``str(Fixed)`` ("3", "-0.50"), None on a size error."""
+        if self.scale:
+            factor = 10 ** self.scale
+            magnitude = np.abs(self.units)
+            template = f"%s%d.%0{self.scale}d"
+            texts = [template % ("-" if negative else "", whole, fraction)
+                     for negative, whole, fraction in zip((self.units < 0).tolist(),
+                                                          (magnitude // factor).tolist(),
+                                                          (magnitude % factor).tolist())]
+        else:
+            texts = list(map(str, self.units.tolist()))
+        for row in np.flatnonzero(self.size_error).tolist():
+            texts[row] = None
+        return texts
+
+
+# Expression tree: ("num", units, scale), ("var", name), ("neg", node),
+# ("pow", node, exponent) or (operator, left, right)
+Node = Tuple[Any, ...]
+
+
+def _tokenize(text: str) -> List[str]:
+    tokens = []
+    position = 0
+    text = text.strip().rstrip(".").rstrip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"COMPUTE: unexpected '{text[position:].strip()[:10]}'")
+        tokens.append(match.group(match.lastgroup))
+        position = match.end()
+        while position < len(text) and text[position].isspace():
+            position += 1
+    return tokens
+
+
+class _Parser:
+    """Recursive descent over the COMPUTE arithmetic expression grammar."""
+
+    def __init__(self, tokens: List[str]):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self) -> str:
+        return self.tokens[self.position] if self.position < len(self.tokens) else ""
+
+    def take(self, expected: str = "") -> str:
+        token = self.peek()
+        if not token or (expected and token != expected):
+            raise ValueError(f"COMPUTE: expected '{expected or 'operand'}', found '{token}'")
+        self.position += 1
+        return token
+
+    def expression(self) -> Node:
+        node = self.term()
+        while self.peek() in ("+", "-"):
+            node = (self.take(), node, self.term())
+        return node
+
+    def term(self) -> Node:
+        node = self.power()
+        while self.peek() in ("*", "/"):
+            node = (self.take(), node, self.power())
+        return node
+
+    def power(self) -> Node:
+        node = self.unary()
+        while self.peek() == "**":
+            self.take()
+            exponent = self.unary()
+            if exponent[0] != "num" or exponent[2] != 0 or exponent[1] < 0:
+                raise ValueError("COMPUTE: ** needs a non-negative integer literal exponent")
+            node = ("pow", node, exponent[1])
+        return node
+
+    def unary(self) -> Node:
+        if self.peek() in ("+", "-"):
+            sign = self.take()
+            operand = self.unary()
+            if sign == "+":
+                return operand
+            if operand[0] == "num":
+                return ("num", -operand[1], operand[2])
+            return ("neg", operand)
+        return self.primary()
+
+    def primary(self) -> Node:
+        token = self.take()
+        if token == "(":
+            node = self.expression()
+            self.take(")")
+            return node
+        if token[0].isdigit() or token[0] == ".":
+            whole, _, fraction = token.partition(".")
+            return ("num", int(whole + fraction or "0"), len(fraction))
+        if not any(ch.isalpha() for ch in token):
+            raise ValueError(f"COMPUTE: unexpected '{token}'")
+        return ("var", token.upper())
+
+
+def parse_compute(statement: str) -> Tuple[str, bool, Node]:
+    """
+    Parse ``[COMPUTE] target [ROUNDED] = expression``.
+
+    Returns:
+        (target name, ROUNDED, expression tree)
+
+    Raises:
+        ValueError: On a syntax error
+    """
+    tokens = _tokenize(statement)
+    if tokens and tokens[0].upper() == "COMPUTE":
+        tokens = tokens[1:]
+    if len(tokens) < 3:
+        raise ValueError("COMPUTE: expected 'target = expression'")
+    target = tokens[0].upper()
+    rounded = tokens[1].upper() == "ROUNDED"
+    parser = _Parser(tokens[2 if rounded else 1:])
+    parser.take("=")
+    node = parser.expression()
+    if parser.peek():
+        raise ValueError(f"COMPUTE: unexpected '{parser.peek()}'")
+    return target, rounded, node
+
+
+class _Generator:
+    """Emit scalar and batch source for an expression tree, tracking scales."""
+
+    def __init__(self, specs: Dict[str, FixedSpec], result: FixedSpec):
+        self.specs = specs
+        self.result = result
+        self.operands: List[str] = []
+        self.scalar: List[str] = []
+        self.batch: List[str] = []
+
+    def temp(self, scalar: str, batch: str) -> str:
+        name = f"t{len(self.scalar)}"
+        self.scalar.append(f"    {name} = {scalar}")
+        self.batch.append(f"    {name} = {batch}")
+        return name
+
+    def upscale(self, name: str, places: int) -> str:
+        if places <= 0:
+            return name
+        factor = 10 ** places
+        return self.temp(f"{name} * {factor}", f"_up({name}, {factor}, e)")
+
+    def emit(self, node: Node) -> Tuple[str, int]:
+        """Generate code for a node; returns (variable, scale)."""
+        kind = node[0]
+        if kind == "num":
+            return self.temp(repr(node[1]), f"_const({node[1]}, n)"), node[2]
+        if kind == "var":
+            name = node[1]
+            if name not in self.specs:
+                raise ValueError(f"COMPUTE: unknown data name {name}")
+            if name not in self.operands:
+                self.operands.append(name)
+            return f"v{self.operands.index(name)}", self.specs[name].scale
+        if kind == "neg":
+            operand, scale = self.emit(node[1])
+            return self.temp(f"-{operand}", f"-{operand}"), scale
+        if kind == "pow":
+            base, scale = self.emit(node[1])
+            if node[2] == 0:
+                return self.temp("1", "_const(1, n)"), 0
+            result = base
+            for _ in range(node[2] - 1):
+                result = self.temp(f"{result} * {base}", f"_mul({result}, {base}, e)")
+            return result, scale * node[2]
+
+        left, left_scale = self.emit(node[1])
+        right, right_scale = self.emit(node[2])
+        if kind in ("+", "-"):
+            scale = max(left_scale, right_scale)
+            left = self.upscale(left, scale - left_scale)
+            right = self.upscale(right, scale - right_scale)
+            helper = "_add" if kind == "+" else "_sub"
+            return self.temp(f"{left} {kind} {right}", f"{helper}({left}, {right}, e)"), scale
+        if kind == "*":
+            return (self.temp(f"{left} * {right}", f"_mul({left}, {right}, e)"),
+                    left_scale + right_scale)
+        # Division: quotient with ``scale`` places, truncated toward zero
+        scale = max(self.result.scale, left_scale, right_scale) + DIVISION_GUARD
+        shift = scale + right_scale - left_scale
+        if shift >= 0:
+            left = self.upscale(left, shift)
+        else:
+            right = self.upscale(right, -shift)
+        return self.temp(f"_div({left}, {right})", f"_div_columns({left}, {right}, e)"), scale
+
+    def source(self, node: Node) -> Tuple[str, int]:
+        result, scale = self.emit(node)
+        args = ", ".join(f"v{i}" for i in range(len(self.operands)))
+        lines = [f"def scalar({args}):"] + self.scalar + [f"    return {result}", ""]
+        lines += [f"def batch({args}{', ' if args else ''}e, n):"] + self.batch
+        lines += [f"    return {result}", ""]
+        return "\n".join(lines), scale
+
+
+# Helpers used by the generated code
+
+def _div(dividend: int, divisor: int) -> int:
+    if divisor == 0:
+        raise SizeError("Division by zero")
+    quotient = abs(dividend) // abs(divisor)
+    return -quotient if (dividend < 0) != (divisor < 0) else quotient
+
+
+def _const(value: int, rows: int) -> np.ndarray:
+    return np.full(rows, value, dtype=np.int64)
+
+
+def _up(a: np.ndarray, factor: int, e: np.ndarray) -> np.ndarray:
+    e |= np.abs(a) > _INT64_MAX // factor
+    return a * factor
+
+
+def _add(a: np.ndarray, b: np.ndarray, e: np.ndarray) -> np.ndarray:
+    r = a + b
+    e |= ((a ^ r) & (b ^ r)) < 0
+    return r
+
+
+def _sub(a: np.ndarray, b: np.ndarray, e: np.ndarray) -> np.ndarray:
+    r = a - b
+    e |= ((a ^ b) & (a ^ r)) < 0
+    return r
+
+
+def _mul(a: np.ndarray, b: np.ndarray, e: np.ndarray) -> np.ndarray:
+    r = a * b
+    # Without overflow r // a is exactly b
+    e |= (a != 0) & (r // np.where(a == 0, 1, a) != b)
+    return r
+
+
+def _div_columns(a: np.ndarray, b: np.ndarray, e: np.ndarray) -> np.ndarray:
+    zero = b == 0
+    e |= zero
+    b = np.where(zero, 1, b)
+    q = np.abs(a) // np.abs(b)
+    return np.where((a < 0) != (b < 0), -q, q)
+
+
+def _store_columns(r: np.ndarray, scale: int, spec: FixedSpec, rounded: bool,
+                   e: np.ndarray) -> np.ndarray:
+    """FixedSpec.store for a column: rescale, drop the sign if unsigned, check size."""
+    if scale > spec.scale:
+        divisor = 10 ** (scale - spec.scale)
+        magnitude = np.abs(r)
+        if rounded:
+            magnitude = (magnitude + divisor // 2) // divisor
+        else:
+            magnitude //= divisor
+        r = np.where(r < 0, -magnitude, magnitude)
+    elif scale < spec.scale:
+        r = _up(r, 10 ** (spec.scale - scale), e)
+    magnitude = np.abs(r)
+    if spec.limit <= _INT64_MAX:
+        e |= magnitude >= spec.limit
+        magnitude %= spec.limit
+    if not spec.signed:
+        return magnitude
+    return np.where(r < 0, -magnitude, magnitude)
+
+
+def _rescale(units: np.ndarray, scale: int, target: int) -> np.ndarray:
+    """Move int64 units between scales, truncating toward zero."""
+    if target >= scale:
+        return units * 10 ** (target - scale)
+    magnitude = np.abs(units) // 10 ** (scale - target)
+    return np.where(units < 0, -magnitude, magnitude)
+
+
+class Compute:
+    """
+    Compiled COMPUTE statement.
+
+    Attributes:
+        statement: Statement as written
+        target: Receiving data name
+        result: Receiving item
+        rounded: ROUNDED phrase
+        operands: Data names the expression reads, in argument order
+        scale: Decimal places of the unstored expression result
+        source: Generated Python source
+    """
+
+    def __init__(self, statement: str, fields: Mapping[str, FieldSpec]):
+        """
+        Compile a statement.
+
+        Args:
+            statement: ``[COMPUTE] target [ROUNDED] = expression``
+            fields: PICTURE string or FixedSpec of every data name used
+
+        Raises:
+            ValueError: On a syntax error, an unknown data name or a
+                target missing from ``fields``
+        """
+        specs = {
+            name.upper(): spec if isinstance(spec, FixedSpec) else FixedSpec.from_picture(spec)
+            for name, spec in fields.items()
+        }
+        self.statement = statement
+        self.target, self.rounded, tree = parse_compute(statement)
+        if self.target not in specs:
+            raise ValueError(f"COMPUTE: unknown receiving item {self.target}")
+        self.result = specs[self.target]
+        self._operand_specs = specs
+        generator = _Generator(specs, self.result)
+        self.source, self.scale = generator.source(tree)
+        self.operands: Tuple[str, ...] = tuple(generator.operands)
+        namespace = {
+            "_div": _div, "_const": _const, "_up": _up, "_add": _add, "_sub": _sub,
+            "_mul": _mul, "_div_columns": _div_columns,
+        }
+        exec(compile(self.source, f"<compute {self.target}>", "exec"), namespace)
+        self._scalar = namespace["scalar"]
+        self._batch = namespace["batch"]
+
+    def evaluate(self, values: Mapping[str, Number], on_size_error: bool = False) -> Fixed:
+        """
+        Evaluate for one set of operands.
+
+        Each operand is first MOVEd into its item (truncated to its PICTURE).
+
+        Args:
+            values: Operand values keyed by data name
+            on_size_error: Raise SizeError instead of truncating
+
+        Raises:
+            SizeError: On division by zero, or an oversize result with
+                ``on_size_error``
+        """
+        values = {name.upper(): value for name, value in values.items()}
+        units = [self._operand_specs[name].store(values[name]).units for name in self.operands]
+        result = self._scalar(*units)
+        return Fixed(self.result.store_units(result, self.scale, self.rounded, on_size_error),
+                     self.result.scale)
+
+    def evaluate_columns(self, columns: Mapping[str, Union[Values, ComputeResult]],
+                         exact: bool = True) -> ComputeResult:
+        """
+        Evaluate over whole columns of operands with int64 arithmetic.
+
+        Args:
+            columns: NumPy arrays or sequences keyed by data name, all the
+                same length; the ComputeResult of an earlier statement can
+                be passed for the item it stored
+            exact: Re-evaluate rows flagged by an int64 overflow with the
+                scalar (unbounded int) code, so only genuine size errors
+                and divisions by zero stay flagged
+
+        Returns:
+            Stored results with a per-element size error flag
+
+        Raises:
+            OverflowError: If an operand doesn't fit an int64 once scaled
+        """
+        columns = {name.upper(): values for name, values in columns.items()}
+        arguments = []
+        for name in self.operands:
+            spec = self._operand_specs[name]
+            values = columns[name]
+            if isinstance(values, ComputeResult):
+                units = _rescale(values.units, values.scale, spec.scale)
+            else:
+                units = scaled_column(values, spec.scale)
+            # MOVE into the operand's item
+            magnitude = np.abs(units)
+            if spec.limit <= _INT64_MAX:
+                magnitude %= spec.limit
+            arguments.append(np.where(units < 0, -magnitude, magnitude) if spec.signed else magnitude)
+        rows = len(arguments[0]) if arguments else len(next(iter(columns.values()), ()))
+        errors = np.zeros(rows, dtype=bool)
+        with np.errstate(over="ignore"):
+            raw = self._batch(*arguments, errors, rows)
+            units = _store_columns(raw, self.scale, self.result, self.rounded, errors)
+        if exact and errors.any() and self.result.limit <= _INT64_MAX:
+            for row in np.flatnonzero(errors).tolist():
+                try:
+                    raw_row = self._scalar(*(int(column[row]) for column in arguments))
+                    units[row] = self.result.store_units(raw_row, self.scale, self.rounded, True)
+                except SizeError:
+                    continue
+                errors[row] = False
+        return ComputeResult(units.astype(np.int64, copy=False), self.result.scale, errors)
+
+
+@lru_cache(maxsize=None)
+def _cached_compute(statement: str, fields: Tuple[Tuple[str, FieldSpec], ...]) -> Compute:
+    return Compute(statement, dict(fields))
+
+
+def compile_compute(statement: str, fields: Mapping[str, FieldSpec]) -> Compute:
+    """Compile a COMPUTE statement, reusing an earlier compilation of the same one."""
+    return _cached_compute(statement, tuple(sorted(fields.items(), key=lambda item: item[0])))
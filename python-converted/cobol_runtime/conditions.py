@@ -0,0 +1,327 @@
+"""
+Level-88 condition names and class tests.
+
+A condition name's VALUE list is compiled once, for the PICTURE of its
+conditional variable, into the cheapest table that answers it:
+- one range: two comparisons
+- single values only: a frozenset (one hash lookup)
+- numeric ranges over a small span: a bitmask indexed by the value
+- a one-byte alphanumeric item: a 256-entry byte table
+- anything else: a sorted table of merged, non-overlapping ranges
+  searched with ``bisect``
+
+Numeric values are compared as scaled integers at the item's scale (a
+value is taken as the item would hold it, truncated to its decimal
+places); alphanumeric values are compared as bytes, space-padded or cut
+to the item's size, in the native collating sequence.
+
+``test_column`` evaluates a condition for a whole column at once: a
+NumPy array of numbers, a ``(rows, width)`` uint8 matrix of fixed-width
+fields (as sliced from ``columnar.record_matrix``), or a sequence of
+values.
+
+The NUMERIC and ALPHABETIC class tests work on bytes instead of trying
+a conversion and catching the error: one value is tested with
+``bytes.isdigit`` or by deleting the class's bytes with
+``bytes.translate`` (nothing may be left), a column by looking every
+byte up in a 256-entry table.
+
+Usage:
+    plan = compile_condition((("100", "9999"),), parse_picture("S9(9)"))
+    plan.test(150)                                   # True
+    plan.test_column(np.array([5, 100, 10000]))      # [False, True, False]
+    is_numeric(b"123"), is_alphabetic(b"John Doe")   # True, True
+"""
+
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .copybook import NUMERIC, Picture
+from .fixed import _power, _shift, _units
+
+# Largest span (high - low) of numeric values kept as a bitmask
+BITMASK_SPAN = 1 << 16
+
+_DIGITS = b"0123456789"
+# Trailing overpunched signs of signed DISPLAY items: GnuCOBOL and IBM
+_OVERPUNCH = b"pqrstuvwxy}{ABCDEFGHIJKLMNOPQR"
+
+
+def _table(members: bytes) -> np.ndarray:
+    table = np.zeros(256, dtype=bool)
+    table[np.frombuffer(members, dtype=np.uint8)] = True
+    return table
+
+
+_UPPER = bytes(range(ord("A"), ord("Z") + 1))
+_LOWER = bytes(range(ord("a"), ord("z") + 1))
+
+# Byte tables of the class conditions (ALPHABETIC includes the space)
+NUMERIC_TABLE = _table(_DIGITS)
+ALPHABETIC_TABLE = _table(_UPPER + _LOWER + b" ")
+ALPHABETIC_UPPER_TABLE = _table(_UPPER + b" ")
+ALPHABETIC_LOWER_TABLE = _table(_LOWER + b" ")
+
+# The same classes as deletion strings for bytes.translate
+_LETTERS = _UPPER + _LOWER + b" "
+_UPPER_LETTERS = _UPPER + b" "
+_LOWER_LETTERS = _LOWER + b" "
+_LAST_SIGNED = frozenset(_DIGITS + _OVERPUNCH)
+
+Text = Union[bytes, bytearray, memoryview, str]
+
+
+def _bytes(value: Text, encoding: str = "utf-8") -> bytes:
+    return value.encode(encoding) if isinstance(value, str) else bytes(value)
+
+
+def is_numeric(value: Text, signed: bool = False) -> bool:
+    """
+    NUMERIC class test: digits only.
+
+    Args:
+        value: Field contents
+        signed: The item is a signed DISPLAY numeric, whose last byte
+            may carry an overpunched sign
+    """
+    data = value if value.__class__ is bytes else _bytes(value)
+    # bytes.isdigit only accepts ASCII digits (and is False when empty)
+    if signed:
+        return len(data) > 0 and data[-1] in _LAST_SIGNED and (len(data) == 1 or data[:-1].isdigit())
+    return data.isdigit()
+
+
+def is_alphabetic(value: Text) -> bool:
+    """ALPHABETIC class test: letters A-Z, a-z and spaces only."""
+    data = value if value.__class__ is bytes else _bytes(value)
+    return not data.translate(None, _LETTERS)
+
+
+def is_alphabetic_upper(value: Text) -> bool:
+    """ALPHABETIC-UPPER class test: letters A-Z and spaces only."""
+    return not _bytes(value).translate(None, _UPPER_LETTERS)
+
+
+def is_alphabetic_lower(value: Text) -> bool:
+    """ALPHABETIC-LOWER class test: letters a-z and spaces only."""
+    return not _bytes(value).translate(None, _LOWER_LETTERS)
+
+
+def class_column(matrix: np.ndarray, table: np.ndarray) -> np.ndarray:
+    """
+    Class test of every row of a ``(rows, width)`` uint8 matrix.
+
+    Args:
+        matrix: Fixed-width fields, one per row
+        table: NUMERIC_TABLE, ALPHABETIC_TABLE, ...
+
+    Returns:
+        Boolean array, True where every byte of the row is in the class
+    """
+    return table[matrix].all(axis=1)
+
+
+def _merge(ranges: List[Tuple[Any, Any]], step: Any) -> List[Tuple[Any, Any]]:
+    """Sort ranges and merge the overlapping ones (and touching ones when ``step`` is set)."""
+    merged: List[Tuple[Any, Any]] = []
+    for low, high in sorted(ranges):
+        if merged and (low <= merged[-1][1] or (step is not None and low == merged[-1][1] + step)):
+            if high > merged[-1][1]:
+                merged[-1] = (merged[-1][0], high)
+        else:
+            merged.append((low, high))
+    return merged
+
+
+class ConditionPlan:
+    """
+    Compiled VALUE list of a level-88 condition name.
+
+    Attributes:
+        numeric: True when the conditional variable is numeric
+        scale: Decimal places of a numeric variable
+        width: Size in bytes of an alphanumeric variable
+        ranges: Sorted, merged (low, high) ranges: scaled integers for
+            numeric variables, padded bytes otherwise
+        first: The first VALUE literal, which SET ... TO TRUE moves
+        kind: The table used: range, set, bitmask, bytes or bisect
+    """
+
+    def __init__(self, values: Sequence[Tuple[str, Optional[str]]], picture: Optional[Picture] = None,
+                 width: int = 0, encoding: str = "utf-8"):
+        """
+        Compile a VALUE list for a conditional variable.
+
+        Args:
+            values: (low, high) literals; high is None for single values
+            picture: PICTURE of the conditional variable (None for a group)
+            width: Size of a group variable
+            encoding: Character encoding of alphanumeric literals
+
+        Raises:
+            ValueError: If the list is empty, a numeric literal is not a
+                number, or a range is reversed
+        """
+        if not values:
+            raise ValueError("Condition name without values")
+        # Numeric-edited items compare as alphanumeric ones
+        self.numeric = picture is not None and picture.category == NUMERIC
+        self.scale = picture.scale if self.numeric else 0
+        self.width = picture.size if picture is not None else width
+        self.encoding = encoding
+        self.first = values[0][0]
+
+        bounds = [(self._key(low), self._key(high if high is not None else low)) for low, high in values]
+        for (low, high), literals in zip(bounds, values):
+            if high < low:
+                raise ValueError(f"Condition range {literals[0]} THRU {literals[1]} is reversed")
+        self.ranges: Tuple[Tuple[Any, Any], ...] = tuple(_merge(bounds, 1 if self.numeric else None))
+        self._lows = [low for low, _ in self.ranges]
+        self._highs = [high for _, high in self.ranges]
+        self.kind, self._test = self._compile(all(high is None for _, high in values))
+
+    def _key(self, literal: str) -> Any:
+        """A literal as compared: scaled integer or padded bytes."""
+        if not self.numeric:
+            return literal.encode(self.encoding)[:self.width].ljust(self.width)
+        try:
+            units, scale = _units(literal)
+        except ArithmeticError:
+            raise ValueError(f"Condition value '{literal}' is not numeric") from None
+        return self._rescale(units, scale)
+
+    def _rescale(self, units: int, scale: int) -> int:
+        if scale > self.scale:
+            return _shift(units, scale - self.scale)
+        return units * _power(self.scale - scale)
+
+    def _compile(self, single_values: bool) -> Tuple[str, Callable[[Any], bool]]:
+        ranges = self.ranges
+        if len(ranges) == 1:
+            low, high = ranges[0]
+            if low == high:
+                return "range", lambda key: key == low
+            return "range", lambda key: low <= key <= high
+        if single_values:
+            members = frozenset(low for low, _ in ranges)
+            return "set", members.__contains__
+        if not self.numeric and self.width == 1:
+            table = bytearray(256)
+            for low, high in ranges:
+                table[low[0]:high[0] + 1] = b"\x01" * (high[0] - low[0] + 1)
+            table = bytes(table)
+            return "bytes", lambda key: table[key[0]] == 1
+        if self.numeric and ranges[-1][1] - ranges[0][0] < BITMASK_SPAN:
+            base = ranges[0][0]
+            span = ranges[-1][1] - base
+            mask = 0
+            for low, high in ranges:
+                mask |= ((1 << (high - low + 1)) - 1) << (low - base)
+            return "bitmask", lambda key: 0 <= key - base <= span and (mask >> (key - base)) & 1 == 1
+        lows, highs = self._lows, self._highs
+
+        def search(key: Any) -> bool:
+            index = bisect_right(lows, key) - 1
+            return index >= 0 and key <= highs[index]
+        return "bisect", search
+
+    def key(self, value: Any) -> Any:
+        """
+        A value as the table compares it.
+
+        Numbers (int, Decimal, Fixed, numeric text) become scaled integers
+        for numeric variables; text becomes bytes padded to the width.
+        """
+        if not self.numeric:
+            data = _bytes(value, self.encoding)
+            if len(data) == self.width:
+                return data
+            return data[:self.width].ljust(self.width)
+        if value.__class__ is int:
+            return value * _power(self.scale) if self.scale else value
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            value = bytes(value).decode("ascii")
+        return self._rescale(*_units(value))
+
+    def test(self, value: Any) -> bool:
+        """Whether the conditional variable holding ``value`` satisfies the condition."""
+        return self._test(self.key(value))
+
+    __call__ = test
+
+    def test_column(self, column: Union[np.ndarray, Sequence[Any]]) -> np.ndarray:
+        """
+        Evaluate the condition for a whole column.
+
+        Args:
+            column: Numeric values (an int or float array, or a sequence)
+                for numeric variables; a ``(rows, width)`` uint8 matrix or
+                a sequence of str/bytes for alphanumeric ones
+
+        Returns:
+            Boolean array, one entry per row
+        """
+        if self.numeric:
+            keys = self._column_keys(column)
+            low = high = None
+        else:
+            matrix = self._column_matrix(column)
+            if self.width == 1:
+                table = np.zeros(256, dtype=bool)
+                for low, high in self.ranges:
+                    table[low[0]:high[0] + 1] = True
+                return table[matrix[:, 0]]
+            keys = np.ascontiguousarray(matrix).view(f"S{self.width}").ravel()
+        if len(self.ranges) == 1:
+            low, high = self.ranges[0]
+            return (keys >= low) & (keys <= high)
+        if self.kind == "bitmask":
+            # Table with a False guard at both ends, indexed by the clipped offset
+            base = self.ranges[0][0]
+            span = self.ranges[-1][1] - base
+            table = np.zeros(span + 3, dtype=bool)
+            for low, high in self.ranges:
+                table[low - base + 1:high - base + 2] = True
+            return table[np.clip(keys - (base - 1), 0, span + 2)]
+        dtype = keys.dtype
+        lows = np.array(self._lows, dtype=dtype)
+        highs = np.array(self._highs, dtype=dtype)
+        index = np.searchsorted(lows, keys, side="right") - 1
+        return (index >= 0) & (keys <= highs[np.maximum(index, 0)])
+
+    def _column_keys(self, column: Union[np.ndarray, Sequence[Any]]) -> np.ndarray:
+        """Scaled int64 keys of a numeric column."""
+        if isinstance(column, np.ndarray):
+            if column.dtype.kind == "f":
+                # Floats hold values at the item's scale: round, don't truncate
+                return np.rint(column * _power(self.scale)).astype(np.int64)
+            keys = column.astype(np.int64, copy=False)
+            return keys * _power(self.scale) if self.scale else keys
+        return np.fromiter((self.key(value) for value in column), dtype=np.int64, count=len(column))
+
+    def _column_matrix(self, column: Union[np.ndarray, Sequence[Text]]) -> np.ndarray:
+        """A ``(rows, width)`` uint8 matrix of an alphanumeric column."""
+        if isinstance(column, np.ndarray):
+            if column.ndim != 2 or column.shape[1] != self.width:
+                raise ValueError(f"Condition column must be (rows, {self.width}) bytes")
+            return column
+        data = b"".join(self.key(value) for value in column)
+        return np.frombuffer(data, dtype=np.uint8).reshape(len(column), self.width)
+
+    def __repr__(self) -> str:
+        return f"ConditionPlan({self.kind}, {self.ranges!r})"
+
+
+@lru_cache(maxsize=None)
+def compile_condition(values: Tuple[Tuple[str, Optional[str]], ...], picture: Optional[Picture] = None,
+                      width: int = 0, encoding: str = "utf-8") -> ConditionPlan:
+    """
+    Compile a VALUE list once per conditional variable PICTURE (cached).
+
+    Raises:
+        ValueError: If a value does not suit the PICTURE
+    """
+    return ConditionPlan(values, picture, width, encoding)
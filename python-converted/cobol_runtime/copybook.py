@@ -0,0 +1,462 @@
+"""
+Copybook parser.
+
+Reads COBOL data description entries (as found in ``CopyBooks/*.cpy``)
+into a tree of ``DataItem`` objects with byte offsets and sizes resolved,
+ready to be compiled into record codecs by ``cobol_runtime.layout``.
+
+Supported clauses:
+- Level numbers 01-49 and 77
+- Level 66 RENAMES ... THRU, kept on the record they rename
+- Level 88 condition names (VALUE lists with THRU ranges), kept on the
+  item they belong to
+- PIC / PICTURE, VALUE, USAGE, REDEFINES
+- Figurative constants (ZERO, SPACES, ...) in VALUE clauses
+- FILLER and unnamed items
+- Fixed format (sequence area, ``*`` comment indicator) and free format
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+# Default search path for COPY members, like ``cobc -I CopyBooks``
+COPYBOOK_DIR = Path(__file__).resolve().parents[2] / "CopyBooks"
+
+NUMERIC = "numeric"
+ALPHANUMERIC = "alphanumeric"
+ALPHABETIC = "alphabetic"
+NUMERIC_EDITED = "numeric-edited"
+
+# VALUE ZERO etc. are stored as their character with value_all set
+_FIGURATIVE = {
+    "SPACE": " ", "SPACES": " ",
+    "ZERO": "0", "ZEROS": "0", "ZEROES": "0",
+    "QUOTE": '"', "QUOTES": '"',
+    "LOW-VALUE": "\x00", "LOW-VALUES": "\x00",
+    "HIGH-VALUE": "\xff", "HIGH-VALUES": "\xff",
+}
+
+_REPEAT = re.compile(r"(.)\((\d+)\)")
+# A period ends an entry only when followed by whitespace or end of text,
+# so edited pictures such as +z(7).zz survive tokenizing.
+_TOKEN = re.compile(r"""("[^"]*"|'[^']*'|[^\s.]+(?:\.(?!\s|$)[^\s.]*)*|\.)""")
+
+
+@dataclass(frozen=True)
+class Picture:
+    """
+    Parsed PICTURE character-string.
+
+    Attributes:
+        text: Picture string as written (upper-cased)
+        symbols: Picture with repetitions expanded, e.g. X(3) -> XXX
+        category: numeric, alphanumeric, alphabetic or numeric-edited
+        size: Storage size in bytes for USAGE DISPLAY
+        digits: Number of digit positions (9, Z, * and floating symbols)
+        scale: Digits to the right of the implied or actual decimal point
+        signed: True if the picture carries a sign (S, +, -, CR, DB)
+    """
+    text: str
+    symbols: str
+    category: str
+    size: int
+    digits: int
+    scale: int
+    signed: bool
+
+
+@lru_cache(maxsize=None)
+def parse_picture(text: str) -> Picture:
+    """
+    Parse a PICTURE string such as ``9(2)``, ``X(16)`` or ``$Z(7).ZZ``.
+
+    Raises:
+        ValueError: If the picture is empty
+    """
+    pic = text.upper()
+    symbols = _REPEAT.sub(lambda m: m.group(1) * int(m.group(2)), pic)
+    if not symbols:
+        raise ValueError("Empty PICTURE string")
+
+    plain = symbols.replace("CR", "").replace("DB", "")
+    size = sum(1 for ch in plain if ch not in "SVP") + (len(symbols) - len(plain))
+    signed = any(s in symbols for s in ("S", "+", "-", "CR", "DB"))
+
+    if set(symbols) <= set("9SVP"):
+        category = NUMERIC
+    elif set(symbols) <= set("A"):
+        category = ALPHABETIC
+    elif "X" in symbols or "A" in symbols:
+        category = ALPHANUMERIC
+    else:
+        category = NUMERIC_EDITED
+
+    digits = scale = 0
+    if category in (NUMERIC, NUMERIC_EDITED):
+        whole, _, fraction = symbols.partition("V" if "V" in symbols else ".")
+        digits = sum(1 for ch in whole if ch in "9Z*")
+        # A floating insertion string ($$$, +++, ---) holds one digit
+        # less than its length: the leftmost symbol is the insertion
+        for symbol in "+-$":
+            if whole.count(symbol) > 1:
+                digits += whole.count(symbol) - 1
+        scale = sum(1 for ch in fraction if ch in "9Z*")
+        digits += scale
+
+    return Picture(pic, symbols, category, size, digits, scale, signed)
+
+
+@dataclass(frozen=True)
+class ConditionName:
+    """
+    Level-88 condition name.
+
+    Attributes:
+        name: Condition name as written
+        values: (low, high) literals with quotes removed; high is None
+            for a single value, and figurative constants are expanded to
+            fill an alphanumeric item
+    """
+    name: str
+    values: Tuple[Tuple[str, Optional[str]], ...]
+
+
+@dataclass
+class DataItem:
+    """
+    Data description entry from a copybook.
+
+    Attributes:
+        level: Level number (01-49, 66, 77)
+        name: Data name as written, FILLER for unnamed items
+        picture: Parsed PICTURE clause for elementary items
+        value: VALUE literal with quotes removed, or None
+        value_all: True for VALUE ALL (literal repeated to fill the item)
+        usage: USAGE clause (DISPLAY unless stated otherwise)
+        redefines: Name of the item this one redefines
+        renames: For level 66, the first and last (THRU) item renamed
+        children: Subordinate items of a group
+        renamings: Level-66 items that rename parts of this record
+        conditions: Level-88 condition names on this item
+        offset: Byte offset within the 01-level record
+        size: Size in bytes
+    """
+    level: int
+    name: str
+    picture: Optional[Picture] = None
+    value: Optional[str] = None
+    value_all: bool = False
+    usage: str = "DISPLAY"
+    redefines: Optional[str] = None
+    renames: Optional[Tuple[str, str]] = None
+    children: List["DataItem"] = field(default_factory=list)
+    renamings: List["DataItem"] = field(default_factory=list)
+    conditions: List[ConditionName] = field(default_factory=list)
+    offset: int = 0
+    size: int = 0
+
+    @property
+    def is_group(self) -> bool:
+        return self.picture is None
+
+    @property
+    def is_filler(self) -> bool:
+        return self.name.upper() == "FILLER"
+
+    @property
+    def attr(self) -> str:
+        """Python identifier for the item, e.g. PERSON-ID -> person_id."""
+        return self.name.lower().replace("-", "_")
+
+    def elementary(self) -> Iterator["DataItem"]:
+        """Yield elementary items in storage order (depth first)."""
+        if self.is_group:
+            for child in self.children:
+                yield from child.elementary()
+        else:
+            yield self
+
+    def find(self, name: str) -> Optional["DataItem"]:
+        """Find a subordinate item (or this one) by name, case-insensitive."""
+        if self.name.upper() == name.upper():
+            return self
+        for child in self.children:
+            found = child.find(name)
+            if found is not None:
+                return found
+        return None
+
+
+_USAGES = {
+    "DISPLAY": "DISPLAY",
+    "COMP": "COMP", "COMPUTATIONAL": "COMP", "BINARY": "COMP",
+    "COMP-3": "COMP-3", "COMPUTATIONAL-3": "COMP-3", "PACKED-DECIMAL": "COMP-3",
+    "COMP-5": "COMP-5", "COMPUTATIONAL-5": "COMP-5",
+}
+
+
+def _is_fixed_format(lines: List[str]) -> bool:
+    """
+    Whether source lines are in fixed format: some line has a six-digit
+    sequence number in columns 1-6, or blank columns 1-6 and a comment
+    indicator in column 7 (indentation alone decides nothing).
+    """
+    for line in lines:
+        if len(line) < 7:
+            continue
+        if line[:6].isdigit() or (not line[:6].strip() and line[6] in "*/" and line[7:8] != ">"):
+            return True
+    return False
+
+
+def _source_lines(text: str) -> Iterator[str]:
+    """
+    Strip sequence/indicator areas and comments from source lines.
+
+    The format is decided once for the whole source.
+
+    Raises:
+        ValueError: If a fixed-format line has code in columns 1-7
+    """
+    lines = text.splitlines()
+    fixed = _is_fixed_format(lines)
+    for number, line in enumerate(lines, 1):
+        if fixed and line.strip():
+            # Columns 1-6 sequence, 7 indicator, 8-72 code
+            sequence = line[:6]
+            if (sequence.strip() and not sequence.isdigit()) or line[6:7] not in ("", " ", "*", "/", "-", "D", "d"):
+                raise ValueError(f"Copybook line {number} is not in fixed format: {line.strip()!r}")
+            if line[6:7] in ("*", "/"):
+                continue
+            line = line[7:72]
+        elif line.lstrip().startswith("*"):
+            continue
+        yield line.split("*>", 1)[0]
+
+
+def _entries(text: str) -> Iterator[List[str]]:
+    """Yield the tokens of each period-terminated entry."""
+    tokens: List[str] = []
+    for line in _source_lines(text):
+        for token in _TOKEN.findall(line):
+            if token == ".":
+                if tokens:
+                    yield tokens
+                tokens = []
+            else:
+                tokens.append(token)
+    if tokens:
+        yield tokens
+
+
+def _parse_entry(tokens: List[str]) -> Optional[DataItem]:
+    if not tokens[0].isdigit():
+        return None
+    level = int(tokens[0])
+    if level == 66:
+        return _parse_renames(tokens)
+
+    rest = tokens[1:]
+    name = "FILLER"
+    if rest and rest[0].upper() not in ("PIC", "PICTURE", "VALUE", "VALUES", "USAGE", "REDEFINES") \
+            and rest[0].upper() not in _USAGES:
+        name, rest = rest[0], rest[1:]
+    item = DataItem(level, name)
+
+    i = 0
+    while i < len(rest):
+        word = rest[i].upper()
+        if word in ("PIC", "PICTURE"):
+            i += 1
+            if i < len(rest) and rest[i].upper() == "IS":
+                i += 1
+            item.picture = parse_picture(rest[i])
+        elif word in ("VALUE", "VALUES"):
+            i += 1
+            if i < len(rest) and rest[i].upper() in ("IS", "ARE"):
+                i += 1
+            if rest[i].upper() == "ALL":
+                i += 1
+                item.value_all = True
+            if rest[i].upper() in _FIGURATIVE:
+                item.value = _FIGURATIVE[rest[i].upper()]
+                item.value_all = True
+            else:
+                item.value = rest[i].strip("\"'")
+        elif word == "REDEFINES":
+            i += 1
+            item.redefines = rest[i]
+        elif word == "USAGE":
+            i += 1
+            if i < len(rest) and rest[i].upper() == "IS":
+                i += 1
+            item.usage = _USAGES[rest[i].upper()]
+        elif word in _USAGES:
+            item.usage = _USAGES[word]
+        elif word == "OCCURS":
+            raise ValueError(f"OCCURS is not supported (item {name})")
+        i += 1
+    return item
+
+
+def _parse_condition(tokens: List[str], owner: DataItem) -> ConditionName:
+    """Parse ``88 name VALUE[S] [IS|ARE] lit [THRU lit] ...`` for ``owner``."""
+    words = [w for w in (t.rstrip(",") for t in tokens[2:]) if w]
+    if not words or words[0].upper() not in ("VALUE", "VALUES"):
+        raise ValueError(f"Condition name {tokens[1]} needs a VALUE clause")
+    words = words[1:]
+    if words and words[0].upper() in ("IS", "ARE"):
+        words = words[1:]
+    text = owner.picture is not None and owner.picture.category not in (NUMERIC, NUMERIC_EDITED)
+
+    def literal(word: str) -> str:
+        figurative = _FIGURATIVE.get(word.upper())
+        if figurative is None:
+            return word.strip("\"'")
+        return figurative * owner.picture.size if text else figurative
+
+    values: List[Tuple[str, Optional[str]]] = []
+    i = 0
+    while i < len(words):
+        low = literal(words[i])
+        if i + 2 < len(words) and words[i + 1].upper() in ("THRU", "THROUGH"):
+            values.append((low, literal(words[i + 2])))
+            i += 3
+        else:
+            values.append((low, None))
+            i += 1
+    if not values:
+        raise ValueError(f"Condition name {tokens[1]} has no values")
+    return ConditionName(tokens[1], tuple(values))
+
+
+def _parse_renames(tokens: List[str]) -> DataItem:
+    """Parse ``66 name RENAMES first [THRU last]``."""
+    words = [t.upper() for t in tokens]
+    if len(words) not in (4, 6) or words[2] != "RENAMES" or \
+            (len(words) == 6 and words[4] not in ("THRU", "THROUGH")):
+        raise ValueError(f"Invalid RENAMES entry: {' '.join(tokens)}")
+    return DataItem(66, tokens[1], renames=(tokens[3], tokens[-1]))
+
+
+def _resolve_renames(record: DataItem, item: DataItem) -> None:
+    """Set the offset and size of a level-66 item from the items it renames."""
+    first, last = (record.find(name) for name in item.renames)
+    if first is None or last is None or record is first or record is last:
+        raise ValueError(f"{item.name} RENAMES unknown item {' THRU '.join(item.renames)}")
+    end = max(first.offset + first.size, last.offset + last.size)
+    if last.offset < first.offset:
+        raise ValueError(f"{item.name}: {last.name} precedes {first.name}")
+    item.offset = first.offset
+    item.size = end - first.offset
+    if first is last:
+        # Renaming one item keeps its PICTURE and USAGE
+        item.picture, item.usage = first.picture, first.usage
+
+
+def _assign_offsets(item: DataItem, offset: int, siblings: List[DataItem]) -> int:
+    """Resolve offset/size recursively; returns the offset after the item."""
+    if item.redefines:
+        target = next((s for s in siblings if s.name.upper() == item.redefines.upper()), None)
+        if target is None:
+            raise ValueError(f"{item.name} REDEFINES unknown item {item.redefines}")
+        offset = target.offset
+    item.offset = offset
+
+    if item.is_group:
+        position = end = offset
+        for index, child in enumerate(item.children):
+            child_end = _assign_offsets(child, position, item.children[:index])
+            end = max(end, child_end)
+            if not child.redefines:
+                position = child_end
+        item.size = end - offset
+    elif item.usage == "DISPLAY":
+        item.size = item.picture.size
+    else:
+        item.size = _binary_size(item)
+    return offset + item.size
+
+
+def _binary_size(item: DataItem) -> int:
+    """Storage size for COMP / COMP-3 items."""
+    digits = item.picture.digits
+    if item.usage == "COMP-3":
+        return digits // 2 + 1
+    for size, max_digits in ((2, 4), (4, 9), (8, 18)):
+        if digits <= max_digits:
+            return size
+    raise ValueError(f"{item.name}: binary items are limited to 18 digits")
+
+
+def parse_copybook(text: str) -> List[DataItem]:
+    """
+    Parse copybook source into its 01/77-level records.
+
+    Args:
+        text: Copybook or DATA DIVISION source text
+
+    Returns:
+        List of top-level DataItem records with offsets resolved
+
+    Raises:
+        ValueError: If an entry cannot be laid out
+    """
+    records: List[DataItem] = []
+    stack: List[DataItem] = []
+    for tokens in _entries(text):
+        if tokens[0] == "88":
+            if not stack:
+                raise ValueError(f"Level 88 {tokens[1]} has no item to belong to")
+            stack[-1].conditions.append(_parse_condition(tokens, stack[-1]))
+            continue
+        item = _parse_entry(tokens)
+        if item is None:
+            continue
+        if item.level == 66:
+            if not records:
+                raise ValueError(f"Level 66 {item.name} has no record to rename")
+            records[-1].renamings.append(item)
+            continue
+        if item.level in (1, 77) or not stack:
+            records.append(item)
+            stack = [item]
+            continue
+        while stack and stack[-1].level >= item.level:
+            stack.pop()
+        if not stack:
+            raise ValueError(f"Level {item.level:02d} {item.name} has no parent group")
+        stack[-1].children.append(item)
+        stack.append(item)
+
+    for index, record in enumerate(records):
+        _assign_offsets(record, 0, records[:index])
+        for item in record.renamings:
+            _resolve_renames(record, item)
+    return records
+
+
+def resolve_copybook(name: Union[str, Path]) -> Path:
+    """
+    Locate a copybook the way COPY does.
+
+    Bare member names (``SampleDataRow``) are looked up in COPYBOOK_DIR
+    with a ``.cpy`` extension; explicit paths are used as given.
+    """
+    path = Path(name)
+    if path.exists():
+        return path.resolve()
+    candidate = COPYBOOK_DIR / path
+    if not candidate.suffix:
+        candidate = candidate.with_suffix(".cpy")
+    if not candidate.exists():
+        raise FileNotFoundError(f"Copybook '{name}' not found")
+    return candidate
+
+
+def load_copybook(name: Union[str, Path]) -> List[DataItem]:
+    """Read and parse a copybook by member name or path."""
+    return parse_copybook(resolve_copybook(name).read_text(encoding="utf-8"))
@@ -0,0 +1,384 @@
+"""
+Scaled-integer fixed-point arithmetic with COBOL semantics.
+
+A ``Fixed`` holds a Python int of units and a scale: ``Fixed(31721, 2)``
+is 317.21. Addition, subtraction, multiplication and integer powers are
+exact int operations (the scale of a product is the sum of the scales),
+so intermediate results never drift the way floats do and avoid the
+context machinery of ``decimal``.
+
+Results are stored into a receiving item described by a ``FixedSpec``
+(the digits, scale and sign of its PICTURE), which applies the COBOL
+rules:
+- excess decimal places are truncated, or rounded half away from zero
+  with ROUNDED
+- an unsigned receiver keeps the absolute value
+- a result too large for the integer digits is truncated on the left,
+  or raises ``SizeError`` when the statement has ON SIZE ERROR
+
+Usage:
+    result = FixedSpec.from_picture("z(15)9.99")
+    a, x = Fixed.of("2"), Fixed.of("1.5")
+    y = result.store(a * x ** 2 + 3, rounded=True, on_size_error=True)
+    quotient, remainder = divide_remainder(10, 3, FixedSpec(10, 2), FixedSpec(10, 2))
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Tuple, Union
+
+from .copybook import parse_picture
+
+# Decimal places kept by ``/`` before the result is stored; COMPUTE
+# truncates to the receiver afterwards
+DIVISION_SCALE = 18
+
+Number = Union["Fixed", int, Decimal, str, float]
+
+
+class SizeError(OverflowError):
+    """ON SIZE ERROR: a result does not fit the receiving item, or division by zero."""
+
+
+# 10**n for the scales that occur in practice
+_POWERS = [10 ** n for n in range(64)]
+
+
+def _power(places: int) -> int:
+    """10**places, from the table when it is there (products can exceed it)."""
+    return _POWERS[places] if places < 64 else 10 ** places
+
+
+def _shift(units: int, places: int, rounded: bool = False) -> int:
+    """Drop ``places`` decimal digits, truncating toward zero or rounding half away."""
+    divisor = _power(places)
+    if units >= 0:
+        return (units + divisor // 2) // divisor if rounded else units // divisor
+    return -((-units + divisor // 2) // divisor) if rounded else -(-units // divisor)
+
+
+def _units(value: Any) -> Tuple[int, int]:
+    """(units, scale) of a number; floats go through their shortest repr."""
+    if value.__class__ is int:
+        return value, 0
+    if isinstance(value, Fixed):
+        return value.units, value.scale
+    if value.__class__ is str:
+        # Plain [sign]digits[.digits] without the Decimal round trip
+        text = value.strip()
+        signed = text[:1] in ("+", "-")
+        whole, _, fraction = text[signed:].partition(".")
+        digits = whole + fraction
+        if digits.isascii() and digits.isdigit():
+            units = int(digits)
+            return (-units if text[0] == "-" else units), len(fraction)
+    if isinstance(value, float):
+        value = repr(value)
+    number = value if isinstance(value, Decimal) else Decimal(str(value).strip())
+    if not number.is_finite():
+        raise ValueError(f"Not a finite number: {value}")
+    sign, digits, exponent = number.as_tuple()
+    units = int("".join(map(str, digits)) or "0")
+    if exponent > 0:
+        units *= 10 ** exponent
+        exponent = 0
+    return (-units if sign else units), -exponent
+
+
+class Fixed:
+    """
+    Fixed-point number: ``units * 10**-scale``.
+
+    Attributes:
+        units: Scaled integer value
+        scale: Decimal places
+    """
+
+    __slots__ = ("units", "scale")
+
+    def __init__(self, units: int = 0, scale: int = 0):
+        self.units = units
+        self.scale = scale
+
+    @classmethod
+    def of(cls, value: Number) -> "Fixed":
+        """
+        Convert an int, Decimal, numeric string or float exactly.
+
+        Raises:
+            ValueError: If the value is not a finite number
+        """
+        if value.__class__ is cls:
+            return value
+        try:
+            return cls(*_units(value))
+        except ArithmeticError:
+            raise ValueError(f"Not a number: {value!r}") from None
+
+    def rescale(self, scale: int, rounded: bool = False) -> "Fixed":
+        """Same value with ``scale`` decimal places, truncated or ROUNDED."""
+        if scale >= self.scale:
+            return Fixed(self.units * 10 ** (scale - self.scale), scale)
+        return Fixed(_shift(self.units, self.scale - scale, rounded), scale)
+
+    def divide(self, other: Number, scale: int, rounded: bool = False) -> "Fixed":
+        """
+        Quotient with ``scale`` decimal places, truncated or ROUNDED.
+
+        Raises:
+            SizeError: On division by zero
+        """
+        units, other_scale = _units(other)
+        # self / other = (u1 / u2) * 10**(s2 - s1)
+        places = scale + other_scale - self.scale
+        if places >= 0:
+            return Fixed(_quotient(self.units, units, places, rounded), scale)
+        return Fixed(_quotient(self.units, units * _power(-places), 0, rounded), scale)
+
+    # Arithmetic: exact except for ``/``
+
+    def __add__(self, other: Number) -> "Fixed":
+        if other.__class__ is Fixed:
+            units, scale = other.units, other.scale
+        elif other.__class__ is int:
+            return Fixed(self.units + other * _power(self.scale), self.scale)
+        else:
+            units, scale = _units(other)
+        if scale == self.scale:
+            return Fixed(self.units + units, scale)
+        if scale > self.scale:
+            return Fixed(self.units * _power(scale - self.scale) + units, scale)
+        return Fixed(self.units + units * _power(self.scale - scale), self.scale)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> "Fixed":
+        return Fixed(-self.units, self.scale)
+
+    def __pos__(self) -> "Fixed":
+        return self
+
+    def __abs__(self) -> "Fixed":
+        return Fixed(abs(self.units), self.scale)
+
+    def __sub__(self, other: Number) -> "Fixed":
+        if other.__class__ is Fixed and other.scale == self.scale:
+            return Fixed(self.units - other.units, self.scale)
+        return self + -Fixed.of(other)
+
+    def __rsub__(self, other: Number) -> "Fixed":
+        return Fixed.of(other) + -self
+
+    def __mul__(self, other: Number) -> "Fixed":
+        if other.__class__ is Fixed:
+            return Fixed(self.units * other.units, self.scale + other.scale)
+        if other.__class__ is int:
+            return Fixed(self.units * other, self.scale)
+        units, scale = _units(other)
+        return Fixed(self.units * units, self.scale + scale)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Number) -> "Fixed":
+        return self.divide(other, max(self.scale, DIVISION_SCALE))
+
+    def __rtruediv__(self, other: Number) -> "Fixed":
+        return Fixed.of(other) / self
+
+    def __pow__(self, exponent: int) -> "Fixed":
+        if exponent.__class__ is not int or exponent < 0:
+            raise ValueError("Fixed supports non-negative integer exponents only")
+        return Fixed(self.units ** exponent, self.scale * exponent)
+
+    # Comparison and conversion
+
+    def _compare(self, other: Any) -> Tuple[int, int]:
+        units, scale = _units(other)
+        if scale > self.scale:
+            return self.units * 10 ** (scale - self.scale), units
+        return self.units, units * 10 ** (self.scale - scale)
+
+    def __eq__(self, other: Any) -> bool:
+        try:
+            mine, theirs = self._compare(other)
+        except (TypeError, ValueError, ArithmeticError):
+            return NotImplemented
+        return mine == theirs
+
+    def __lt__(self, other: Number) -> bool:
+        mine, theirs = self._compare(other)
+        return mine < theirs
+
+    def __le__(self, other: Number) -> bool:
+        mine, theirs = self._compare(other)
+        return mine <= theirs
+
+    def __gt__(self, other: Number) -> bool:
+        mine, theirs = self._compare(other)
+        return mine > theirs
+
+    def __ge__(self, other: Number) -> bool:
+        mine, theirs = self._compare(other)
+        return mine >= theirs
+
+    def __hash__(self) -> int:
+        return hash(self.to_decimal())
+
+    def __bool__(self) -> bool:
+        return self.units != 0
+
+    def __int__(self) -> int:
+        return _shift(self.units, self.scale) if self.scale else self.units
+
+    def __float__(self) -> float:
+        return self.units / 10 ** self.scale
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.units).scaleb(-self.scale)
+
+    def __str__(self) -> str:
+        if not self.scale:
+            return str(self.units)
+        digits = "%0*d" % (self.scale + 1, abs(self.units))
+        sign = "-" if self.units < 0 else ""
+        return f"{sign}{digits[:-self.scale]}.{digits[-self.scale:]}"
+
+    def __repr__(self) -> str:
+        return f"Fixed('{self}')"
+
+    def __format__(self, spec: str) -> str:
+        return format(self.to_decimal(), spec)
+
+
+@dataclass(frozen=True)
+class FixedSpec:
+    """
+    Receiving item of an arithmetic statement: PIC S9(n)V9(m).
+
+    Attributes:
+        digits: Total digit positions (integer and decimal)
+        scale: Decimal places
+        signed: Whether the item keeps a sign
+    """
+    digits: int
+    scale: int = 0
+    signed: bool = True
+    limit: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "limit", 10 ** self.digits)
+
+    @classmethod
+    def from_picture(cls, picture: str) -> "FixedSpec":
+        """Receiver for a numeric or numeric-edited PICTURE, e.g. ``S9(5)V99``."""
+        parsed = parse_picture(picture)
+        if not parsed.digits:
+            raise ValueError(f"PICTURE {picture} is not numeric")
+        return cls(parsed.digits, parsed.scale, parsed.signed)
+
+    def store(self, value: Number, rounded: bool = False, on_size_error: bool = False) -> Fixed:
+        """
+        Store a result as MOVE/COMPUTE would.
+
+        Args:
+            value: Result of the arithmetic
+            rounded: ROUNDED phrase (half away from zero); otherwise truncate
+            on_size_error: Raise SizeError instead of truncating high-order
+                digits when the result does not fit
+
+        Returns:
+            The value as held by the receiving item
+
+        Raises:
+            SizeError: If ``on_size_error`` is set and the value doesn't fit
+        """
+        if value.__class__ is Fixed:
+            units, scale = value.units, value.scale
+        else:
+            units, scale = _units(value)
+        return Fixed(self.store_units(units, scale, rounded, on_size_error), self.scale)
+
+    def store_units(self, units: int, scale: int, rounded: bool = False,
+                    on_size_error: bool = False) -> int:
+        """
+        ``store`` on a raw scaled integer, for loops that keep plain ints.
+
+        Args:
+            units: Result in units of 10**-scale
+            scale: Decimal places of ``units``
+
+        Returns:
+            The stored value in units of 10**-self.scale
+        """
+        if scale > self.scale:
+            units = _shift(units, scale - self.scale, rounded)
+        elif scale < self.scale:
+            units *= _power(self.scale - scale)
+        if not self.signed and units < 0:
+            units = -units
+        limit = self.limit
+        if -limit < units < limit:
+            return units
+        if on_size_error:
+            raise SizeError(f"{Fixed(units, self.scale)} does not fit {self.digits} digits")
+        return units % limit if units >= 0 else -(-units % limit)
+
+
+def _quotient(dividend: int, divisor: int, places: int, rounded: bool) -> int:
+    """dividend / divisor * 10**places, truncated toward zero or ROUNDED."""
+    if divisor == 0:
+        raise SizeError("Division by zero")
+    if rounded:
+        return _shift(_quotient(dividend, divisor, places + 1, False), 1, True)
+    numerator = abs(dividend) * _power(places)
+    quotient = numerator // abs(divisor)
+    return -quotient if (dividend < 0) != (divisor < 0) else quotient
+
+
+def divide_remainder(
+    dividend: Number,
+    divisor: Number,
+    quotient: FixedSpec,
+    remainder: FixedSpec,
+    rounded: bool = False,
+    on_size_error: bool = False,
+) -> Tuple[Fixed, Fixed]:
+    """
+    DIVIDE dividend BY divisor GIVING quotient REMAINDER remainder.
+
+    The remainder is ``dividend - q * divisor`` where q is the quotient
+    truncated to the quotient item's decimal places, as COBOL defines it
+    (even when the stored quotient is ROUNDED).
+
+    Returns:
+        (quotient, remainder) as stored in their items
+
+    Raises:
+        SizeError: On division by zero, or an oversize result with
+            ``on_size_error``
+    """
+    dividend_units, dividend_scale = _units(dividend)
+    divisor_units, divisor_scale = _units(divisor)
+    places = quotient.scale + divisor_scale - dividend_scale
+    if places >= 0:
+        truncated = _quotient(dividend_units, divisor_units, places, False)
+    else:
+        truncated = _quotient(dividend_units, divisor_units * _power(-places), 0, False)
+    if rounded:
+        stored = Fixed(dividend_units, dividend_scale).divide(divisor, quotient.scale, True)
+        result = quotient.store(stored, on_size_error=on_size_error)
+    else:
+        result = Fixed(quotient.store_units(truncated, quotient.scale, False, on_size_error),
+                       quotient.scale)
+
+    # dividend - truncated quotient * divisor, at the finer of the two scales
+    product_scale = quotient.scale + divisor_scale
+    product = quotient.store_units(truncated, quotient.scale) * divisor_units
+    if dividend_scale >= product_scale:
+        rest = dividend_units - product * _power(dividend_scale - product_scale)
+        rest_scale = dividend_scale
+    else:
+        rest = dividend_units * _power(product_scale - dividend_scale) - product
+        rest_scale = product_scale
+    return result, Fixed(remainder.store_units(rest, rest_scale, False, on_size_error),
+                         remainder.scale)
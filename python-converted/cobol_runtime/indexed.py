@@ -0,0 +1,732 @@
+"""
+Indexed (ISAM) file engine.
+
+Python counterpart of ``ORGANIZATION IS INDEXED`` files with a RECORD
+KEY and ACCESS IS DYNAMIC. Records live in the leaves of a page-based
+B+tree stored in a single file, so every keyed operation touches
+O(log n) pages and memory use does not grow with the file:
+- WRITE: insert a new record (INVALID KEY 22 on duplicates)
+- READ: random read by key (INVALID KEY 23 if missing)
+- START: position with KEY =, >= or > (INVALID KEY 23 if no record)
+- READ NEXT: sequential read in key order from the current position
+- REWRITE / DELETE: replace or remove the record with a given key
+
+File format (big-endian):
+- Page 0: header (magic, geometry, root page, page and record counts)
+- Leaf pages: kind, count, next-leaf pointer, then whole records
+- Internal pages: kind, count, then child pointers and separator keys
+
+Pages are read and written through a ``PageCache`` (shared by default),
+so hot pages such as the root stay in memory and modified pages are
+written back when evicted or on CLOSE. READ NEXT reads ahead: a missed
+leaf is fetched together with the pages that follow it in one read.
+
+Durability options:
+- ``wal=True``: changed pages are logged to ``<file>.wal`` and are only
+  written to the data file after they are committed. A commit groups up
+  to ``group_size`` WRITE/REWRITE/DELETE operations behind one fsync;
+  after a crash the next OPEN replays every complete commit.
+- ``bulk=True``: WRITEs are staged in an external sort (spilling to work
+  files next to the data file) and the index is built bottom-up at
+  CLOSE (or before the next operation that needs it), with leaves
+  packed full and laid out in key order. Duplicate keys found then are
+  skipped and listed in ``duplicates``.
+
+Deleted entries leave room in their leaf for later inserts; pages are
+not merged or returned to the file.
+"""
+
+import os
+import struct
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .layout import RecordCodec
+from .pagecache import PageCache, shared_cache
+from .sort import ExternalSorter
+from .wal import WriteAheadLog, recover, sync, wal_path
+
+MAGIC = b"PYISAM01"
+DEFAULT_PAGE_SIZE = 4096
+DEFAULT_PREFETCH = 8
+DEFAULT_GROUP_SIZE = 1000
+DEFAULT_CHECKPOINT_BYTES = 64 * 1024 * 1024
+
+_HEADER = struct.Struct(">8sIIIIIIQ")
+_NODE = struct.Struct(">BHI")
+_CHILD = struct.Struct(">I")
+LEAF = 1
+INTERNAL = 2
+
+# COBOL file status codes for INVALID KEY conditions
+STATUS_DUPLICATE_KEY = "22"
+STATUS_KEY_NOT_FOUND = "23"
+
+KeyLike = Union[bytes, str, int]
+
+
+class InvalidKeyError(KeyError):
+    """
+    INVALID KEY condition raised by keyed operations.
+
+    Attributes:
+        status: COBOL file status ("22" duplicate key, "23" not found)
+        key: Key bytes involved
+    """
+
+    def __init__(self, status: str, key: bytes):
+        super().__init__(key)
+        self.status = status
+        self.key = key
+
+    def __str__(self) -> str:
+        return f"INVALID KEY (status {self.status}): {self.key!r}"
+
+
+class Node:
+    """
+    In-memory copy of one B+tree page.
+
+    Attributes:
+        page: Page number in the file
+        leaf: True for leaf pages
+        keys: Sorted keys (record keys in leaves, separators otherwise)
+        values: Records (leaf) or child page numbers (internal)
+        next: Next leaf page, 0 at the end of the chain
+    """
+
+    __slots__ = ("page", "leaf", "keys", "values", "next")
+
+    def __init__(self, page: int, leaf: bool, keys: List[bytes], values: list, next_page: int = 0):
+        self.page = page
+        self.leaf = leaf
+        self.keys = keys
+        self.values = values
+        self.next = next_page
+
+
+class IndexedFile:
+    """
+    B+tree indexed file with COBOL DYNAMIC access semantics.
+
+    Usage:
+        with IndexedFile("output.dat", "output", record_length=44,
+                         key_offset=0, key_length=3) as people:
+            people.write(record)
+
+    Attributes:
+        path: File path
+        record_length: Record length in bytes
+        key_offset: Offset of the RECORD KEY within a record
+        key_length: Length of the RECORD KEY
+        page_size: Bytes per page
+        group_size: Operations per WAL commit
+        bulk: WRITEs are staged until CLOSE
+        duplicates: Keys of staged WRITEs rejected as duplicates
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        mode: str = "io",
+        record_length: Optional[int] = None,
+        key_offset: int = 0,
+        key_length: Optional[int] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cache: Optional[PageCache] = None,
+        prefetch: int = DEFAULT_PREFETCH,
+        wal: bool = False,
+        group_size: int = DEFAULT_GROUP_SIZE,
+        bulk: bool = False,
+    ):
+        """
+        Open an indexed file.
+
+        Args:
+            path: File path
+            mode: "output" creates (or truncates) the file; "input" and
+                "io" open an existing file read-only or read-write
+            record_length: Record length (required for "output")
+            key_offset: RECORD KEY offset (for "output")
+            key_length: RECORD KEY length (required for "output")
+            page_size: Page size for new files; grown if a page would
+                hold fewer than four records
+            cache: Page cache to use (defaults to the shared cache)
+            prefetch: Pages read at once when READ NEXT misses (1 disables
+                read-ahead)
+            wal: Log changes and commit them in groups (crash safe)
+            group_size: Operations per commit when ``wal`` is set
+            bulk: Stage WRITEs and build the index at CLOSE
+
+        Raises:
+            FileNotFoundError: If an input/io file doesn't exist
+            ValueError: On a bad mode, geometry or file header
+        """
+        if mode not in ("input", "output", "io"):
+            raise ValueError(f"Unknown open mode '{mode}'")
+        self.path = Path(path)
+        self.mode = mode
+        self.cache = cache if cache is not None else shared_cache()
+        self.prefetch = max(1, prefetch)
+        self.group_size = max(1, group_size)
+        self.checkpoint_bytes = DEFAULT_CHECKPOINT_BYTES
+        self.bulk = bulk
+        self.duplicates: List[bytes] = []
+        self._staged: Optional[ExternalSorter] = None
+        self._wal: Optional[WriteAheadLog] = None
+        # Pages changed since the last commit; they stay out of the data
+        # file until they are in the log
+        self._pending: Dict[int, Node] = {}
+        self._pending_ops = 0
+
+        if mode == "output":
+            if not record_length or not key_length:
+                raise ValueError("record_length and key_length are required to create a file")
+            if key_offset < 0 or key_offset + key_length > record_length:
+                raise ValueError("RECORD KEY lies outside the record")
+            while (page_size - _NODE.size) // record_length < 4:
+                page_size *= 2
+            self.page_size = page_size
+            self.record_length = record_length
+            self.key_offset = key_offset
+            self.key_length = key_length
+            if wal_path(self.path).exists():
+                wal_path(self.path).unlink()
+            self._file = open(self.path, "w+b")
+            self._page_count = 1
+            self._record_count = 0
+            self._root = self._allocate()
+            self._write_node(Node(self._root, True, [], []))
+            self._write_header()
+        else:
+            recover(self.path)
+            self._file = open(self.path, "rb" if mode == "input" else "r+b")
+            self._read_header()
+
+        self._leaf_capacity = (self.page_size - _NODE.size) // self.record_length
+        self._internal_capacity = (self.page_size - _NODE.size - _CHILD.size) // (self.key_length + _CHILD.size)
+        self._key_slice = slice(self.key_offset, self.key_offset + self.key_length)
+
+        # Sequential position: the next READ NEXT returns the first record
+        # with key > _position_key (>= when _position_inclusive). The leaf
+        # and index are a shortcut that is dropped whenever the tree changes.
+        self._position_key: Optional[bytes] = None
+        self._position_inclusive = True
+        self._cursor: Optional[Tuple[Node, int]] = None
+
+        if wal and mode != "input":
+            self._wal = WriteAheadLog.for_file(self.path, self.page_size)
+            if mode == "output":
+                self.checkpoint()
+
+    @classmethod
+    def for_layout(
+        cls,
+        path: Union[str, Path],
+        layout: RecordCodec,
+        key: str,
+        mode: str = "io",
+        **kwargs,
+    ) -> "IndexedFile":
+        """
+        Open an indexed file whose records follow a compiled layout.
+
+        Args:
+            path: File path
+            layout: Record layout
+            key: COBOL name of the RECORD KEY field
+            mode: Open mode (see ``__init__``)
+        """
+        field = layout.field(key)
+        return cls(path, mode, layout.size, field.start, field.size, **kwargs)
+
+    # -- page I/O ---------------------------------------------------------
+
+    def _read_header(self) -> None:
+        self._file.seek(0)
+        data = self._file.read(_HEADER.size)
+        if len(data) < _HEADER.size or data[:8] != MAGIC:
+            raise ValueError(f"{self.path} is not an indexed file")
+        (_, self.page_size, self.record_length, self.key_offset, self.key_length,
+         self._root, self._page_count, self._record_count) = _HEADER.unpack(data)
+
+    def _header(self) -> bytes:
+        return _HEADER.pack(MAGIC, self.page_size, self.record_length, self.key_offset,
+                            self.key_length, self._root, self._page_count, self._record_count)
+
+    def _write_header(self) -> None:
+        self._write_page(0, self._header())
+
+    def _read_page(self, page: int) -> bytes:
+        self._file.seek(page * self.page_size)
+        return self._file.read(self.page_size)
+
+    def _write_page(self, page: int, data: bytes) -> None:
+        self._file.seek(page * self.page_size)
+        self._file.write(data.ljust(self.page_size, b"\0"))
+
+    def _allocate(self) -> int:
+        page = self._page_count
+        self._page_count += 1
+        return page
+
+    def _load(self, page: int, read_ahead: bool = False) -> Node:
+        """Fetch a page through the cache, optionally reading ahead."""
+        node = self.cache.get(self, page)
+        if node is not None:
+            return node
+        node = self._pending.get(page)
+        if node is not None:
+            self.cache.put(self, page, node, self.page_size, dirty=True)
+            return node
+        if read_ahead and self.prefetch > 1:
+            return self._read_ahead(page)
+        node = self._parse(page, self._read_page(page))
+        self.cache.put(self, page, node, self.page_size)
+        return node
+
+    def _read_ahead(self, page: int) -> Node:
+        """Read ``page`` and the pages after it in one call, caching them."""
+        count = min(self.prefetch, self._page_count - page)
+        self._file.seek(page * self.page_size)
+        data = self._file.read(count * self.page_size)
+        size = self.page_size
+        node = self._parse(page, data[:size])
+        for offset in range(count - 1, 0, -1):
+            # Pages already cached may be newer than the disk copy
+            if (self, page + offset) not in self.cache and page + offset not in self._pending:
+                chunk = data[offset * size:(offset + 1) * size]
+                if len(chunk) == size:
+                    self.cache.put(self, page + offset, self._parse(page + offset, chunk), size)
+                    self.cache.prefetched += 1
+        self.cache.put(self, page, node, size)
+        return node
+
+    def _parse(self, page: int, data: bytes) -> Node:
+        kind, count, next_page = _NODE.unpack_from(data)
+        if kind == LEAF:
+            size = self.record_length
+            start = _NODE.size
+            values = [data[start + i * size:start + (i + 1) * size] for i in range(count)]
+            key_slice = self._key_slice
+            return Node(page, True, [v[key_slice] for v in values], values, next_page)
+
+        start = _NODE.size
+        children = list(struct.unpack_from(f">{count + 1}I", data, start))
+        start += (count + 1) * _CHILD.size
+        size = self.key_length
+        keys = [data[start + i * size:start + (i + 1) * size] for i in range(count)]
+        return Node(page, False, keys, children)
+
+    def _write_node(self, node: Node) -> None:
+        """Store a modified page in the cache; it reaches disk on write-back."""
+        if self._wal is not None:
+            self._pending[node.page] = node
+        self.cache.put(self, node.page, node, self.page_size, dirty=True)
+
+    def _write_back(self, page: int, node: Node) -> None:
+        if page in self._pending:
+            # Not logged yet: kept in _pending until the next commit
+            return
+        self._write_page(page, self._serialize(node))
+
+    def _serialize(self, node: Node) -> bytes:
+        if node.leaf:
+            data = _NODE.pack(LEAF, len(node.keys), node.next) + b"".join(node.values)
+        else:
+            data = (_NODE.pack(INTERNAL, len(node.keys), 0)
+                    + struct.pack(f">{len(node.values)}I", *node.values)
+                    + b"".join(node.keys))
+        return data
+
+    # -- helpers ----------------------------------------------------------
+
+    def _key(self, key: KeyLike) -> bytes:
+        """Normalise a key to its stored form (PIC 9 ints are zero-filled)."""
+        if isinstance(key, int):
+            key = b"%0*d" % (self.key_length, key)
+        elif isinstance(key, str):
+            key = key.encode("utf-8")
+        if len(key) != self.key_length:
+            key = bytes(key)[:self.key_length].ljust(self.key_length)
+        return bytes(key)
+
+    def _record(self, record: Union[bytes, bytearray, memoryview]) -> bytes:
+        record = bytes(record)
+        if len(record) > self.record_length:
+            raise ValueError(f"Record is {len(record)} bytes, expected {self.record_length}")
+        return record.ljust(self.record_length)
+
+    def _check_writable(self) -> None:
+        if self.mode == "input":
+            raise PermissionError("File is open for INPUT")
+
+    def _find_leaf(self, key: bytes) -> Tuple[Node, List[Tuple[Node, int]]]:
+        """Descend to the leaf that holds ``key``, recording the path."""
+        node = self._load(self._root)
+        path: List[Tuple[Node, int]] = []
+        while not node.leaf:
+            index = bisect_right(node.keys, key)
+            path.append((node, index))
+            node = self._load(node.values[index])
+        return node, path
+
+    def _split(self, node: Node, path: List[Tuple[Node, int]]) -> None:
+        """Split an overfull node, pushing separators up the path."""
+        while True:
+            capacity = self._leaf_capacity if node.leaf else self._internal_capacity
+            if len(node.keys) <= capacity:
+                self._write_node(node)
+                return
+
+            middle = len(node.keys) // 2
+            right = Node(self._allocate(), node.leaf, [], [])
+            if node.leaf:
+                separator = node.keys[middle]
+                right.keys, right.values = node.keys[middle:], node.values[middle:]
+                node.keys, node.values = node.keys[:middle], node.values[:middle]
+                right.next, node.next = node.next, right.page
+            else:
+                separator = node.keys[middle]
+                right.keys, right.values = node.keys[middle + 1:], node.values[middle + 1:]
+                node.keys, node.values = node.keys[:middle], node.values[:middle + 1]
+            self._write_node(node)
+            self._write_node(right)
+
+            if not path:
+                root = Node(self._allocate(), False, [separator], [node.page, right.page])
+                self._write_node(root)
+                self._root = root.page
+                if self._wal is None:
+                    self._write_header()
+                return
+            parent, index = path.pop()
+            parent.keys.insert(index, separator)
+            parent.values.insert(index + 1, right.page)
+            node = parent
+
+    # -- COBOL operations -------------------------------------------------
+
+    def write(self, record: Union[bytes, bytearray, memoryview]) -> None:
+        """
+        WRITE a new record.
+
+        In bulk mode the record is only staged; duplicate keys are
+        detected when the index is built.
+
+        Raises:
+            InvalidKeyError: Status 22 if the key already exists
+        """
+        self._check_writable()
+        record = self._record(record)
+        if self.bulk:
+            if self._staged is None:
+                key_slice = self._key_slice
+                self._staged = ExternalSorter(self.record_length, lambda r: r[key_slice],
+                                              work_dir=self.path.parent)
+            self._staged.add(record)
+            return
+        key = record[self._key_slice]
+        leaf, path = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            raise InvalidKeyError(STATUS_DUPLICATE_KEY, key)
+        leaf.keys.insert(index, key)
+        leaf.values.insert(index, record)
+        self._record_count += 1
+        self._cursor = None
+        self._split(leaf, path)
+        self._operation_done()
+
+    def read(self, key: KeyLike) -> bytes:
+        """
+        READ a record by key; READ NEXT continues after it.
+
+        Raises:
+            InvalidKeyError: Status 23 if there is no such record
+        """
+        self._apply_bulk()
+        key = self._key(key)
+        leaf, _ = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index >= len(leaf.keys) or leaf.keys[index] != key:
+            raise InvalidKeyError(STATUS_KEY_NOT_FOUND, key)
+        self._position_key, self._position_inclusive = key, False
+        self._cursor = (leaf, index + 1)
+        return leaf.values[index]
+
+    def start(self, key: KeyLike, condition: str = ">=") -> None:
+        """
+        START: position for READ NEXT at the first record meeting
+        ``KEY <condition> key``.
+
+        Args:
+            key: Key to compare with
+            condition: "=", ">=" or ">"
+
+        Raises:
+            InvalidKeyError: Status 23 if no record satisfies the condition
+            ValueError: On an unsupported condition
+        """
+        if condition not in ("=", ">=", ">"):
+            raise ValueError(f"Unsupported START condition '{condition}'")
+        self._apply_bulk()
+        key = self._key(key)
+        inclusive = condition != ">"
+        found = self._seek(key, inclusive)
+        if found is None or (condition == "=" and found[0].keys[found[1]] != key):
+            raise InvalidKeyError(STATUS_KEY_NOT_FOUND, key)
+        self._position_key, self._position_inclusive = key, inclusive
+        self._cursor = found
+
+    def _seek(self, key: Optional[bytes], inclusive: bool) -> Optional[Tuple[Node, int]]:
+        """Locate the first record with key >= / > ``key``."""
+        if key is None:
+            node = self._load(self._root)
+            while not node.leaf:
+                node = self._load(node.values[0])
+            index = 0
+        else:
+            node, _ = self._find_leaf(key)
+            index = (bisect_left if inclusive else bisect_right)(node.keys, key)
+        while index >= len(node.keys):
+            if not node.next:
+                return None
+            node, index = self._load(node.next, read_ahead=True), 0
+        return node, index
+
+    def read_next(self) -> Optional[bytes]:
+        """
+        READ NEXT record in key order.
+
+        Returns:
+            The record, or None AT END
+        """
+        self._apply_bulk()
+        if self._cursor is not None:
+            node, index = self._cursor
+            while index >= len(node.keys) and node.next:
+                node, index = self._load(node.next, read_ahead=True), 0
+            found = (node, index) if index < len(node.keys) else None
+        else:
+            found = self._seek(self._position_key, self._position_inclusive)
+        if found is None:
+            self._cursor = None
+            return None
+        node, index = found
+        self._position_key, self._position_inclusive = node.keys[index], False
+        self._cursor = (node, index + 1)
+        return node.values[index]
+
+    def rewrite(self, record: Union[bytes, bytearray, memoryview]) -> None:
+        """
+        REWRITE the record with the same key.
+
+        Raises:
+            InvalidKeyError: Status 23 if the key doesn't exist
+        """
+        self._check_writable()
+        self._apply_bulk()
+        record = self._record(record)
+        key = record[self._key_slice]
+        leaf, _ = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index >= len(leaf.keys) or leaf.keys[index] != key:
+            raise InvalidKeyError(STATUS_KEY_NOT_FOUND, key)
+        leaf.values[index] = record
+        self._write_node(leaf)
+        if self._cursor is not None and self._cursor[0].page == leaf.page:
+            self._cursor = (leaf, self._cursor[1])
+        self._operation_done()
+
+    def delete(self, key: KeyLike) -> None:
+        """
+        DELETE the record with the given key.
+
+        Raises:
+            InvalidKeyError: Status 23 if the key doesn't exist
+        """
+        self._check_writable()
+        self._apply_bulk()
+        key = self._key(key)
+        leaf, _ = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index >= len(leaf.keys) or leaf.keys[index] != key:
+            raise InvalidKeyError(STATUS_KEY_NOT_FOUND, key)
+        del leaf.keys[index]
+        del leaf.values[index]
+        self._record_count -= 1
+        self._cursor = None
+        self._write_node(leaf)
+        self._operation_done()
+
+    def key_of(self, record: Union[bytes, bytearray, memoryview]) -> bytes:
+        """Extract the RECORD KEY from a record."""
+        return bytes(record[self._key_slice])
+
+    def __len__(self) -> int:
+        self._apply_bulk()
+        return self._record_count
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield every record in key order (does not move the READ NEXT position)."""
+        self._apply_bulk()
+        return self._scan()
+
+    def _scan(self) -> Iterator[bytes]:
+        found = self._seek(None, True)
+        if found is None:
+            return
+        node, index = found
+        while True:
+            for record in node.values[index:]:
+                yield record
+            if not node.next:
+                return
+            node, index = self._load(node.next, read_ahead=True), 0
+
+    # -- durability -------------------------------------------------------
+
+    def _operation_done(self) -> None:
+        """Count a finished update and commit when the group is full."""
+        if self._wal is None:
+            return
+        self._pending_ops += 1
+        if (self._pending_ops >= self.group_size
+                or len(self._pending) * self.page_size >= self.cache.budget // 2):
+            self.commit()
+
+    def commit(self) -> None:
+        """
+        Make every update so far durable with a single log fsync.
+
+        Without a WAL this does nothing; pages reach the file on
+        write-back and CLOSE as usual.
+        """
+        if self._wal is None or not (self._pending or self._pending_ops):
+            return
+        pending = self._pending
+        pages = [(0, self._header())]
+        pages.extend((page, self._serialize(node)) for page, node in sorted(pending.items()))
+        self._wal.commit(pages)
+        self._pending = {}
+        self._pending_ops = 0
+        # Logged pages may now be written back to the data file
+        for page, node in pending.items():
+            self.cache.put(self, page, node, self.page_size, dirty=True)
+        if len(self._wal) >= self.checkpoint_bytes:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Commit, write every changed page to the data file and empty the log."""
+        self.commit()
+        self.cache.flush(self)
+        self._write_header()
+        if self._wal is not None:
+            sync(self._file)
+            self._wal.reset()
+        else:
+            self._file.flush()
+
+    def _apply_bulk(self) -> None:
+        """Merge staged bulk WRITEs into the file by rebuilding the index."""
+        if self._staged is None:
+            return
+        staged, self._staged = self._staged, None
+        # The log must not hold pages of the file about to be replaced
+        self.checkpoint()
+        # Both sides are stable: existing records win over staged ones,
+        # and earlier WRITEs over later ones
+        with staged:
+            self._rebuild(self._unique(merge(self._scan(), staged, key=staged.key)))
+
+    def _unique(self, records: Iterable[bytes]) -> Iterator[bytes]:
+        previous = None
+        key_slice = self._key_slice
+        for record in records:
+            key = record[key_slice]
+            if key == previous:
+                self.duplicates.append(key)
+                continue
+            previous = key
+            yield record
+
+    def _rebuild(self, records: Iterable[bytes]) -> None:
+        """Bulk-load a fresh tree from records in key order and swap it in."""
+        build = self.path.with_name(self.path.name + ".build")
+        size = self.page_size
+        key_slice = self._key_slice
+        count = 0
+        with open(build, "w+b") as out:
+            def emit(node: Node) -> None:
+                out.seek(node.page * size)
+                out.write(self._serialize(node).ljust(size, b"\0"))
+
+            # Leaves first, packed full and in key order
+            level: List[Tuple[bytes, int]] = []
+            leaf = Node(1, True, [], [])
+            for record in records:
+                if len(leaf.keys) == self._leaf_capacity:
+                    leaf.next = leaf.page + 1
+                    emit(leaf)
+                    level.append((leaf.keys[0], leaf.page))
+                    leaf = Node(leaf.page + 1, True, [], [])
+                leaf.keys.append(record[key_slice])
+                leaf.values.append(record)
+                count += 1
+            emit(leaf)
+            level.append((leaf.keys[0] if leaf.keys else b"", leaf.page))
+            page = leaf.page + 1
+
+            # Then each internal level over the one below
+            fanout = self._internal_capacity + 1
+            while len(level) > 1:
+                parents = []
+                for start in range(0, len(level), fanout):
+                    group = level[start:start + fanout]
+                    emit(Node(page, False, [k for k, _ in group[1:]], [p for _, p in group]))
+                    parents.append((group[0][0], page))
+                    page += 1
+                level = parents
+
+            self._root, self._page_count, self._record_count = level[0][1], page, count
+            out.seek(0)
+            out.write(self._header())
+            if self._wal is not None:
+                sync(out)
+
+        self.cache.discard(self)
+        self._file.close()
+        os.replace(build, self.path)
+        self._file = open(self.path, "r+b")
+        self._cursor = None
+
+    def close(self) -> None:
+        """CLOSE the file: apply bulk WRITEs, commit and save the header."""
+        if self._file.closed:
+            return
+        try:
+            if self.mode != "input":
+                self._apply_bulk()
+                self.checkpoint()
+                if self._wal is not None:
+                    self._wal.close(remove=True)
+        finally:
+            if self._wal is not None:
+                self._wal.close()
+            self.cache.discard(self)
+            self._file.close()
+
+    def flush(self) -> None:
+        """Write modified pages and the header to disk without closing."""
+        if self.mode != "input":
+            self._apply_bulk()
+            self.checkpoint()
+
+    def __enter__(self) -> "IndexedFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,653 @@
+"""
+INSPECT statement engine.
+
+Compiles an INSPECT statement once into a plan that can be run on any
+number of values:
+
+    INSPECT var-str TALLYING var-length FOR ALL SPACE
+    INSPECT var-str REPLACING ALL 'a' BY 'z' AFTER INITIAL ':'
+    INSPECT var-str CONVERTING 'abc' TO 'ABC' BEFORE INITIAL SPACE
+
+Supported: TALLYING ... FOR CHARACTERS / ALL / LEADING, REPLACING
+CHARACTERS / ALL / LEADING / FIRST ... BY, CONVERTING ... TO, BEFORE
+and AFTER INITIAL on every clause, quoted literals and the figurative
+constants SPACE, ZERO, QUOTE, LOW-VALUE and HIGH-VALUE. Operands must
+be literals; TALLYING runs before REPLACING, as in COBOL.
+
+Plans pick the cheapest implementation of each statement:
+- one TALLYING clause: ``count`` (or a length, or an anchored regex for
+  LEADING) over the inspected region
+- several ALL/CHARACTERS clauses: one precompiled regex alternation, in
+  clause order, so the first clause wins at each position like COBOL's
+  left-to-right comparison cycle
+- single-character replacements and CONVERTING: a ``translate`` table
+- anything else (LEADING or FIRST mixed with other clauses, clauses with
+  different BEFORE/AFTER phrases): the comparison cycle itself
+
+The same plan runs on ``str`` and ``bytes`` (literals are encoded with
+the plan's encoding). ``tally_column`` and ``replace_column`` run it over
+a whole column of fields; a ``(rows, width)`` uint8 matrix of fixed-width
+fields, as sliced from ``columnar.record_matrix``, is processed with
+NumPy masks when every operand is a single character.
+
+Usage:
+    spaces = compile_inspect("INSPECT var-str TALLYING var-length FOR ALL SPACE")
+    spaces.tally("a b c")                       # {'VAR-LENGTH': 2}
+    compile_inspect("REPLACING ALL 'a' BY 'z'").replace("banana")   # 'bznznz'
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+CHARACTERS = "CHARACTERS"
+ALL = "ALL"
+LEADING = "LEADING"
+FIRST = "FIRST"
+
+FIGURATIVE = {
+    "SPACE": " ", "SPACES": " ",
+    "ZERO": "0", "ZEROS": "0", "ZEROES": "0",
+    "QUOTE": '"', "QUOTES": '"',
+    "LOW-VALUE": "\x00", "LOW-VALUES": "\x00",
+    "HIGH-VALUE": "\xff", "HIGH-VALUES": "\xff",
+}
+
+_TOKEN = re.compile(r"""\s*('(?:[^']|'')*'|"(?:[^"]|"")*"|[^\s,;]+)[\s,;]*""")
+
+Text = Union[str, bytes]
+
+
+class Literal(NamedTuple):
+    """Operand: text, and whether it is a figurative constant (sized to fit)."""
+    text: str
+    figurative: bool
+
+
+class Clause(NamedTuple):
+    """
+    One TALLYING, REPLACING or CONVERTING operation.
+
+    Attributes:
+        kind: CHARACTERS, ALL, LEADING or FIRST (CONVERTING uses ALL)
+        pattern: Characters compared ("" for CHARACTERS; the source
+            characters for CONVERTING)
+        replacement: BY / TO text, None for TALLYING
+        counter: TALLYING data name, None otherwise
+        before: BEFORE INITIAL delimiter
+        after: AFTER INITIAL delimiter
+    """
+    kind: str
+    pattern: str
+    replacement: Optional[str]
+    counter: Optional[str]
+    before: Optional[str]
+    after: Optional[str]
+
+
+def _tokenize(statement: str, verb: str = "INSPECT") -> List[str]:
+    text = statement.strip()
+    if text.endswith("."):
+        text = text[:-1]
+    tokens = []
+    position = 0
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None:
+            raise ValueError(f"{verb}: unexpected '{text[position:][:10]}'")
+        tokens.append(match.group(1))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive descent over the INSPECT statement formats."""
+
+    verb = "INSPECT"
+
+    def __init__(self, tokens: List[str]):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self, offset: int = 0) -> str:
+        index = self.position + offset
+        return self.tokens[index].upper() if index < len(self.tokens) else ""
+
+    def take(self, *expected: str) -> str:
+        token = self.peek()
+        if not token or (expected and token not in expected):
+            wanted = " or ".join(expected) or "operand"
+            raise ValueError(f"{self.verb}: expected {wanted}, found '{token or 'end'}'")
+        self.position += 1
+        return self.tokens[self.position - 1]
+
+    def literal(self) -> Literal:
+        token = self.take()
+        if token[0] in "'\"":
+            text = token[1:-1].replace(token[0] * 2, token[0])
+            if not text:
+                raise ValueError(f"{self.verb}: empty literal")
+            return Literal(text, False)
+        word = token.upper()
+        if word in FIGURATIVE:
+            return Literal(FIGURATIVE[word], True)
+        raise ValueError(f"{self.verb}: only literals are supported, found '{token}'")
+
+    def phrases(self) -> Tuple[Optional[str], Optional[str]]:
+        before = after = None
+        while self.peek() in ("BEFORE", "AFTER"):
+            which = self.take()
+            if self.peek() == "INITIAL":
+                self.take()
+            text = self.literal().text
+            if which.upper() == "BEFORE":
+                before = text
+            else:
+                after = text
+        return before, after
+
+    def tallying(self) -> List[Clause]:
+        clauses = []
+        while self.peek() and self.peek(1) == "FOR":
+            counter = self.take().upper()
+            self.take("FOR")
+            while True:
+                kind = self.peek()
+                if kind == CHARACTERS:
+                    self.take()
+                    clauses.append(Clause(CHARACTERS, "", None, counter, *self.phrases()))
+                elif kind in (ALL, LEADING):
+                    self.take()
+                    clauses.append(Clause(kind, self.literal().text, None, counter, *self.phrases()))
+                    while self.peek() and self.peek() not in _KEYWORDS and self.peek(1) != "FOR":
+                        clauses.append(Clause(kind, self.literal().text, None, counter, *self.phrases()))
+                else:
+                    break
+        if not clauses:
+            raise ValueError("INSPECT: TALLYING needs 'counter FOR ...'")
+        return clauses
+
+    def replacing(self) -> List[Clause]:
+        clauses = []
+        while True:
+            kind = self.peek()
+            if kind == CHARACTERS:
+                self.take()
+                self.take("BY")
+                replacement = self.literal()
+                if len(replacement.text) != 1:
+                    raise ValueError("INSPECT: CHARACTERS BY needs a single character")
+                clauses.append(Clause(CHARACTERS, "", replacement.text, None, *self.phrases()))
+            elif kind in (ALL, LEADING, FIRST):
+                self.take()
+                clauses.append(self.replacement(kind))
+                while self.peek() and self.peek() not in _KEYWORDS:
+                    clauses.append(self.replacement(kind))
+            else:
+                break
+        if not clauses:
+            raise ValueError("INSPECT: REPLACING needs CHARACTERS, ALL, LEADING or FIRST")
+        return clauses
+
+    def replacement(self, kind: str) -> Clause:
+        pattern = self.literal()
+        self.take("BY")
+        return Clause(kind, *_sized(pattern, self.literal()), None, *self.phrases())
+
+    def converting(self) -> Clause:
+        source = self.literal()
+        self.take("TO")
+        return Clause(ALL, *_sized(source, self.literal()), None, *self.phrases())
+
+
+_KEYWORDS = frozenset((CHARACTERS, ALL, LEADING, FIRST, "REPLACING", "BEFORE", "AFTER"))
+
+
+def _sized(pattern: Literal, replacement: Literal) -> Tuple[str, str]:
+    """Size figurative constants to the other operand; lengths must then match."""
+    if replacement.figurative:
+        return pattern.text, replacement.text * len(pattern.text)
+    if pattern.figurative:
+        return pattern.text * len(replacement.text), replacement.text
+    if len(pattern.text) != len(replacement.text):
+        raise ValueError(f"INSPECT: '{pattern.text}' and '{replacement.text}' differ in length")
+    return pattern.text, replacement.text
+
+
+def parse_inspect(statement: str) -> Tuple[List[Clause], List[Clause], Optional[Clause]]:
+    """
+    Parse ``[INSPECT identifier] TALLYING ... [REPLACING ...] | REPLACING ... | CONVERTING ...``.
+
+    Returns:
+        (TALLYING clauses, REPLACING clauses, CONVERTING clause or None)
+
+    Raises:
+        ValueError: On a syntax error or an unsupported operand
+    """
+    parser = _Parser(_tokenize(statement))
+    if parser.peek() == "INSPECT":
+        parser.take()
+        parser.take()
+    tallying: List[Clause] = []
+    replacing: List[Clause] = []
+    converting = None
+    if parser.peek() == "CONVERTING":
+        parser.take()
+        converting = parser.converting()
+    else:
+        if parser.peek() == "TALLYING":
+            parser.take()
+            tallying = parser.tallying()
+        if parser.peek() == "REPLACING":
+            parser.take()
+            replacing = parser.replacing()
+        if not tallying and not replacing:
+            raise ValueError("INSPECT: expected TALLYING, REPLACING or CONVERTING")
+    if parser.peek():
+        raise ValueError(f"INSPECT: unexpected '{parser.peek()}'")
+    return tallying, replacing, converting
+
+
+# Execution on one value
+
+def _region(value: Text, before: Optional[Text], after: Optional[Text]) -> Tuple[int, int]:
+    """Start and end of the part of the value a clause inspects."""
+    start, end = 0, len(value)
+    if after is not None:
+        found = value.find(after)
+        start = end if found < 0 else found + len(after)
+    if before is not None:
+        found = value.find(before)
+        if found >= 0:
+            end = found
+    return start, max(start, end)
+
+
+def _cycle(value: Text, clauses: Sequence[Clause]) -> List[Tuple[int, int, int]]:
+    """
+    The comparison cycle: scan left to right, trying the clauses in order.
+
+    Returns:
+        (clause index, position, length) of every match
+    """
+    regions = [_region(value, clause.before, clause.after) for clause in clauses]
+    leading = [start if clause.kind == LEADING else -1 for clause, (start, _) in zip(clauses, regions)]
+    done = [False] * len(clauses)
+    matches = []
+    position = min((start for start, _ in regions), default=0)
+    stop = max((end for _, end in regions), default=0)
+    while position < stop:
+        matched = -1
+        length = 1
+        for index, clause in enumerate(clauses):
+            start, end = regions[index]
+            if not start <= position < end or done[index]:
+                continue
+            if clause.kind == CHARACTERS:
+                matched = index
+                break
+            if clause.kind == LEADING and leading[index] != position:
+                continue
+            size = len(clause.pattern)
+            if position + size <= end and value.startswith(clause.pattern, position):
+                matched, length = index, size
+                break
+        for index, at in enumerate(leading):
+            if at == position and index != matched:
+                # A LEADING clause stops at its first miss
+                leading[index] = -1
+        if matched < 0:
+            position += 1
+            continue
+        kind = clauses[matched].kind
+        if kind == LEADING:
+            leading[matched] = position + length
+        elif kind == FIRST:
+            done[matched] = True
+        matches.append((matched, position, length))
+        position += length
+    return matches
+
+
+def _regex(template: str, pattern: Text) -> "re.Pattern":
+    """Compile ``template`` with ``{}`` standing for the escaped pattern, as str or bytes."""
+    escaped = re.escape(pattern)
+    if isinstance(pattern, bytes):
+        return re.compile(template.encode("ascii").replace(b"{}", escaped), re.DOTALL)
+    return re.compile(template.replace("{}", escaped), re.DOTALL)
+
+
+def _alternation(clauses: Sequence[Clause], empty: Text) -> "re.Pattern":
+    """One group per clause, in clause order; CHARACTERS matches any character."""
+    if isinstance(empty, bytes):
+        parts = [b"(" + (b"." if c.kind == CHARACTERS else re.escape(c.pattern)) + b")" for c in clauses]
+        return re.compile(b"|".join(parts), re.DOTALL)
+    parts = ["(" + ("." if c.kind == CHARACTERS else re.escape(c.pattern)) + ")" for c in clauses]
+    return re.compile("|".join(parts), re.DOTALL)
+
+
+def _in_region(function: Callable[[Text], Any], before: Optional[Text], after: Optional[Text],
+               splice: bool) -> Callable[[Text], Any]:
+    """Apply a function to the inspected region only (and splice it back in)."""
+    if before is None and after is None:
+        return function
+    if not splice:
+        def regional(value):
+            start, end = _region(value, before, after)
+            return function(value[start:end])
+        return regional
+
+    def spliced(value):
+        start, end = _region(value, before, after)
+        return value[:start] + function(value[start:end]) + value[end:]
+    return spliced
+
+
+def _tally_function(clauses: Sequence[Clause], slots: Sequence[int], counters: int,
+                    empty: Text) -> Callable[[Text], Tuple[int, ...]]:
+    """Compile TALLYING clauses into value -> counts per counter."""
+    before, after = clauses[0].before, clauses[0].after
+    shared = all((c.before, c.after) == (before, after) for c in clauses)
+    function: Optional[Callable[[Text], Tuple[int, ...]]] = None
+
+    if shared and len(clauses) == 1 and counters == 1:
+        clause = clauses[0]
+        if clause.kind == CHARACTERS:
+            function = lambda value: (len(value),)  # noqa: E731
+        elif clause.kind == ALL:
+            pattern = clause.pattern
+            function = lambda value: (value.count(pattern),)  # noqa: E731
+        else:
+            size = len(clause.pattern)
+            run = _regex("(?:{})*", clause.pattern)
+            function = lambda value: (run.match(value).end() // size,)  # noqa: E731
+    elif shared and all(c.kind in (ALL, CHARACTERS) for c in clauses):
+        finder = _alternation(clauses, empty)
+
+        def function(value):
+            counts = [0] * counters
+            for match in finder.finditer(value):
+                counts[slots[match.lastindex - 1]] += 1
+            return tuple(counts)
+
+    if function is not None:
+        return _in_region(function, before, after, False)
+
+    def cycle(value):
+        counts = [0] * counters
+        for index, _, _ in _cycle(value, clauses):
+            counts[slots[index]] += 1
+        return tuple(counts)
+    return cycle
+
+
+def _replace_function(clauses: Sequence[Clause], empty: Text) -> Callable[[Text], Text]:
+    """Compile REPLACING (or CONVERTING) clauses into value -> new value."""
+    before, after = clauses[0].before, clauses[0].after
+    shared = all((c.before, c.after) == (before, after) for c in clauses)
+    function: Optional[Callable[[Text], Text]] = None
+    maketrans = bytes.maketrans if isinstance(empty, bytes) else str.maketrans
+
+    if shared and all(c.kind == ALL and len(c.pattern) == len(c.replacement) == 1
+                      for c in clauses):
+        # First clause wins for a character named twice
+        pairs: Dict[Text, Text] = {}
+        for clause in clauses:
+            pairs.setdefault(clause.pattern, clause.replacement)
+        table = maketrans(empty.join(pairs), empty.join(pairs.values()))
+        function = lambda value: value.translate(table)  # noqa: E731
+    elif shared and len(clauses) == 1:
+        clause = clauses[0]
+        pattern, replacement = clause.pattern, clause.replacement
+        if clause.kind == ALL:
+            function = lambda value: value.replace(pattern, replacement)  # noqa: E731
+        elif clause.kind == FIRST:
+            function = lambda value: value.replace(pattern, replacement, 1)  # noqa: E731
+        elif clause.kind == CHARACTERS:
+            function = lambda value: replacement * len(value)  # noqa: E731
+        else:
+            run = _regex("\\A(?:{})+", pattern)
+            size = len(pattern)
+            function = lambda value: run.sub(  # noqa: E731
+                lambda match: replacement * (len(match.group()) // size), value)
+    elif shared and all(c.kind in (ALL, CHARACTERS) for c in clauses):
+        finder = _alternation(clauses, empty)
+        replacements = [c.replacement for c in clauses]
+        function = lambda value: finder.sub(  # noqa: E731
+            lambda match: replacements[match.lastindex - 1], value)
+
+    if function is not None:
+        return _in_region(function, before, after, True)
+
+    def cycle(value):
+        pieces = []
+        position = 0
+        for index, at, length in _cycle(value, clauses):
+            pieces.append(value[position:at])
+            pieces.append(clauses[index].replacement)
+            position = at + length
+        pieces.append(value[position:])
+        return empty.join(pieces)
+    return cycle
+
+
+def _convert_function(clause: Clause, empty: Text) -> Callable[[Text], Text]:
+    """CONVERTING: one translate table, the first occurrence of a character wins."""
+    pairs: Dict[Text, Text] = {}
+    for i in range(len(clause.pattern)):
+        pairs.setdefault(clause.pattern[i:i + 1], clause.replacement[i:i + 1])
+    maketrans = bytes.maketrans if isinstance(empty, bytes) else str.maketrans
+    table = maketrans(empty.join(pairs), empty.join(pairs.values()))
+    return _in_region(lambda value: value.translate(table), clause.before, clause.after, True)
+
+
+# Execution on a matrix of fixed-width fields
+
+def _column_region(matrix: np.ndarray, before: Optional[int], after: Optional[int],
+                   cache: Dict[Tuple[Optional[int], Optional[int]], np.ndarray]) -> np.ndarray:
+    """Mask of the inspected positions of every row."""
+    key = (before, after)
+    if key not in cache:
+        rows, width = matrix.shape
+        start = np.zeros(rows, dtype=np.intp)
+        end = np.full(rows, width, dtype=np.intp)
+        if after is not None:
+            found = matrix == after
+            start = np.where(found.any(axis=1), found.argmax(axis=1) + 1, width)
+        if before is not None:
+            found = matrix == before
+            end = np.where(found.any(axis=1), found.argmax(axis=1), width)
+        positions = np.arange(width)
+        cache[key] = (positions >= start[:, None]) & (positions < end[:, None])
+    return cache[key]
+
+
+def _column_matches(matrix: np.ndarray, clauses: Sequence[Clause]) -> List[np.ndarray]:
+    """
+    Positions each single-byte clause matches, for all rows at once.
+
+    With one-character operands every match takes one position, so the
+    comparison cycle reduces to: a position goes to the first clause (in
+    order) that matches it in its region; LEADING keeps only the run
+    from the region start and FIRST only the first match.
+    """
+    regions: Dict[Tuple[Optional[int], Optional[int]], np.ndarray] = {}
+    claimed = np.zeros(matrix.shape, dtype=bool)
+    matches = []
+    for clause in clauses:
+        region = _column_region(matrix, _byte(clause.before), _byte(clause.after), regions)
+        candidates = region & ~claimed
+        if clause.kind != CHARACTERS:
+            candidates &= matrix == clause.pattern[0]
+        if clause.kind == LEADING:
+            # The run that starts at the region start
+            before_start = np.cumsum(region, axis=1) == 0
+            candidates &= np.logical_and.accumulate(candidates | before_start, axis=1)
+        elif clause.kind == FIRST:
+            candidates &= np.cumsum(candidates, axis=1) == 1
+        claimed |= candidates
+        matches.append(candidates)
+    return matches
+
+
+def _byte(text: Optional[bytes]) -> Optional[int]:
+    return None if text is None else text[0]
+
+
+def _single_bytes(clauses: Sequence[Clause], converting: bool = False) -> bool:
+    """True if every operand (but a CONVERTING source) is one byte, as the matrix path needs."""
+    for clause in clauses:
+        operands = [clause.before, clause.after]
+        if clause.kind != CHARACTERS and not converting:
+            operands.append(clause.pattern)
+        if any(text is not None and len(text) != 1 for text in operands):
+            return False
+    return True
+
+
+class InspectPlan:
+    """
+    Compiled INSPECT statement.
+
+    Attributes:
+        statement: Statement as written
+        counters: TALLYING data names, in order of first appearance
+        tallying: TALLYING clauses
+        replacing: REPLACING clauses, or the CONVERTING clause
+        converting: True for a CONVERTING statement
+        encoding: Encoding of literals when inspecting bytes
+    """
+
+    def __init__(self, statement: str, encoding: str = "latin-1"):
+        """
+        Compile a statement.
+
+        Raises:
+            ValueError: On a syntax error or an unsupported operand
+        """
+        tallying, replacing, converting = parse_inspect(statement)
+        self.statement = statement
+        self.encoding = encoding
+        self.tallying: Tuple[Clause, ...] = tuple(tallying)
+        self.converting = converting is not None
+        self.replacing: Tuple[Clause, ...] = (converting,) if converting else tuple(replacing)
+        self.counters: Tuple[str, ...] = tuple(dict.fromkeys(c.counter for c in tallying))
+        self._kernels: Dict[type, Tuple[Any, Any, Tuple[Clause, ...], Tuple[Clause, ...]]] = {}
+
+    def _kernel(self, kind: type) -> Tuple[Any, Any, Tuple[Clause, ...], Tuple[Clause, ...]]:
+        """(tally, replace, tallying, replacing) functions and clauses for str or bytes."""
+        kernel = self._kernels.get(kind)
+        if kernel is not None:
+            return kernel
+        if kind is str:
+            empty: Text = ""
+            tallying, replacing = self.tallying, self.replacing
+        else:
+            empty = b""
+            tallying = tuple(self._encoded(c) for c in self.tallying)
+            replacing = tuple(self._encoded(c) for c in self.replacing)
+        tally = replace = None
+        if tallying:
+            slots = [self.counters.index(c.counter) for c in tallying]
+            tally = _tally_function(tallying, slots, len(self.counters), empty)
+        if replacing:
+            if self.converting:
+                replace = _convert_function(replacing[0], empty)
+            else:
+                replace = _replace_function(replacing, empty)
+        kernel = self._kernels[kind] = (tally, replace, tallying, replacing)
+        return kernel
+
+    def _encoded(self, clause: Clause) -> Clause:
+        def encode(text):
+            return None if text is None else text.encode(self.encoding)
+        return Clause(clause.kind, encode(clause.pattern), encode(clause.replacement),
+                      clause.counter, encode(clause.before), encode(clause.after))
+
+    def tally(self, value: Text) -> Dict[str, int]:
+        """Counts of the TALLYING phrase, per counter (to be added to the counters)."""
+        tally = self._kernel(str if isinstance(value, str) else bytes)[0]
+        if tally is None:
+            return {}
+        return dict(zip(self.counters, tally(value)))
+
+    def replace(self, value: Text) -> Text:
+        """The value after REPLACING or CONVERTING."""
+        replace = self._kernel(str if isinstance(value, str) else bytes)[1]
+        return value if replace is None else replace(value)
+
+    def __call__(self, value: Text) -> Tuple[Text, Dict[str, int]]:
+        """Run the whole statement: (new value, counts)."""
+        return self.replace(value), self.tally(value)
+
+    def tally_column(self, values: Union[np.ndarray, Sequence[Text]]) -> Dict[str, np.ndarray]:
+        """
+        TALLYING over a column of fields.
+
+        Args:
+            values: ``(rows, width)`` uint8 matrix of fixed-width fields,
+                or a sequence of str or bytes values
+
+        Returns:
+            int64 counts per row, per counter
+        """
+        if isinstance(values, np.ndarray) and values.ndim == 2:
+            _, _, tallying, _ = self._kernel(bytes)
+            if _single_bytes(tallying):
+                counts = {name: np.zeros(len(values), dtype=np.int64) for name in self.counters}
+                for clause, matches in zip(tallying, _column_matches(values, tallying)):
+                    counts[clause.counter] += matches.sum(axis=1)
+                return counts
+            values = [row.tobytes() for row in values]
+        values = list(values)
+        tally = self._kernel(str if values and isinstance(values[0], str) else bytes)[0]
+        if tally is None:
+            return {}
+        table = np.array(list(map(tally, values)), dtype=np.int64).reshape(len(values), len(self.counters))
+        return {name: table[:, i] for i, name in enumerate(self.counters)}
+
+    def replace_column(self, values: Union[np.ndarray, Sequence[Text]]) -> Union[np.ndarray, List[Text]]:
+        """
+        REPLACING or CONVERTING over a column of fields.
+
+        Args:
+            values: ``(rows, width)`` uint8 matrix of fixed-width fields,
+                or a sequence of str or bytes values
+
+        Returns:
+            A new matrix for matrix input, otherwise a list of new values
+        """
+        if isinstance(values, np.ndarray) and values.ndim == 2:
+            _, replace, _, replacing = self._kernel(bytes)
+            if replace is None:
+                return values.copy()
+            if _single_bytes(replacing, self.converting):
+                return self._replace_matrix(values, replacing)
+            width = values.shape[1]
+            block = b"".join(map(replace, (row.tobytes() for row in values)))
+            return np.frombuffer(block, dtype=np.uint8).reshape(-1, width).copy()
+        values = list(values)
+        replace = self._kernel(str if values and isinstance(values[0], str) else bytes)[1]
+        return values if replace is None else list(map(replace, values))
+
+    def _replace_matrix(self, matrix: np.ndarray, replacing: Sequence[Clause]) -> np.ndarray:
+        if self.converting:
+            clause = replacing[0]
+            table = np.arange(256, dtype=np.uint8)
+            # First occurrence of a character wins: assign in reverse
+            for source, target in reversed(list(zip(clause.pattern, clause.replacement))):
+                table[source] = target
+            region = _column_region(matrix, _byte(clause.before), _byte(clause.after), {})
+            return np.where(region, table[matrix], matrix)
+        out = matrix.copy()
+        for clause, matches in zip(replacing, _column_matches(matrix, replacing)):
+            out[matches] = clause.replacement[0]
+        return out
+
+
+@lru_cache(maxsize=None)
+def compile_inspect(statement: str, encoding: str = "latin-1") -> InspectPlan:
+    """Compile an INSPECT statement, reusing an earlier compilation of the same one."""
+    return InspectPlan(statement, encoding)
@@ -0,0 +1,328 @@
+"""
+Record layout compiler.
+
+Compiles a copybook record into a ``RecordCodec`` whose ``decode`` and
+``encode`` functions are generated Python source specialised for that
+one layout: every slice offset is a constant and there are no per-field
+loops or dictionary lookups at run time. Compiled layouts are cached per
+copybook (and invalidated when the copybook changes on disk), so each
+layout is built once per process.
+
+USAGE DISPLAY, COMP / BINARY, COMP-5 and COMP-3 / PACKED-DECIMAL items
+are supported; the binary forms use the codecs in ``cobol_runtime.comp``.
+
+Usage:
+    layout = load_layout("PersonRecord")
+    person_id, name, surname = layout.decode(b"001 John            Smith")
+    record = layout.encode((1, "John", "Smith"))
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence, Tuple, Union
+
+from .copybook import (
+    ALPHABETIC,
+    ALPHANUMERIC,
+    NUMERIC,
+    DataItem,
+    Picture,
+    load_copybook,
+    parse_picture,
+    resolve_copybook,
+)
+from .comp import binary_byteorder, decode_binary, decode_packed, encode_binary, encode_packed
+from .picture import compile_picture
+
+# Trailing overpunch signs: GnuCOBOL (ASCII) and IBM (EBCDIC-derived)
+_NEGATIVE_PUNCH = frozenset(b"pqrstuvwxy}JKLMNOPQR")
+_UNPUNCH = bytes.maketrans(b"pqrstuvwxy}JKLMNOPQR{ABCDEFGHI", b"0123456789" * 3)
+
+
+@dataclass(frozen=True)
+class FieldLayout:
+    """
+    Position of one elementary item inside a record.
+
+    Attributes:
+        name: COBOL data name
+        attr: Python identifier derived from the name
+        start: Byte offset of the first byte
+        end: Byte offset one past the last byte
+        picture: Parsed PICTURE clause
+        usage: USAGE clause
+        value: VALUE literal, if any
+    """
+    name: str
+    attr: str
+    start: int
+    end: int
+    picture: Picture
+    usage: str
+    value: Optional[str]
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start
+
+
+def decode_display_numeric(raw: bytes, scale: int = 0) -> Union[int, Decimal]:
+    """
+    Decode a signed and/or scaled USAGE DISPLAY numeric field.
+
+    Handles a trailing overpunched sign and a leading or trailing
+    separate sign character.
+
+    Raises:
+        ValueError: If the field does not hold a number
+    """
+    raw = bytes(raw).strip()
+    if raw[-1:] in (b"-", b"+"):
+        raw = raw[-1:] + raw[:-1]
+    if raw and raw[-1] in _NEGATIVE_PUNCH:
+        value = -int(raw.translate(_UNPUNCH))
+    else:
+        value = int(raw.translate(_UNPUNCH))
+    return Decimal(value).scaleb(-scale) if scale else value
+
+
+def encode_display_numeric(value: Any, size: int, scale: int = 0, signed: bool = False) -> bytes:
+    """
+    Encode a number as a USAGE DISPLAY field of ``size`` digits.
+
+    Follows MOVE rules: digits beyond the picture are truncated on both
+    sides of the decimal point and negative values lose their sign when
+    the receiving picture is unsigned. Signed fields carry a trailing
+    overpunched sign in GnuCOBOL's ASCII convention.
+    """
+    if scale:
+        number = Decimal(str(value)) if isinstance(value, float) else Decimal(value)
+        value = int(number.scaleb(scale))
+    else:
+        value = int(value)
+    digits = b"%0*d" % (size, abs(value) % 10 ** size)
+    if signed and value < 0:
+        digits = digits[:-1] + bytes((digits[-1] + 0x40,))
+    return digits
+
+
+def encode_text(value: Any, size: int, encoding: str = "utf-8") -> bytes:
+    """Encode a PIC X value left-justified and space-padded to ``size`` bytes."""
+    if value is None:
+        return b" " * size
+    return str(value).encode(encoding)[:size].ljust(size)
+
+
+def encode_edited(value: Any, picture: str, encoding: str = "utf-8") -> bytes:
+    """
+    Encode a value into a numeric-edited field by editing it with its PICTURE.
+
+    Strings are taken as already edited and right-justified; None gives
+    a field of spaces.
+    """
+    size = parse_picture(picture).size
+    if value is None:
+        return b" " * size
+    if isinstance(value, str):
+        return value.encode(encoding)[-size:].rjust(size)
+    return compile_picture(picture)(value).encode(encoding)
+
+
+def _is_text(field: FieldLayout) -> bool:
+    return field.picture.category in (ALPHANUMERIC, ALPHABETIC)
+
+
+def _decode_expr(field: FieldLayout) -> str:
+    chunk = f"b[{field.start}:{field.end}]"
+    picture = field.picture
+    if field.usage == "COMP-3":
+        return f"_packed({chunk}, {picture.scale})"
+    if field.usage in ("COMP", "COMP-5"):
+        order = binary_byteorder(field.usage)
+        if picture.scale:
+            return f"_binary({chunk}, {picture.scale}, {picture.signed}, {order!r})"
+        return f"_int.from_bytes({chunk}, {order!r}, signed={picture.signed})"
+    if picture.category == NUMERIC:
+        if picture.scale or picture.signed:
+            return f"_num({chunk}, {picture.scale})"
+        return f"_int(_bytes({chunk}))"
+    return f"_str({chunk}, _enc).strip()"
+
+
+def _encode_expr(field: FieldLayout, var: str) -> str:
+    picture = field.picture
+    size = field.size
+    if field.usage == "COMP-3":
+        return f"_put_packed({var}, {size}, {picture.scale}, {picture.signed}, {picture.digits})"
+    if field.usage in ("COMP", "COMP-5"):
+        # COMP truncates to the PICTURE, COMP-5 only to the binary size
+        digits = picture.digits if field.usage == "COMP" else 0
+        return (f"_put_binary({var}, {size}, {picture.scale}, {picture.signed}, "
+                f"{digits}, {binary_byteorder(field.usage)!r})")
+    if picture.category == NUMERIC:
+        if picture.scale or picture.signed:
+            return f"_put_num({var}, {size}, {picture.scale}, {picture.signed})"
+        return f"b'%0{size}d' % (abs(_int({var})) % {10 ** size})"
+    if _is_text(field):
+        return f"_put_text({var}, {size}, _enc)"
+    return f"_put_edited({var}, {picture.text!r}, _enc)"
+
+
+def _initial_bytes(item: DataItem, encoding: str) -> bytes:
+    """Storage for a FILLER item initialised from its VALUE clause."""
+    if item.value is None:
+        return b" " * item.size
+    literal = item.value.encode(encoding)
+    if item.value_all:
+        literal = literal * (item.size // max(len(literal), 1) + 1)
+    return literal[:item.size].ljust(item.size)
+
+
+class RecordCodec:
+    """
+    Compiled codec for one record layout.
+
+    Attributes:
+        name: 01-level record name
+        size: Record length in bytes
+        fields: Named elementary items in storage order (FILLER excluded)
+        decode: Callable mapping record bytes to a tuple of field values
+        encode: Callable mapping a sequence of field values to bytes
+        source: Generated Python source of decode/encode
+    """
+
+    def __init__(self, record: DataItem, encoding: str = "utf-8"):
+        """
+        Compile a parsed record.
+
+        Raises:
+            ValueError: If a COMP or COMP-3 item has a non-numeric PICTURE
+        """
+        self.name = record.name
+        self.size = record.size
+        self.encoding = encoding
+
+        elementary = list(record.elementary())
+        for item in elementary:
+            if item.usage != "DISPLAY" and item.picture.category != NUMERIC:
+                raise ValueError(f"{item.name}: USAGE {item.usage} needs a numeric PICTURE")
+
+        self.fields: Tuple[FieldLayout, ...] = tuple(
+            FieldLayout(item.name, item.attr, item.offset, item.offset + item.size,
+                        item.picture, item.usage, item.value)
+            for item in elementary if not item.is_filler
+        )
+        self._by_name = {f.name.upper(): f for f in self.fields}
+
+        self.source = self._generate(elementary)
+        namespace = {
+            "_int": int, "_bytes": bytes, "_str": str, "_enc": encoding,
+            "_num": decode_display_numeric, "_put_num": encode_display_numeric,
+            "_put_text": encode_text, "_put_edited": encode_edited,
+            "_packed": decode_packed, "_put_packed": encode_packed,
+            "_binary": decode_binary, "_put_binary": encode_binary,
+        }
+        exec(compile(self.source, f"<layout {self.name}>", "exec"), namespace)
+        self.decode: Callable[[bytes], Tuple[Any, ...]] = namespace["decode"]
+        self.encode: Callable[[Sequence[Any]], bytes] = namespace["encode"]
+
+    def _generate(self, elementary: Sequence[DataItem]) -> str:
+        decode_exprs = [_decode_expr(f) for f in self.fields]
+        variables = [f"v{i}" for i in range(len(self.fields))]
+
+        encode_parts = []
+        fields = iter(zip(self.fields, variables))
+        position = 0
+        for item in elementary:
+            # Items overlaid by REDEFINES are already covered
+            if item.offset < position:
+                if not item.is_filler:
+                    next(fields)
+                continue
+            if item.offset > position:
+                encode_parts.append(repr(b" " * (item.offset - position)))
+            if item.is_filler:
+                encode_parts.append(repr(_initial_bytes(item, self.encoding)))
+            else:
+                encode_parts.append(_encode_expr(*next(fields)))
+            position = item.offset + item.size
+        if position < self.size:
+            encode_parts.append(repr(b" " * (self.size - position)))
+
+        lines = ["def decode(b):"]
+        lines.append(f"    return ({', '.join(decode_exprs)}{',' if decode_exprs else ''})")
+        lines.append("")
+        lines.append("def encode(values):")
+        if variables:
+            lines.append(f"    {', '.join(variables)}, = values")
+        lines.append(f"    return b''.join(({', '.join(encode_parts)},))")
+        return "\n".join(lines) + "\n"
+
+    def field(self, name: str) -> FieldLayout:
+        """
+        Look up a field by COBOL name.
+
+        Raises:
+            KeyError: If the record has no such field
+        """
+        return self._by_name[name.upper()]
+
+    def field_specs(self) -> Tuple[Tuple[str, int, int], ...]:
+        """Return (attr, start, end) triples for ``MappedRecordFile``."""
+        return tuple((f.attr, f.start, f.end) for f in self.fields)
+
+    def initial_values(self) -> Tuple[Any, ...]:
+        """Return field values as set by the VALUE clauses (INITIALIZE)."""
+        values = []
+        for f in self.fields:
+            if f.picture.category == NUMERIC:
+                literal = f.value or "0"
+                values.append(Decimal(literal) if f.picture.scale else int(Decimal(literal)))
+            elif _is_text(f):
+                values.append(f.value or "")
+            else:
+                values.append(Decimal(f.value) if f.value else 0)
+        return tuple(values)
+
+
+def compile_layout(record: DataItem, encoding: str = "utf-8") -> RecordCodec:
+    """Compile a parsed 01-level record into a ``RecordCodec``."""
+    return RecordCodec(record, encoding)
+
+
+@lru_cache(maxsize=None)
+def _cached_layout(path: str, mtime_ns: int, record: Optional[str], encoding: str) -> RecordCodec:
+    records = load_copybook(path)
+    if record is None:
+        return compile_layout(records[0], encoding)
+    for item in records:
+        if item.name.upper() == record:
+            return compile_layout(item, encoding)
+    raise KeyError(f"Record '{record}' not found in {path}")
+
+
+def load_layout(
+    copybook: Union[str, Path],
+    record: Optional[str] = None,
+    encoding: str = "utf-8",
+) -> RecordCodec:
+    """
+    Load and compile a record layout from a copybook, with caching.
+
+    Args:
+        copybook: Member name (looked up in CopyBooks/) or path
+        record: 01-level record name; defaults to the first record
+        encoding: Character encoding of PIC X fields
+
+    Returns:
+        Compiled RecordCodec, shared between callers
+
+    Raises:
+        FileNotFoundError: If the copybook can't be found
+        KeyError: If the record is not defined in the copybook
+    """
+    path = resolve_copybook(copybook)
+    return _cached_layout(str(path), path.stat().st_mtime_ns,
+                          record.upper() if record else None, encoding)
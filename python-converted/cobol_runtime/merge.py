@@ -0,0 +1,192 @@
+"""
+Streaming MERGE of sorted record files.
+
+Python counterpart of the COBOL ``MERGE`` verb: combines any number of
+files, each already in key order, into one ordered stream. Only one
+record and one read buffer per input are held at a time, so memory is
+O(N) in the number of inputs and independent of their sizes. Inputs are
+read and the output written in large blocks.
+
+Records with equal keys come out in the order of the inputs in USING,
+as COBOL requires. With more inputs than ``max_open`` the inputs are
+merged in groups into temporary files first.
+
+Usage:
+    merge_files(["../SampleData/persons.txt", "../SampleData/persons2.txt"],
+                "merged.txt", PERSON_LAYOUT, ["PERSON-ID"])
+"""
+
+import os
+import shutil
+import tempfile
+from heapq import merge
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, TypeVar, Union
+
+from .layout import RecordCodec
+from .output import RecordWriter
+from .sort import KeySpec, SortKey, compile_sort_key, read_run, write_sorted
+
+DEFAULT_MERGE_BUFFER = 256 * 1024
+DEFAULT_MAX_OPEN = 256
+
+T = TypeVar("T")
+PathLike = Union[str, Path]
+
+
+class MergeOrderError(ValueError):
+    """An input of a MERGE is not in key order."""
+
+
+def read_line_records(
+    path: PathLike,
+    record_length: int,
+    buffer_size: int = DEFAULT_MERGE_BUFFER,
+) -> Iterator[bytes]:
+    """
+    Stream LINE SEQUENTIAL records in large blocks, padded to the record length.
+
+    Args:
+        path: File to read
+        record_length: Record length in bytes (longer lines are truncated)
+        buffer_size: Bytes per read call
+    """
+    with open(path, "rb") as source:
+        tail = b""
+        while True:
+            block = source.read(buffer_size)
+            if not block:
+                break
+            lines = (tail + block).split(b"\n")
+            tail = lines.pop()
+            for line in lines:
+                if line.endswith(b"\r"):
+                    line = line[:-1]
+                yield line[:record_length].ljust(record_length)
+        if tail.rstrip(b"\r"):
+            yield tail.rstrip(b"\r")[:record_length].ljust(record_length)
+
+
+def checked(records: Iterable[bytes], key: SortKey, name: str) -> Iterator[bytes]:
+    """
+    Pass records through, verifying that their keys never decrease.
+
+    Raises:
+        MergeOrderError: On the first record out of order
+    """
+    previous = None
+    for number, record in enumerate(records, 1):
+        current = key(record)
+        if previous is not None and current < previous:
+            raise MergeOrderError(f"{name}: record {number} is out of key order")
+        previous = current
+        yield record
+
+
+def _open_inputs(
+    paths: Sequence[PathLike],
+    record_length: int,
+    key: SortKey,
+    line_sequential: bool,
+    buffer_size: int,
+    check_order: bool,
+) -> List[Iterator[bytes]]:
+    streams = []
+    for path in paths:
+        if line_sequential:
+            records = read_line_records(path, record_length, buffer_size)
+        else:
+            records = read_run(path, record_length, buffer_size)
+        streams.append(checked(records, key, str(path)) if check_order else records)
+    return streams
+
+
+def merge_procedure(
+    inputs: Sequence[PathLike],
+    layout: RecordCodec,
+    keys: Sequence[KeySpec],
+    output_procedure: Callable[[Iterator[bytes]], T],
+    line_sequential: bool = True,
+    buffer_size: int = DEFAULT_MERGE_BUFFER,
+    max_open: int = DEFAULT_MAX_OPEN,
+    check_order: bool = True,
+    work_dir: Optional[PathLike] = None,
+) -> T:
+    """
+    MERGE ... ON ASCENDING/DESCENDING KEY ... USING inputs OUTPUT PROCEDURE.
+
+    Args:
+        inputs: Sorted input files, in USING order
+        layout: Record layout shared by all inputs
+        keys: Key specs the inputs are sorted on, major key first
+        output_procedure: Receives an iterator over the merged records
+            (each ``next`` is a RETURN)
+        line_sequential: Inputs are newline terminated; otherwise they
+            are RECORD SEQUENTIAL
+        buffer_size: Read buffer per input
+        max_open: Inputs merged at once; more are merged in passes
+        check_order: Raise MergeOrderError if an input is out of order
+        work_dir: Directory for intermediate files of multi-pass merges
+
+    Returns:
+        Whatever the output procedure returns
+    """
+    record_length = layout.size
+    key = compile_sort_key(layout, keys)
+    max_open = max(2, max_open)
+    paths = list(inputs)
+    directory = None
+    try:
+        # Too many inputs: merge them in groups into RECORD SEQUENTIAL files
+        if len(paths) > max_open:
+            directory = tempfile.mkdtemp(prefix="merge-", dir=work_dir)
+            streams_are_lines = line_sequential
+            passes = 0
+            while len(paths) > max_open:
+                passes += 1
+                merged = []
+                for start in range(0, len(paths), max_open):
+                    group = paths[start:start + max_open]
+                    path = os.path.join(directory, f"pass{passes:03d}-{len(merged):06d}.tmp")
+                    streams = _open_inputs(group, record_length, key, streams_are_lines,
+                                           buffer_size, check_order)
+                    with open(path, "wb") as run, RecordWriter(run, buffer_size, b"") as out:
+                        out.write_many(merge(*streams, key=key))
+                    merged.append(path)
+                    if passes > 1:
+                        for old in group:
+                            os.remove(old)
+                paths = merged
+                # Intermediate files are already checked and fixed length
+                streams_are_lines = False
+                check_order = False
+            line_sequential = streams_are_lines
+        streams = _open_inputs(paths, record_length, key, line_sequential, buffer_size, check_order)
+        return output_procedure(merge(*streams, key=key))
+    finally:
+        if directory is not None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def merge_files(
+    inputs: Sequence[PathLike],
+    output: PathLike,
+    layout: RecordCodec,
+    keys: Sequence[KeySpec],
+    line_sequential: bool = True,
+    buffer_size: int = DEFAULT_MERGE_BUFFER,
+    max_open: int = DEFAULT_MAX_OPEN,
+    check_order: bool = True,
+    work_dir: Optional[PathLike] = None,
+) -> int:
+    """
+    MERGE ... USING inputs GIVING output (see ``merge_procedure``).
+
+    Returns:
+        Number of records written
+    """
+    def give(records: Iterator[bytes]) -> int:
+        return write_sorted(records, output, line_sequential)
+
+    return merge_procedure(inputs, layout, keys, give, line_sequential, buffer_size,
+                           max_open, check_order, work_dir)
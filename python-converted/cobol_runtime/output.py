@@ -0,0 +1,127 @@
+"""
+Buffered record output.
+
+``RecordWriter`` replaces per-record ``print()`` calls: records are
+appended to one reusable ``bytearray`` and written to the underlying
+binary stream in large blocks, so a job producing millions of lines
+issues a handful of ``write`` calls instead of millions.
+
+Usage:
+    with RecordWriter() as out:          # defaults to stdout
+        for record in records:
+            out.write(record)            # bytes, newline appended
+        out.write_text("Finished!")
+"""
+
+import sys
+from typing import BinaryIO, Iterable, Optional, Union
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class RecordWriter:
+    """
+    Block-buffered, newline-terminated record writer.
+
+    Attributes:
+        buffer_size: Bytes collected before the buffer is written out
+        records_written: Records (lines) written so far
+    """
+
+    def __init__(
+        self,
+        stream: Optional[BinaryIO] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        newline: bytes = b"\n",
+        encoding: str = "utf-8",
+    ):
+        """
+        Create a writer.
+
+        Args:
+            stream: Binary stream to write to (defaults to stdout)
+            buffer_size: Flush threshold in bytes
+            newline: Record terminator
+            encoding: Encoding used by write_text
+
+        Raises:
+            ValueError: If buffer_size is not positive
+        """
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be positive")
+        if stream is None:
+            # Text written earlier through print() must come out first
+            sys.stdout.flush()
+            stream = sys.stdout.buffer
+        self._stream = stream
+        self._buffer = bytearray()
+        self._newline = newline
+        self._encoding = encoding
+        self.buffer_size = buffer_size
+        self.records_written = 0
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.flush()
+
+    def write(self, record: BytesLike) -> None:
+        """Append one record followed by the newline."""
+        buffer = self._buffer
+        buffer += record
+        buffer += self._newline
+        self.records_written += 1
+        if len(buffer) >= self.buffer_size:
+            self._drain()
+
+    def write_text(self, line: str) -> None:
+        """Encode and append one line of text."""
+        self.write(line.encode(self._encoding))
+
+    def write_many(self, records: Iterable[BytesLike]) -> None:
+        """Append many records with a single join per buffer fill."""
+        newline = self._newline
+        buffer = self._buffer
+        limit = self.buffer_size
+        count = 0
+        for record in records:
+            buffer += record
+            buffer += newline
+            count += 1
+            if len(buffer) >= limit:
+                self._drain()
+        self.records_written += count
+
+    def write_raw(self, block: BytesLike, records: int = 0) -> None:
+        """
+        Pass a block of already-terminated records straight through.
+
+        Blocks at least as large as the buffer skip it entirely and go to
+        the stream in one ``write`` call.
+
+        Args:
+            block: Bytes in final output form, newlines included
+            records: Number of records in the block (for the counter)
+        """
+        self.records_written += records
+        if len(block) >= self.buffer_size:
+            self._drain()
+            self._stream.write(block)
+        else:
+            self._buffer += block
+            if len(self._buffer) >= self.buffer_size:
+                self._drain()
+
+    def _drain(self) -> None:
+        if self._buffer:
+            self._stream.write(self._buffer)
+            # clear() keeps the same bytearray object for the next fill
+            self._buffer.clear()
+
+    def flush(self) -> None:
+        """Write out buffered records and flush the stream."""
+        self._drain()
+        self._stream.flush()
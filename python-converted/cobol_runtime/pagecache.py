@@ -0,0 +1,202 @@
+"""
+Shared page cache for paged files.
+
+Keeps recently used pages of one or more files in memory under a single
+byte budget. Pages are owned by a file object (such as ``IndexedFile``)
+that knows how to write them back; modified pages are marked dirty and
+written back when they are evicted or the owner flushes.
+
+Two eviction policies are available:
+- "lru": least recently used, exact recency (a hit reorders the entry)
+- "clock": second-chance approximation of LRU (a hit only sets a
+  reference bit, which makes hits cheaper)
+
+Usage:
+    cache = PageCache(budget=64 * 1024 * 1024, policy="clock")
+    with IndexedFile("output.dat", "io", cache=cache) as people:
+        ...
+    print(cache.hits, cache.misses, cache.hit_ratio)
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+DEFAULT_CACHE_BYTES = 8 * 1024 * 1024
+
+_POLICIES = ("lru", "clock")
+
+
+class _Entry:
+    __slots__ = ("owner", "value", "size", "dirty", "referenced")
+
+    def __init__(self, owner: Any, value: Any, size: int, dirty: bool):
+        self.owner = owner
+        self.value = value
+        self.size = size
+        self.dirty = dirty
+        self.referenced = False
+
+
+class PageCache:
+    """
+    Byte-budgeted page cache shared by any number of files.
+
+    Owners must provide ``_write_back(page, value)``, which is called for
+    dirty pages on eviction and flush.
+
+    Attributes:
+        budget: Maximum bytes of cached pages
+        policy: "lru" or "clock"
+        hits, misses: Lookup counters
+        evictions: Pages dropped to stay within the budget
+        writebacks: Dirty pages written back
+        prefetched: Pages loaded ahead of use by read-ahead
+    """
+
+    def __init__(self, budget: int = DEFAULT_CACHE_BYTES, policy: str = "lru"):
+        """
+        Create a cache.
+
+        Args:
+            budget: Memory budget in bytes (counted in page sizes)
+            policy: Eviction policy, "lru" or "clock"
+
+        Raises:
+            ValueError: On a non-positive budget or unknown policy
+        """
+        if budget <= 0:
+            raise ValueError("budget must be positive")
+        if policy not in _POLICIES:
+            raise ValueError(f"Unknown eviction policy '{policy}'")
+        self.budget = budget
+        self.policy = policy
+        self._entries: "OrderedDict[Tuple[int, int], _Entry]" = OrderedDict()
+        self._used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.writebacks = 0
+        self.prefetched = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Tuple[Any, int]) -> bool:
+        owner, page = key
+        return (id(owner), page) in self._entries
+
+    @property
+    def used(self) -> int:
+        """Bytes of pages currently cached."""
+        return self._used
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from memory."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Hashable]:
+        """Counters as a dictionary, for reports and logging."""
+        return {
+            "policy": self.policy,
+            "pages": len(self._entries),
+            "used": self._used,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hit_ratio, 4),
+            "evictions": self.evictions,
+            "writebacks": self.writebacks,
+            "prefetched": self.prefetched,
+        }
+
+    def get(self, owner: Any, page: int) -> Optional[Any]:
+        """Return a cached page (counting a hit) or None (counting a miss)."""
+        key = (id(owner), page)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.policy == "lru":
+            self._entries.move_to_end(key)
+        else:
+            entry.referenced = True
+        return entry.value
+
+    def put(self, owner: Any, page: int, value: Any, size: int, dirty: bool = False) -> None:
+        """
+        Insert or replace a page, evicting others to respect the budget.
+
+        Args:
+            owner: File object the page belongs to
+            page: Page number
+            value: Cached page (bytes or a parsed node)
+            size: Bytes to charge against the budget
+            dirty: Page differs from disk and must be written back
+        """
+        key = (id(owner), page)
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.value = value
+            entry.dirty = entry.dirty or dirty
+            entry.referenced = True
+            if self.policy == "lru":
+                self._entries.move_to_end(key)
+            return
+        self._entries[key] = _Entry(owner, value, size, dirty)
+        self._used += size
+        self._evict(key)
+
+    def _evict(self, keep: Tuple[int, int]) -> None:
+        entries = self._entries
+        while self._used > self.budget and len(entries) > 1:
+            key, entry = next(iter(entries.items()))
+            if key == keep or (self.policy == "clock" and entry.referenced):
+                # Second chance: clear the bit and move behind the hand
+                entry.referenced = False
+                entries.move_to_end(key)
+                continue
+            del entries[key]
+            self._used -= entry.size
+            self.evictions += 1
+            if entry.dirty:
+                entry.owner._write_back(key[1], entry.value)
+                self.writebacks += 1
+
+    def flush(self, owner: Optional[Any] = None) -> int:
+        """
+        Write back dirty pages (of one owner, or all), in page order.
+
+        Returns:
+            Number of pages written
+        """
+        owner_id = None if owner is None else id(owner)
+        dirty = [
+            (key, entry) for key, entry in self._entries.items()
+            if entry.dirty and (owner_id is None or key[0] == owner_id)
+        ]
+        dirty.sort(key=lambda item: item[0])
+        for key, entry in dirty:
+            entry.owner._write_back(key[1], entry.value)
+            entry.dirty = False
+        self.writebacks += len(dirty)
+        return len(dirty)
+
+    def discard(self, owner: Any) -> None:
+        """Drop every page of an owner without writing it back."""
+        owner_id = id(owner)
+        for key in [key for key in self._entries if key[0] == owner_id]:
+            self._used -= self._entries.pop(key).size
+
+
+_shared_cache: Optional[PageCache] = None
+
+
+def shared_cache() -> PageCache:
+    """Process-wide cache used by files opened without an explicit cache."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = PageCache()
+    return _shared_cache
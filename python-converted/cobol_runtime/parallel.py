@@ -0,0 +1,220 @@
+"""
+Parallel chunked processing of fixed-width record files.
+
+A file is cut into record-aligned byte ranges and each range is handed
+to a worker process. Workers map the file themselves, so only the range
+offsets travel to them and only their (usually much smaller) results
+travel back.
+
+Functions passed to the helpers here run in other processes and must be
+picklable: module-level functions or methods, not lambdas. Layouts are
+passed by copybook name and compiled once per worker process.
+
+Usage:
+    adults = parallel_filter("persons.txt", "PersonRecord", is_adult,
+                             convert=Person.from_record, workers=32)
+"""
+
+import mmap
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from functools import partial
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
+
+from .layout import load_layout
+from .pipeline import read_records
+from .recordio import RecordView
+
+ByteRange = Tuple[int, int]
+
+# Ranges submitted ahead per worker: enough to keep every worker busy,
+# few enough that finished results don't pile up before they are yielded
+IN_FLIGHT_PER_WORKER = 2
+
+
+def split_ranges(
+    path: Union[str, Path],
+    parts: int,
+    record_length: int,
+    line_sequential: bool = True,
+) -> List[ByteRange]:
+    """
+    Split a file into at most ``parts`` record-aligned byte ranges.
+
+    LINE SEQUENTIAL cut points are moved forward to just after the next
+    newline; RECORD SEQUENTIAL cut points are rounded to a multiple of
+    the record length. Ranges are contiguous and cover the whole file.
+
+    Args:
+        path: File to split
+        parts: Desired number of ranges
+        record_length: Record length in bytes
+        line_sequential: Records are newline terminated
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    parts = max(1, min(parts, size // max(record_length, 1) or 1))
+    step = size / parts
+
+    cuts = [0]
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for index in range(1, parts):
+            cut = int(step * index)
+            if line_sequential:
+                newline = mm.find(b"\n", max(cut - 1, cuts[-1]))
+                cut = size if newline < 0 else newline + 1
+            else:
+                cut -= cut % record_length
+            if cuts[-1] < cut < size:
+                cuts.append(cut)
+    cuts.append(size)
+    return list(zip(cuts, cuts[1:]))
+
+
+def map_ranges(
+    function: Callable[[str, int, int], Any],
+    path: Union[str, Path],
+    record_length: int,
+    workers: Optional[int] = None,
+    chunks_per_worker: int = 4,
+    ordered: bool = True,
+    line_sequential: bool = True,
+    executor: Optional[Executor] = None,
+) -> Iterator[Any]:
+    """
+    Run ``function(path, start, stop)`` over record-aligned ranges.
+
+    Args:
+        function: Picklable worker taking the path and a byte range
+        path: File to process
+        record_length: Record length in bytes
+        workers: Worker processes (defaults to the CPU count)
+        chunks_per_worker: Ranges per worker, for load balancing
+        ordered: Yield results in file order; otherwise as they finish
+        line_sequential: Records are newline terminated
+        executor: Existing executor to reuse instead of creating a pool
+
+    Yields:
+        One result per range. At most ``IN_FLIGHT_PER_WORKER`` ranges per
+        worker are submitted ahead of the one being yielded, so results
+        are streamed rather than collected.
+    """
+    workers = workers or os.cpu_count() or 1
+    path = str(path)
+    ranges = split_ranges(path, workers * chunks_per_worker, record_length, line_sequential)
+    if not ranges:
+        return
+
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    remaining = iter(ranges)
+    window = workers * IN_FLIGHT_PER_WORKER
+    in_flight: "deque[Future]" = deque(pool.submit(function, path, start, stop)
+                                       for start, stop in islice(remaining, window))
+    try:
+        while in_flight:
+            if ordered:
+                done = [in_flight.popleft()]
+            else:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                done = [future for future in in_flight if future in finished]
+                for future in done:
+                    in_flight.remove(future)
+            # Keep the workers busy while the caller consumes these results
+            for start, stop in islice(remaining, len(done)):
+                in_flight.append(pool.submit(function, path, start, stop))
+            while done:
+                yield done.pop(0).result()
+    finally:
+        # Abandoned early (or failed): don't run the remaining ranges
+        for future in in_flight:
+            future.cancel()
+        if executor is None:
+            pool.shutdown()
+
+
+def _filter_range(
+    path: str,
+    start: int,
+    stop: int,
+    copybook: str,
+    record: Optional[str],
+    predicate: Optional[Callable[[Any], bool]],
+    convert: Optional[Callable[[RecordView], Any]],
+    line_sequential: bool,
+) -> List[Any]:
+    layout = load_layout(copybook, record)
+    records = read_records(path, layout, convert, line_sequential, start, stop)
+    return list(records if predicate is None else filter(predicate, records))
+
+
+def _count_range(
+    path: str,
+    start: int,
+    stop: int,
+    copybook: str,
+    record: Optional[str],
+    predicate: Optional[Callable[[Any], bool]],
+    convert: Optional[Callable[[RecordView], Any]],
+    line_sequential: bool,
+) -> int:
+    layout = load_layout(copybook, record)
+    records = read_records(path, layout, convert, line_sequential, start, stop)
+    if predicate is None:
+        return sum(1 for _ in records)
+    return sum(1 for value in records if predicate(value))
+
+
+def parallel_filter(
+    path: Union[str, Path],
+    copybook: str,
+    predicate: Optional[Callable[[Any], bool]] = None,
+    convert: Optional[Callable[[RecordView], Any]] = None,
+    record: Optional[str] = None,
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    line_sequential: bool = True,
+) -> Iterator[Any]:
+    """
+    Parse a file across worker processes and keep matching records.
+
+    Args:
+        path: File to process
+        copybook: Copybook holding the record layout
+        predicate: Picklable filter applied in the workers
+        convert: Picklable RecordView converter (e.g. ``Person.from_record``);
+            defaults to decoded field tuples
+        record: 01-level record name within the copybook
+        workers: Worker processes (defaults to the CPU count)
+        ordered: Keep file order; otherwise records arrive per finished chunk
+        line_sequential: Records are newline terminated
+
+    Yields:
+        Matching records
+    """
+    layout = load_layout(copybook, record)
+    worker = partial(_filter_range, copybook=copybook, record=record, predicate=predicate,
+                     convert=convert, line_sequential=line_sequential)
+    chunks = map_ranges(worker, path, layout.size, workers, ordered=ordered,
+                        line_sequential=line_sequential)
+    return chain.from_iterable(chunks)
+
+
+def parallel_count(
+    path: Union[str, Path],
+    copybook: str,
+    predicate: Optional[Callable[[Any], bool]] = None,
+    convert: Optional[Callable[[RecordView], Any]] = None,
+    record: Optional[str] = None,
+    workers: Optional[int] = None,
+    line_sequential: bool = True,
+) -> int:
+    """Count records (optionally matching ``predicate``) across worker processes."""
+    layout = load_layout(copybook, record)
+    worker = partial(_count_range, copybook=copybook, record=record, predicate=predicate,
+                     convert=convert, line_sequential=line_sequential)
+    return sum(map_ranges(worker, path, layout.size, workers, ordered=False,
+                          line_sequential=line_sequential))
@@ -0,0 +1,169 @@
+"""
+Person record types.
+
+The PERSON record (CopyBooks/PersonRecord.cpy) is shared by the file,
+sorting and indexed-file programs:
+- ``Person``: one decoded record, a ``__slots__`` dataclass with no
+  per-instance ``__dict__``
+- ``PersonTable``: many records packed into parallel ``array``/bytes
+  buffers; ``Person`` objects are only built when a row is accessed
+"""
+
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from .layout import load_layout
+from .recordio import MappedRecordFile, RecordView
+
+# PERSON record layout, compiled once from CopyBooks/PersonRecord.cpy
+PERSON_LAYOUT = load_layout("PersonRecord")
+
+_ID, _NAME, _SURNAME = PERSON_LAYOUT.fields
+
+
+@dataclass
+class Person:
+    """
+    Person record structure.
+
+    Attributes:
+        person_id: Person ID number (PIC 999)
+        name: Person first name (PIC X(16))
+        surname: Person last name (PIC X(25))
+    """
+    __slots__ = ("person_id", "name", "surname")
+
+    person_id: int
+    name: str
+    surname: str
+
+    @classmethod
+    def from_line(cls, line: str) -> Optional["Person"]:
+        """
+        Parse a person record from a fixed-width text line.
+
+        COBOL format (CopyBooks/PersonRecord.cpy):
+        - ID: bytes 0-2 (PIC 999)
+        - Name: bytes 3-18 (PIC X(16))
+        - Surname: bytes 19-43 (PIC X(25))
+
+        Args:
+            line: Fixed-width text line
+
+        Returns:
+            Person object or None if parsing fails
+        """
+        try:
+            return cls(*PERSON_LAYOUT.decode(line.encode("utf-8")))
+        except (ValueError, UnicodeDecodeError):
+            return None
+
+    @classmethod
+    def from_record(cls, record: Union[RecordView, bytes, memoryview]) -> Optional["Person"]:
+        """
+        Build a person from raw record bytes or a memory-mapped view.
+
+        Fields are sliced as bytes, so multi-byte UTF-8 names keep the
+        COBOL byte offsets instead of shifting the following field.
+
+        Returns:
+            Person object or None if parsing fails
+        """
+        raw = record.raw() if isinstance(record, RecordView) else record
+        try:
+            return cls(*PERSON_LAYOUT.decode(raw))
+        except (ValueError, UnicodeDecodeError):
+            return None
+
+    def to_record(self) -> bytes:
+        """Encode the person as a fixed-width PersonRecord."""
+        return PERSON_LAYOUT.encode((self.person_id, self.name, self.surname))
+
+    def __str__(self) -> str:
+        """Format person record for display."""
+        return f"{self.person_id:03d} {self.name:16s} {self.surname:25s}"
+
+
+class PersonTable:
+    """
+    Column store for many person records.
+
+    IDs are kept in an ``array('H')`` and names/surnames in fixed-width
+    ``bytearray`` buffers (16 and 25 bytes per row), i.e. 43 bytes per
+    record with no per-record Python objects. Indexing returns a freshly
+    decoded ``Person``.
+    """
+
+    __slots__ = ("_ids", "_names", "_surnames")
+
+    NAME_SIZE = _NAME.size
+    SURNAME_SIZE = _SURNAME.size
+
+    def __init__(self, people: Iterable[Person] = ()):
+        self._ids = array("H")
+        self._names = bytearray()
+        self._surnames = bytearray()
+        for person in people:
+            self.append(person)
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "PersonTable":
+        """
+        Load a person file without decoding any text.
+
+        Name and surname bytes are copied straight from the memory map
+        into the column buffers; only the ID is converted.
+
+        Raises:
+            ValueError: If a record has a non-numeric ID
+        """
+        table = cls()
+        ids, names, surnames = table._ids, table._names, table._surnames
+        id_slice = slice(_ID.start, _ID.end)
+        name_slice = slice(_NAME.start, _NAME.end)
+        surname_slice = slice(_SURNAME.start, _SURNAME.end)
+        with MappedRecordFile(path, PERSON_LAYOUT.field_specs(), PERSON_LAYOUT.size) as records:
+            for record in records:
+                raw = record.raw()
+                ids.append(int(bytes(raw[id_slice])))
+                names += bytes(raw[name_slice]).ljust(cls.NAME_SIZE)
+                surnames += bytes(raw[surname_slice]).ljust(cls.SURNAME_SIZE)
+        return table
+
+    def append(self, person: Person) -> None:
+        """Add a person, storing its fields in the column buffers."""
+        self._ids.append(person.person_id)
+        self._names += person.name.encode("utf-8")[:self.NAME_SIZE].ljust(self.NAME_SIZE)
+        self._surnames += person.surname.encode("utf-8")[:self.SURNAME_SIZE].ljust(self.SURNAME_SIZE)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index: int) -> Person:
+        if index < 0:
+            index += len(self._ids)
+        person_id = self._ids[index]
+        name = self._names[index * self.NAME_SIZE:(index + 1) * self.NAME_SIZE]
+        surname = self._surnames[index * self.SURNAME_SIZE:(index + 1) * self.SURNAME_SIZE]
+        # A character cut by the fixed field size is dropped, as DISPLAY does
+        return Person(person_id, name.decode("utf-8", errors="ignore").strip(),
+                      surname.decode("utf-8", errors="ignore").strip())
+
+    def __iter__(self) -> Iterator[Person]:
+        for index in range(len(self._ids)):
+            yield self[index]
+
+    def person_id(self, index: int) -> int:
+        """Return the ID of a row without building a Person."""
+        return self._ids[index]
+
+    def surname_bytes(self, index: int) -> bytes:
+        """Return the raw space-padded surname of a row."""
+        return bytes(self._surnames[index * self.SURNAME_SIZE:(index + 1) * self.SURNAME_SIZE])
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column buffers."""
+        return self._ids.itemsize * len(self._ids) + len(self._names) + len(self._surnames)
@@ -0,0 +1,358 @@
+"""
+PICTURE editing.
+
+Compiles a numeric-edited PICTURE such as ``+z(7).zz`` or ``$$$,$$9.99CR``
+into a formatter function, the way a COBOL compiler turns the picture
+into an edit mask once and applies it on every MOVE. The formatter is
+generated Python source specialised for that one picture: for every
+possible count of suppressed leading zeros there is a prebuilt f-string
+template, so editing a value is a truncation, one ``%`` format of the
+digits and one template call. Formatters are cached per picture.
+
+Supported symbols:
+- Digit positions: 9, Z (zero suppression), * (check protection)
+- Implied decimal point V and sign S (no print position)
+- Insertion: B (space), 0, /, comma and the actual decimal point
+- Signs: + and - (fixed when written once, floating when repeated),
+  CR and DB
+- Currency: ``$`` (fixed or floating), printed as the currency sign
+
+Editing follows MOVE rules: digits beyond the picture are truncated on
+both sides of the decimal point and a picture without a sign prints the
+absolute value.
+
+Usage:
+    edit = compile_picture("+z(7).zz")
+    edit(Decimal("-317.21"))       # '-    317.21'
+    edit_value(3721, "z(10)")      # '      3721'
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple
+
+from .copybook import parse_picture
+
+EditFunction = Callable[[Any], str]
+# One print position: ("text", literal), ("digit", index) or ("sign", None)
+Position = Tuple[str, Any]
+
+# Item kinds of an edit mask, one per print position (CR/DB take two)
+_DIGIT = "digit"
+_INSERT = "insert"
+_POINT = "point"
+_SIGN = "sign"
+_CURRENCY = "currency"
+_FLOAT_HEAD = "float"
+
+_INSERTION = {"B": " ", "0": "0", "/": "/", ",": ","}
+_SIGNS = {
+    "+": ("+", "-"),
+    "-": (" ", "-"),
+    "CR": ("  ", "CR"),
+    "DB": ("  ", "DB"),
+}
+
+
+@dataclass(frozen=True)
+class EditMask:
+    """
+    Edit mask compiled from a PICTURE string.
+
+    Attributes:
+        picture: Picture string as written (upper-cased)
+        size: Print positions of the edited result
+        digits: Digit positions (9, Z, * and floating symbols)
+        scale: Digit positions right of the decimal point
+        suppressible: Leading digit positions that zero suppression or
+            floating insertion may blank out
+        sign: Sign symbol (+, -, CR or DB), or None
+        layouts: Print positions for each count of suppressed leading
+            digits, 0 to ``suppressible``
+        templates: f-string source printing each of ``layouts``
+        zero: Result for a zero value when no digit position is a 9,
+            or None
+    """
+    picture: str
+    size: int
+    digits: int
+    scale: int
+    suppressible: int
+    sign: Optional[str]
+    layouts: Tuple[Tuple[Position, ...], ...]
+    templates: Tuple[str, ...]
+    zero: Optional[str]
+
+    def sign_text(self, negative: bool) -> str:
+        """Characters printed for the sign symbol."""
+        if self.sign is None:
+            return ""
+        return _SIGNS[self.sign][negative]
+
+
+def _tokenize(symbols: str) -> List[str]:
+    tokens = []
+    i = 0
+    while i < len(symbols):
+        if symbols[i:i + 2] in ("CR", "DB"):
+            tokens.append(symbols[i:i + 2])
+            i += 2
+        else:
+            tokens.append(symbols[i])
+            i += 1
+    return tokens
+
+
+def _parse_items(picture: str, currency: str) -> List[Tuple[str, str]]:
+    """Turn a picture into (kind, symbol) items, one per print position."""
+    symbols = parse_picture(picture).symbols
+    tokens = _tokenize(symbols)
+    for bad in ("X", "A", "P", "E"):
+        if bad in tokens:
+            raise ValueError(f"PICTURE {picture}: symbol {bad} is not supported in editing")
+
+    floating = None
+    for symbol in ("$", "+", "-"):
+        if tokens.count(symbol) > 1:
+            if floating is not None:
+                raise ValueError(f"PICTURE {picture}: more than one floating insertion symbol")
+            floating = symbol
+
+    items: List[Tuple[str, str]] = []
+    head_seen = False
+    for token in tokens:
+        if token in ("S", "V"):
+            if token == "V":
+                items.append((_POINT, ""))
+        elif token in ("9", "Z", "*"):
+            items.append((_DIGIT, token))
+        elif token == floating:
+            # The leftmost floating symbol is an insertion position only
+            head = currency if token == "$" else token
+            items.append((_DIGIT, "F") if head_seen else (_FLOAT_HEAD, head))
+            head_seen = True
+        elif token == ".":
+            items.append((_POINT, "."))
+        elif token in _INSERTION:
+            items.append((_INSERT, _INSERTION[token]))
+        elif token == "$":
+            items.append((_CURRENCY, currency))
+        elif token in _SIGNS:
+            items.append((_SIGN, token))
+        else:
+            raise ValueError(f"PICTURE {picture}: unknown symbol '{token}'")
+    return items
+
+
+def _literal(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("{", "{{").replace("}", "}}").replace('"', '\\"')
+
+
+def _positions(items: List[Tuple[str, str]], suppressed: int, fill: str,
+               floating: Optional[str]) -> Tuple[Position, ...]:
+    """
+    Lay out the print positions for a value whose first ``suppressed``
+    digits are leading zeros that may be blanked out.
+    """
+    positions: List[Position] = []
+    significant = False
+    float_slot = None
+    digit = 0
+    for kind, symbol in items:
+        if kind == _DIGIT:
+            if not significant and digit < suppressed:
+                positions.append(("text", fill if symbol == "*" else " "))
+                float_slot = len(positions) - 1 if symbol == "F" else float_slot
+            else:
+                significant = True
+                positions.append(("digit", digit))
+            digit += 1
+        elif kind == _FLOAT_HEAD:
+            positions.append(("text", " "))
+            float_slot = len(positions) - 1
+        elif kind == _INSERT:
+            if significant:
+                positions.append(("text", symbol))
+            else:
+                positions.append(("text", fill))
+                if float_slot is not None and float_slot == len(positions) - 2:
+                    float_slot = len(positions) - 1
+        elif kind == _POINT:
+            significant = True
+            if symbol:
+                positions.append(("text", symbol))
+        elif kind == _CURRENCY:
+            positions.append(("text", symbol))
+        else:
+            positions.append(("sign", None))
+
+    # The floating symbol lands in the rightmost blanked-out position
+    if floating is not None and float_slot is not None:
+        positions[float_slot] = ("sign", None) if floating in "+-" else ("text", floating)
+    return tuple(positions)
+
+
+def _template(positions: Tuple[Position, ...]) -> str:
+    """Build the f-string source that prints one position layout."""
+    parts: List[str] = []
+    text = ""
+    run_start = run_end = None
+    for kind, value in positions:
+        if kind == "digit" and run_end == value:
+            run_end += 1
+            continue
+        if run_start is not None:
+            parts.append(f"{{d[{run_start}:{run_end}]}}")
+            run_start = run_end = None
+        if kind == "text":
+            text += value
+            continue
+        if text:
+            parts.append(_literal(text))
+            text = ""
+        if kind == "digit":
+            run_start, run_end = value, value + 1
+        else:
+            parts.append("{s}")
+    if run_start is not None:
+        parts.append(f"{{d[{run_start}:{run_end}]}}")
+    if text:
+        parts.append(_literal(text))
+    return 'f"' + "".join(parts) + '"'
+
+
+@lru_cache(maxsize=None)
+def compile_mask(picture: str, currency: str = "$", blank_when_zero: bool = False) -> EditMask:
+    """
+    Compile a PICTURE string into an edit mask.
+
+    Args:
+        picture: Numeric or numeric-edited picture, e.g. ``$z(7).zz``
+        currency: Text printed for the currency symbol ``$``
+        blank_when_zero: BLANK WHEN ZERO clause
+
+    Raises:
+        ValueError: For alphanumeric pictures and unsupported symbols
+    """
+    picture = picture.upper()
+    items = _parse_items(picture, currency)
+    fill = "*" if any(item == (_DIGIT, "*") for item in items) else " "
+    floating = next((symbol for kind, symbol in items if kind == _FLOAT_HEAD), None)
+    signs = [symbol for kind, symbol in items if kind == _SIGN]
+    if len(signs) > 1:
+        raise ValueError(f"PICTURE {picture}: more than one sign symbol")
+    sign = signs[0] if signs else floating if floating in ("+", "-") else None
+
+    digits = sum(1 for kind, _ in items if kind == _DIGIT)
+    point = next((i for i, (kind, _) in enumerate(items) if kind == _POINT), len(items))
+    scale = sum(1 for kind, _ in items[point:] if kind == _DIGIT)
+
+    # Zero suppression stops at the first 9 or the decimal point
+    suppressible = 0
+    for kind, symbol in items[:point]:
+        if kind == _DIGIT:
+            if symbol == "9":
+                break
+            suppressible += 1
+
+    sign_width = len(_SIGNS[sign][0]) if sign else 0
+    layouts = tuple(_positions(items, k, fill, floating) for k in range(suppressible + 1))
+    templates = tuple(_template(positions) for positions in layouts)
+    size = sum(_width(kind, symbol, sign_width) for kind, symbol in items)
+
+    zero = None
+    if blank_when_zero:
+        zero = " " * size
+    elif not any(item == (_DIGIT, "9") for item in items):
+        if fill == "*":
+            # Check protection: everything but the decimal point is starred
+            zero = "".join(symbol if kind == _POINT else "*" * _width(kind, symbol, sign_width)
+                           for kind, symbol in items)
+        else:
+            zero = " " * size
+    return EditMask(picture, size, digits, scale, suppressible, sign, layouts, templates, zero)
+
+
+def _width(kind: str, symbol: str, sign_width: int) -> int:
+    """Print positions taken by one mask item."""
+    if kind == _SIGN or (kind == _FLOAT_HEAD and symbol in "+-"):
+        return sign_width
+    if kind in (_CURRENCY, _FLOAT_HEAD):
+        return len(symbol)
+    return len(symbol) if kind == _POINT else 1
+
+
+def scaled_integer(value: Any, scale: int) -> int:
+    """
+    Convert a number to an integer count of 10**-scale units, truncating.
+
+    Floats go through their shortest repr, so 317.21 is 31721 hundredths
+    and not 31720.
+    """
+    if value.__class__ is int:
+        return value * 10 ** scale if scale else value
+    if isinstance(value, float):
+        value = repr(value)
+    number = value if isinstance(value, Decimal) else Decimal(str(value).strip())
+    return int(number.scaleb(scale)) if scale else int(number)
+
+
+def _generate(mask: EditMask) -> str:
+    positive, negative = _SIGNS[mask.sign] if mask.sign else ("", "")
+    lines = ["def edit(value):"]
+    lines.append("    if value.__class__ is int:")
+    lines.append(f"        n = value * {10 ** mask.scale}" if mask.scale else "        n = value")
+    lines.append("    else:")
+    lines.append(f"        n = _scaled(value, {mask.scale})")
+    lines.append(f"    a = (-n if n < 0 else n) % {10 ** mask.digits}")
+    if mask.zero is not None:
+        lines.append("    if not a:")
+        lines.append(f"        return {mask.zero!r}")
+    if mask.sign:
+        lines.append(f"    s = {negative!r} if n < 0 and a else {positive!r}")
+    else:
+        lines.append("    s = ''")
+    lines.append(f"    d = '%0{mask.digits}d' % a")
+    if mask.suppressible:
+        lines.append("    k = len(d) - len(d.lstrip('0'))")
+        lines.append(f"    return _templates[k if k < {mask.suppressible} else {mask.suppressible}](d, s)")
+    else:
+        lines.append(f"    return {mask.templates[0]}")
+    return "\n".join(lines) + "\n"
+
+
+@lru_cache(maxsize=None)
+def compile_picture(picture: str, currency: str = "$", blank_when_zero: bool = False) -> EditFunction:
+    """
+    Compile a PICTURE string into a cached formatter.
+
+    Args:
+        picture: Numeric or numeric-edited picture, e.g. ``+z(7).zz``
+        currency: Text printed for the currency symbol ``$``
+        blank_when_zero: BLANK WHEN ZERO clause
+
+    Returns:
+        Function taking an int, Decimal, float or numeric string and
+        returning the edited text; its ``mask`` and ``source``
+        attributes describe the compiled picture
+
+    Raises:
+        ValueError: For alphanumeric pictures and unsupported symbols
+    """
+    mask = compile_mask(picture, currency, blank_when_zero)
+    source = _generate(mask)
+    namespace = {
+        "_scaled": scaled_integer,
+        "_templates": tuple(eval(f"lambda d, s: {t}") for t in mask.templates),
+    }
+    exec(compile(source, f"<picture {mask.picture}>", "exec"), namespace)
+    edit = namespace["edit"]
+    edit.mask = mask
+    edit.source = source
+    return edit
+
+
+def edit_value(value: Any, picture: str, currency: str = "$") -> str:
+    """MOVE a number to a numeric-edited item and return the edited text."""
+    return compile_picture(picture, currency)(value)
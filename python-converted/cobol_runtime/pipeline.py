@@ -0,0 +1,212 @@
+"""
+Streaming record pipelines.
+
+A ``Pipeline`` chains lazy generator stages over a record source, the
+way a COBOL batch job chains READ, IF, MOVE, SORT and WRITE. Records (or
+batches of records) flow through one at a time; no stage builds an
+intermediate list, so memory stays flat regardless of input size. The
+only exception is ``sort``, which must see every record before it can
+emit the first one; for streams of record bytes,
+``cobol_runtime.sort.external_sort_stage`` sorts within a fixed memory
+budget instead.
+
+Usage:
+    (Pipeline.read("../SampleData/persons.txt", PERSON_LAYOUT, Person.from_record)
+        .filter(lambda p: p.person_id > 10)
+        .map(str)
+        .write_text(RecordWriter()))
+"""
+
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
+
+from .layout import RecordCodec
+from .output import RecordWriter
+from .recordio import MappedRecordFile, RecordView
+
+Stage = Callable[[Iterator[Any]], Iterator[Any]]
+
+
+def read_records(
+    path: Union[str, Path],
+    layout: RecordCodec,
+    convert: Optional[Callable[[RecordView], Any]] = None,
+    line_sequential: bool = True,
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> Iterator[Any]:
+    """
+    Stream records from a fixed-width file (or a byte range of it).
+
+    Args:
+        path: File to read
+        layout: Compiled record layout
+        convert: Applied to each ``RecordView``; records for which it
+            returns None are dropped. Defaults to ``layout.decode`` on
+            the raw bytes (a tuple of field values).
+        line_sequential: Records are newline terminated
+        start: Byte offset to begin at; must be a record boundary
+        stop: Byte offset to stop at (defaults to end of file)
+
+    Yields:
+        Converted records; the file stays mapped until the generator
+        is exhausted or closed
+    """
+    with MappedRecordFile(path, layout.field_specs(), layout.size, line_sequential) as mapped:
+        records = mapped.records(start, stop)
+        if convert is None:
+            decode = layout.decode
+            for record in records:
+                yield decode(record.raw())
+        else:
+            for record in records:
+                value = convert(record)
+                if value is not None:
+                    yield value
+
+
+class FileSource:
+    """Re-iterable record source: every iteration reads the file anew."""
+
+    def __init__(self, path: Union[str, Path], layout: RecordCodec,
+                 convert: Optional[Callable[[RecordView], Any]] = None,
+                 line_sequential: bool = True):
+        self.path = path
+        self.layout = layout
+        self.convert = convert
+        self.line_sequential = line_sequential
+
+    def __iter__(self) -> Iterator[Any]:
+        return read_records(self.path, self.layout, self.convert, self.line_sequential)
+
+
+def filter_stage(predicate: Callable[[Any], bool]) -> Stage:
+    """Keep records for which ``predicate`` is true (COBOL IF)."""
+    return lambda records: filter(predicate, records)
+
+
+def map_stage(function: Callable[[Any], Any]) -> Stage:
+    """Transform every record (COBOL MOVE / COMPUTE)."""
+    return lambda records: map(function, records)
+
+
+def sort_stage(key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> Stage:
+    """Sort all records; this stage holds the whole input in memory."""
+    return lambda records: iter(sorted(records, key=key, reverse=reverse))
+
+
+def batch_stage(size: int) -> Stage:
+    """Group records into lists of at most ``size`` records."""
+    if size <= 0:
+        raise ValueError("batch size must be positive")
+
+    def batches(records: Iterator[Any]) -> Iterator[List[Any]]:
+        while True:
+            batch = list(islice(records, size))
+            if not batch:
+                return
+            yield batch
+    return batches
+
+
+def flatten_stage() -> Stage:
+    """Undo ``batch_stage``: emit the records of each batch in turn."""
+    return chain.from_iterable
+
+
+class Pipeline:
+    """
+    Lazy chain of record stages over a source iterable.
+
+    Builder methods return a new pipeline, so a partially built chain
+    can be extended in several ways; pipelines started with ``read`` can
+    be run more than once. Nothing runs until the pipeline is iterated or a
+    terminal method (``write``, ``write_text``, ``for_each``, ``count``,
+    ``collect``) is called.
+    """
+
+    def __init__(self, source: Iterable[Any], stages: Iterable[Stage] = ()):
+        self._source = source
+        self._stages = tuple(stages)
+
+    @classmethod
+    def read(
+        cls,
+        path: Union[str, Path],
+        layout: RecordCodec,
+        convert: Optional[Callable[[RecordView], Any]] = None,
+        line_sequential: bool = True,
+    ) -> "Pipeline":
+        """Start a pipeline from a fixed-width file (see ``read_records``)."""
+        return cls(FileSource(path, layout, convert, line_sequential))
+
+    def then(self, stage: Stage) -> "Pipeline":
+        """Append a custom stage."""
+        return Pipeline(self._source, self._stages + (stage,))
+
+    def filter(self, predicate: Callable[[Any], bool]) -> "Pipeline":
+        return self.then(filter_stage(predicate))
+
+    def map(self, function: Callable[[Any], Any]) -> "Pipeline":
+        return self.then(map_stage(function))
+
+    def sort(self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> "Pipeline":
+        return self.then(sort_stage(key, reverse))
+
+    def batch(self, size: int) -> "Pipeline":
+        return self.then(batch_stage(size))
+
+    def flatten(self) -> "Pipeline":
+        return self.then(flatten_stage())
+
+    def __iter__(self) -> Iterator[Any]:
+        records: Iterator[Any] = iter(self._source)
+        for stage in self._stages:
+            records = stage(records)
+        return records
+
+    def count(self) -> int:
+        """Run the pipeline and return the number of records out."""
+        return sum(1 for _ in self)
+
+    def for_each(self, function: Callable[[Any], Any]) -> int:
+        """Run the pipeline, passing every record to ``function`` (e.g. REWRITE); returns the count."""
+        count = 0
+        for record in self:
+            function(record)
+            count += 1
+        return count
+
+    def collect(self) -> List[Any]:
+        """Run the pipeline into a list (for small results and tests)."""
+        return list(self)
+
+    def write(
+        self,
+        target: Union[str, Path, RecordWriter],
+        encode: Optional[Callable[[Any], bytes]] = None,
+    ) -> int:
+        """
+        Run the pipeline, writing each record as a line of bytes.
+
+        Args:
+            target: Output file path or an open RecordWriter
+            encode: Converts a record to bytes (e.g. ``layout.encode``);
+                records that are already bytes need none
+
+        Returns:
+            Number of records written
+        """
+        records = iter(self) if encode is None else map(encode, self)
+        if isinstance(target, RecordWriter):
+            before = target.records_written
+            target.write_many(records)
+            return target.records_written - before
+        with open(target, "wb") as stream, RecordWriter(stream) as out:
+            out.write_many(records)
+            return out.records_written
+
+    def write_text(self, target: Union[str, Path, RecordWriter], encoding: str = "utf-8") -> int:
+        """Run the pipeline, writing each record as a line of text."""
+        return self.write(target, lambda line: line.encode(encoding))
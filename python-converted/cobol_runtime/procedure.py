@@ -0,0 +1,243 @@
+"""
+PROCEDURE DIVISION paragraphs and transfers of control.
+
+A ``Procedure`` holds a program's paragraphs in source order. ``compile``
+turns them into an indexed table of functions plus a name -> index map,
+and ``run`` executes the table with a program counter: a paragraph that
+ends falls through to the next index, and every transfer is a table
+index found with one dict lookup.
+
+Paragraph bodies are plain functions. A paragraph ends with a transfer
+of control by returning the statement; one that carries on after the
+transfer is written as a generator and yields it (a generator's return
+value is lost, so generators always yield their statements):
+- ``perform(first, thru=..., times=..., until=...)``: PERFORM a range of
+  paragraphs; a yielding paragraph resumes after the yield when the
+  range ends
+- ``go_to(target)``: GO TO; the rest of the paragraph is abandoned
+- ``go_to(t1, t2, t3, depending_on=n)``: GO TO ... DEPENDING ON; when n
+  is out of range the paragraph carries on with its next statement
+- ``STOP_RUN``
+A bare ``yield`` ends the paragraph there, like EXIT PARAGRAPH.
+
+Active PERFORMs are kept on an explicit stack of frames, so control
+transfers use neither recursion nor exceptions: a deep chain of nested
+PERFORMs or a long GO TO loop cannot hit the recursion limit. As in
+COBOL, the range of the innermost active PERFORM ends whenever its last
+paragraph ends, however control got there.
+
+Usage:
+    procedure = Procedure("02_LOOPS")
+
+    @procedure.paragraph("MAIN")
+    def main_line():
+        yield perform("B-PARAGRAPH", thru="D-PARAGRAPH", times=2)
+        print("=======")
+
+    @procedure.paragraph("B-PARAGRAPH")
+    def b_paragraph():
+        print("B-PARAGRAPH")
+        if done:
+            return go_to("E-PARAGRAPH")
+    ...
+    procedure.run()
+"""
+
+from inspect import isgeneratorfunction
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+class Perform(NamedTuple):
+    """PERFORM first [THRU thru] [times TIMES] [UNTIL until()] (test before)."""
+    first: str
+    thru: Optional[str] = None
+    times: Optional[int] = 1
+    until: Optional[Callable[[], bool]] = None
+
+
+class GoTo(NamedTuple):
+    """GO TO targets [DEPENDING ON depending_on]."""
+    targets: Tuple[str, ...]
+    depending_on: Optional[int] = None
+
+
+class _StopRun:
+    def __repr__(self) -> str:
+        return "STOP_RUN"
+
+
+STOP_RUN = _StopRun()
+
+# Statements built so far, so a PERFORM or GO TO in a loop reuses one
+# object instead of building it again (PERFORM ... UNTIL is not cached:
+# its condition is usually a new closure every time)
+_STATEMENTS: Dict[Tuple[Any, ...], Any] = {}
+
+
+def perform(first: str, thru: Optional[str] = None, times: Optional[int] = None,
+            until: Optional[Callable[[], bool]] = None) -> Perform:
+    """
+    PERFORM a paragraph or a THRU range.
+
+    Args:
+        first: First paragraph of the range
+        thru: Last paragraph of the range (default: ``first``)
+        times: Number of times to run the range (default: once, or as
+            often as it takes ``until`` to hold); zero or less skips it
+        until: Condition tested before each run of the range
+    """
+    if until is not None:
+        return Perform(first.upper(), thru.upper() if thru else None, times, until)
+    key = (first, thru, times)
+    statement = _STATEMENTS.get(key)
+    if statement is None:
+        statement = _STATEMENTS[key] = Perform(first.upper(), thru.upper() if thru else None,
+                                               1 if times is None else times)
+    return statement
+
+
+def go_to(*targets: str, depending_on: Optional[int] = None) -> GoTo:
+    """
+    GO TO a paragraph, or GO TO ... DEPENDING ON a 1-based index.
+
+    Raises:
+        ValueError: If no target is given, or several without DEPENDING ON
+    """
+    key = (targets, depending_on)
+    statement = _STATEMENTS.get(key)
+    if statement is None:
+        if not targets or (len(targets) > 1 and depending_on is None):
+            raise ValueError("GO TO: one target, or several with DEPENDING ON")
+        statement = GoTo(tuple(t.upper() for t in targets), depending_on)
+        # Out-of-range DEPENDING ON values are not kept
+        if depending_on is None or 1 <= depending_on <= len(targets):
+            _STATEMENTS[key] = statement
+    return statement
+
+
+class Procedure:
+    """
+    A program's paragraphs, compiled into a dispatch table.
+
+    Attributes:
+        name: PROGRAM-ID, used in error messages
+        names: Paragraph names in source order
+    """
+
+    def __init__(self, name: str = "PROGRAM"):
+        self.name = name
+        self.names: List[str] = []
+        self._bodies: List[Callable[..., Any]] = []
+        self._table: Optional[Tuple[Tuple[Callable[..., Any], ...], Tuple[bool, ...], Dict[str, int]]] = None
+
+    def paragraph(self, name: Optional[str] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """
+        Decorator adding a paragraph after the ones already defined.
+
+        Args:
+            name: Paragraph name; defaults to the function name, with
+                ``_`` read as ``-`` (a_paragraph -> A-PARAGRAPH)
+
+        Raises:
+            ValueError: If the name is already used
+        """
+        def add(body: Callable[..., Any]) -> Callable[..., Any]:
+            key = (name or body.__name__.replace("_", "-")).upper()
+            if key in self.names:
+                raise ValueError(f"{self.name}: duplicate paragraph {key}")
+            self.names.append(key)
+            self._bodies.append(body)
+            self._table = None
+            return body
+        return add
+
+    def compile(self) -> Tuple[Tuple[Callable[..., Any], ...], Tuple[bool, ...], Dict[str, int]]:
+        """
+        Build the dispatch table: bodies by index, which ones are
+        generators (can transfer control), and the index of every name.
+        """
+        if self._table is None:
+            self._table = (
+                tuple(self._bodies),
+                tuple(isgeneratorfunction(body) for body in self._bodies),
+                {name: index for index, name in enumerate(self.names)},
+            )
+        return self._table
+
+    def run(self, *args: Any, start: Optional[str] = None) -> None:
+        """
+        Execute the procedure until STOP RUN or the end of the last paragraph.
+
+        Args:
+            *args: Passed to every paragraph body (e.g. the working storage)
+            start: Paragraph to start at (default: the first one)
+
+        Raises:
+            ValueError: On a transfer to an unknown paragraph, or a
+                paragraph that returns or yields something other than a
+                statement
+        """
+        bodies, resumable, index = self.compile()
+        count = len(bodies)
+        # Active PERFORMs: [first, last, runs left, until, return index, paused generator]
+        frames: List[List[Any]] = []
+        pc = index[start.upper()] if start else 0
+        current = None
+
+        while True:
+            if current is None:
+                if pc >= count:
+                    return
+                if resumable[pc]:
+                    current = bodies[pc](*args)
+                    transfer = next(current, None)
+                else:
+                    transfer = bodies[pc](*args)
+            else:
+                transfer = next(current, None)
+
+            if transfer is not None:
+                kind = transfer.__class__
+                try:
+                    if kind is Perform:
+                        first = index[transfer.first]
+                        last = index[transfer.thru] if transfer.thru else first
+                        times, until = transfer.times, transfer.until
+                        if (times is None or times > 0) and (until is None or not until()):
+                            frames.append([first, last, -1 if times is None else times, until, pc, current])
+                            pc, current = first, None
+                            continue
+                    elif kind is GoTo:
+                        targets = transfer.targets
+                        choice = transfer.depending_on
+                        if choice is None or 1 <= choice <= len(targets):
+                            pc = index[targets[0 if choice is None else choice - 1]]
+                            current = None
+                            continue
+                    elif transfer is STOP_RUN:
+                        return
+                    else:
+                        raise ValueError(f"{self.name}: paragraph {self.names[pc]} gave {transfer!r}")
+                except KeyError as e:
+                    raise ValueError(f"{self.name}: no paragraph named {e.args[0]}") from None
+                if current is not None:
+                    # Nothing to do: a yielding paragraph carries on
+                    continue
+
+            # End of paragraph pc: repeat or leave the innermost PERFORM
+            # range ending here, or fall through to the next paragraph
+            current = None
+            while frames and frames[-1][1] == pc:
+                frame = frames[-1]
+                frame[2] -= 1
+                if frame[2] != 0 and (frame[3] is None or not frame[3]()):
+                    pc = frame[0]
+                    break
+                frames.pop()
+                pc, current = frame[4], frame[5]
+                if current is not None:
+                    break
+                # The PERFORM was returned as the last statement of
+                # paragraph pc, which ends now as well
+            else:
+                pc += 1
@@ -0,0 +1,220 @@
+"""
+Memory-mapped record I/O.
+
+Zero-copy access to fixed-width record files. The file is mapped with
+``mmap`` and every record is exposed as a ``memoryview`` slice of the
+mapping, so field bytes are only decoded when a caller actually reads
+them as text or numbers.
+
+Two COBOL file organizations are supported:
+- LINE SEQUENTIAL: records terminated by a newline, trailing spaces
+  may be trimmed (short records read as space-padded)
+- RECORD SEQUENTIAL: records of exactly ``record_length`` bytes with
+  no separator
+"""
+
+import mmap
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Sequence, Tuple, Union
+
+# (field name, start offset, end offset) - offsets are byte positions
+FieldSpec = Tuple[str, int, int]
+
+
+class RecordView:
+    """
+    Lazy view over a single record.
+
+    Holds a ``memoryview`` into the mapped file. Nothing is copied or
+    decoded until ``field``/``text``/``number`` is called. A view is only
+    valid while the file it came from is open.
+    """
+
+    __slots__ = ("_buf", "_fields")
+
+    def __init__(self, buf: memoryview, fields: Dict[str, slice]):
+        self._buf = buf
+        self._fields = fields
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    def raw(self) -> memoryview:
+        """Return the record bytes exactly as stored (without newline)."""
+        return self._buf
+
+    def field(self, name: str) -> memoryview:
+        """
+        Return the bytes of a field as a zero-copy slice.
+
+        Fields that lie past the end of a short record come back shorter
+        than declared (or empty); callers treat that as space padding.
+        """
+        return self._buf[self._fields[name]]
+
+    def text(self, name: str, encoding: str = "utf-8") -> str:
+        """Decode a PIC X field and strip the space padding."""
+        return str(self.field(name), encoding).strip()
+
+    def number(self, name: str) -> int:
+        """
+        Decode an unsigned display-numeric (PIC 9) field.
+
+        Raises:
+            ValueError: If the field does not contain digits
+        """
+        return int(bytes(self.field(name)))
+
+
+class MappedRecordFile:
+    """
+    Fixed-width record file opened through ``mmap``.
+
+    Usage:
+        with MappedRecordFile(path, fields) as records:
+            for record in records:
+                print(record.text("name"))
+
+    Attributes:
+        path: Path of the mapped file
+        record_length: Declared record length in bytes
+        line_sequential: True for newline-terminated records
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        fields: Sequence[FieldSpec],
+        record_length: Optional[int] = None,
+        line_sequential: bool = True,
+    ):
+        """
+        Map a record file for reading.
+
+        Args:
+            path: File to map
+            fields: Field layout as (name, start, end) byte offsets
+            record_length: Record length; defaults to the end of the last
+                field. Required to step through RECORD SEQUENTIAL files.
+            line_sequential: Records are newline terminated
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the record length is not positive
+        """
+        self.path = Path(path)
+        self.record_length = record_length or max(end for _, _, end in fields)
+        if self.record_length <= 0:
+            raise ValueError("record_length must be positive")
+        self.line_sequential = line_sequential
+        self._fields = {name: slice(start, end) for name, start, end in fields}
+
+        self._file = open(self.path, "rb")
+        self._mm: Optional[mmap.mmap] = None
+        self._view = memoryview(b"")
+        try:
+            # mmap refuses to map empty files; those simply have no records
+            if self._file.seek(0, 2) > 0:
+                self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._view = memoryview(self._mm)
+        except BaseException:
+            self._file.close()
+            raise
+
+    def __enter__(self) -> "MappedRecordFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Size of the mapped file in bytes."""
+        return len(self._view)
+
+    def raw(self) -> memoryview:
+        """Return the whole mapped file as a zero-copy view."""
+        return self._view
+
+    def close(self) -> None:
+        """
+        Release the mapping.
+
+        If callers still hold record views the mapping stays alive until
+        the last view is garbage collected; the file handle is closed
+        either way.
+        """
+        self._view.release()
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                pass
+            self._mm = None
+        self._file.close()
+
+    def is_canonical(self) -> bool:
+        """
+        True if every record is exactly ``record_length`` bytes.
+
+        For LINE SEQUENTIAL files this means each record is followed by a
+        single newline at a fixed stride, so the file can be processed in
+        whole blocks without looking for record boundaries.
+        """
+        size = len(self._view)
+        if not self.line_sequential:
+            return size % self.record_length == 0
+        stride = self.record_length + 1
+        if self._mm is None or size % stride:
+            return False
+        return self._mm[self.record_length::stride].count(b"\n") == size // stride
+
+    def spans(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+        """
+        Yield (start, end) byte offsets of each record, excluding newlines.
+
+        Record boundaries are located with ``mmap.find`` so the scan runs
+        in C without copying any data.
+
+        Args:
+            start: Byte offset to begin at; must be a record boundary
+            stop: Byte offset to stop at (defaults to end of file)
+        """
+        size = len(self._view)
+        stop = size if stop is None else min(stop, size)
+
+        if not self.line_sequential:
+            length = self.record_length
+            for pos in range(start, stop - length + 1, length):
+                yield pos, pos + length
+            return
+
+        find = self._mm.find if self._mm is not None else None
+        view = self._view
+        pos = start
+        while pos < stop:
+            newline = find(b"\n", pos, stop)
+            if newline < 0:
+                end = next_pos = stop
+            else:
+                end, next_pos = newline, newline + 1
+            if end > pos and view[end - 1] == 0x0D:
+                end -= 1
+            yield pos, end
+            pos = next_pos
+
+    def records(self, start: int = 0, stop: Optional[int] = None) -> Iterator[RecordView]:
+        """
+        Yield a lazy ``RecordView`` for each record in a byte range.
+
+        Args:
+            start: Byte offset to begin at; must be a record boundary
+            stop: Byte offset to stop at (defaults to end of file)
+        """
+        view = self._view
+        fields = self._fields
+        for begin, end in self.spans(start, stop):
+            yield RecordView(view[begin:end], fields)
+
+    def __iter__(self) -> Iterator[RecordView]:
+        """Yield a lazy ``RecordView`` for every record in the file."""
+        return self.records()
@@ -0,0 +1,603 @@
+"""
+External merge sort for fixed-width records.
+
+Python counterpart of the COBOL ``SORT`` verb. Records are collected in
+memory up to a budget; each full batch is sorted and spilled to a work
+file as a sorted run. The runs are then combined with a heap-based
+k-way merge, so files much larger than memory sort with a fixed
+footprint. When everything fits in the budget no work file is written.
+
+The sort is stable: records with equal keys keep their input order,
+as with ``WITH DUPLICATES IN ORDER``.
+
+Sort keys are compiled from the record layout into a single generated
+function returning one ``bytes`` value per record, so the merge only
+ever compares bytes: ASCENDING fields are sliced as stored, DESCENDING
+fields are byte-inverted, and signed numbers and native-order binary
+fields are re-encoded so that byte order is numeric order.
+
+With ``parallel_sort_file`` run generation (reading, key extraction and
+sorting of runs) happens in worker processes, one input range each;
+the parent only merges.
+
+INPUT and OUTPUT PROCEDUREs are generator hooks (``sort_procedure``):
+every record an input generator yields is RELEASEd to the sort, and the
+output procedure consumes the sorted records as an iterator, each
+``next`` being a RETURN. Records can so be filtered on the way in and
+processed on the way out without USING/GIVING files.
+
+Usage:
+    sort_file("../SampleData/persons.txt", "sortedOutput.dat",
+              PERSON_LAYOUT, ["PERSON-SURNAME", ("PERSON-ID", "DESCENDING")])
+
+    with ExternalSorter(44, key=lambda r: r[19:44]) as sorter:
+        sorter.extend(records)
+        for record in sorter:
+            ...
+"""
+
+import os
+import shutil
+import tempfile
+from functools import lru_cache, partial
+from heapq import merge
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from .comp import BIG, binary_byteorder, decode_packed
+from .copybook import NUMERIC
+from .layout import RecordCodec, decode_display_numeric, load_layout
+from .output import RecordWriter
+from .parallel import map_ranges
+from .pipeline import Stage
+from .recordio import MappedRecordFile
+
+DEFAULT_SORT_MEMORY = 64 * 1024 * 1024
+DEFAULT_FAN_IN = 64
+MAX_MERGE_BUFFER = 1024 * 1024
+
+# Approximate cost of one in-memory record beyond its bytes: the bytes
+# object header, its list slot and the sort key
+RECORD_OVERHEAD = 96
+
+ASCENDING = "ASCENDING"
+DESCENDING = "DESCENDING"
+_DIRECTIONS = {"ASCENDING": ASCENDING, "ASC": ASCENDING, "DESCENDING": DESCENDING, "DESC": DESCENDING}
+
+# Byte inversion: ascending byte order of inverted keys is descending order
+_INVERT = bytes(range(255, -1, -1))
+
+SortKey = Callable[[bytes], bytes]
+RecordBytes = Union[bytes, bytearray, memoryview]
+# An iterable of records to RELEASE, or a callable given the release function
+InputProcedure = Union[Iterable[RecordBytes], Callable[[Callable[[RecordBytes], None]], Any]]
+T = TypeVar("T")
+# A field name (ascending) or a (field name, direction) pair
+KeySpec = Union[str, Tuple[str, str]]
+
+
+def _signed_key(raw: bytes, digits: int) -> bytes:
+    """Re-encode a signed DISPLAY number so byte order is numeric order."""
+    return b"%0*d" % (digits + 1, int(decode_display_numeric(raw)) + 10 ** digits)
+
+
+def _packed_key(raw: bytes, size: int) -> bytes:
+    """Re-encode a signed COMP-3 number as an offset big-endian integer."""
+    return (decode_packed(raw) + 10 ** (2 * size - 1)).to_bytes(size + 1, BIG)
+
+
+def _binary_key(raw: bytes, signed: bool, byteorder: str) -> bytes:
+    """Re-encode a COMP/COMP-5 number as an offset big-endian integer."""
+    value = int.from_bytes(raw, byteorder, signed=signed)
+    if signed:
+        value += 1 << 8 * len(raw) - 1
+    return value.to_bytes(len(raw), BIG)
+
+
+def parse_key_spec(key: KeySpec) -> Tuple[str, str]:
+    """
+    Normalise a key spec to (field name, ASCENDING/DESCENDING).
+
+    Raises:
+        ValueError: On an unknown direction
+    """
+    if isinstance(key, str):
+        return key, ASCENDING
+    name, direction = key
+    try:
+        return name, _DIRECTIONS[direction.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown sort direction '{direction}'") from None
+
+
+def compile_sort_key(layout: RecordCodec, keys: Sequence[KeySpec]) -> SortKey:
+    """
+    Compile ON ASCENDING/DESCENDING KEY clauses into a byte key function.
+
+    Unsigned DISPLAY, COMP-3 and COMP fields already compare correctly
+    as bytes (PIC X in the native collating sequence, the numbers
+    numerically), so they are plain slices; signed numeric fields and
+    COMP-5 are re-encoded as offset numbers.
+
+    Args:
+        layout: Record layout
+        keys: Key specs, major key first
+
+    Returns:
+        Function mapping record bytes to one comparable ``bytes`` key
+
+    Raises:
+        KeyError: If a key names a field the layout doesn't have
+        ValueError: On an empty key list or unknown direction
+    """
+    if not keys:
+        raise ValueError("At least one sort key is required")
+    parts = []
+    for spec in keys:
+        name, direction = parse_key_spec(spec)
+        field = layout.field(name)
+        part = f"r[{field.start}:{field.end}]"
+        signed = field.picture.category == NUMERIC and field.picture.signed
+        if field.usage == "COMP-3":
+            if signed:
+                part = f"_packed({part}, {field.size})"
+        elif field.usage in ("COMP", "COMP-5"):
+            order = binary_byteorder(field.usage)
+            if signed or order != BIG:
+                part = f"_binary({part}, {signed}, {order!r})"
+        elif signed:
+            part = f"_signed({part}, {field.size})"
+        if direction == DESCENDING:
+            part = f"{part}.translate(_INVERT)"
+        parts.append(part)
+    source = f"def key(r):\n    return {' + '.join(parts)}\n"
+    namespace = {"_signed": _signed_key, "_packed": _packed_key, "_binary": _binary_key,
+                 "_INVERT": _INVERT}
+    exec(compile(source, f"<sort key {layout.name}>", "exec"), namespace)
+    return namespace["key"]
+
+
+@lru_cache(maxsize=None)
+def _cached_sort_key(copybook: str, record: Optional[str], keys: Tuple[KeySpec, ...]) -> SortKey:
+    return compile_sort_key(load_layout(copybook, record), keys)
+
+
+def write_run(path: str, batch: List[bytes], key: Optional[SortKey]) -> None:
+    """Sort a batch of records in place and write it as a run file."""
+    batch.sort(key=key)
+    with open(path, "wb") as run:
+        run.write(b"".join(batch))
+
+
+def read_run(path: Union[str, Path], record_length: int, buffer_size: int) -> Iterator[bytes]:
+    """Stream fixed-length records from a run file in large blocks."""
+    block = max(1, buffer_size // record_length) * record_length
+    with open(path, "rb") as run:
+        while True:
+            data = run.read(block)
+            if not data:
+                return
+            for pos in range(0, len(data), record_length):
+                yield data[pos:pos + record_length]
+
+
+class ExternalSorter:
+    """
+    Sort work file (the COBOL SD) with a memory budget.
+
+    Records are added with ``add``/``extend`` and come back in key order
+    by iterating the sorter, which can be done once. Work files live in
+    a private temporary directory removed on ``close``.
+
+    Attributes:
+        record_length: Length of every record in bytes
+        memory_limit: Bytes of records held in memory before a spill
+        fan_in: Maximum runs merged at once
+        records: Records added
+        runs: Runs spilled to work files
+        merge_passes: Intermediate merge passes needed to reach fan_in
+    """
+
+    def __init__(
+        self,
+        record_length: int,
+        key: Optional[SortKey] = None,
+        memory_limit: int = DEFAULT_SORT_MEMORY,
+        work_dir: Optional[Union[str, Path]] = None,
+        fan_in: int = DEFAULT_FAN_IN,
+    ):
+        """
+        Create a sorter.
+
+        Args:
+            record_length: Record length in bytes
+            key: Sort key function over record bytes (defaults to the
+                whole record)
+            memory_limit: In-memory budget for run generation
+            work_dir: Directory for work files (defaults to the system
+                temporary directory)
+            fan_in: Runs merged per pass (at least 2)
+
+        Raises:
+            ValueError: On a non-positive record length or budget
+        """
+        if record_length <= 0 or memory_limit <= 0:
+            raise ValueError("record_length and memory_limit must be positive")
+        self.record_length = record_length
+        self.key = key
+        self.memory_limit = memory_limit
+        self.fan_in = max(2, fan_in)
+        self.records = 0
+        self.runs = 0
+        self.merge_passes = 0
+        self._work_dir = work_dir
+        self._directory: Optional[str] = None
+        self._run_paths: List[str] = []
+        self._batch: List[bytes] = []
+        self._batch_limit = max(1, memory_limit // (record_length + RECORD_OVERHEAD))
+        self._merged = False
+        self._output: Optional[Iterator[bytes]] = None
+
+    def __enter__(self) -> "ExternalSorter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def buffer_size(self) -> int:
+        """Read buffer per run during the merge."""
+        share = self.memory_limit // (self.fan_in + 1)
+        return max(self.record_length, min(share, MAX_MERGE_BUFFER))
+
+    def add(self, record: Union[bytes, bytearray, memoryview]) -> None:
+        """
+        Add one record, padded or truncated to the record length.
+
+        Raises:
+            RuntimeError: If the sorted output has already been read
+        """
+        if self._merged:
+            raise RuntimeError("Records cannot be added after the sort has been read")
+        record = bytes(record)
+        if len(record) != self.record_length:
+            record = record[:self.record_length].ljust(self.record_length)
+        self._batch.append(record)
+        self.records += 1
+        if len(self._batch) >= self._batch_limit:
+            self._spill()
+
+    # RELEASE in an INPUT PROCEDURE
+    release = add
+
+    def extend(self, records: Iterable[Union[bytes, bytearray, memoryview]]) -> None:
+        """Add many records."""
+        for record in records:
+            self.add(record)
+
+    def return_record(self) -> Optional[bytes]:
+        """RETURN in an OUTPUT PROCEDURE: the next sorted record, or None AT END."""
+        if self._output is None:
+            self._output = iter(self)
+        return next(self._output, None)
+
+    @property
+    def work_directory(self) -> str:
+        """Private directory for run files (created on first use)."""
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix="sort-", dir=self._work_dir)
+        return self._directory
+
+    def _new_run(self) -> str:
+        path = os.path.join(self.work_directory, f"run{self.runs:06d}.tmp")
+        self.runs += 1
+        return path
+
+    def _spill(self) -> None:
+        """Sort the in-memory batch and write it out as a run."""
+        path = self._new_run()
+        write_run(path, self._batch, self.key)
+        self._run_paths.append(path)
+        self._batch = []
+
+    def add_runs(self, paths: Iterable[str], records: int) -> None:
+        """
+        Take over run files sorted elsewhere (e.g. by worker processes).
+
+        Runs are merged after any runs already held, which keeps the
+        sort stable when they are added in input order.
+
+        Args:
+            paths: Run files in ``work_directory``, each sorted by ``key``
+            records: Number of records in the runs
+        """
+        if self._merged:
+            raise RuntimeError("Records cannot be added after the sort has been read")
+        if self._batch:
+            self._spill()
+        paths = list(paths)
+        self._run_paths.extend(paths)
+        self.runs += len(paths)
+        self.records += records
+
+    def _merge_runs(self, paths: List[str]) -> Iterator[bytes]:
+        buffer_size = self.buffer_size
+        runs = [read_run(path, self.record_length, buffer_size) for path in paths]
+        return merge(*runs, key=self.key)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """
+        Return the records in key order.
+
+        Raises:
+            RuntimeError: If called a second time
+        """
+        if self._merged:
+            raise RuntimeError("Sorted output can only be read once")
+        self._merged = True
+        if not self._run_paths:
+            # Everything fitted in memory: no work files at all
+            self._batch.sort(key=self.key)
+            batch, self._batch = self._batch, []
+            return iter(batch)
+        if self._batch:
+            self._spill()
+
+        # Reduce the number of runs until one merge pass can take them all
+        paths = self._run_paths
+        while len(paths) > self.fan_in:
+            self.merge_passes += 1
+            merged = []
+            for start in range(0, len(paths), self.fan_in):
+                group = paths[start:start + self.fan_in]
+                path = self._new_run()
+                with open(path, "wb") as run, RecordWriter(run, self.buffer_size, b"") as out:
+                    out.write_many(self._merge_runs(group))
+                for old in group:
+                    os.remove(old)
+                merged.append(path)
+            paths = merged
+        self._run_paths = paths
+        return self._merge_runs(paths)
+
+    def close(self) -> None:
+        """Remove the work files."""
+        self._batch = []
+        self._run_paths = []
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+
+def sort_records(
+    records: Iterable[Union[bytes, bytearray, memoryview]],
+    record_length: int,
+    key: Optional[SortKey] = None,
+    memory_limit: int = DEFAULT_SORT_MEMORY,
+    work_dir: Optional[Union[str, Path]] = None,
+) -> Iterator[bytes]:
+    """
+    Sort a stream of fixed-width records, yielding them in key order.
+
+    Work files are removed when the generator finishes or is closed.
+    """
+    with ExternalSorter(record_length, key, memory_limit, work_dir) as sorter:
+        sorter.extend(records)
+        yield from sorter
+
+
+def sort_procedure(
+    record_length: int,
+    key: Optional[SortKey],
+    input_procedure: InputProcedure,
+    output_procedure: Callable[[Iterator[bytes]], T],
+    memory_limit: int = DEFAULT_SORT_MEMORY,
+    work_dir: Optional[Union[str, Path]] = None,
+) -> T:
+    """
+    SORT ... INPUT PROCEDURE ... OUTPUT PROCEDURE ...
+
+    Usage:
+        def adults(records):                    # INPUT PROCEDURE
+            for record in records:
+                if int(record[0:3]) > 10:
+                    yield record                # RELEASE
+
+        def display(returned):                  # OUTPUT PROCEDURE
+            for record in returned:             # RETURN ... AT END
+                out.write(record)
+
+        sort_procedure(44, key, adults(source), display)
+
+    Args:
+        record_length: Record length in bytes
+        key: Sort key function (see ``compile_sort_key``)
+        input_procedure: Iterable (typically a generator) whose items are
+            released, or a callable that receives the release function
+        output_procedure: Receives an iterator over the sorted records
+        memory_limit: In-memory budget for run generation
+        work_dir: Directory for work files
+
+    Returns:
+        Whatever the output procedure returns
+    """
+    with ExternalSorter(record_length, key, memory_limit, work_dir) as sorter:
+        if callable(input_procedure):
+            input_procedure(sorter.release)
+        else:
+            sorter.extend(input_procedure)
+        return output_procedure(iter(sorter))
+
+
+def external_sort_stage(
+    record_length: int,
+    key: Optional[SortKey] = None,
+    memory_limit: int = DEFAULT_SORT_MEMORY,
+    work_dir: Optional[Union[str, Path]] = None,
+) -> Stage:
+    """
+    Pipeline stage sorting fixed-width records with the external sort.
+
+    Unlike ``Pipeline.sort`` it keeps memory bounded, so it suits
+    streams of record bytes larger than memory.
+    """
+    return lambda records: sort_records(records, record_length, key, memory_limit, work_dir)
+
+
+def write_sorted(records: Iterable[bytes], output_path: Union[str, Path], line_sequential: bool = True) -> int:
+    """
+    Write sorted records to a GIVING file.
+
+    LINE SEQUENTIAL output has trailing spaces removed, as GnuCOBOL
+    writes it; RECORD SEQUENTIAL output keeps full-length records.
+
+    Returns:
+        Number of records written
+    """
+    newline = b"\n" if line_sequential else b""
+    with open(output_path, "wb") as stream, RecordWriter(stream, newline=newline) as out:
+        if line_sequential:
+            out.write_many(record.rstrip(b" ") for record in records)
+        else:
+            out.write_many(records)
+        return out.records_written
+
+
+def sort_file(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    layout: RecordCodec,
+    keys: Sequence[KeySpec],
+    memory_limit: int = DEFAULT_SORT_MEMORY,
+    work_dir: Optional[Union[str, Path]] = None,
+    line_sequential: bool = True,
+) -> int:
+    """
+    SORT ... ON ASCENDING/DESCENDING KEY ... USING input GIVING output.
+
+    Args:
+        input_path: USING file
+        output_path: GIVING file
+        layout: Record layout
+        keys: Key specs, major key first (see ``compile_sort_key``)
+        memory_limit: In-memory budget for run generation
+        work_dir: Directory for work files
+        line_sequential: Input and output files are newline terminated
+
+    Returns:
+        Number of records sorted
+    """
+    record_length = layout.size
+    with MappedRecordFile(input_path, layout.field_specs(), record_length, line_sequential) as source:
+        records = (record.raw() for record in source)
+        with ExternalSorter(record_length, compile_sort_key(layout, keys), memory_limit, work_dir) as sorter:
+            sorter.extend(records)
+            return write_sorted(sorter, output_path, line_sequential)
+
+
+def _sort_range(
+    path: str,
+    start: int,
+    stop: int,
+    copybook: str,
+    record: Optional[str],
+    keys: Tuple[KeySpec, ...],
+    memory_limit: int,
+    directory: str,
+    line_sequential: bool,
+) -> Tuple[List[str], int]:
+    """Worker: cut one input range into sorted runs; return their paths and record count."""
+    layout = load_layout(copybook, record)
+    key = _cached_sort_key(copybook, record, keys)
+    size = layout.size
+    limit = max(1, memory_limit // (size + RECORD_OVERHEAD))
+    runs: List[str] = []
+    batch: List[bytes] = []
+    count = 0
+    with MappedRecordFile(path, layout.field_specs(), size, line_sequential) as source:
+        for view in source.records(start, stop):
+            raw = bytes(view.raw())
+            batch.append(raw if len(raw) == size else raw[:size].ljust(size))
+            if len(batch) >= limit:
+                runs.append(os.path.join(directory, f"{start:015d}-{len(runs):06d}.run"))
+                write_run(runs[-1], batch, key)
+                count += len(batch)
+                batch = []
+    if batch:
+        runs.append(os.path.join(directory, f"{start:015d}-{len(runs):06d}.run"))
+        write_run(runs[-1], batch, key)
+        count += len(batch)
+    return runs, count
+
+
+def parallel_sort_procedure(
+    input_path: Union[str, Path],
+    copybook: str,
+    keys: Sequence[KeySpec],
+    output_procedure: Callable[[Iterator[bytes]], T],
+    record: Optional[str] = None,
+    workers: Optional[int] = None,
+    memory_limit: int = DEFAULT_SORT_MEMORY,
+    work_dir: Optional[Union[str, Path]] = None,
+    line_sequential: bool = True,
+) -> T:
+    """
+    SORT ... USING input OUTPUT PROCEDURE, building runs in parallel.
+
+    Each worker reads one record-aligned range of the input and writes
+    sorted runs using its share of ``memory_limit``; the parent merges
+    all runs in input order, so the result is identical to a
+    sequential sort.
+
+    Args:
+        input_path: USING file
+        copybook: Copybook holding the record layout (workers compile
+            the layout and key themselves)
+        keys: Key specs, major key first
+        output_procedure: Receives an iterator over the sorted records
+        record: 01-level record name within the copybook
+        workers: Worker processes (defaults to the CPU count)
+        memory_limit: Total in-memory budget across workers
+        work_dir: Directory for work files
+        line_sequential: Input file is newline terminated
+
+    Returns:
+        Whatever the output procedure returns
+    """
+    keys = tuple(keys)
+    layout = load_layout(copybook, record)
+    workers = workers or os.cpu_count() or 1
+    key = _cached_sort_key(copybook, record, keys)
+    with ExternalSorter(layout.size, key, memory_limit, work_dir) as sorter:
+        worker = partial(_sort_range, copybook=copybook, record=record, keys=keys,
+                         memory_limit=max(1, memory_limit // workers),
+                         directory=sorter.work_directory, line_sequential=line_sequential)
+        for runs, count in map_ranges(worker, input_path, layout.size, workers,
+                                      chunks_per_worker=1, line_sequential=line_sequential):
+            sorter.add_runs(runs, count)
+        return output_procedure(iter(sorter))
+
+
+def parallel_sort_file(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    copybook: str,
+    keys: Sequence[KeySpec],
+    record: Optional[str] = None,
+    workers: Optional[int] = None,
+    memory_limit: int = DEFAULT_SORT_MEMORY,
+    work_dir: Optional[Union[str, Path]] = None,
+    line_sequential: bool = True,
+) -> int:
+    """
+    ``sort_file`` with run generation spread over worker processes
+    (see ``parallel_sort_procedure``).
+
+    Returns:
+        Number of records sorted
+    """
+    def give(records: Iterator[bytes]) -> int:
+        return write_sorted(records, output_path, line_sequential)
+
+    return parallel_sort_procedure(input_path, copybook, keys, give, record, workers,
+                                   memory_limit, work_dir, line_sequential)
@@ -0,0 +1,380 @@
+"""
+Working storage: fixed-length fields over one buffer per record.
+
+``WorkingStorage`` lays out DATA DIVISION entries (parsed by
+``cobol_runtime.copybook``) in one ``bytearray`` per 01/77-level record
+and gives every data name a ``Field``, a ``memoryview`` slice of that
+buffer together with its PICTURE. Items that share storage are views of
+the same bytes, never copies:
+- a group item spans the bytes of its subordinate items
+- REDEFINES (``basic/08_redefines.cbl``) is a second view of the bytes
+  of the item it redefines; a 01-level record that REDEFINES another
+  shares that record's buffer
+- a level-66 RENAMES ... THRU (``basic/09_rename.cbl``) spans the
+  renamed items
+
+LINKAGE SECTION records are laid out the same way and ``rebind`` points
+them at a caller's buffer (``cobol_runtime.call``).
+
+Level-88 condition names (``control/01_if.cbl``) are ``Condition``
+objects bound to their conditional variable, with the VALUE list
+compiled by ``cobol_runtime.conditions``: ``bool()`` tests the
+variable's current value and ``set_true()`` is SET ... TO TRUE.
+
+MOVE writes into the receiving view in place. Alphanumeric and group
+receivers are left-justified, truncated or space-filled; numeric ones
+use the MOVE rules of ``cobol_runtime.layout`` (digits beyond the
+PICTURE are truncated on both sides of the decimal point, unsigned
+receivers drop the sign) and numeric-edited ones are edited with their
+PICTURE. Items without a VALUE clause start as zero or spaces.
+
+Usage:
+    storage = WorkingStorage.parse('''
+           01 var-record.
+              02 var-num1 PIC 9(10) VALUE ZERO.
+                 88 var-small VALUE 1 THRU 99.
+              02 filler   PIC X VALUE SPACE.
+              02 var-num2 PIC 9(10) VALUE ZERO.
+           66 var-group RENAMES var-num1 THRU var-num2.
+    ''')
+    storage.var_num1.move("42")
+    str(storage.var_group)              # '0000000042 0000000000'
+    storage["VAR-NUM1"].value           # 42
+    bool(storage.var_small)             # True
+"""
+
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .comp import binary_byteorder, decode_binary, decode_packed, encode_binary, encode_packed
+from .conditions import ConditionPlan, compile_condition
+from .copybook import ALPHABETIC, ALPHANUMERIC, NUMERIC, DataItem, Picture, parse_copybook
+from .fixed import Fixed
+from .layout import decode_display_numeric, encode_display_numeric, encode_edited
+
+_SPACES = memoryview(b" " * 256)
+
+
+def _fill(target: Union[bytearray, memoryview], start: int) -> None:
+    """Space-fill ``target[start:]`` in place."""
+    end = len(target)
+    while start < end:
+        size = min(end - start, len(_SPACES))
+        target[start:start + size] = _SPACES[:size]
+        start += size
+
+
+def _move(target: Union[bytearray, memoryview], data: memoryview) -> None:
+    """Alphanumeric MOVE: left-justify, truncate or space-fill."""
+    size = len(target)
+    length = len(data)
+    if length >= size:
+        target[:] = data[:size]
+        return
+    target[:length] = data
+    if size - length <= len(_SPACES):
+        target[length:] = _SPACES[:size - length]
+    else:
+        _fill(target, length)
+
+
+def _number(value: Any) -> Union[int, Decimal]:
+    """A MOVE source as an int or Decimal; text is read as a numeric literal."""
+    if value.__class__ is int or isinstance(value, Decimal):
+        return value
+    if isinstance(value, Field):
+        value = value.value
+    if isinstance(value, Fixed):
+        return value.to_decimal()
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        value = bytes(value).decode("ascii", errors="replace")
+    if isinstance(value, int):
+        return int(value)
+    text = str(value).strip()
+    try:
+        return Decimal(text) if text else 0
+    except InvalidOperation:
+        raise ValueError(f"MOVE: '{text}' is not numeric") from None
+
+
+def _encoder(picture: Picture, usage: str, size: int, encoding: str) -> Callable[[Any], bytes]:
+    """Encoding function for a numeric or numeric-edited receiver."""
+    scale, signed = picture.scale, picture.signed
+    if usage == "COMP-3":
+        return lambda value: encode_packed(value, size, scale, signed, picture.digits)
+    if usage in ("COMP", "COMP-5"):
+        digits = picture.digits if usage == "COMP" else 0
+        order = binary_byteorder(usage)
+        return lambda value: encode_binary(value, size, scale, signed, digits, order)
+    if picture.category == NUMERIC:
+        return lambda value: encode_display_numeric(value, size, scale, signed)
+    return lambda value: encode_edited(value, picture.text, encoding)
+
+
+class Field:
+    """
+    One data item: a writable view of its bytes and how to read them.
+
+    Group items and RENAMES of several items have no PICTURE and behave
+    as alphanumeric items, as in COBOL.
+
+    Attributes:
+        name: COBOL data name
+        view: ``memoryview`` slice of the record buffer
+        picture: Parsed PICTURE clause, None for group items
+        usage: USAGE clause
+        encoding: Character encoding of alphanumeric data
+    """
+
+    __slots__ = ("name", "view", "picture", "usage", "encoding", "_encode")
+
+    def __init__(self, name: str, view: memoryview, picture: Optional[Picture] = None,
+                 usage: str = "DISPLAY", encoding: str = "utf-8"):
+        self.name = name
+        self.view = view
+        self.picture = picture
+        self.usage = usage
+        self.encoding = encoding
+        self._encode: Optional[Callable[[Any], bytes]] = None
+        if picture is not None and picture.category not in (ALPHANUMERIC, ALPHABETIC):
+            self._encode = _encoder(picture, usage, len(view), encoding)
+
+    @property
+    def is_numeric(self) -> bool:
+        """True for numeric and numeric-edited items (MOVE converts the value)."""
+        return self._encode is not None
+
+    def move(self, value: Any) -> None:
+        """
+        MOVE a value to this item, in place.
+
+        Args:
+            value: A Field, str, bytes-like buffer, or number (int,
+                Decimal, Fixed, float); numeric receivers also take
+                numeric text, as ACCEPT does
+
+        Raises:
+            ValueError: If a numeric receiver is given non-numeric text
+        """
+        if self._encode is not None:
+            self.view[:] = self._encode(_number(value))
+            return
+        if isinstance(value, Field):
+            data = value.view
+        elif value.__class__ is str:
+            data = memoryview(value.encode(self.encoding))
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            data = memoryview(value)
+        else:
+            # A number moved to an alphanumeric item: its digits
+            data = memoryview(str(value).lstrip("-").encode(self.encoding))
+        _move(self.view, data)
+
+    @property
+    def value(self) -> Any:
+        """
+        The item's value: int or Decimal for numeric items, str otherwise.
+
+        Raises:
+            ValueError: If a numeric item does not hold a number
+        """
+        picture = self.picture
+        if self.usage == "COMP-3":
+            return decode_packed(self.view, picture.scale)
+        if self.usage in ("COMP", "COMP-5"):
+            return decode_binary(self.view, picture.scale, picture.signed, binary_byteorder(self.usage))
+        if picture is not None and picture.category == NUMERIC:
+            return decode_display_numeric(self.view, picture.scale)
+        return str(self)
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self.move(value)
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.view)
+
+    def __str__(self) -> str:
+        """The bytes as DISPLAY shows them (a character cut by truncation is dropped)."""
+        return bytes(self.view).decode(self.encoding, errors="ignore")
+
+    def __repr__(self) -> str:
+        return f"Field({self.name!r}, {bytes(self.view)!r})"
+
+
+class Condition:
+    """
+    A level-88 condition name bound to its conditional variable.
+
+    Attributes:
+        name: Condition name
+        field: The conditional variable
+        plan: Compiled VALUE list
+    """
+
+    __slots__ = ("name", "field", "plan")
+
+    def __init__(self, name: str, field: Field, plan: ConditionPlan):
+        self.name = name
+        self.field = field
+        self.plan = plan
+
+    def __bool__(self) -> bool:
+        """
+        Whether the variable's current value is in the VALUE list.
+
+        Raises:
+            ValueError: If a numeric variable does not hold a number
+        """
+        return self.plan.test(self.field.value if self.plan.numeric else self.field.view)
+
+    def set_true(self) -> None:
+        """SET name TO TRUE: MOVE the first VALUE literal to the variable."""
+        self.field.move(self.plan.first)
+
+    def __repr__(self) -> str:
+        return f"Condition({self.name!r}, {self.field.name!r}, {bool(self)})"
+
+
+class WorkingStorage:
+    """
+    WORKING-STORAGE for a set of records, one buffer per 01/77 level.
+
+    Fields are looked up by COBOL name (``storage["VAR-NUM1"]``) or as
+    attributes (``storage.var_num1``). Names are not qualified: when two
+    groups hold items with the same name, the first one wins.
+
+    Attributes:
+        records: Buffer of every 01/77-level record by upper-case name
+        fields: Field of every named item by upper-case name
+        conditions: Condition of every level-88 name by upper-case name
+        encoding: Character encoding of alphanumeric data
+    """
+
+    def __init__(self, records: Sequence[DataItem], encoding: str = "utf-8"):
+        """
+        Allocate and initialise storage for parsed records.
+
+        Raises:
+            ValueError: If a VALUE clause does not fit its item's PICTURE
+        """
+        self.encoding = encoding
+        self.records: Dict[str, Union[bytearray, memoryview]] = {}
+        self.fields: Dict[str, Field] = {}
+        self.conditions: Dict[str, Condition] = {}
+
+        # A record that REDEFINES another shares its buffer, sized for
+        # the larger of the two
+        self._owner: Dict[str, str] = {}
+        self._sizes: Dict[str, int] = {}
+        for record in records:
+            name = record.name.upper()
+            owner = self._owner[record.redefines.upper()] if record.redefines else name
+            self._owner[name] = owner
+            self._sizes[owner] = max(self._sizes.get(owner, 0), record.size)
+        buffers = {name: bytearray(size) for name, size in self._sizes.items()}
+
+        # Every view over a buffer as (field, start, end), for rebind
+        self._views: Dict[str, List[Tuple[Field, int, int]]] = {name: [] for name in buffers}
+        for record in records:
+            owner = self._owner[record.name.upper()]
+            self.records[record.name.upper()] = buffers[owner]
+            view = memoryview(buffers[owner])
+            for item in _items(record) + record.renamings:
+                field = self._field(item, view)
+                self._views[owner].append((field, item.offset, item.offset + item.size))
+                if not item.is_filler:
+                    self.fields.setdefault(item.name.upper(), field)
+                for condition in item.conditions:
+                    plan = compile_condition(condition.values, item.picture, item.size, self.encoding)
+                    self.conditions.setdefault(condition.name.upper(), Condition(condition.name, field, plan))
+        for record in records:
+            if not record.redefines:
+                self._initialize(record, memoryview(self.records[record.name.upper()]))
+
+    @classmethod
+    def parse(cls, text: str, encoding: str = "utf-8") -> "WorkingStorage":
+        """Build storage from DATA DIVISION source text (fixed or free format)."""
+        return cls(parse_copybook(text), encoding)
+
+    def _field(self, item: DataItem, view: memoryview) -> Field:
+        return Field(item.name, view[item.offset:item.offset + item.size],
+                     item.picture, item.usage, self.encoding)
+
+    def _initialize(self, item: DataItem, view: memoryview) -> None:
+        """Apply VALUE clauses, or zero/space-fill, skipping REDEFINES views."""
+        field = self._field(item, view)
+        if item.value is not None:
+            if field.is_numeric:
+                field.move(item.value)
+            elif item.value_all:
+                literal = item.value.encode(self.encoding)
+                field.move(literal * (len(field) // max(len(literal), 1) + 1))
+            else:
+                field.move(item.value)
+        elif item.is_group:
+            for child in item.children:
+                if not child.redefines:
+                    self._initialize(child, view)
+        else:
+            field.move(0 if field.is_numeric else b"")
+
+    def rebind(self, name: str, buffer: Union[bytearray, memoryview]) -> None:
+        """
+        Point a record, and every record sharing its bytes, at another buffer.
+
+        LINKAGE SECTION records have no storage of their own: each CALL
+        rebinds them to the caller's buffers. Fields and condition names
+        already handed out follow the new buffer.
+
+        Raises:
+            KeyError: If no record has that name
+            ValueError: If the buffer is shorter than the record
+        """
+        owner = self._owner[name.upper()]
+        view = buffer if buffer.__class__ is memoryview else memoryview(buffer)
+        if len(view) < self._sizes[owner]:
+            raise ValueError(f"{name}: {len(view)} bytes given for a {self._sizes[owner]}-byte record")
+        for field, start, end in self._views[owner]:
+            field.view = view[start:end]
+        for record, record_owner in self._owner.items():
+            if record_owner == owner:
+                self.records[record] = buffer
+
+    def __getitem__(self, name: str) -> Union[Field, Condition]:
+        """
+        Look up a field or condition name by COBOL name.
+
+        Raises:
+            KeyError: If no item or condition has that name
+        """
+        key = name.upper()
+        field = self.fields.get(key)
+        return field if field is not None else self.conditions[key]
+
+    def __getattr__(self, attr: str) -> Union[Field, Condition]:
+        key = attr.upper().replace("_", "-")
+        field = self.__dict__["fields"].get(key)
+        if field is not None:
+            return field
+        try:
+            return self.__dict__["conditions"][key]
+        except KeyError:
+            raise AttributeError(f"No data item named {attr}") from None
+
+    def __contains__(self, name: str) -> bool:
+        key = name.upper()
+        return key in self.fields or key in self.conditions
+
+
+def _items(item: DataItem) -> List[DataItem]:
+    """The item and all its subordinate items, in definition order."""
+    items = [item]
+    for child in item.children:
+        items.extend(_items(child))
+    return items
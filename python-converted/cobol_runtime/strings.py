@@ -0,0 +1,543 @@
+"""
+STRING and UNSTRING statement engines.
+
+Compiles a STRING or UNSTRING statement once into a plan that moves
+bytes between fixed-length fields the way COBOL does, writing straight
+into the receiving ``bytearray`` (or writable ``memoryview``) instead of
+building new strings:
+
+    STRING var-str2 DELIMITED BY SIZE var-str1 DELIMITED BY SPACE
+        INTO var-str-out WITH POINTER var-count
+    UNSTRING var-long-str DELIMITED BY ALL SPACE OR ','
+        INTO var-name COUNT IN name-length, var-surname
+        WITH POINTER var-pos TALLYING IN var-fields
+
+Supported: DELIMITED BY SIZE or a literal for STRING; DELIMITED BY
+[ALL] literal OR ... (or no delimiter: each receiver takes its size)
+for UNSTRING; POINTER, COUNT IN and TALLYING IN. Delimiters must be
+literals or figurative constants; sources and receivers are passed to
+the plan as buffers, in statement order. The ON OVERFLOW condition is
+returned rather than executed, and the POINTER, COUNT IN and TALLYING
+values are returned for the caller to store (TALLYING IN adds to its
+counter, as in COBOL).
+
+The bulk forms run a plan over whole columns of fixed-width fields
+(``(rows, width)`` uint8 matrices, as sliced from
+``columnar.record_matrix``) with NumPy index arithmetic, writing into
+one preallocated result matrix per receiver: no per-record objects.
+
+Usage:
+    concat = compile_string("STRING a DELIMITED BY SIZE b DELIMITED BY SPACE INTO out")
+    out = bytearray(b" " * 20)
+    concat(out, b"Doe", b"John Smith").pointer      # 8, out = b'DoeJohn   ...'
+
+    split = compile_unstring("UNSTRING s DELIMITED BY SPACE INTO name surname")
+    name, surname = bytearray(10), bytearray(10)
+    split(b"John Doe", name, surname).tallying      # 2
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .inspect import FIGURATIVE, _Parser, _tokenize
+from .storage import _move
+
+SPACE = 0x20
+
+# Rows per step of the bulk forms
+CHUNK_ROWS = 4096
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class StringResult(NamedTuple):
+    """Outcome of one STRING: the new POINTER value, and ON OVERFLOW."""
+    pointer: int
+    overflow: bool
+
+
+class UnstringResult(NamedTuple):
+    """
+    Outcome of one UNSTRING.
+
+    Attributes:
+        pointer: New POINTER value
+        tallying: Receivers acted upon (to add to the TALLYING counter)
+        overflow: ON OVERFLOW condition
+        counts: COUNT IN value of every receiver acted upon (0 for the rest)
+    """
+    pointer: int
+    tallying: int
+    overflow: bool
+    counts: Tuple[int, ...]
+
+
+class StringRows(NamedTuple):
+    """Outcome of a bulk STRING: the receiving fields, POINTER and ON OVERFLOW per row."""
+    matrix: np.ndarray
+    pointer: np.ndarray
+    overflow: np.ndarray
+
+
+class UnstringRows(NamedTuple):
+    """Outcome of a bulk UNSTRING: the receiving fields and the UnstringResult values per row."""
+    targets: Tuple[np.ndarray, ...]
+    pointer: np.ndarray
+    tallying: np.ndarray
+    overflow: np.ndarray
+    counts: np.ndarray
+
+
+def _broadcast(literal: bytes, rows: int) -> np.ndarray:
+    """A literal as a read-only ``(rows, len(literal))`` uint8 matrix."""
+    return np.broadcast_to(np.frombuffer(literal, dtype=np.uint8), (rows, len(literal)))
+
+
+def _first(matrix: np.ndarray, delimiter: bytes) -> np.ndarray:
+    """Offset of the first occurrence of ``delimiter`` in every row (the width if none)."""
+    rows, width = matrix.shape
+    span = width - len(delimiter) + 1
+    if span <= 0:
+        return np.full(rows, width, dtype=np.int64)
+    found = matrix[:, :span] == delimiter[0]
+    for k in range(1, len(delimiter)):
+        found &= matrix[:, k:k + span] == delimiter[k]
+    return np.where(found.any(axis=1), found.argmax(axis=1), width)
+
+
+def _chunks(rows: int) -> Iterator[slice]:
+    """Row ranges of the bulk forms, small enough for their temporaries to stay cached."""
+    for start in range(0, rows, CHUNK_ROWS):
+        yield slice(start, min(start + CHUNK_ROWS, rows))
+
+
+def _scatter(out: np.ndarray, source: np.ndarray, mask: np.ndarray, columns: np.ndarray) -> None:
+    """``out[row, columns[row, i]] = source[row, i]`` wherever ``mask`` is set."""
+    rows, cols = np.nonzero(mask)
+    out[rows, columns[rows, cols]] = source[rows, cols]
+
+
+class _StatementParser(_Parser):
+    """INSPECT's parser, plus identifiers for STRING / UNSTRING operands."""
+
+    def __init__(self, tokens: List[str], verb: str):
+        super().__init__(tokens)
+        self.verb = verb
+
+    def is_literal(self) -> bool:
+        token = self.tokens[self.position] if self.peek() else ""
+        return token[:1] in ("'", '"') or self.peek() in FIGURATIVE
+
+    def identifier(self) -> str:
+        token = self.take()
+        if token[0] in "'\"":
+            raise ValueError(f"{self.verb}: expected a data name, found {token}")
+        return token.upper()
+
+    def end(self) -> None:
+        if self.peek():
+            raise ValueError(f"{self.verb}: unexpected '{self.peek()}'")
+
+
+class StringPlan:
+    """
+    Compiled STRING statement.
+
+    Attributes:
+        statement: Statement as written
+        sources: Data names of the sending fields, in order (literals are
+            part of the plan and not passed in)
+        target: Data name of the receiving field
+        pointer: POINTER data name, or None
+    """
+
+    def __init__(self, statement: str, encoding: str = "latin-1"):
+        """
+        Compile a statement.
+
+        Raises:
+            ValueError: On a syntax error or an unsupported operand
+        """
+        parser = _StatementParser(_tokenize(statement, "STRING"), "STRING")
+        if parser.peek() == "STRING":
+            parser.take()
+        sources: List[str] = []
+        # (source index or literal bytes, delimiter bytes or None for SIZE)
+        parts: List[Tuple[Union[int, bytes], Optional[bytes]]] = []
+        pending: List[Union[int, bytes]] = []
+        while parser.peek() and parser.peek() not in ("INTO", "DELIMITED"):
+            if parser.is_literal():
+                pending.append(parser.literal().text.encode(encoding))
+            else:
+                pending.append(len(sources))
+                sources.append(parser.identifier())
+            if parser.peek() == "DELIMITED":
+                parser.take()
+                if parser.peek() == "BY":
+                    parser.take()
+                if parser.peek() == "SIZE":
+                    parser.take()
+                    delimiter = None
+                else:
+                    delimiter = parser.literal().text.encode(encoding)
+                parts.extend((part, delimiter) for part in pending)
+                pending = []
+        parts.extend((part, None) for part in pending)
+        if not parts:
+            raise ValueError("STRING: expected sending fields")
+        parser.take("INTO")
+        self.target = parser.identifier()
+        self.pointer: Optional[str] = None
+        if parser.peek() == "WITH":
+            parser.take()
+        if parser.peek() == "POINTER":
+            parser.take()
+            self.pointer = parser.identifier()
+        parser.end()
+
+        self.statement = statement
+        self.sources: Tuple[str, ...] = tuple(sources)
+        self._parts = tuple(
+            (part, delimiter, None if delimiter is None else re.compile(re.escape(delimiter)))
+            for part, delimiter in parts
+        )
+
+    def __call__(self, target: Union[bytearray, memoryview], *sources: Buffer,
+                 pointer: int = 1) -> StringResult:
+        """
+        Run the statement.
+
+        Args:
+            target: Receiving field, changed in place from the POINTER
+                position on (the rest of it is left as it was)
+            sources: Sending fields, one per data name in ``sources``
+            pointer: POINTER value (1 without a POINTER phrase)
+
+        Raises:
+            TypeError: If the number of sources is wrong
+        """
+        if len(sources) != len(self.sources):
+            raise TypeError(f"STRING needs {len(self.sources)} sources, got {len(sources)}")
+        size = len(target)
+        if not 1 <= pointer <= size:
+            return StringResult(pointer, True)
+        position = pointer - 1
+        for part, delimiter, pattern in self._parts:
+            source = sources[part] if isinstance(part, int) else part
+            length = len(source)
+            if delimiter is not None:
+                if isinstance(source, memoryview):
+                    match = pattern.search(source)
+                    length = length if match is None else match.start()
+                else:
+                    found = source.find(delimiter)
+                    length = length if found < 0 else found
+            room = size - position
+            if length > room:
+                target[position:] = memoryview(source)[:room]
+                return StringResult(size + 1, True)
+            target[position:position + length] = memoryview(source)[:length]
+            position += length
+        return StringResult(position + 1, False)
+
+    def rows(
+        self,
+        columns: Sequence[np.ndarray],
+        width: int = 0,
+        pointer: int = 1,
+        out: Optional[np.ndarray] = None,
+    ) -> StringRows:
+        """
+        Run the statement on every row of a set of columns.
+
+        Args:
+            columns: ``(rows, width)`` uint8 matrices of the sending
+                fields, one per data name in ``sources``
+            width: Receiving field size, when ``out`` is not given
+            pointer: POINTER value for every row
+            out: Receiving fields to update in place; defaults to a new
+                space-filled ``(rows, width)`` matrix
+
+        Returns:
+            The receiving fields, and POINTER and ON OVERFLOW per row
+        """
+        if len(columns) != len(self.sources):
+            raise TypeError(f"STRING needs {len(self.sources)} columns, got {len(columns)}")
+        rows = len(columns[0]) if columns else (len(out) if out is not None else 1)
+        if out is None:
+            out = np.full((rows, width), SPACE, dtype=np.uint8)
+        width = out.shape[1]
+        position = np.full(rows, pointer - 1, dtype=np.int64)
+        overflow = np.zeros(rows, dtype=bool)
+        if not 1 <= pointer <= width:
+            overflow[:] = True
+            return StringRows(out, position + 1, overflow)
+        for chunk in _chunks(rows):
+            self._string_rows(columns, chunk, out[chunk], position[chunk], overflow[chunk])
+        return StringRows(out, position + 1, overflow)
+
+    def _string_rows(self, columns: Sequence[np.ndarray], chunk: slice, out: np.ndarray,
+                     position: np.ndarray, overflow: np.ndarray) -> None:
+        rows, width = out.shape
+        for part, delimiter, _ in self._parts:
+            source = columns[part][chunk] if isinstance(part, int) else _broadcast(part, rows)
+            size = source.shape[1]
+            if delimiter is None:
+                length = np.full(rows, size, dtype=np.int64)
+            else:
+                length = _first(source, delimiter)
+            room = width - position
+            overflow |= length > room
+            moved = np.minimum(length, room)
+            offsets = np.arange(size)
+            _scatter(out, source, offsets < moved[:, None], position[:, None] + offsets)
+            position += moved
+
+
+class UnstringPlan:
+    """
+    Compiled UNSTRING statement.
+
+    Attributes:
+        statement: Statement as written
+        source: Data name of the sending field
+        targets: Data names of the receiving fields, in order
+        counts: COUNT IN data name of each receiver, or None
+        pointer: POINTER data name, or None
+        tallying: TALLYING IN data name, or None
+        delimiters: (delimiter, ALL) pairs, in the order they are tried
+    """
+
+    def __init__(self, statement: str, encoding: str = "latin-1"):
+        """
+        Compile a statement.
+
+        Raises:
+            ValueError: On a syntax error or an unsupported phrase
+        """
+        parser = _StatementParser(_tokenize(statement, "UNSTRING"), "UNSTRING")
+        if parser.peek() == "UNSTRING":
+            parser.take()
+        self.source = parser.identifier()
+        delimiters: List[Tuple[bytes, bool]] = []
+        if parser.peek() == "DELIMITED":
+            parser.take()
+            if parser.peek() == "BY":
+                parser.take()
+            while True:
+                every = parser.peek() == "ALL"
+                if every:
+                    parser.take()
+                delimiters.append((parser.literal().text.encode(encoding), every))
+                if parser.peek() != "OR":
+                    break
+                parser.take()
+        parser.take("INTO")
+        targets: List[str] = []
+        counts: List[Optional[str]] = []
+        while parser.peek() and parser.peek() not in ("WITH", "POINTER", "TALLYING"):
+            targets.append(parser.identifier())
+            counts.append(None)
+            if parser.peek() == "DELIMITER":
+                raise ValueError("UNSTRING: DELIMITER IN is not supported")
+            if parser.peek() == "COUNT":
+                parser.take()
+                if parser.peek() == "IN":
+                    parser.take()
+                counts[-1] = parser.identifier()
+        if not targets:
+            raise ValueError("UNSTRING: expected receiving fields")
+        self.pointer: Optional[str] = None
+        self.tallying: Optional[str] = None
+        if parser.peek() == "WITH":
+            parser.take()
+        if parser.peek() == "POINTER":
+            parser.take()
+            self.pointer = parser.identifier()
+        if parser.peek() == "TALLYING":
+            parser.take()
+            if parser.peek() == "IN":
+                parser.take()
+            self.tallying = parser.identifier()
+        parser.end()
+
+        self.statement = statement
+        self.targets: Tuple[str, ...] = tuple(targets)
+        self.counts: Tuple[Optional[str], ...] = tuple(counts)
+        self.delimiters: Tuple[Tuple[bytes, bool], ...] = tuple(delimiters)
+        self._pattern = None
+        self._single = delimiters[0][0] if len(delimiters) == 1 and not delimiters[0][1] else None
+        if delimiters:
+            # Alternatives in statement order: the first delimiter wins
+            # at a position, as in COBOL
+            self._pattern = re.compile(b"|".join(
+                b"(?:" + re.escape(text) + b")+" if every else re.escape(text)
+                for text, every in delimiters
+            ))
+
+    def __call__(self, source: Buffer, *targets: Union[bytearray, memoryview],
+                 pointer: int = 1) -> UnstringResult:
+        """
+        Run the statement.
+
+        Args:
+            source: Sending field
+            targets: Receiving fields, one per data name in ``targets``;
+                the receivers acted upon are overwritten (MOVE rules),
+                the others are left as they were
+            pointer: POINTER value (1 without a POINTER phrase)
+
+        Raises:
+            TypeError: If the number of receivers is wrong
+        """
+        if len(targets) != len(self.targets):
+            raise TypeError(f"UNSTRING needs {len(self.targets)} receivers, got {len(targets)}")
+        size = len(source)
+        counts = [0] * len(targets)
+        if not 1 <= pointer <= size:
+            return UnstringResult(pointer, 0, True, tuple(counts))
+        view = memoryview(source)
+        position = pointer - 1
+        filled = 0
+        pattern = self._pattern
+        # One plain delimiter: bytes.find beats a regex search
+        find = getattr(source, "find", None) if self._single else None
+        for target in targets:
+            if position >= size:
+                break
+            if find is not None:
+                end = find(self._single, position)
+                following = end + len(self._single)
+                if end < 0:
+                    end = following = size
+            elif pattern is None:
+                end = following = min(size, position + len(target))
+            else:
+                match = pattern.search(source, position)
+                if match is None:
+                    end = following = size
+                else:
+                    end, following = match.span()
+            _move(target, view[position:end])
+            counts[filled] = end - position
+            filled += 1
+            position = following
+        return UnstringResult(position + 1, filled, position < size, tuple(counts))
+
+    def rows(self, matrix: Union[np.ndarray, bytes], targets: Sequence[Union[int, np.ndarray]],
+             pointer: int = 1, width: int = 0) -> UnstringRows:
+        """
+        Run the statement on every row of a column.
+
+        Single-byte delimiters (the common SPACE, ',' and '|' cases) are
+        handled for all rows at once; other statements run row by row
+        on views of the matrices.
+
+        Args:
+            matrix: ``(rows, width)`` uint8 matrix of the sending field
+                (or bytes of back-to-back fields of ``width`` bytes)
+            targets: Per receiver, a ``(rows, size)`` uint8 matrix to
+                update in place, or a size for a new space-filled one
+            pointer: POINTER value for every row
+
+        Returns:
+            The receiving fields, and the UnstringResult values per row
+        """
+        if len(targets) != len(self.targets):
+            raise TypeError(f"UNSTRING needs {len(self.targets)} receivers, got {len(targets)}")
+        if not isinstance(matrix, np.ndarray):
+            matrix = np.frombuffer(matrix, dtype=np.uint8).reshape(-1, width)
+        rows, width = matrix.shape
+        outs = tuple(
+            np.full((rows, target), SPACE, dtype=np.uint8) if isinstance(target, int) else target
+            for target in targets
+        )
+        pointer_out = np.full(rows, pointer, dtype=np.int64)
+        tallying = np.zeros(rows, dtype=np.int64)
+        overflow = np.ones(rows, dtype=bool)
+        counts = np.zeros((rows, len(outs)), dtype=np.int64)
+        result = UnstringRows(outs, pointer_out, tallying, overflow, counts)
+        if not 1 <= pointer <= width:
+            return result
+        if self.delimiters and all(len(text) == 1 for text, _ in self.delimiters):
+            kernel = self._rows_single_bytes
+        else:
+            kernel = self._rows_each
+        for chunk in _chunks(rows):
+            part = UnstringRows(tuple(out[chunk] for out in outs), pointer_out[chunk],
+                                tallying[chunk], overflow[chunk], counts[chunk])
+            kernel(matrix[chunk], part, pointer)
+        return result
+
+    def _rows_single_bytes(self, matrix: np.ndarray, result: UnstringRows, pointer: int) -> None:
+        rows, width = matrix.shape
+        receivers = len(result.targets)
+        start = pointer - 1
+        table = np.zeros(256, dtype=bool)
+        repeats = np.zeros(256, dtype=bool)
+        for text, every in self.delimiters:
+            table[text[0]] = True
+            repeats[text[0]] |= every
+        delimiter = table[matrix]
+        delimiter[:, :start] = False
+        opening = closing = delimiter
+        if repeats.any():
+            # Bytes that continue an ALL run belong to the delimiter before them
+            continued = np.zeros_like(delimiter)
+            continued[:, 1:] = (delimiter[:, 1:] & delimiter[:, :-1]
+                                & (matrix[:, 1:] == matrix[:, :-1]) & repeats[matrix[:, 1:]])
+            opening = delimiter & ~continued
+            closing = delimiter.copy()
+            closing[:, :-1] &= ~continued[:, 1:]
+        number = np.cumsum(opening, axis=1, dtype=np.int32)
+        fields = 1 + number[:, -1] - delimiter[:, -1]
+
+        # Field k runs from starts[:, k] up to stops[:, k]
+        starts = np.full((rows, receivers + 1), start, dtype=np.int64)
+        stops = np.full((rows, receivers), width, dtype=np.int64)
+        row, column = np.nonzero(opening)
+        index = number[row, column] - 1
+        keep = index < receivers
+        stops[row[keep], index[keep]] = column[keep]
+        if closing is not opening:
+            row, column = np.nonzero(closing)
+        index = number[row, column]
+        keep = index <= receivers
+        starts[row[keep], index[keep]] = column[keep] + 1
+        lengths = stops - starts[:, :receivers]
+
+        for index, out in enumerate(result.targets):
+            present = fields > index
+            result.counts[:, index] = np.where(present, lengths[:, index], 0)
+            offsets = np.arange(out.shape[1])
+            gather = np.minimum(starts[:, index, None] + offsets, width - 1)
+            moved = np.take_along_axis(matrix, gather, axis=1)
+            moved[offsets >= lengths[:, index, None]] = SPACE
+            out[present] = moved[present]
+
+        overflow = fields > receivers
+        result.overflow[:] = overflow
+        result.tallying[:] = np.minimum(fields, receivers)
+        # Past the delimiter that ends the last receiver's field
+        result.pointer[:] = np.where(overflow, starts[:, receivers] + 1, width + 1)
+
+    def _rows_each(self, matrix: np.ndarray, result: UnstringRows, pointer: int) -> None:
+        for row in range(len(matrix)):
+            outcome = self(memoryview(matrix[row]), *(memoryview(out[row]) for out in result.targets),
+                           pointer=pointer)
+            result.pointer[row], result.tallying[row], result.overflow[row], result.counts[row] = outcome
+
+
+@lru_cache(maxsize=None)
+def compile_string(statement: str, encoding: str = "latin-1") -> StringPlan:
+    """Compile a STRING statement, reusing an earlier compilation of the same one."""
+    return StringPlan(statement, encoding)
+
+
+@lru_cache(maxsize=None)
+def compile_unstring(statement: str, encoding: str = "latin-1") -> UnstringPlan:
+    """Compile an UNSTRING statement, reusing an earlier compilation of the same one."""
+    return UnstringPlan(statement, encoding)
@@ -0,0 +1,183 @@
+"""
+Write-ahead log for paged files.
+
+Changes are logged as whole page images. A commit appends the images of
+every page changed since the previous commit followed by a commit frame
+(page count and CRC-32), then issues a single ``fsync``, so any number
+of operations grouped into one commit share one disk flush.
+
+After a crash, ``recover`` copies the pages of every complete commit
+back into the data file; a torn or unterminated group at the end of the
+log is ignored. A checkpoint writes the changed pages to the data file,
+syncs it and empties the log.
+
+Log format (big-endian):
+- Header: magic, page size
+- Page frame: page number, page image
+- Commit frame: 0xFFFFFFFF, number of page frames, CRC-32 of those frames
+
+Usage:
+    recover("output.dat")
+    log = WriteAheadLog.for_file("output.dat", page_size)
+    log.commit([(0, header), (7, leaf)])
+"""
+
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Iterable, Optional, Tuple, Union
+
+MAGIC = b"PYWAL001"
+
+_HEADER = struct.Struct(">8sI")
+_FRAME = struct.Struct(">I")
+_COMMIT = struct.Struct(">III")
+COMMIT_MARK = 0xFFFFFFFF
+
+PageImage = Tuple[int, bytes]
+
+
+def wal_path(path: Union[str, Path]) -> Path:
+    """Path of the log belonging to a data file."""
+    path = Path(path)
+    return path.with_name(path.name + ".wal")
+
+
+def sync(file: BinaryIO) -> None:
+    """Flush Python buffers and force the file to stable storage."""
+    file.flush()
+    os.fsync(file.fileno())
+
+
+class WriteAheadLog:
+    """
+    Append-only page-image log with group commit.
+
+    Attributes:
+        path: Log file path
+        page_size: Size of each logged page image
+        commits: Commit groups written
+        syncs: ``fsync`` calls issued
+    """
+
+    def __init__(self, path: Union[str, Path], page_size: int):
+        """
+        Create (or empty) a log.
+
+        Args:
+            path: Log file path
+            page_size: Page size of the data file
+        """
+        self.path = Path(path)
+        self.page_size = page_size
+        self.commits = 0
+        self.syncs = 0
+        self._file = open(self.path, "w+b")
+        self._file.write(_HEADER.pack(MAGIC, page_size))
+        self._sync()
+
+    @classmethod
+    def for_file(cls, data_path: Union[str, Path], page_size: int) -> "WriteAheadLog":
+        """Create the log for a data file."""
+        return cls(wal_path(data_path), page_size)
+
+    def __len__(self) -> int:
+        """Size of the log in bytes."""
+        return self._file.tell()
+
+    def _sync(self) -> None:
+        sync(self._file)
+        self.syncs += 1
+
+    def commit(self, pages: Iterable[PageImage]) -> None:
+        """
+        Append one commit group and make it durable with a single fsync.
+
+        Args:
+            pages: (page number, image) pairs; images shorter than a page
+                are zero padded
+        """
+        block = bytearray()
+        count = 0
+        for page, image in pages:
+            block += _FRAME.pack(page)
+            block += image
+            block += bytes(self.page_size - len(image))
+            count += 1
+        block += _COMMIT.pack(COMMIT_MARK, count, zlib.crc32(block))
+        self._file.write(block)
+        self._sync()
+        self.commits += 1
+
+    def reset(self) -> None:
+        """Empty the log after a checkpoint."""
+        self._file.seek(_HEADER.size)
+        self._file.truncate()
+        self._sync()
+
+    def close(self, remove: bool = False) -> None:
+        """Close the log, deleting the file if ``remove`` is set."""
+        if not self._file.closed:
+            self._file.close()
+        if remove and self.path.exists():
+            self.path.unlink()
+
+
+def recover(data_path: Union[str, Path]) -> int:
+    """
+    Replay committed groups from a leftover log into its data file.
+
+    Does nothing if there is no log. The log is removed afterwards.
+
+    Args:
+        data_path: Data file the log belongs to
+
+    Returns:
+        Number of commit groups applied
+    """
+    log_path = wal_path(data_path)
+    if not log_path.exists():
+        return 0
+
+    applied = 0
+    with open(log_path, "rb") as log:
+        header = log.read(_HEADER.size)
+        if len(header) == _HEADER.size and header[:8] == MAGIC:
+            _, page_size = _HEADER.unpack(header)
+            frame_size = _FRAME.size + page_size
+            with open(data_path, "r+b") as data:
+                while True:
+                    group = _read_group(log, frame_size)
+                    if group is None:
+                        break
+                    for offset in range(0, len(group), frame_size):
+                        (page,) = _FRAME.unpack_from(group, offset)
+                        data.seek(page * page_size)
+                        data.write(group[offset + _FRAME.size:offset + frame_size])
+                    applied += 1
+                sync(data)
+    log_path.unlink()
+    return applied
+
+
+def _read_group(log: BinaryIO, frame_size: int) -> Optional[bytes]:
+    """Read the next complete, checksummed group of page frames."""
+    block = bytearray()
+    while True:
+        mark = log.read(_FRAME.size)
+        if len(mark) < _FRAME.size:
+            return None
+        if _FRAME.unpack(mark)[0] == COMMIT_MARK:
+            rest = log.read(_COMMIT.size - _FRAME.size)
+            if len(rest) < _COMMIT.size - _FRAME.size:
+                return None
+            _, count, crc = _COMMIT.unpack(mark + rest)
+            if count * frame_size != len(block) or zlib.crc32(block) != crc:
+                return None
+            return bytes(block)
+        image = log.read(frame_size - _FRAME.size)
+        if len(image) < frame_size - _FRAME.size:
+            return None
+        block += mark
+        block += image
@@ -8,27 +8,63 @@ Original COBOL Program: 02_loops.cbl
 Converted from specification: 02_loops-spec.md
 """
 
+import sys
+from pathlib import Path
+from typing import Iterator
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.procedure import Perform, Procedure, perform  # noqa: E402
+
+PROCEDURE = Procedure("02_LOOPS")
+
+
+@PROCEDURE.paragraph("MAIN")
+def main_line() -> Iterator[Perform]:
+    """
+    Statements before the first paragraph.
+    
+    COBOL behavior:
+    1. Inline PERFORM (one-step loop)
+    2. PERFORM B-PARAGRAPH THRU D-PARAGRAPH 2 TIMES
+    3. Display separator
+    4. Fall through to the paragraphs that follow (A through E)
+    """
+    # One-step inline perform
+    print("HELLO WORLD")
+    
+    # Perform paragraphs B through D, 2 times
+    yield perform("B-PARAGRAPH", thru="D-PARAGRAPH", times=2)
+    
+    # Separator line
+    print("=======")
+
+
+@PROCEDURE.paragraph()
 def a_paragraph() -> None:
     """Execute A paragraph logic."""
     print("A-PARAGRAPH")
 
 
+@PROCEDURE.paragraph()
 def b_paragraph() -> None:
     """Execute B paragraph logic."""
     print("B-PARAGRAPH")
 
 
+@PROCEDURE.paragraph()
 def c_paragraph() -> None:
     """Execute C paragraph logic."""
     print("C-PARAGRAPH")
 
 
+@PROCEDURE.paragraph()
 def d_paragraph() -> None:
     """Execute D paragraph logic."""
     print("D-PARAGRAPH")
 
 
+@PROCEDURE.paragraph()
 def e_paragraph() -> None:
     """Execute E paragraph logic."""
     print("E-PARAGRAPH")
@@ -38,30 +74,11 @@ def demonstrate_loops() -> None:
     """
     Demonstrate various loop structures.
     
-    COBOL behavior:
-    1. Inline PERFORM (one-step loop)
-    2. PERFORM paragraph range (B through D) 2 times
-    3. Display separator
-    4. Fall through to remaining paragraphs (A through E)
+    Runs the paragraphs from the top: the PERFORM THRU range and the
+    fall-through into A-PARAGRAPH .. E-PARAGRAPH are handled by the
+    paragraph dispatch table, as in the COBOL program.
     """
-    # One-step inline perform
-    print("HELLO WORLD")
-    
-    # Perform paragraphs B through D, 2 times
-    for _ in range(2):
-        b_paragraph()
-        c_paragraph()
-        d_paragraph()
-    
-    # Separator line
-    print("=======")
-    
-    # Fall through execution (all paragraphs in sequence)
-    a_paragraph()
-    b_paragraph()
-    c_paragraph()
-    d_paragraph()
-    e_paragraph()
+    PROCEDURE.run()
 
 
 def main() -> None:
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+04_GOTO - Python Implementation
+
+A program demonstrating GO TO and GO TO ... DEPENDING ON, with
+paragraphs falling through to the next one.
+
+Original COBOL Program: 04_goto.cbl
+Converted from specification: 04_goto-spec.md
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.procedure import GoTo, Procedure, go_to  # noqa: E402
+from cobol_runtime.storage import WorkingStorage  # noqa: E402
+
+WORKING_STORAGE = """
+       01 var-switch PIC 9(2) VALUE 1.
+"""
+
+PROCEDURE = Procedure("04_GOTO")
+
+
+@PROCEDURE.paragraph("MAIN")
+def main_line(storage: WorkingStorage) -> GoTo:
+    """GO TO PARA-NEXT, skipping PARA-TO-SKIP."""
+    return go_to("PARA-NEXT")
+
+
+@PROCEDURE.paragraph()
+def para_to_skip(storage: WorkingStorage) -> None:
+    """Never reached: nothing falls through or jumps to it."""
+    print("You never see that.")
+
+
+@PROCEDURE.paragraph()
+def para_next(storage: WorkingStorage) -> GoTo:
+    """
+    Accept var-switch and jump to PARA-1, PARA-2 or PARA-3.
+    
+    COBOL behavior:
+    - GO TO ... DEPENDING ON var-switch jumps to the n-th paragraph
+    - Any other value does nothing: control falls through to PARA-1
+    """
+    print("Hello in PARA-NEXT!")
+    
+    print("Enter number 1,2 or 3:")
+    storage.var_switch.move(input())
+    
+    return go_to("PARA-1", "PARA-2", "PARA-3", depending_on=storage.var_switch.value)
+
+
+@PROCEDURE.paragraph("PARA-1")
+def para_1(storage: WorkingStorage) -> None:
+    """Display PARA-1."""
+    print("PARA-1")
+
+
+@PROCEDURE.paragraph("PARA-2")
+def para_2(storage: WorkingStorage) -> None:
+    """Display PARA-2."""
+    print("PARA-2")
+
+
+@PROCEDURE.paragraph("PARA-3")
+def para_3(storage: WorkingStorage) -> None:
+    """Display PARA-3."""
+    print("PARA-3")
+
+
+def demonstrate_goto() -> None:
+    """
+    Run the paragraphs from the top.
+    
+    The paragraphs after the chosen one run too, as they fall through
+    to the end of the program (switch 2 prints PARA-2 and PARA-3).
+    """
+    try:
+        PROCEDURE.run(WorkingStorage.parse(WORKING_STORAGE))
+    except EOFError:
+        print("Error: No input provided")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def main() -> None:
+    """Main entry point for the GO TO program."""
+    demonstrate_goto()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,71 +9,99 @@ Original COBOL Program: 01_read.cbl
 Converted from specification: 01_read-spec.md
 """
 
-from dataclasses import dataclass
+import argparse
+import sys
 from pathlib import Path
-from typing import Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-@dataclass
-class Person:
+from cobol_runtime.person import PERSON_LAYOUT, Person  # noqa: E402
+from cobol_runtime.output import DEFAULT_BUFFER_SIZE, RecordWriter  # noqa: E402
+from cobol_runtime.parallel import map_ranges  # noqa: E402
+from cobol_runtime.pipeline import Pipeline  # noqa: E402
+from cobol_runtime.recordio import MappedRecordFile, RecordView  # noqa: E402
+
+
+def display_line(record: RecordView) -> str:
     """
-    Person record structure.
+    Format one record for display.
     
-    Attributes:
-        person_id: Person ID number (3 digits)
-        name: Person first name (16 chars)
-        surname: Person last name (25 chars)
+    Args:
+        record: Lazy record view
+        
+    Returns:
+        Formatted person, or a warning if the record can't be parsed
     """
-    person_id: int
-    name: str
-    surname: str
+    person = Person.from_record(record)
+    if person:
+        return str(person)
+    line = bytes(record.raw()).decode('utf-8', 'replace')
+    return f"Warning: Could not parse line: {line}"
+
+
+def display_range(filename: str, start: int, stop: int) -> bytes:
+    """
+    Format the records in one byte range of the file (worker process).
     
-    @classmethod
-    def from_line(cls, line: str) -> Optional['Person']:
-        """
-        Parse a person record from a fixed-width text line.
-        
-        COBOL format:
-        - ID: positions 0-2 (3 digits)
-        - Name: positions 3-18 (16 chars)
-        - Surname: positions 19-43 (25 chars)
+    Args:
+        filename: Path to person records file
+        start: First byte of the range (record boundary)
+        stop: Byte offset where the range ends
         
-        Args:
-            line: Fixed-width text line
-            
-        Returns:
-            Person object or None if parsing fails
-        """
-        try:
-            if len(line) < 44:
-                # Pad line if too short
-                line = line.ljust(44)
-            
-            person_id = int(line[0:3].strip())
-            name = line[3:19].strip()
-            surname = line[19:44].strip()
-            
-            return cls(person_id, name, surname)
-        except (ValueError, IndexError):
-            return None
+    Returns:
+        Display lines for the range, newline terminated
+    """
+    with MappedRecordFile(filename, PERSON_LAYOUT.field_specs(), PERSON_LAYOUT.size) as records:
+        lines = [display_line(record) for record in records.records(start, stop)]
+    return ("\n".join(lines) + "\n").encode('utf-8') if lines else b""
+
+
+def display_raw(records: MappedRecordFile, out: RecordWriter) -> None:
+    """
+    Display records exactly as stored, like COBOL DISPLAY S_PERSON.
+    
+    Canonical files (every record full length) are copied to the output
+    in whole blocks without splitting them into records; otherwise each
+    record is padded to the record length.
+    
+    Args:
+        records: Mapped person file
+        out: Buffered output writer
+    """
+    if records.is_canonical():
+        data = records.raw()
+        stride = records.record_length + 1
+        block = max(out.buffer_size // stride, 1) * stride
+        for start in range(0, len(data), block):
+            chunk = data[start:start + block]
+            out.write_raw(chunk, len(chunk) // stride)
+        return
     
-    def __str__(self) -> str:
-        """Format person record for display."""
-        return f"{self.person_id:03d} {self.name:16s} {self.surname:25s}"
+    record_length = records.record_length
+    for record in records:
+        out.write(bytes(record.raw()).ljust(record_length))
 
 
-def read_person_file(filename: str) -> None:
+def read_person_file(
+    filename: str,
+    raw: bool = False,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    workers: int = 1,
+) -> None:
     """
     Read and display person records from file.
     
     Process:
-    1. Open file for reading
+    1. Open file for reading (memory-mapped)
     2. Loop through records
-    3. Display each record
+    3. Display each record (buffered, written in large blocks)
     4. Close file
     
     Args:
         filename: Path to person records file
+        raw: Display records as stored instead of formatted fields
+        buffer_size: Output buffer size in bytes
+        workers: Parse in this many processes (output order is kept)
         
     Raises:
         FileNotFoundError: If file doesn't exist
@@ -87,20 +115,18 @@ def read_person_file(filename: str) -> None:
             print(f"Error: File '{filename}' not found")
             return
         
-        # Open file for reading
-        with open(file_path, 'r', encoding='utf-8') as f:
-            # Read and display each record
-            for line in f:
-                # Remove trailing newline
-                line = line.rstrip('\n\r')
-                
-                # Parse person record
-                person = Person.from_line(line)
-                
-                if person:
-                    print(person)
-                else:
-                    print(f"Warning: Could not parse line: {line}")
+        # Map file for reading (records are sliced without copying)
+        with MappedRecordFile(file_path, PERSON_LAYOUT.field_specs(), PERSON_LAYOUT.size) as records, \
+                RecordWriter(buffer_size=buffer_size) as out:
+            if raw:
+                display_raw(records, out)
+            elif workers > 1:
+                # Parse record-aligned ranges in parallel, display in order
+                for block in map_ranges(display_range, file_path, PERSON_LAYOUT.size, workers):
+                    out.write_raw(block)
+            else:
+                # Parse and display each record as a stream
+                Pipeline(records).map(display_line).write_text(out)
         
         print("File reading completed successfully")
         
@@ -117,11 +143,17 @@ def main() -> None:
     # Default file location (matching COBOL)
     default_file = "../SampleData/persons.txt"
     
-    # For testing, allow command line argument
-    import sys
-    filename = sys.argv[1] if len(sys.argv) > 1 else default_file
+    parser = argparse.ArgumentParser(description="Display person records")
+    parser.add_argument("filename", nargs="?", default=default_file)
+    parser.add_argument("--raw", action="store_true",
+                        help="display records as stored (fixed-width pass-through)")
+    parser.add_argument("--buffer-size", type=int, default=DEFAULT_BUFFER_SIZE,
+                        help="output buffer size in bytes")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="parse the file in this many processes")
+    args = parser.parse_args()
     
-    read_person_file(filename)
+    read_person_file(args.filename, args.raw, args.buffer_size, args.workers)
 
 
 if __name__ == "__main__":
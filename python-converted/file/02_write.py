@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+02_WRITE - Python Implementation
+
+A program demonstrating writing to an indexed file.
+Copies person records from a text file into an indexed file keyed on
+the person ID, displaying each record as it is copied.
+
+Original COBOL Program: 02_write.cbl
+Converted from specification: 02_write-spec.md
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.indexed import IndexedFile, InvalidKeyError  # noqa: E402
+from cobol_runtime.output import RecordWriter  # noqa: E402
+from cobol_runtime.person import PERSON_LAYOUT  # noqa: E402
+from cobol_runtime.recordio import MappedRecordFile  # noqa: E402
+
+RECORD_KEY = "PERSON-ID"
+
+
+def write_indexed_file(input_file: str, output_file: str, bulk: bool = False) -> None:
+    """
+    Copy person records into an indexed file.
+    
+    Process:
+    1. Open input file (line sequential)
+    2. Create the indexed output file (OPEN OUTPUT, CLOSE, OPEN I-O)
+    3. Loop through input records
+    4. Display each record and WRITE it to the indexed file
+    5. Close both files
+    
+    Args:
+        input_file: Path to person records file
+        output_file: Path to the indexed file to create
+        bulk: Stage records and build the index once at close
+    """
+    try:
+        if not Path(input_file).exists():
+            print(f"Error: File '{input_file}' not found")
+            return
+        
+        # OPEN OUTPUT creates an empty indexed file, then reopen it I-O
+        IndexedFile.for_layout(output_file, PERSON_LAYOUT, RECORD_KEY, "output").close()
+        
+        record_length = PERSON_LAYOUT.size
+        with MappedRecordFile(input_file, PERSON_LAYOUT.field_specs(), record_length) as records, \
+                IndexedFile.for_layout(output_file, PERSON_LAYOUT, RECORD_KEY, "io",
+                                       bulk=bulk) as people, \
+                RecordWriter() as out:
+            for record in records:
+                # READ INTO pads (or truncates) the line to the record length
+                data = bytes(record.raw())[:record_length].ljust(record_length)
+                out.write(data)
+                try:
+                    people.write(data)
+                except InvalidKeyError as e:
+                    out.write_text(f"Warning: Duplicate key {e.key.decode('utf-8', 'replace')}")
+        
+        # Bulk mode detects duplicates when the index is built at close
+        for key in people.duplicates:
+            print(f"Warning: Duplicate key {key.decode('utf-8', 'replace')}")
+        
+    except IOError as e:
+        print(f"Error writing file: {e}")
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+
+
+def main() -> None:
+    """Main entry point for the indexed write program."""
+    # Default file locations (matching COBOL)
+    parser = argparse.ArgumentParser(description="Copy person records to an indexed file")
+    parser.add_argument("input_file", nargs="?", default="../SampleData/persons.txt")
+    parser.add_argument("output_file", nargs="?", default="output.dat")
+    parser.add_argument("--bulk", action="store_true",
+                        help="build the index once at close")
+    args = parser.parse_args()
+    
+    write_indexed_file(args.input_file, args.output_file, args.bulk)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+03_REWRITE - Python Implementation
+
+A program demonstrating REWRITE on an indexed file.
+Reads every record of the indexed file in key order and replaces the
+surname with 'RODO anon.'.
+
+Original COBOL Program: 03_rewrite.cbl
+Converted from specification: 03_rewrite-spec.md
+
+Run 02_write.py first to create the indexed file.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.indexed import DEFAULT_GROUP_SIZE, IndexedFile  # noqa: E402
+from cobol_runtime.layout import encode_text  # noqa: E402
+from cobol_runtime.person import PERSON_LAYOUT  # noqa: E402
+from cobol_runtime.pipeline import Pipeline  # noqa: E402
+
+ANONYMOUS_SURNAME = "RODO anon."
+
+
+def anonymize_file(filename: str, wal: bool = False, group_size: int = DEFAULT_GROUP_SIZE) -> int:
+    """
+    Replace the surname of every record in an indexed file.
+    
+    Process:
+    1. Open indexed file I-O
+    2. READ NEXT until end of file
+    3. MOVE 'RODO anon.' to the surname and REWRITE the record
+    4. Close file
+    
+    Args:
+        filename: Path to the indexed person file
+        wal: Log rewrites and commit them in groups (crash safe)
+        group_size: Rewrites sharing one commit when ``wal`` is set
+        
+    Returns:
+        Number of records rewritten
+    """
+    surname = PERSON_LAYOUT.field("PERSON-SURNAME")
+    anonymous = encode_text(ANONYMOUS_SURNAME, surname.size)
+    count = 0
+    try:
+        with IndexedFile.for_layout(filename, PERSON_LAYOUT, "PERSON-ID", "io",
+                                    wal=wal, group_size=group_size) as people:
+            # READ NEXT until AT END -> MOVE the surname -> REWRITE
+            count = (Pipeline(iter(people.read_next, None))
+                     .map(lambda record: record[:surname.start] + anonymous + record[surname.end:])
+                     .for_each(people.rewrite))
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found")
+    except IOError as e:
+        print(f"Error updating file: {e}")
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+    return count
+
+
+def main() -> None:
+    """Main entry point for the rewrite program."""
+    parser = argparse.ArgumentParser(description="Anonymize surnames in an indexed file")
+    parser.add_argument("filename", nargs="?", default="output.dat")
+    parser.add_argument("--wal", action="store_true",
+                        help="write-ahead log with group commit")
+    parser.add_argument("--group-size", type=int, default=DEFAULT_GROUP_SIZE,
+                        help="rewrites per commit with --wal")
+    args = parser.parse_args()
+    
+    anonymize_file(args.filename, args.wal, args.group_size)
+
+
+if __name__ == "__main__":
+    main()
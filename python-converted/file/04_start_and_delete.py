@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+04_START_AND_DELETE - Python Implementation
+
+A program demonstrating START and DELETE on an indexed file.
+Positions the file after person ID 10 and removes every following
+record, displaying each one as it goes.
+
+Original COBOL Program: 04_start_and_delete.cbl
+Converted from specification: 04_start_and_delete-spec.md
+
+Run 02_write.py first to create the indexed file.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.indexed import IndexedFile, InvalidKeyError  # noqa: E402
+from cobol_runtime.output import RecordWriter  # noqa: E402
+from cobol_runtime.person import PERSON_LAYOUT  # noqa: E402
+
+START_KEY = 10
+
+
+def delete_after(filename: str, start_key: int = START_KEY) -> int:
+    """
+    Delete every record whose key is greater than ``start_key``.
+    
+    Process:
+    1. Open indexed file I-O
+    2. START KEY IS GREATER THAN start_key
+    3. READ NEXT until end of file
+    4. Display "Removing" with the record and DELETE it
+    5. Close file
+    
+    Args:
+        filename: Path to the indexed person file
+        start_key: Person ID to start after
+        
+    Returns:
+        Number of records deleted
+    """
+    count = 0
+    try:
+        with IndexedFile.for_layout(filename, PERSON_LAYOUT, "PERSON-ID", "io") as people, \
+                RecordWriter() as out:
+            try:
+                people.start(start_key, ">")
+            except InvalidKeyError:
+                # No records after the key: READ NEXT is immediately AT END
+                return count
+            while True:
+                record = people.read_next()
+                if record is None:
+                    break
+                out.write(b"Removing" + record)
+                people.delete(people.key_of(record))
+                count += 1
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found")
+    except IOError as e:
+        print(f"Error updating file: {e}")
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+    return count
+
+
+def main() -> None:
+    """Main entry point for the start and delete program."""
+    parser = argparse.ArgumentParser(description="Delete records after a person ID")
+    parser.add_argument("filename", nargs="?", default="output.dat")
+    parser.add_argument("--start-key", type=int, default=START_KEY)
+    args = parser.parse_args()
+    
+    delete_after(args.filename, args.start_key)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+01_SORT - Python Implementation
+
+A program demonstrating the SORT verb.
+Sorts person records by surname in ascending order through a work file,
+writes the sorted file and displays it.
+
+The job is a record pipeline: read -> external sort stage -> display.
+The COBOL program reads the GIVING file back to display it; here the
+display runs as an OUTPUT PROCEDURE over the sorted records while the
+GIVING file is written, which saves a full pass over the data.
+
+Original COBOL Program: 01_sort.cbl
+Converted from specification: 01_sort-spec.md
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.output import RecordWriter  # noqa: E402
+from cobol_runtime.person import PERSON_LAYOUT  # noqa: E402
+from cobol_runtime.pipeline import Pipeline  # noqa: E402
+from cobol_runtime.recordio import RecordView  # noqa: E402
+from cobol_runtime.sort import (  # noqa: E402
+    DEFAULT_SORT_MEMORY,
+    KeySpec,
+    compile_sort_key,
+    external_sort_stage,
+    parallel_sort_procedure,
+)
+
+SORT_KEYS: List[KeySpec] = ["PERSON-SURNAME"]
+
+
+def parse_sort_key(text: str) -> KeySpec:
+    """
+    Parse a --key argument such as ``PERSON-ID:DESC``.
+    
+    Args:
+        text: Field name, optionally followed by ``:ASC`` or ``:DESC``
+        
+    Returns:
+        Key spec for the sort engine
+    """
+    name, _, direction = text.partition(":")
+    return (name, direction) if direction else name
+
+
+def display_sorted(records: Iterator[bytes], output_file: Optional[str]) -> int:
+    """
+    OUTPUT PROCEDURE: write the GIVING file and display each record.
+    
+    Args:
+        records: Sorted records (each one a RETURN)
+        output_file: GIVING file path, or None to only display
+        
+    Returns:
+        Number of records displayed
+    """
+    print("Finished!")
+    with RecordWriter() as out:
+        if output_file is None:
+            out.write_many(records)
+        else:
+            with open(output_file, "wb") as stream, RecordWriter(stream) as given:
+                for record in records:
+                    # LINE SEQUENTIAL WRITE drops trailing spaces
+                    given.write(record.rstrip(b" "))
+                    out.write(record)
+        return out.records_written
+
+
+def sort_person_file(
+    input_file: str,
+    output_file: Optional[str],
+    memory_limit: int = DEFAULT_SORT_MEMORY,
+    work_dir: Optional[str] = None,
+    keys: Optional[List[KeySpec]] = None,
+    workers: int = 1,
+) -> None:
+    """
+    Sort person records by surname and display the result.
+    
+    Process:
+    1. SORT input ON ASCENDING KEY surname (or the given keys)
+    2. Display "Finished!"
+    3. Write each sorted record to the output file and display it
+    
+    Args:
+        input_file: Path to person records file (USING)
+        output_file: Path to the sorted file (GIVING), or None to skip it
+        memory_limit: Bytes of records sorted in memory before spilling
+            a run to a work file
+        work_dir: Directory for work files
+        keys: Sort keys, major first (defaults to surname ascending)
+        workers: Build sorted runs in this many processes
+    """
+    try:
+        if not Path(input_file).exists():
+            print(f"Error: File '{input_file}' not found")
+            return
+        
+        keys = keys or SORT_KEYS
+        
+        def output_procedure(records: Iterator[bytes]) -> int:
+            return display_sorted(records, output_file)
+        
+        if workers > 1:
+            # Runs are sorted in worker processes and merged here
+            parallel_sort_procedure(input_file, "PersonRecord", keys, output_procedure,
+                                    workers=workers, memory_limit=memory_limit, work_dir=work_dir)
+        else:
+            # USING: every input record is released (padded to the record length)
+            sorted_records = (
+                Pipeline.read(input_file, PERSON_LAYOUT, RecordView.raw)
+                .then(external_sort_stage(PERSON_LAYOUT.size, compile_sort_key(PERSON_LAYOUT, keys),
+                                          memory_limit, work_dir))
+            )
+            output_procedure(iter(sorted_records))
+        
+    except IOError as e:
+        print(f"Error sorting file: {e}")
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+
+
+def main() -> None:
+    """Main entry point for the sort program."""
+    # Default file locations (matching COBOL)
+    parser = argparse.ArgumentParser(description="Sort person records by surname")
+    parser.add_argument("input_file", nargs="?", default="../SampleData/persons.txt")
+    parser.add_argument("output_file", nargs="?", default="sortedOutput.dat")
+    parser.add_argument("--memory", type=int, default=DEFAULT_SORT_MEMORY,
+                        help="sort memory budget in bytes")
+    parser.add_argument("--work-dir", default=None,
+                        help="directory for sort work files")
+    parser.add_argument("--key", dest="keys", action="append", type=parse_sort_key,
+                        help="sort key FIELD[:ASC|:DESC], repeatable (default PERSON-SURNAME)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="build sorted runs in this many processes")
+    parser.add_argument("--no-giving", action="store_true",
+                        help="only display the sorted records, don't write the output file")
+    args = parser.parse_args()
+    
+    output_file = None if args.no_giving else args.output_file
+    sort_person_file(args.input_file, output_file, args.memory, args.work_dir,
+                     args.keys, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+01_INSPECT - Python Implementation
+
+A program demonstrating the INSPECT verb: counting characters, counting
+spaces and replacing characters.
+
+Original COBOL Program: 01_insepct.cbl
+Converted from specification: 01_insepct-spec.md
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.inspect import compile_inspect  # noqa: E402
+
+MAX_INPUT_LEN = 10
+
+TALLY_LENGTH = compile_inspect("INSPECT var-str TALLYING var-length FOR CHARACTERS")
+TALLY_SPACES = compile_inspect("INSPECT var-str TALLYING var-length FOR ALL SPACE")
+REPLACE_A = compile_inspect("INSPECT var-str REPLACING ALL 'a' BY 'z'")
+
+
+def demonstrate_inspect() -> None:
+    """
+    Demonstrate INSPECT TALLYING and REPLACING.
+    
+    Process:
+    1. Accept a string (up to 10 characters)
+    2. TALLYING FOR CHARACTERS: display its length
+    3. TALLYING FOR ALL SPACE: display its space count
+    4. REPLACING ALL 'a' BY 'z': display the new string
+    
+    COBOL behavior:
+    - var-length is reset (MOVE 0) before each TALLYING, which adds to it
+    - REPLACING is case-sensitive and changes var-str in place
+    """
+    try:
+        print("Enter some string:")
+        var_str = input()[:MAX_INPUT_LEN]
+    
+        # Tallying
+        var_length = TALLY_LENGTH.tally(var_str)["VAR-LENGTH"]
+        print(f"Length: {var_length}")
+    
+        var_length = TALLY_SPACES.tally(var_str)["VAR-LENGTH"]
+        print(f"Spaces: {var_length}")
+    
+        # Replacing
+        var_str = REPLACE_A.replace(var_str)
+        print(f"Str: {var_str}")
+    
+    except EOFError:
+        print("Error: No input provided")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def main() -> None:
+    """Main entry point for the INSPECT program."""
+    demonstrate_inspect()
+
+
+if __name__ == "__main__":
+    main()
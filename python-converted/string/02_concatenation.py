@@ -9,6 +9,26 @@ Original COBOL Program: 02_concatenation.cbl
 Converted from specification: 02_concatenation-spec.md
 """
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.storage import WorkingStorage  # noqa: E402
+from cobol_runtime.strings import compile_string  # noqa: E402
+
+WORKING_STORAGE = """
+       01 var-str1 PIC X(10) VALUE 'HELLO!'.
+       01 var-str2 PIC X(10) VALUE 'HELLO!'.
+       01 var-str-out PIC X(20) VALUE ' '.
+       01 var-count PIC 99 VALUE 1.
+"""
+
+CONCATENATE = compile_string(
+    "STRING var-str2 DELIMITED BY SIZE var-str1 DELIMITED BY SPACE "
+    "INTO var-str-out WITH POINTER var-count"
+)
+
 
 def demonstrate_concatenation() -> None:
     """
@@ -24,35 +44,35 @@ def demonstrate_concatenation() -> None:
     COBOL behavior:
     - var-str2 DELIMITED BY SIZE: uses entire field
     - var-str1 DELIMITED BY space: stops at first space
+    - ACCEPT truncates or space-pads the input to PIC X(10)
+    - STRING writes into var-str-out (PIC X(20)) from var-count on
     """
-    MAX_OUTPUT_LEN = 20
-    
     try:
+        storage = WorkingStorage.parse(WORKING_STORAGE)
+        
         # Prompt and accept first string (name)
         print("Enter name: ", end="")
-        name = input()[:10]  # Limit to 10 chars like COBOL
+        storage.var_str1.move(input())
         
         # Prompt and accept second string (surname)
         print("Enter surname: ", end="")
-        surname = input()[:10]  # Limit to 10 chars like COBOL
+        storage.var_str2.move(input())
         
-        # Concatenate:
-        # - surname: entire field (all 10 chars in COBOL, we use actual input)
-        # - name: up to first space
-        name_part = name.split()[0] if name.strip() else name
-        result = surname + name_part
+        # Concatenate into the 20-byte output field, as the spec does
+        # taking the surname without its padding
+        pointer, overflow = CONCATENATE(storage.var_str_out.view, bytes(storage.var_str2).rstrip(),
+                                        storage.var_str1.view, pointer=storage.var_count.value)
+        storage.var_count.move(pointer)
         
-        # Check for overflow (max 20 chars)
-        if len(result) > MAX_OUTPUT_LEN:
+        if overflow:
             print("String overflow!")
-            result = result[:MAX_OUTPUT_LEN]
         
         # Display result
+        result = storage.var_str_out.view[:pointer - 1].tobytes().decode("utf-8", errors="ignore")
         print(f"Result: {result}")
         
-        # Display length/position
-        position = len(result) + 1  # POINTER is 1-based in COBOL
-        print(f"Position: {position}")
+        # Display length/position (POINTER is 1-based in COBOL)
+        print(f"Position: {storage.var_count.value}")
         
     except Exception as e:
         print(f"Error: {e}")
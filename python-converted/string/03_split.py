@@ -9,6 +9,25 @@ Original COBOL Program: 03_split.cbl
 Converted from specification: 03_split-spec.md
 """
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.storage import WorkingStorage  # noqa: E402
+from cobol_runtime.strings import compile_unstring  # noqa: E402
+
+WORKING_STORAGE = """
+       01 var-long-str PIC X(20) VALUE 'HELLO!'.
+       01 var-name PIC X(20) VALUE 'name'.
+       01 var-surname PIC X(20) VALUE 'name'.
+       01 var-rest PIC X(20).
+"""
+
+SPLIT = compile_unstring(
+    "UNSTRING var-long-str DELIMITED BY SPACE INTO var-name, var-surname, var-rest"
+)
+
 
 def demonstrate_split() -> None:
     """
@@ -26,27 +45,23 @@ def demonstrate_split() -> None:
     - First token → var-name
     - Second token → var-surname
     - Additional tokens → var-rest (captured but not displayed)
+    - Each space is a delimiter: two spaces in a row give an empty field
     """
-    MAX_INPUT_LEN = 20
-    
     try:
+        storage = WorkingStorage.parse(WORKING_STORAGE)
+        
         # Display prompt
         print("Type your name and surname (use space as delimiter)")
         
-        # Accept input (limit to 20 chars like COBOL)
-        input_str = input()[:MAX_INPUT_LEN]
-        
-        # Split by space delimiter
-        tokens = input_str.split()
+        # Accept input into the 20-byte field (ACCEPT truncates or pads with spaces)
+        storage.var_long_str.move(input())
         
-        # Extract fields (pad with spaces to match COBOL field behavior)
-        name = tokens[0] if len(tokens) > 0 else ""
-        surname = tokens[1] if len(tokens) > 1 else ""
-        rest = " ".join(tokens[2:]) if len(tokens) > 2 else ""
+        SPLIT(storage.var_long_str.view, storage.var_name.view, storage.var_surname.view,
+              storage.var_rest.view)
         
         # Display extracted fields
-        print(f"Name: {name}")
-        print(f"Surname: {surname}")
+        print(f"Name: {str(storage.var_name).rstrip()}")
+        print(f"Surname: {str(storage.var_surname).rstrip()}")
         
         # Note: var-rest is not displayed in original COBOL program
         # but could be used for overflow detection
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+01_MAIN - Python Implementation
+
+A program demonstrating CALL with its two parameter passing modes: BY
+REFERENCE (the default), where the subroutine's MOVE changes the
+caller's number, and BY CONTENT, where it only changes a copy.
+
+Original COBOL Program: 01_call_main.cbl
+Converted from specification: 01_call_main-spec.md
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.call import ProgramRegistry, compile_call  # noqa: E402
+from cobol_runtime.storage import WorkingStorage  # noqa: E402
+
+WORKING_STORAGE = """
+       01 WS-NUMBER PIC 9(4) VALUE 1234.
+       01 WS-STRING PIC A(15) VALUE 'Some string'.
+"""
+
+# 01_call_subroutine is loaded from this directory on its first CALL
+PROGRAMS = ProgramRegistry([Path(__file__).resolve().parent])
+
+CALL_BY_REFERENCE = compile_call("CALL '01_call_subroutine' USING WS-NUMBER, WS-STRING", PROGRAMS)
+CALL_BY_CONTENT = compile_call("CALL '01_call_subroutine' USING BY CONTENT WS-NUMBER, WS-STRING", PROGRAMS)
+
+
+def display(storage: WorkingStorage, title: str) -> None:
+    """Display a title, then WS-NUMBER and WS-STRING."""
+    print(title)
+    print(f"Number: {storage.ws_number}")
+    print(f"String: {storage.ws_string}")
+
+
+def demonstrate_call() -> None:
+    """
+    Call 01_call_subroutine BY REFERENCE, then BY CONTENT.
+    
+    Process:
+    1. Display WS-NUMBER (1234) and WS-STRING
+    2. CALL BY REFERENCE: the subroutine moves 3721 to WS-NUMBER
+    3. MOVE 1234 TO WS-NUMBER
+    4. CALL BY CONTENT: the subroutine moves 3721 to a copy
+    
+    COBOL behavior:
+    - BY CONTENT applies to every argument after it
+    - WS-STRING is PIC A(15): displayed with its trailing spaces
+    """
+    try:
+        storage = WorkingStorage.parse(WORKING_STORAGE)
+        
+        display(storage, "Before CALL BY: ")
+        print(" ")
+        
+        CALL_BY_REFERENCE(storage.ws_number, storage.ws_string)
+        
+        print(" ")
+        display(storage, "After CALL BY REFERENCE: ")
+        
+        storage.ws_number.move(1234)
+        print(" ")
+        
+        CALL_BY_CONTENT(storage.ws_number, storage.ws_string)
+        
+        print(" ")
+        display(storage, "After CALL BY CONTENT: ")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def main() -> None:
+    """Main entry point for the CALL program."""
+    demonstrate_call()
+
+
+if __name__ == "__main__":
+    main()
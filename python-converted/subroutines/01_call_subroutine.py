@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+01_call_subroutine - Python Implementation
+
+The subprogram called by 01_call_main.py: it displays the string it is
+given and moves 3721 to the number, which only reaches the caller when
+the number is passed BY REFERENCE.
+
+Do not run this file: run 01_call_main.py, which loads it on its first
+CALL through the program registry.
+
+Original COBOL Program: 01_call_subroutine.cbl
+Converted from specification: 01_call_subroutine-spec.md
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobol_runtime.call import Program  # noqa: E402
+from cobol_runtime.storage import WorkingStorage  # noqa: E402
+
+LINKAGE_SECTION = """
+       01 LS-NUMBER PIC 9(4).
+       01 LS-STRING PIC A(15).
+"""
+
+PROGRAM = Program("01_call_subroutine", linkage=LINKAGE_SECTION, using=("LS-NUMBER", "LS-STRING"))
+
+
+@PROGRAM.procedure_division
+def procedure_division(linkage: WorkingStorage, storage: WorkingStorage) -> None:
+    """
+    PROCEDURE DIVISION USING LS-NUMBER, LS-STRING.
+    
+    COBOL behavior:
+    - LS-NUMBER and LS-STRING are the caller's bytes (BY REFERENCE) or
+      a copy of them (BY CONTENT)
+    - EXIT PROGRAM returns to the caller
+    """
+    print("Hello subroutine!")
+    print(f"String data: {linkage.ls_string}")
+    linkage.ls_number.move(3721)
+
+
+def main() -> None:
+    """This subprogram is not run on its own."""
+    print("01_call_subroutine is called by 01_call_main.py: run that instead")
+
+
+if __name__ == "__main__":
+    main()
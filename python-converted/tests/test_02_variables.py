@@ -29,10 +29,7 @@ def test_variables_output():
     assert lines[1] == "-" * 80
     
     # Check data row format
-    assert "01|" in lines[2]
-    assert "3721" in lines[2]
-    assert "-317.21" in lines[2]
-    assert "$" in lines[2] and "317.21" in lines[2]
+    assert lines[2] == "01|      3721|-    317.21|$    317.21"
 
 
 def test_variables_exit_success():
@@ -55,15 +52,16 @@ def test_variables_formatting():
     lines = result.stdout.split('\n')
     data_line = lines[2]
     
-    # Verify format: "01|      3721|   -317.21|  $317.21"
-    # Line position should be 2 digits
-    assert data_line.startswith("01|")
+    lp, number, decimal, currency = data_line.split("|")
     
-    # Number should be right-aligned in 10 character field
-    assert "3721" in data_line
+    # Line position should be 2 digits: PIC 9(2)
+    assert lp == "01"
     
-    # Decimal should show sign and 2 decimal places
-    assert "-317.21" in data_line
+    # Number should be zero suppressed in 10 positions: PIC z(10)
+    assert number == "      3721"
     
-    # Currency should have dollar sign and 2 decimal places
-    assert "$" in data_line and "317.21" in data_line
+    # Decimal should show the fixed sign first: PIC +z(7).zz
+    assert decimal == "-    317.21"
+    
+    # Currency should have a fixed dollar sign: PIC $z(7).zz
+    assert currency == "$    317.21"
@@ -71,3 +71,31 @@ def test_add_invalid_input():
     )
     # Program should handle error gracefully
     assert "Error" in result.stdout or result.returncode != 0
+
+
+def test_add_batch_mode():
+    """Test --batch: one result line per pair, in order, without prompts."""
+    result = subprocess.run(
+        [sys.executable, str(ADD_PATH), "--batch"],
+        input="5 10\n\n0,0\nfive 10\n-4 7\n99999999999999999999 1\n",
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    assert result.stdout == (
+        "Result : 15\nResult : 0\nError: Please enter valid numbers\n"
+        "Result : 3\nResult : 100000000000000000000\n"
+    )
+
+
+def test_add_batch_file(tmp_path):
+    """Test --batch FILE with more pairs than one chunk."""
+    pairs = tmp_path / "pairs.txt"
+    pairs.write_text("".join(f"{i} {i}\n" for i in range(70000)))
+    result = subprocess.run(
+        [sys.executable, str(ADD_PATH), "--batch", str(pairs)],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    assert result.stdout.splitlines() == [f"Result : {2 * i}" for i in range(70000)]
@@ -0,0 +1,55 @@
+"""
+Unit tests for 06_divide program.
+
+Tests integer and decimal division with remainder.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+
+DIVIDE_PATH = Path(__file__).parent.parent / "basic" / "06_divide.py"
+
+
+def run_divide(text: str) -> str:
+    result = subprocess.run(
+        [sys.executable, str(DIVIDE_PATH)],
+        input=text,
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    return result.stdout
+
+
+def test_divide_with_remainder():
+    """Test 10 / 3: integer remainder 1, decimal remainder 0.01."""
+    output = run_divide("10\n3\n")
+    assert "Result : 3\nRemainder : 1\n" in output
+    assert "Result : 3.33\nRemainder : 0.01\n" in output
+
+
+def test_divide_truncates_toward_zero():
+    """Test that negative quotients are truncated, not floored."""
+    output = run_divide("-7\n2\n")
+    assert "Result : -3\nRemainder : -1\n" in output
+    assert "Result : -3.50\nRemainder : 0.00\n" in output
+
+
+def test_divide_by_zero():
+    """Test the division by zero message."""
+    assert "Error: Cannot divide by zero" in run_divide("7\n0\n")
+
+
+def test_divide_batch_mode():
+    """Test --batch prints the interactive blocks for every pair."""
+    pairs = ["10 3", "7 0", "-7 2", "10000000000000000000 3", "x 1"]
+    result = subprocess.run(
+        [sys.executable, str(DIVIDE_PATH), "--batch"],
+        input="\n".join(pairs) + "\n",
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    expected = "".join(run_divide(pair.replace(" ", "\n") + "\n") for pair in pairs)
+    assert result.stdout == expected.replace("Enter number 2: ", "").replace("Enter number 1: ", "")
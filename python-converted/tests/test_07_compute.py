@@ -0,0 +1,52 @@
+"""
+Unit tests for 07_compute program.
+
+Tests the quadratic formula with exact fixed-point arithmetic.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+
+COMPUTE_PATH = Path(__file__).parent.parent / "basic" / "07_compute.py"
+
+
+def run_compute(text: str) -> str:
+    result = subprocess.run(
+        [sys.executable, str(COMPUTE_PATH)],
+        input=text,
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    return result.stdout
+
+
+def test_compute_quadratic():
+    """Test y = 2*1.5^2 + 3*1.5 + 4 = 13.00."""
+    assert "y = 13.00" in run_compute("2\n3\n4\n1.5\n")
+
+
+def test_compute_truncates():
+    """Test that the result is truncated, not rounded: 0.321 -> 0.32."""
+    assert "y = 0.32" in run_compute("0.1\n0.2\n0.3\n0.1\n")
+
+
+def test_compute_size_error():
+    """Test that a result wider than PIC z(15)9.99 is reported."""
+    assert "Error: Result too large" in run_compute("1e9\n0\n0\n1e5\n")
+
+
+def test_compute_batch_mode(tmp_path):
+    """Test --batch FILE against the interactive results, exotic operands included."""
+    lines = ["2 3 4 1.5", "0.1 0.2 0.3 0.1", "1e9 0 0 1e5", "0.001 1 1 1", "-2.5 1 1 abc"]
+    values = tmp_path / "values.txt"
+    values.write_text("\n".join(lines) + "\n")
+    result = subprocess.run(
+        [sys.executable, str(COMPUTE_PATH), "--batch", str(values)],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    expected = [run_compute(line.replace(" ", "\n") + "\n").splitlines()[-1] for line in lines]
+    assert result.stdout.splitlines() == [line.split("x = ")[-1] for line in expected]
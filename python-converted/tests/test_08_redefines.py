@@ -0,0 +1,35 @@
+"""
+Unit tests for 08_redefines program.
+
+Tests that the redefining PIC 9(12) items show the edited results' bytes.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+
+REDEFINES_PATH = Path(__file__).parent.parent / "basic" / "08_redefines.py"
+
+
+def run_redefines(text: str) -> str:
+    result = subprocess.run(
+        [sys.executable, str(REDEFINES_PATH)],
+        input=text,
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    return result.stdout
+
+
+def test_redefines_shows_same_bytes():
+    """Test 10 / 3: 3.33 remainder 0.01, and the same bytes cut to 12."""
+    output = run_redefines("10\n3\n")
+    assert "Result :          3.33\nReminder :          0.01\n" in output
+    assert "Result :          3.3\nReminder :          0.0\n" in output
+
+
+def test_redefines_invalid_input():
+    """Test non-numeric input and division by zero."""
+    assert "Error: Please enter valid numbers" in run_redefines("x\n3\n")
+    assert "Error: Cannot divide by zero" in run_redefines("7\n0\n")
@@ -0,0 +1,23 @@
+"""
+Unit tests for 09_rename program.
+
+Tests that the level-66 group spans the first three numbers.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+
+RENAME_PATH = Path(__file__).parent.parent / "basic" / "09_rename.py"
+
+
+def test_rename_group():
+    """Test that var-group displays var-num1 THRU var-num3 with the fillers."""
+    result = subprocess.run(
+        [sys.executable, str(RENAME_PATH)],
+        input="1\n22\n333\n4\n5\n6\n",
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    assert result.stdout.endswith("var-group : \n0000000001 0000000022 0000000333\n")
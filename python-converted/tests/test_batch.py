@@ -0,0 +1,57 @@
+"""
+Unit tests for batch runs of the arithmetic programs.
+
+Tests chunking, output order around invalid and oversize operands, and
+buffered output.
+"""
+import io
+
+from cobol_runtime.batch import INVALID, calculate_lines, run_batch, within
+from cobol_runtime.output import RecordWriter
+
+
+def bulk_add(first, second):
+    """Column function that marks its lines, so tests see which path ran."""
+    return "".join(f"bulk {a + b}\n" for a, b in zip(first, second))
+
+
+def single_add(a, b):
+    return f"single {a + b}\n"
+
+
+def test_good_lines_go_through_bulk():
+    """Test one bulk call per chunk when every line parses and fits."""
+    calls = []
+
+    def bulk(first, second):
+        calls.append(len(first))
+        return bulk_add(first, second)
+
+    lines = [f"{i}, {i}\n" for i in range(10)]
+    text = "".join(calculate_lines(lines, 2, bulk, single_add, chunk_rows=4))
+    assert text == "".join(f"bulk {2 * i}\n" for i in range(10))
+    assert calls == [4, 4, 2]
+
+
+def test_order_kept_around_other_lines():
+    """Test that invalid, oversize and blank lines keep their place."""
+    lines = ["1 2\n", "\n", "3 x\n", "4 5 6\n", "1000 1\n", "7 8\n", "9 1\n"]
+    text = "".join(calculate_lines(lines, 2, bulk_add, single_add, fits=within(100)))
+    assert text == "bulk 3\n" + INVALID + INVALID + "single 1001\nbulk 15\nbulk 10\n"
+
+
+def test_within():
+    """Test the int range check used as ``fits``."""
+    fits = within(10)
+    assert fits(9) and fits(-9) and fits(0)
+    assert not fits(10) and not fits(-10)
+
+
+def test_run_batch_writes_buffered():
+    """Test that results go through the record writer."""
+    sink = io.BytesIO()
+    with RecordWriter(sink) as out:
+        lines = run_batch(io.StringIO("1 1\n2 2\nbad\n"), 2, bulk_add, single_add, out=out)
+    assert lines == 3
+    assert out.records_written == 3
+    assert sink.getvalue() == b"bulk 2\nbulk 4\n" + INVALID.encode()
@@ -0,0 +1,142 @@
+"""
+Unit tests for the CALL runtime.
+
+Tests BY REFERENCE and BY CONTENT passing, subprogram state kept
+between calls and reset by CANCEL, loading programs from the search
+path, and CALL statement errors.
+"""
+import pytest
+
+from cobol_runtime.call import CallPlan, Program, ProgramRegistry, compile_call
+from cobol_runtime.storage import WorkingStorage
+
+CALLER = """
+       01 ws-record.
+          05 ws-number PIC 9(4) VALUE 1234.
+          05 ws-name   PIC X(6) VALUE 'Alice'.
+       01 ws-flag PIC X VALUE 'N'.
+"""
+
+
+def counter() -> Program:
+    """A subprogram that counts its calls and changes what it is given."""
+    program = Program(
+        "COUNTER",
+        linkage="""
+       01 ls-record.
+          05 ls-number PIC 9(4).
+             88 ls-big VALUE 1000 THRU 9999.
+          05 ls-name   PIC X(6).
+       01 ls-flag PIC X.
+""",
+        working_storage="       01 ws-calls PIC 9(4) VALUE 0.",
+    )
+
+    @program.procedure_division
+    def body(linkage: WorkingStorage, storage: WorkingStorage) -> int:
+        storage.ws_calls.move(storage.ws_calls.value + 1)
+        if linkage.ls_big:
+            linkage.ls_flag.move("Y")
+        linkage.ls_number.move(linkage.ls_number.value + 1)
+        linkage.ls_name.move("Bob")
+        return storage.ws_calls.value
+
+    return program
+
+
+def test_by_reference_and_by_content():
+    """Test that BY REFERENCE changes the caller's storage and BY CONTENT does not."""
+    registry = ProgramRegistry([])
+    registry.register(counter())
+    storage = WorkingStorage.parse(CALLER)
+    by_content = CallPlan("CALL 'COUNTER' USING BY CONTENT ws-record BY REFERENCE ws-flag", registry)
+    assert by_content(storage.ws_record, storage.ws_flag) == 1
+    assert bytes(storage.ws_record) == b"1234Alice " and str(storage.ws_flag) == "Y"
+    storage.ws_flag.move("N")
+    by_reference = CallPlan("CALL 'COUNTER' USING ws-record, ws-flag.", registry)
+    for calls in range(2, 5):
+        assert by_reference(storage.ws_record, storage.ws_flag) == calls
+    assert storage.ws_number.value == 1237 and str(storage.ws_name) == "Bob   "
+    assert str(storage.ws_flag) == "Y"
+
+
+def test_linkage_follows_each_caller():
+    """Test that LINKAGE items are rebound whenever a different buffer is passed."""
+    program = counter()
+    first, second = WorkingStorage.parse(CALLER), WorkingStorage.parse(CALLER)
+    second.ws_number.move(5)
+    program(first.ws_record, first.ws_flag)
+    program(second.ws_record, bytearray(b"N"))
+    program(first.ws_record.view, first.ws_flag)
+    assert (first.ws_number.value, second.ws_number.value) == (1236, 6)
+    assert program.linkage.records["LS-RECORD"].obj is first.records["WS-RECORD"]
+    with pytest.raises(ValueError):
+        program(bytearray(4), first.ws_flag)
+    with pytest.raises(ValueError):
+        program(first.ws_record)
+
+
+def test_state_and_cancel():
+    """Test that WORKING-STORAGE persists between calls until CANCEL."""
+    registry = ProgramRegistry([])
+    program = registry.register(counter())
+    call = compile_call("CALL 'counter' USING ws-record ws-flag", registry)
+    storage = WorkingStorage.parse(CALLER)
+    assert [call(storage.ws_record, storage.ws_flag) for _ in range(3)] == [1, 2, 3]
+    registry.cancel("COUNTER")
+    assert call(storage.ws_record, storage.ws_flag) == 1
+    assert call.program is program and registry.resolve("Counter") is program
+    with pytest.raises(ValueError):
+        registry.register(counter())
+
+
+def test_literals_and_recursion():
+    """Test BY CONTENT literals, and that an active program cannot be called again."""
+    program = Program("ECHO", linkage="       01 ls-text PIC X(5).")
+    seen = []
+
+    @program.procedure_division
+    def body(linkage: WorkingStorage, storage: WorkingStorage) -> None:
+        seen.append(str(linkage.ls_text))
+        linkage.ls_text.move("XXXXX")
+        if len(seen) == 2:
+            program(bytearray(5))
+
+    registry = ProgramRegistry([])
+    registry.register(program)
+    call = CallPlan("CALL 'ECHO' USING 'hello'", registry)
+    call()
+    with pytest.raises(ValueError):
+        call()
+    assert seen == ["hello", "hello"]
+    call()
+
+
+def test_load_from_search_path(tmp_path):
+    """Test that a program is loaded from <name>.py once, on its first CALL."""
+    (tmp_path / "01_sub.py").write_text(
+        "from cobol_runtime.call import Program\n"
+        "LOADS = []\n"
+        "PROGRAM = Program('01_SUB', linkage='       01 ls-n PIC 99.')\n"
+        "LOADS.append(1)\n"
+        "PROGRAM.procedure_division(lambda linkage, storage: linkage.ls_n.move(42))\n"
+    )
+    registry = ProgramRegistry([tmp_path])
+    storage = WorkingStorage.parse("       01 ws-n PIC 99 VALUE 0.")
+    call = compile_call("CALL '01_sub' USING ws-n", registry)
+    call(storage.ws_n)
+    call(storage.ws_n)
+    assert storage.ws_n.value == 42 and list(registry.programs) == ["01_SUB"]
+    with pytest.raises(ValueError):
+        compile_call("CALL 'missing' USING ws-n", registry)(storage.ws_n)
+
+
+@pytest.mark.parametrize("statement", [
+    "CALL ws-program USING ws-n",
+    "CALL 'SUB' USING BY VALUE ws-n",
+    "CALL 'SUB' USING ws-n RETURNING ws-code",
+])
+def test_unsupported_statements(statement):
+    """Test that unsupported CALL forms are rejected when compiled."""
+    with pytest.raises(ValueError):
+        CallPlan(statement)
@@ -0,0 +1,77 @@
+"""
+Unit tests for columnar (NumPy) batch decoding.
+
+Tests vectorized decoding of person files into structured arrays.
+"""
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cobol_runtime.columnar import decode_columns, iter_column_chunks, read_columns, record_matrix  # noqa: E402
+from cobol_runtime.copybook import parse_copybook  # noqa: E402
+from cobol_runtime.layout import compile_layout, load_layout  # noqa: E402
+
+
+SAMPLE_FILE = Path(__file__).parent.parent.parent / "SampleData" / "persons.txt"
+LAYOUT = load_layout("PersonRecord")
+
+
+def test_columns_dtype_and_values():
+    """Test that the sample file decodes into typed columns."""
+    people = read_columns(SAMPLE_FILE, LAYOUT)
+    assert people.dtype["person_id"] == np.uint16
+    assert people.dtype["person_name"] == np.dtype("S16")
+    assert people.dtype["person_surname"] == np.dtype("S25")
+    assert len(people) == 19
+    assert people["person_surname"][2].decode("utf-8") == "Wojciechowski"
+    assert (people["person_id"] > 10).sum() == 10
+
+
+def test_columns_canonical_records():
+    """Test full-length records (zero-copy strided path)."""
+    data = b"".join(LAYOUT.encode((i, f"N{i}", "S")) + b"\n" for i in range(1, 6))
+    people = decode_columns(data, LAYOUT)
+    assert people["person_id"].tolist() == [1, 2, 3, 4, 5]
+    assert people["person_name"].tolist() == [b"N1", b"N2", b"N3", b"N4", b"N5"]
+
+
+def test_crlf_records_one_byte_short():
+    """Test that a CR ending a record one byte short becomes a space, not data."""
+    matrix = record_matrix(b"abc\r\ndef\r\n", 4)
+    assert [row.tobytes() for row in matrix] == [b"abc ", b"def "]
+
+
+def test_columns_chunks_are_record_aligned():
+    """Test that small chunks still cover every record exactly once."""
+    chunks = list(iter_column_chunks(SAMPLE_FILE, LAYOUT, chunk_bytes=100))
+    assert len(chunks) > 1
+    ids = np.concatenate([c["person_id"] for c in chunks])
+    assert ids.tolist() == read_columns(SAMPLE_FILE, LAYOUT)["person_id"].tolist()
+
+
+def test_columns_non_numeric_id():
+    """Test that a bad numeric field is reported with its record number."""
+    with pytest.raises(ValueError, match="Record 2"):
+        decode_columns(b"001 A               B\nx02 C               D\n", LAYOUT)
+
+
+@pytest.mark.parametrize("picture", ["S999", "S9V99", "999"])
+def test_display_numbers_match_record_codec(picture):
+    """Test that signs and spaces the record codec reads decode the same in columns."""
+    (record,) = parse_copybook(f"       01  AMOUNT  PIC {picture}.\n")
+    layout = compile_layout(record)
+    fields = [b"123", b" 12", b"12 ", b"007"]
+    if "S" in picture:
+        fields += [b"12p", b"12}", b"12J", b"12{", b"12A", b"-12", b"12-", b"+12", b" -1"]
+    columns = decode_columns(b"".join(fields), layout, line_sequential=False)
+    expected = [float(layout.decode(field)[0]) for field in fields]
+    assert columns["amount"].tolist() == expected
+
+
+def test_display_numbers_too_wide():
+    """Test that DISPLAY fields over 18 digits are refused rather than overflowing."""
+    (record,) = parse_copybook("       01  TOTAL  PIC 9(19).\n")
+    with pytest.raises(ValueError, match="int64"):
+        decode_columns(b"1" * 19, compile_layout(record), line_sequential=False)
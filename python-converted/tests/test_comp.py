@@ -0,0 +1,120 @@
+"""
+Unit tests for the COMP-3 and COMP codecs.
+
+Tests single-value and column codecs, and binary fields in record
+layouts, columnar decoding and report rows.
+"""
+from decimal import Decimal
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cobol_runtime.columnar import decode_columns  # noqa: E402
+from cobol_runtime.comp import (  # noqa: E402
+    NATIVE,
+    decode_binary,
+    decode_binary_column,
+    decode_packed,
+    decode_packed_column,
+    encode_binary,
+    encode_binary_column,
+    encode_packed,
+    encode_packed_column,
+)
+from cobol_runtime.copybook import parse_copybook  # noqa: E402
+from cobol_runtime.layout import compile_layout  # noqa: E402
+from cobol_runtime.report import edit_rows  # noqa: E402
+from cobol_runtime.storage import WorkingStorage  # noqa: E402
+
+
+def test_packed_values():
+    """Test COMP-3 sign nibbles, scale and MOVE truncation."""
+    assert encode_packed(-1234, 3) == b"\x01\x23\x4d"
+    assert encode_packed(1234, 3, signed=False) == b"\x01\x23\x4f"
+    assert encode_packed(Decimal("12.345"), 3, scale=2) == b"\x01\x23\x4c"
+    assert encode_packed(123456, 3) == b"\x23\x45\x6c"
+    assert encode_packed(12345, 3, digits=4) == b"\x02\x34\x5c"
+    assert decode_packed(b"\x01\x23\x4d") == -1234
+    assert decode_packed(b"\x01\x23\x4b") == -1234
+    assert decode_packed(b"\x01\x23\x4f", 2) == Decimal("12.34")
+    with pytest.raises(ValueError):
+        decode_packed(b"\x0a\x23\x4c")
+    with pytest.raises(ValueError):
+        decode_packed(b"\x01\x23\x45")
+
+
+def test_binary_values():
+    """Test COMP (big-endian, PICTURE digits) and COMP-5 (native, binary size)."""
+    assert encode_binary(-2, 2) == b"\xff\xfe"
+    assert encode_binary(12345, 2, digits=4) == (2345).to_bytes(2, "big")
+    assert encode_binary(12345, 2, byteorder=NATIVE) == (12345).to_bytes(2, NATIVE)
+    assert encode_binary(-7, 2, signed=False) == b"\x00\x07"
+    assert encode_binary(-32768, 2) == b"\x80\x00" and encode_binary(32768, 2) == b"\x80\x00"
+    assert decode_binary(b"\xff\xfe") == -2
+    assert decode_binary(b"\x04\xd2", 2) == Decimal("12.34")
+    assert decode_binary(b"\xff\xfe", signed=False) == 65534
+
+
+def test_packed_column_matches_values():
+    """Test that the column codecs agree with the single-value ones."""
+    units = np.array([0, 1, -1, 99999, -12345, 54321], dtype=np.int64)
+    matrix = encode_packed_column(units, 3)
+    assert matrix.tobytes() == b"".join(encode_packed(int(u), 3) for u in units)
+    assert decode_packed_column(matrix).tolist() == units.tolist()
+    assert decode_packed_column(matrix.tobytes(), 3).tolist() == units.tolist()
+    with pytest.raises(ValueError, match="Record 3"):
+        decode_packed_column(b"\x00\x1c\x00\x2c\x0a\x2c", 2)
+    assert decode_packed_column(encode_packed_column(units, 3, digits=4)).tolist() == \
+        [0, 1, -1, 9999, -2345, 4321]
+
+
+def test_binary_column_matches_values():
+    """Test binary column round trips in both byte orders."""
+    units = np.array([0, 1, -1, 32767, -32768, 1234], dtype=np.int64)
+    for order in ("big", "little"):
+        matrix = encode_binary_column(units, 2, byteorder=order)
+        assert matrix.tobytes() == b"".join(encode_binary(int(u), 2, byteorder=order) for u in units)
+        assert decode_binary_column(matrix, byteorder=order).tolist() == units.tolist()
+    assert encode_binary_column(units, 4, digits=3).view(">i4").ravel().tolist() == \
+        [0, 1, -1, 767, -768, 234]
+
+
+def test_comp_fields_in_layouts():
+    """Test binary items in the layout codec, columnar decoding and report rows."""
+    (record,) = parse_copybook(
+        "       01  BALANCE.\n"
+        "           05  ACCOUNT     PIC 9(4) COMP.\n"
+        "           05  AMOUNT      PIC S9(7)V99 COMP-3.\n"
+        "           05  COUNTER     PIC S9(9) COMP-5.\n"
+        "           05  NAME        PIC X(4).\n"
+    )
+    layout = compile_layout(record)
+    assert layout.size == 2 + 5 + 4 + 4
+    row = (42, Decimal("-1234.56"), -7, "ab")
+    encoded = layout.encode(row)
+    assert encoded[:7] == b"\x00\x2a\x00\x01\x23\x45\x6d"
+    assert layout.decode(encoded) == (42, Decimal("-1234.56"), -7, "ab")
+
+    data = encoded + layout.encode((9999, Decimal("0.01"), 123456789, "cd"))
+    columns = decode_columns(data, layout, line_sequential=False)
+    assert columns["account"].tolist() == [42, 9999]
+    assert columns["amount"].tolist() == [-1234.56, 0.01]
+    assert columns["counter"].tolist() == [-7, 123456789]
+
+    rows = edit_rows(layout, {"ACCOUNT": [42, 9999], "AMOUNT": [Decimal("-1234.56"), Decimal("0.01")],
+                              "COUNTER": [-7, 123456789], "NAME": ["ab", "cd"]}, newline=b"")
+    assert rows == data
+
+
+def test_packed_truncates_to_picture():
+    """Test that an even-digit COMP-3 item keeps its PICTURE digits, not the field's."""
+    source = "       01  TOTAL       PIC S9(4) COMP-3.\n"
+    (record,) = parse_copybook(source)
+    layout = compile_layout(record)
+    assert layout.size == 3
+    assert layout.encode((12345,)) == b"\x02\x34\x5c"
+    assert edit_rows(layout, {"TOTAL": [12345, -99999]}, newline=b"") == b"\x02\x34\x5c\x09\x99\x9d"
+    storage = WorkingStorage.parse(source)
+    storage.total.move(12345)
+    assert storage.total.value == 2345
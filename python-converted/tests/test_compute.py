@@ -0,0 +1,91 @@
+"""
+Unit tests for the COMPUTE compiler.
+
+Tests parsing, scale handling, scalar against batch evaluation, size
+errors and the exact fallback for int64 overflow.
+"""
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from cobol_runtime.compute import Compute, compile_compute, parse_compute
+from cobol_runtime.fixed import Fixed, SizeError
+
+QUADRATIC = {
+    "var-a": "S9(11)V99", "var-b": "S9(11)V99", "var-c": "S9(11)V99",
+    "var-x": "S9(11)V99", "var-result": "S9(16)V99",
+}
+
+
+def test_parse_precedence():
+    """Test ** over unary minus over * / over + -, and ROUNDED."""
+    target, rounded, node = parse_compute("COMPUTE y ROUNDED = a + b * c ** 2.")
+    assert (target, rounded) == ("Y", True)
+    assert node == ("+", ("var", "A"), ("*", ("var", "B"), ("pow", ("var", "C"), 2)))
+    assert parse_compute("y = -(a - 1.5)")[2] == ("neg", ("-", ("var", "A"), ("num", 15, 1)))
+
+
+@pytest.mark.parametrize("statement", ["y a + b", "y = a +", "y = (a", "y = a ** b", "y = a $ b"])
+def test_parse_errors(statement):
+    """Test that malformed statements are rejected."""
+    with pytest.raises(ValueError, match="COMPUTE"):
+        parse_compute(statement)
+
+
+def test_unknown_names():
+    """Test that every data name needs a PICTURE."""
+    with pytest.raises(ValueError, match="VAR-Z"):
+        Compute("var-result = var-a + var-z", QUADRATIC)
+    with pytest.raises(ValueError, match="receiving"):
+        Compute("total = var-a", QUADRATIC)
+
+
+def test_scalar_evaluation():
+    """Test exact evaluation with truncation and ROUNDED on store."""
+    compute = compile_compute("var-result = var-a * var-x ** 2 + var-b * var-x + var-c", QUADRATIC)
+    assert compute.evaluate({"var-a": 2, "var-b": 3, "var-c": 4, "var-x": 5}) == 69
+    assert compute.evaluate({"var-a": "1.5", "var-b": -2, "var-c": 0, "var-x": "0.1"}) == Fixed.of("-0.18")
+    rounded = Compute("var-result ROUNDED = var-a / var-x", QUADRATIC)
+    assert rounded.evaluate({"var-a": 2, "var-x": 3}) == Fixed.of("0.67")
+    assert Compute("var-result = var-a / var-x", QUADRATIC).evaluate({"var-a": 2, "var-x": 3}) == Fixed.of("0.66")
+    with pytest.raises(SizeError):
+        rounded.evaluate({"var-a": 1, "var-x": 0})
+
+
+def test_batch_matches_scalar():
+    """Test that the int64 column code gives the scalar results."""
+    compute = compile_compute("var-result = (var-a - var-b) / var-x + var-c * 3", QUADRATIC)
+    rng = np.random.default_rng(7)
+    columns = {name: rng.integers(-10 ** 6, 10 ** 6, 500) / 100 for name in ("var-a", "var-b", "var-c", "var-x")}
+    columns["var-x"][columns["var-x"] == 0] = 1
+    batch = compute.evaluate_columns(columns)
+    assert not batch.size_error.any()
+    for row in range(0, 500, 37):
+        values = {name: Decimal(repr(float(column[row]))) for name, column in columns.items()}
+        assert batch.fixed(row) == compute.evaluate(values)
+
+
+def test_batch_size_errors():
+    """Test per-element size errors: oversize results and division by zero."""
+    compute = compile_compute("r = a / b", {"a": "S9(4)", "b": "S9(4)", "r": "S9(2)V9"})
+    batch = compute.evaluate_columns({"a": [7, 5000, 1, -9], "b": [2, 1, 0, 4]})
+    assert batch.size_error.tolist() == [False, True, True, False]
+    assert batch.strings() == ["3.5", None, None, "-2.2"]
+
+
+def test_batch_exact_fallback():
+    """Test that int64 overflow in intermediates isn't mistaken for a size error."""
+    compute = compile_compute("r = a * b / c", {"a": "S9(18)", "b": "S9(18)", "c": "S9(18)", "r": "S9(18)"})
+    columns = {"a": [10 ** 17, 4], "b": [10 ** 17, 5], "c": [10 ** 17, 2]}
+    assert compute.evaluate_columns(columns).strings() == [str(10 ** 17), "10"]
+    assert compute.evaluate_columns(columns, exact=False).size_error.tolist() == [True, False]
+
+
+def test_chained_results():
+    """Test passing one statement's result as the next one's operand."""
+    fields = {"a": "S9(4)", "b": "S9(4)", "q": "S9(4)V99", "r": "S9(4)V99"}
+    quotient = compile_compute("q = a / b", fields).evaluate_columns({"a": [10, -7], "b": [3, 2]})
+    remainder = compile_compute("r = a - q * b", fields).evaluate_columns(
+        {"a": [10, -7], "b": [3, 2], "q": quotient})
+    assert remainder.strings() == ["0.01", "0.00"]
@@ -0,0 +1,117 @@
+"""
+Unit tests for level-88 condition names and class tests.
+
+Tests parsing of VALUE lists, each compiled table kind against the
+column form, the NUMERIC/ALPHABETIC byte tests, and condition names
+bound to working storage.
+"""
+import numpy as np
+import pytest
+
+from cobol_runtime.conditions import (
+    ALPHABETIC_TABLE,
+    NUMERIC_TABLE,
+    class_column,
+    compile_condition,
+    is_alphabetic,
+    is_alphabetic_upper,
+    is_numeric,
+)
+from cobol_runtime.copybook import parse_copybook, parse_picture
+from cobol_runtime.storage import WorkingStorage
+
+DATA = """
+       01 var-record.
+          05 var-status PIC X.
+             88 var-vowel  VALUE 'A' 'E' 'I' 'O' 'U'.
+             88 var-letter VALUES ARE 'A' THRU 'Z'.
+          05 var-code   PIC X(3) VALUE SPACES.
+             88 var-empty VALUE SPACES.
+             88 var-band  VALUE 'AAA' THRU 'CZZ', 'X00' THROUGH 'X99'.
+          05 var-amount PIC S9(5)V99 COMP-3 VALUE 12.5.
+             88 var-small VALUE ZERO THRU 20.
+       01 var-num PIC S9(9) VALUE 0.
+       88 var-pass VALUES ARE 100 THRU 9999.
+"""
+
+
+def test_parse_condition_names():
+    """Test VALUE lists, THRU ranges and figurative constants on 88 entries."""
+    record, number = parse_copybook(DATA)
+    status, code, amount = record.children
+    assert [c.name for c in status.conditions] == ["var-vowel", "var-letter"]
+    assert status.conditions[0].values == tuple((v, None) for v in "AEIOU")
+    assert status.conditions[1].values == (("A", "Z"),)
+    assert code.conditions[0].values == (("   ", None),)
+    assert code.conditions[1].values == (("AAA", "CZZ"), ("X00", "X99"))
+    assert amount.conditions[0].values == (("0", "20"),)
+    assert number.conditions[0].values == (("100", "9999"),)
+    with pytest.raises(ValueError):
+        parse_copybook("       88 var-orphan VALUE 1.")
+
+
+@pytest.mark.parametrize("values, picture, kind", [
+    ((("100", "9999"),), "S9(9)", "range"),
+    ((("1", None), ("3", None), ("5", None)), "99", "set"),
+    ((("1", "10"), ("20", "30"), ("500", None)), "9(4)", "bitmask"),
+    ((("1", "10"), ("1000000", "2000000")), "9(9)", "bisect"),
+    ((("0.5", "1.25"), ("3", "4")), "9V99", "bitmask"),
+    ((("A", "C"), ("X", "Z")), "X", "bytes"),
+    ((("AB", "AZ"), ("Q", None), ("ZZ", None)), "XX", "bisect"),
+])
+def test_plans_match_column(values, picture, kind):
+    """Test that every table kind gives the same answer one by one and by column."""
+    plan = compile_condition(values, parse_picture(picture))
+    assert plan.kind == kind
+    if plan.numeric:
+        samples = [0, 1, 3, 4, 10, 11, 25, 99, 100, 500, 9999, 10000, 1500000, -5]
+        if plan.scale:
+            samples = ["0.49", "0.5", "1.25", "1.26", "3.5", "4", "4.01"]
+        expected = [plan.test(value) for value in samples]
+        column = np.array([float(value) for value in samples]) if plan.scale else np.array(samples)
+    else:
+        samples = ["A", "B", "D", "Y", "AC", "AZ", "B", "Q ", "ZZ", "Z"]
+        expected = [plan.test(value) for value in samples]
+        column = samples
+    assert plan.test_column(column).tolist() == expected
+    assert any(expected) and not all(expected)
+
+
+def test_scaled_and_alphanumeric_keys():
+    """Test that values compare at the item's scale and width."""
+    plan = compile_condition((("0.5", "1.25"),), parse_picture("9V99"))
+    assert plan.test("1.25") and plan.test("1.259") and not plan.test("1.26")
+    band = compile_condition((("AAA", "CZZ"),), parse_picture("X(3)"))
+    assert band.test(b"BCD") and band.test("B") and not band.test("D")
+    matrix = np.frombuffer(b"ABCD  C  ", dtype=np.uint8).reshape(3, 3)
+    assert band.test_column(matrix).tolist() == [True, False, True]
+    with pytest.raises(ValueError):
+        compile_condition((("9", "1"),), parse_picture("9"))
+
+
+def test_class_tests():
+    """Test the NUMERIC and ALPHABETIC class tests, one value and by column."""
+    assert is_numeric(b"123") and not is_numeric(b"12.3") and not is_numeric(b"")
+    assert not is_numeric(b"123      ")
+    assert is_numeric(b"12p", signed=True) and not is_numeric(b"12p")
+    assert is_alphabetic("John Doe") and not is_alphabetic(b"mixed123")
+    assert is_alphabetic_upper(b"ABC") and not is_alphabetic_upper(b"AbC")
+    matrix = np.frombuffer(b"123ABC1A ", dtype=np.uint8).reshape(3, 3)
+    assert class_column(matrix, NUMERIC_TABLE).tolist() == [True, False, False]
+    assert class_column(matrix, ALPHABETIC_TABLE).tolist() == [False, True, False]
+
+
+def test_storage_conditions():
+    """Test condition names bound to working storage, and SET ... TO TRUE."""
+    storage = WorkingStorage.parse(DATA)
+    assert bool(storage.var_empty) and bool(storage.var_small)
+    assert not storage.var_vowel and not storage.var_pass
+    storage.var_num.move(150)
+    assert storage["VAR-PASS"]
+    storage.var_amount.move("-0.01")
+    assert not storage.var_small
+    storage.var_vowel.set_true()
+    assert str(storage.var_status) == "A" and storage.var_letter
+    storage.var_band.set_true()
+    assert str(storage.var_code) == "AAA" and not storage.var_empty
+    assert "var-band" in storage and "var-other" not in storage
@@ -1,7 +1,7 @@
 """
 Unit tests for control flow programs.
 
-Tests conditional logic and loops.
+Tests conditional logic, loops and GO TO.
 """
 import subprocess
 import sys
@@ -10,6 +10,7 @@ from pathlib import Path
 
 IF_PATH = Path(__file__).parent.parent / "control" / "01_if.py"
 LOOPS_PATH = Path(__file__).parent.parent / "control" / "02_loops.py"
+GOTO_PATH = Path(__file__).parent.parent / "control" / "04_goto.py"
 
 
 def test_if_greater_than():
@@ -108,3 +109,18 @@ def test_loops_paragraph_count():
     # A-PARAGRAPH should appear once (only in fall-through)
     a_count = sum(1 for line in lines if "A-PARAGRAPH" in line)
     assert a_count == 1
+
+
+def test_goto_depending_on():
+    """Test that GO TO DEPENDING ON falls through the paragraphs after its target."""
+    expected = {"1": "PARA-1\nPARA-2\nPARA-3\n", "2": "PARA-2\nPARA-3\n", "3": "PARA-3\n",
+                "7": "PARA-1\nPARA-2\nPARA-3\n"}
+    for switch, tail in expected.items():
+        result = subprocess.run(
+            [sys.executable, str(GOTO_PATH)],
+            input=f"{switch}\n",
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 0
+        assert result.stdout == "Hello in PARA-NEXT!\nEnter number 1,2 or 3:\n" + tail
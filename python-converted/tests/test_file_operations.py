@@ -66,3 +66,75 @@ def test_read_file_multiple_records():
     
     # Should have at least 3 records
     assert len(lines) >= 3
+
+
+def test_read_file_raw_display():
+    """Test raw mode displays records as stored, padded to 44 bytes."""
+    result = subprocess.run(
+        [sys.executable, str(FILE_READ_PATH), "--raw", str(TEST_DATA_FILE)],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    lines = result.stdout.split('\n')
+    assert lines[0] == "001 John            Smith".ljust(44)
+    assert "completed successfully" in result.stdout
+
+
+INDEXED_DIR = Path(__file__).parent.parent / "file"
+
+
+def test_indexed_write_rewrite_delete(tmp_path):
+    """Test the indexed write, rewrite and start/delete programs in sequence."""
+    indexed = tmp_path / "output.dat"
+    result = subprocess.run(
+        [sys.executable, str(INDEXED_DIR / "02_write.py"), str(TEST_DATA_FILE), str(indexed)],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    assert result.stdout.split('\n')[0] == "001 John            Smith".ljust(44)
+    
+    result = subprocess.run(
+        [sys.executable, str(INDEXED_DIR / "03_rewrite.py"), str(indexed)],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    
+    result = subprocess.run(
+        [sys.executable, str(INDEXED_DIR / "04_start_and_delete.py"), str(indexed),
+         "--start-key", "1"],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    lines = result.stdout.splitlines()
+    assert lines[0] == "Removing002" + " Jane".ljust(16) + "RODO anon.".ljust(25)
+    assert len(lines) == 2
+
+
+def test_indexed_bulk_write_and_wal_rewrite(tmp_path):
+    """Test bulk loading and WAL rewriting produce the same file contents."""
+    indexed = tmp_path / "output.dat"
+    subprocess.run(
+        [sys.executable, str(INDEXED_DIR / "02_write.py"), "--bulk", str(TEST_DATA_FILE), str(indexed)],
+        capture_output=True,
+        check=True
+    )
+    subprocess.run(
+        [sys.executable, str(INDEXED_DIR / "03_rewrite.py"), "--wal", "--group-size", "2", str(indexed)],
+        capture_output=True,
+        check=True
+    )
+    assert not (tmp_path / "output.dat.wal").exists()
+    
+    result = subprocess.run(
+        [sys.executable, str(INDEXED_DIR / "04_start_and_delete.py"), str(indexed),
+         "--start-key", "0"],
+        capture_output=True,
+        text=True
+    )
+    lines = result.stdout.splitlines()
+    assert len(lines) == 3
+    assert all("RODO anon." in line for line in lines)
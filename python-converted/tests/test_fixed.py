@@ -0,0 +1,71 @@
+"""
+Unit tests for fixed-point arithmetic.
+
+Tests exact arithmetic, truncation and ROUNDED, ON SIZE ERROR and
+DIVIDE ... REMAINDER.
+"""
+from decimal import Decimal
+
+import pytest
+
+from cobol_runtime.fixed import Fixed, FixedSpec, SizeError, divide_remainder
+
+
+def test_exact_arithmetic():
+    """Test that sums and products don't drift like floats."""
+    assert Fixed.of("0.1") + Fixed.of("0.2") == Decimal("0.3")
+    assert Fixed.of(0.1) * 3 == Fixed.of("0.3")
+    assert Fixed.of("1.5") ** 2 == Fixed(225, 2)
+    assert 1 - Fixed.of("0.01") == Fixed.of("0.99")
+    assert str(Fixed.of("-0.05")) == "-0.05"
+    assert f"{Fixed.of('2.5'):.2f}" == "2.50"
+    assert int(Fixed.of("-2.7")) == -2
+    assert Fixed.of(" -.50 ") == Fixed(-50, 2) and Fixed.of("1e3") == 1000
+
+
+def test_store_truncates_and_rounds():
+    """Test truncation, ROUNDED (half away from zero) and unsigned receivers."""
+    spec = FixedSpec.from_picture("S9(3)V99")
+    assert (spec.digits, spec.scale, spec.signed) == (5, 2, True)
+    assert spec.store(Fixed.of("1.239")) == Fixed.of("1.23")
+    assert spec.store(Fixed.of("1.235"), rounded=True) == Fixed.of("1.24")
+    assert spec.store(Fixed.of("-1.235"), rounded=True) == Fixed.of("-1.24")
+    assert FixedSpec.from_picture("9(3)").store(-42) == 42
+    assert spec.store_units(123456, 3) == 12345
+
+
+def test_size_error():
+    """Test high-order truncation and ON SIZE ERROR."""
+    spec = FixedSpec.from_picture("9(3)V9")
+    assert spec.store(Decimal("1234.5")) == Fixed.of("234.5")
+    with pytest.raises(SizeError):
+        spec.store(Decimal("1234.5"), on_size_error=True)
+    with pytest.raises(SizeError):
+        Fixed.of(1).divide(0, 2)
+
+
+def test_divide_remainder():
+    """Test DIVIDE GIVING REMAINDER with integer and decimal quotients."""
+    whole = FixedSpec(10)
+    cents = FixedSpec(10, 2)
+    assert divide_remainder(10, 3, whole, cents) == (3, 1)
+    assert divide_remainder(10, 3, cents, cents) == (Fixed.of("3.33"), Fixed.of("0.01"))
+    assert divide_remainder(-7, 2, whole, whole) == (-3, -1)
+    # ROUNDED changes the quotient, not the remainder
+    assert divide_remainder(2, 3, cents, cents, rounded=True) == (Fixed.of("0.67"), Fixed.of("0.02"))
+
+
+def test_scales_beyond_table():
+    """Test that products and quotients with 64 or more decimal places still work."""
+    assert (Fixed.of("1.01") ** 40).scale == 80
+    assert FixedSpec(10, 2).store(Fixed.of("1.01") ** 40) == Fixed.of("1.48")
+    assert Fixed.of("1.5").divide(Fixed(1, 70), 2) == Fixed(15 * 10 ** 69, 0)
+    assert Fixed.of("1") + Fixed(1, 70) == Fixed(10 ** 70 + 1, 70)
+
+
+def test_invalid_numbers():
+    """Test that non-numeric input is rejected."""
+    with pytest.raises(ValueError):
+        Fixed.of("abc")
+    with pytest.raises(ValueError):
+        Fixed.of(float("nan"))
@@ -0,0 +1,92 @@
+"""
+Unit tests for the indexed (ISAM) file engine.
+
+Tests keyed WRITE/READ/START/READ NEXT/REWRITE/DELETE on the B+tree.
+"""
+import random
+
+import pytest
+
+from cobol_runtime.indexed import IndexedFile, InvalidKeyError
+from cobol_runtime.person import PERSON_LAYOUT
+
+
+def make_record(key: int) -> bytes:
+    return b"%08d" % key + b"payload-%06d" % (key % 10 ** 6)
+
+
+def test_write_and_read_by_key(tmp_path):
+    """Test records can be read back by key after reopening."""
+    path = tmp_path / "people.dat"
+    with IndexedFile(path, "output", record_length=22, key_length=8) as f:
+        for key in (5, 1, 3):
+            f.write(make_record(key))
+    
+    with IndexedFile(path, "input") as f:
+        assert len(f) == 3
+        assert f.read(3) == make_record(3)
+        assert list(f) == [make_record(1), make_record(3), make_record(5)]
+        with pytest.raises(InvalidKeyError) as missing:
+            f.read(4)
+        assert missing.value.status == "23"
+
+
+def test_duplicate_key_is_invalid(tmp_path):
+    """Test WRITE of an existing key raises status 22."""
+    with IndexedFile(tmp_path / "dup.dat", "output", record_length=22, key_length=8) as f:
+        f.write(make_record(1))
+        with pytest.raises(InvalidKeyError) as duplicate:
+            f.write(make_record(1))
+        assert duplicate.value.status == "22"
+        assert len(f) == 1
+
+
+def test_start_read_next_rewrite_delete(tmp_path):
+    """Test sequential access after START while updating records."""
+    with IndexedFile(tmp_path / "seq.dat", "output", record_length=22, key_length=8) as f:
+        for key in range(1, 11):
+            f.write(make_record(key))
+        
+        f.start(7, ">")
+        assert f.read_next() == make_record(8)
+        f.rewrite(b"%08d" % 8 + b"changed".ljust(14))
+        assert f.read_next() == make_record(9)
+        f.delete(9)
+        assert f.read_next() == make_record(10)
+        assert f.read_next() is None
+        
+        f.start(8, "=")
+        assert f.read_next().endswith(b"changed".ljust(14))
+        with pytest.raises(InvalidKeyError):
+            f.start(10, ">")
+
+
+def test_many_keys_match_reference(tmp_path):
+    """Test random inserts and deletes across many page splits."""
+    random.seed(7)
+    keys = random.sample(range(10 ** 7), 20000)
+    expected = {}
+    with IndexedFile(tmp_path / "big.dat", "output", record_length=22, key_length=8,
+                     page_size=512) as f:
+        for key in keys:
+            f.write(make_record(key))
+            expected[key] = make_record(key)
+        for key in keys[::2]:
+            f.delete(key)
+            del expected[key]
+        assert list(f) == [expected[key] for key in sorted(expected)]
+    
+    with IndexedFile(tmp_path / "big.dat", "io") as f:
+        assert len(f) == len(expected)
+        middle = sorted(expected)[len(expected) // 2]
+        f.start(middle, ">=")
+        assert f.read_next() == expected[middle]
+
+
+def test_for_layout_uses_record_key(tmp_path):
+    """Test opening with a copybook layout keys on PERSON-ID."""
+    path = tmp_path / "output.dat"
+    with IndexedFile.for_layout(path, PERSON_LAYOUT, "PERSON-ID", "output") as f:
+        assert (f.record_length, f.key_offset, f.key_length) == (44, 0, 3)
+        f.write(b"007Jan")
+        assert f.read(7) == b"007Jan".ljust(44)
@@ -0,0 +1,90 @@
+"""
+Unit tests for the INSPECT engine.
+
+Tests statement parsing, TALLYING/REPLACING/CONVERTING semantics and
+the column API.
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cobol_runtime.inspect import InspectPlan, compile_inspect, parse_inspect  # noqa: E402
+
+
+def test_parse_statements():
+    """Test clause parsing, figurative constants and syntax errors."""
+    tallying, replacing, converting = parse_inspect(
+        "INSPECT WS-TEXT TALLYING N FOR ALL 'ab' SPACE BEFORE INITIAL '.' "
+        "M FOR CHARACTERS REPLACING ALL ZERO BY 'xy'."
+    )
+    assert [(c.kind, c.pattern, c.counter, c.before) for c in tallying] == [
+        ("ALL", "ab", "N", None), ("ALL", " ", "N", "."), ("CHARACTERS", "", "M", None)
+    ]
+    assert (replacing[0].pattern, replacing[0].replacement) == ("00", "xy")
+    assert converting is None
+    assert parse_inspect("CONVERTING 'abc' TO 'ABC'")[2].replacement == "ABC"
+    for statement in ("INSPECT X", "REPLACING ALL 'ab' BY 'x'", "TALLYING N FOR ALL WS-CHAR",
+                      "REPLACING ALL 'a' BY 'b' EXTRA"):
+        with pytest.raises(ValueError, match="INSPECT"):
+            parse_inspect(statement)
+
+
+def test_tallying():
+    """Test CHARACTERS, ALL and LEADING counts within BEFORE/AFTER regions."""
+    assert compile_inspect("TALLYING N FOR CHARACTERS").tally("banana") == {"N": 6}
+    assert compile_inspect("TALLYING N FOR ALL 'an'").tally("banana") == {"N": 2}
+    assert compile_inspect("TALLYING N FOR LEADING '0'").tally("0070") == {"N": 2}
+    assert compile_inspect("TALLYING N FOR ALL 'a' AFTER INITIAL 'n'").tally("banana") == {"N": 2}
+    assert compile_inspect("TALLYING N FOR CHARACTERS BEFORE INITIAL SPACE").tally("ab cd") == {"N": 2}
+    assert compile_inspect("TALLYING N FOR ALL 'a' AFTER 'x'").tally("banana") == {"N": 0}
+    # The first clause that matches at a position takes it
+    plan = compile_inspect("TALLYING A FOR ALL 'a' C FOR CHARACTERS")
+    assert plan.tally("banana") == {"A": 3, "C": 3}
+    plan = compile_inspect("TALLYING L FOR LEADING 'a' B FOR ALL 'b' BEFORE 'x'")
+    assert plan.tally(b"aababx b") == {"L": 2, "B": 2}
+
+
+def test_replacing():
+    """Test ALL, LEADING, FIRST and CHARACTERS replacements."""
+    assert compile_inspect("REPLACING ALL 'a' BY 'z'").replace("banana") == "bznznz"
+    assert compile_inspect("REPLACING LEADING '0' BY SPACE").replace("00120") == "  120"
+    assert compile_inspect("REPLACING FIRST 'an' BY 'AN'").replace("banana") == "bANana"
+    assert compile_inspect("REPLACING CHARACTERS BY '*' AFTER ':'").replace("pw:abc") == "pw:***"
+    plan = compile_inspect("REPLACING ALL 'a' BY 'z' 'n' BY 'm' AFTER INITIAL 'b'")
+    assert plan.replace("abanana") == "zbzmzmz"
+    plan = compile_inspect("REPLACING LEADING 'a' BY 'x' FIRST 'n' BY 'N' ALL 'a' BY 'y'")
+    assert plan.replace("aanana") == "xxNyny"
+    assert compile_inspect("REPLACING ALL 'a' BY 'z'").replace(b"banana") == b"bznznz"
+
+
+def test_converting_and_tallying_with_replacing():
+    """Test CONVERTING, and that TALLYING sees the value before REPLACING."""
+    plan = compile_inspect("CONVERTING 'abc' TO 'ABC' BEFORE INITIAL SPACE")
+    assert plan.replace("cab cab") == "CAB cab"
+    plan = compile_inspect("INSPECT X TALLYING N FOR ALL 'a' REPLACING ALL 'a' BY 'b'")
+    assert plan("banana") == ("bbnbnb", {"N": 3})
+    assert compile_inspect("TALLYING N FOR ALL 'a'") is compile_inspect("TALLYING N FOR ALL 'a'")
+
+
+@pytest.mark.parametrize("statement", [
+    "TALLYING N FOR ALL 'a' M FOR LEADING ' ' AFTER 'b'",
+    "TALLYING N FOR LEADING 'a' M FOR CHARACTERS BEFORE ' '",
+    "REPLACING LEADING 'a' BY 'z' FIRST 'b' BY 'y' ALL ' ' BY '_' AFTER 'a'",
+    "CONVERTING 'ab' TO 'AB' AFTER ' '",
+    "REPLACING ALL 'ab' BY 'XY'",
+])
+def test_columns_match_values(statement):
+    """Test that matrix and sequence columns give the per-value results."""
+    values = [b"aab ba", b"  ab a", b"bbbbbb", b"a a a ", b"      ", b"ab  ba"]
+    matrix = np.frombuffer(b"".join(values), dtype=np.uint8).reshape(len(values), 6)
+    plan = InspectPlan(statement)
+    if plan.counters:
+        counts = plan.tally_column(matrix)
+        assert {k: v.tolist() for k, v in counts.items()} == \
+            {k: [plan.tally(v)[k] for v in values] for k in plan.counters}
+        assert {k: v.tolist() for k, v in plan.tally_column(values).items()} == \
+            {k: v.tolist() for k, v in counts.items()}
+    else:
+        expected = [plan.replace(v) for v in values]
+        assert [row.tobytes() for row in plan.replace_column(matrix)] == expected
+        assert plan.replace_column([v.decode() for v in values]) == [v.decode() for v in expected]
@@ -0,0 +1,88 @@
+"""
+Unit tests for the copybook parser and record layout compiler.
+
+Tests PICTURE sizing, source formats, offset resolution and generated
+codecs.
+"""
+from decimal import Decimal
+
+import pytest
+
+from cobol_runtime.copybook import parse_copybook, parse_picture
+from cobol_runtime.layout import compile_layout, load_layout
+
+
+def test_picture_sizes():
+    """Test storage size and category of common pictures."""
+    assert parse_picture("999").size == 3
+    assert parse_picture("X(16)").size == 16
+    assert parse_picture("S9(5)V99").size == 7
+    assert parse_picture("S9(5)V99").scale == 2
+    assert parse_picture("+z(7).zz").size == 11
+    assert parse_picture("ZZ9CR").size == 5
+    assert parse_picture("$z(7).zz").category == "numeric-edited"
+
+
+@pytest.mark.parametrize("indent", [2, 4, 8])
+def test_free_format_indents(indent):
+    """Test that indented free-format entries keep their level numbers."""
+    (record,) = parse_copybook(
+        "01 rec.\n" + " " * indent + "05 a PIC X(3).\n" + " " * indent + "05 b PIC 9(2).\n"
+    )
+    assert [(item.name, item.offset, item.size) for item in record.children] == [("a", 0, 3), ("b", 3, 2)]
+
+
+def test_fixed_format_areas():
+    """Test sequence numbers, comment lines and the identification area in fixed format."""
+    lines = [
+        "000100 01 rec.",
+        "000200     05 a PIC X(3).".ljust(72) + "IDENTIFY",
+        "000300*    05 b PIC 9(2).",
+        "      /",
+        "000400     05 c PIC 9(2).",
+    ]
+    (record,) = parse_copybook("\n".join(lines))
+    assert [item.name for item in record.children] == ["a", "c"]
+    with pytest.raises(ValueError):
+        parse_copybook("000100 01 rec.\n    05 a PIC X(3).\n")
+
+
+def test_person_layout_roundtrip():
+    """Test decoding and encoding the shared person record."""
+    layout = load_layout("PersonRecord")
+    assert layout.size == 44
+    assert layout.field_specs() == (
+        ("person_id", 0, 3), ("person_name", 3, 19), ("person_surname", 19, 44)
+    )
+    record = layout.encode((7, "Jane", "Doe"))
+    assert record == b"007" + b"Jane".ljust(16) + b"Doe".ljust(25)
+    assert layout.decode(record) == (7, "Jane", "Doe")
+
+
+def test_layout_is_cached():
+    """Test that a copybook layout is compiled only once."""
+    assert load_layout("PersonRecord") is load_layout("PersonRecord")
+
+
+def test_sample_data_row_fillers():
+    """Test that FILLER VALUE clauses are emitted by encode."""
+    layout = load_layout("SampleDataRow")
+    assert [f.name for f in layout.fields] == ["var-lp", "var-number", "var-decimal", "var-currency"]
+    assert layout.encode(layout.initial_values()).count(b"|") == 3
+    assert layout.initial_values()[2] == Decimal("-317.21")
+
+
+def test_signed_scaled_and_redefines():
+    """Test signed implied-decimal fields and REDEFINES offsets."""
+    (record,) = parse_copybook(
+        "       01  AMOUNTS.\n"
+        "           05  AMOUNT      PIC S9(3)V99.\n"
+        "           05  AMOUNT-X    REDEFINES AMOUNT PIC X(5).\n"
+        "           05  CODE-1      PIC XX VALUE 'AB'.\n"
+    )
+    layout = compile_layout(record)
+    assert layout.size == 7
+    assert layout.field("CODE-1").start == 5
+    encoded = layout.encode((Decimal("-12.34"), None, "AB"))
+    assert encoded == b"0123t" + b"AB"
+    assert layout.decode(encoded) == (Decimal("-12.34"), "0123t", "AB")
@@ -0,0 +1,65 @@
+"""
+Unit tests for the streaming MERGE.
+
+Tests key order, USING-order ties, order checking and multi-pass merges.
+"""
+import random
+from pathlib import Path
+
+import pytest
+
+from cobol_runtime.merge import MergeOrderError, merge_files, merge_procedure, read_line_records
+from cobol_runtime.person import PERSON_LAYOUT
+
+
+SAMPLE_DIR = Path(__file__).parent.parent.parent / "SampleData"
+
+
+def test_merge_sample_files(tmp_path):
+    """Test merging the two sample files on PERSON-ID keeps USING order for ties."""
+    output = tmp_path / "merged.txt"
+    inputs = [SAMPLE_DIR / "persons.txt", SAMPLE_DIR / "persons2.txt"]
+    count = merge_files(inputs, output, PERSON_LAYOUT, ["PERSON-ID"])
+    first = (SAMPLE_DIR / "persons.txt").read_bytes().splitlines()
+    second = (SAMPLE_DIR / "persons2.txt").read_bytes().splitlines()
+    lines = output.read_bytes().splitlines()
+    assert count == len(lines) == len(first) + len(second)
+    assert [line[:3] for line in lines] == sorted(line[:3] for line in lines)
+    assert lines[0] == first[0].rstrip() and lines[1] == second[0].rstrip()
+
+
+def test_merge_rejects_unsorted_input(tmp_path):
+    """Test an input out of key order raises MergeOrderError."""
+    unsorted = tmp_path / "unsorted.txt"
+    unsorted.write_bytes(b"002 B\n001 A\n")
+    with pytest.raises(MergeOrderError):
+        merge_files([unsorted], tmp_path / "out.txt", PERSON_LAYOUT, ["PERSON-ID"])
+
+
+def test_merge_many_inputs_in_passes(tmp_path):
+    """Test more inputs than max_open merge correctly through passes."""
+    random.seed(9)
+    inputs = []
+    expected = []
+    for number in range(30):
+        ids = sorted(random.sample(range(1000), 15))
+        path = tmp_path / f"in{number:02d}.txt"
+        path.write_bytes(b"".join(b"%03d name%02d\r\n" % (i, number) for i in ids))
+        inputs.append(path)
+        expected.extend((i, number) for i in ids)
+    expected.sort()
+    
+    def collect(records):
+        return [(int(r[:3]), int(r[8:10])) for r in records]
+    
+    result = merge_procedure(inputs, PERSON_LAYOUT, ["PERSON-ID"], collect, max_open=4,
+                             buffer_size=64, work_dir=tmp_path)
+    assert result == expected
+    assert not list(tmp_path.glob("merge-*"))
+
+
+def test_read_line_records_across_buffers(tmp_path):
+    """Test lines split across read buffers are rejoined and padded."""
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"abc\ndefgh\nij")
+    assert list(read_line_records(path, 4, buffer_size=3)) == [b"abc ", b"defg", b"ij  "]
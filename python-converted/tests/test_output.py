@@ -0,0 +1,59 @@
+"""
+Unit tests for the buffered record writer.
+
+Tests block buffering and raw pass-through.
+"""
+import io
+
+import pytest
+
+from cobol_runtime.output import RecordWriter
+
+
+class CountingStream(io.BytesIO):
+    """BytesIO that counts write calls."""
+    
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+    
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+def test_writer_batches_records():
+    """Test that records are written in blocks, not one call each."""
+    stream = CountingStream()
+    with RecordWriter(stream, buffer_size=100) as out:
+        for i in range(50):
+            out.write(b"%03d" % i)
+    assert stream.getvalue() == b"".join(b"%03d\n" % i for i in range(50))
+    assert stream.writes == 2
+    assert out.records_written == 50
+
+
+def test_writer_text_and_many():
+    """Test text encoding and bulk writes."""
+    stream = io.BytesIO()
+    with RecordWriter(stream) as out:
+        out.write_text("Wałęsa")
+        out.write_many([b"a", b"b"])
+    assert stream.getvalue() == "Wałęsa\na\nb\n".encode("utf-8")
+    assert out.records_written == 3
+
+
+def test_writer_raw_passthrough():
+    """Test that large raw blocks bypass the buffer."""
+    stream = CountingStream()
+    with RecordWriter(stream, buffer_size=8) as out:
+        out.write(b"x")
+        out.write_raw(b"0123456789\n", records=1)
+    assert stream.getvalue() == b"x\n0123456789\n"
+    assert stream.writes == 2
+
+
+def test_writer_rejects_bad_buffer_size():
+    """Test that a non-positive buffer size is rejected."""
+    with pytest.raises(ValueError):
+        RecordWriter(io.BytesIO(), buffer_size=0)
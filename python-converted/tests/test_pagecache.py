@@ -0,0 +1,84 @@
+"""
+Unit tests for the shared page cache.
+
+Tests eviction policies, dirty write-back and the indexed file read path.
+"""
+import random
+
+import pytest
+
+from cobol_runtime.indexed import IndexedFile
+from cobol_runtime.pagecache import PageCache
+
+
+class Owner:
+    """Minimal page owner recording write-backs."""
+    
+    def __init__(self):
+        self.written = {}
+    
+    def _write_back(self, page, value):
+        self.written[page] = value
+
+
+def test_lru_evicts_least_recently_used():
+    """Test LRU keeps recently touched pages."""
+    cache = PageCache(budget=3, policy="lru")
+    owner = Owner()
+    for page in range(3):
+        cache.put(owner, page, page, 1)
+    assert cache.get(owner, 0) == 0
+    cache.put(owner, 3, 3, 1)
+    assert (owner, 1) not in cache
+    assert (owner, 0) in cache
+    assert cache.hits == 1 and cache.evictions == 1
+
+
+def test_clock_gives_second_chance():
+    """Test CLOCK skips referenced pages once."""
+    cache = PageCache(budget=3, policy="clock")
+    owner = Owner()
+    for page in range(3):
+        cache.put(owner, page, page, 1)
+    cache.get(owner, 0)
+    cache.put(owner, 3, 3, 1)
+    assert (owner, 0) in cache
+    assert (owner, 1) not in cache
+
+
+def test_dirty_pages_written_back():
+    """Test dirty pages are written on eviction and flush."""
+    cache = PageCache(budget=2)
+    owner = Owner()
+    cache.put(owner, 1, "one", 1, dirty=True)
+    cache.put(owner, 2, "two", 1)
+    cache.put(owner, 3, "three", 1, dirty=True)
+    assert owner.written == {1: "one"}
+    assert cache.flush(owner) == 1
+    assert owner.written == {1: "one", 3: "three"}
+    assert cache.flush(owner) == 0
+    with pytest.raises(ValueError):
+        PageCache(policy="fifo")
+
+
+@pytest.mark.parametrize("policy", ["lru", "clock"])
+def test_indexed_file_with_small_cache(tmp_path, policy):
+    """Test the B+tree stays correct when pages are constantly evicted."""
+    random.seed(3)
+    keys = random.sample(range(10 ** 6), 5000)
+    cache = PageCache(budget=8 * 512, policy=policy)
+    path = tmp_path / "small.dat"
+    with IndexedFile(path, "output", record_length=16, key_length=6,
+                     page_size=512, cache=cache) as f:
+        for key in keys:
+            f.write(b"%06d" % key + b"x" * 10)
+    assert cache.writebacks > 0 and len(cache) == 0
+    
+    with IndexedFile(path, "input", cache=cache) as f:
+        records = list(f)
+        f.start(0)
+        while f.read_next() is not None:
+            pass
+    assert [r[:6] for r in records] == [b"%06d" % k for k in sorted(keys)]
+    assert cache.prefetched > 0
+    assert cache.hits > 0
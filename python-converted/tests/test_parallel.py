@@ -0,0 +1,88 @@
+"""
+Unit tests for parallel chunked file processing.
+
+Tests record-aligned splitting, the bounded window of ranges in flight
+and multi-process filter/count.
+"""
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from cobol_runtime.parallel import IN_FLIGHT_PER_WORKER, map_ranges, parallel_count, parallel_filter, split_ranges
+from cobol_runtime.person import PERSON_LAYOUT, Person
+from cobol_runtime.pipeline import read_records
+
+
+SAMPLE_FILE = Path(__file__).parent.parent.parent / "SampleData" / "persons.txt"
+FILE_READ_PATH = Path(__file__).parent.parent / "file" / "01_read.py"
+
+
+def id_above_ten(person):
+    """Picklable predicate for worker processes."""
+    return person.person_id > 10
+
+
+def test_split_ranges_are_record_aligned():
+    """Test that every range starts right after a newline."""
+    data = SAMPLE_FILE.read_bytes()
+    ranges = split_ranges(SAMPLE_FILE, 5, PERSON_LAYOUT.size)
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    for (_, stop), (start, _) in zip(ranges, ranges[1:]):
+        assert stop == start
+        assert data[start - 1:start] == b"\n"
+
+
+def test_split_ranges_record_sequential():
+    """Test that fixed-length cuts fall on record multiples."""
+    ranges = split_ranges(SAMPLE_FILE, 4, 10, line_sequential=False)
+    assert all(start % 10 == 0 for start, _ in ranges)
+
+
+def test_map_ranges_bounds_ranges_in_flight():
+    """Test that ranges are submitted as results are consumed, not all at once."""
+    started = []
+
+    def first_byte(path, start, stop):
+        started.append(start)
+        return start
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        results = map_ranges(first_byte, SAMPLE_FILE, PERSON_LAYOUT.size, workers=1,
+                             chunks_per_worker=8, executor=executor)
+        assert next(results) == 0
+        assert len(started) <= IN_FLIGHT_PER_WORKER + 1
+        rest = list(results)
+    assert [0] + rest == sorted(started) and len(started) == 8
+
+
+def test_parallel_filter_matches_sequential():
+    """Test that ordered parallel results equal a sequential scan."""
+    expected = [p for p in read_records(SAMPLE_FILE, PERSON_LAYOUT, Person.from_record) if id_above_ten(p)]
+    result = list(parallel_filter(SAMPLE_FILE, "PersonRecord", id_above_ten,
+                                  convert=Person.from_record, workers=2))
+    assert result == expected
+    unordered = parallel_filter(SAMPLE_FILE, "PersonRecord", id_above_ten,
+                                convert=Person.from_record, workers=2, ordered=False)
+    assert sorted(p.person_id for p in unordered) == [p.person_id for p in expected]
+
+
+def test_parallel_count():
+    """Test counting records across workers."""
+    assert parallel_count(SAMPLE_FILE, "PersonRecord", workers=2) == 19
+
+
+def test_read_file_parallel_output_unchanged():
+    """Test that --workers keeps the sequential output."""
+    sequential = subprocess.run(
+        [sys.executable, str(FILE_READ_PATH), str(SAMPLE_FILE)],
+        capture_output=True,
+        text=True
+    )
+    parallel = subprocess.run(
+        [sys.executable, str(FILE_READ_PATH), "--workers", "3", str(SAMPLE_FILE)],
+        capture_output=True,
+        text=True
+    )
+    assert parallel.returncode == 0
+    assert parallel.stdout == sequential.stdout
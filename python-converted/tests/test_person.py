@@ -0,0 +1,54 @@
+"""
+Unit tests for the compact person record types.
+
+Tests the __slots__ Person and the column-backed PersonTable.
+"""
+from pathlib import Path
+
+import pytest
+
+from cobol_runtime.person import Person, PersonTable
+
+
+SAMPLE_FILE = Path(__file__).parent.parent.parent / "SampleData" / "persons.txt"
+
+
+def test_person_has_no_dict():
+    """Test that Person instances carry no per-instance __dict__."""
+    person = Person(1, "John", "Smith")
+    assert not hasattr(person, "__dict__")
+    with pytest.raises(AttributeError):
+        person.nickname = "Johnny"
+
+
+def test_person_record_roundtrip():
+    """Test encoding a person and parsing it back."""
+    person = Person(42, "Jane", "Doe")
+    assert Person.from_record(person.to_record()) == person
+    assert Person.from_line("abc") is None
+
+
+def test_person_table_views():
+    """Test that rows are stored packed and decoded on access."""
+    table = PersonTable([Person(1, "John", "Smith"), Person(2, "Łucja", "Wałęsa")])
+    assert len(table) == 2
+    assert table.nbytes == 2 * (2 + 16 + 25)
+    assert table[1] == Person(2, "Łucja", "Wałęsa")
+    assert table[-1].surname == "Wałęsa"
+    assert table.person_id(0) == 1
+
+
+def test_person_table_cut_character():
+    """Test that a multi-byte character cut at the field size is dropped."""
+    table = PersonTable()
+    table.append(Person(1, "a" + "Ł" * 8, "Doe"))
+    assert table[0].name == "a" + "Ł" * 7
+    assert len(table[0].name.encode("utf-8")) == PersonTable.NAME_SIZE - 1
+
+
+def test_person_table_from_file():
+    """Test loading the sample file straight into the column buffers."""
+    table = PersonTable.from_file(SAMPLE_FILE)
+    assert len(table) == 19
+    assert table[2] == Person(3, "Stanisław", "Wojciechowski")
+    assert [p.person_id for p in table][-1] == 20
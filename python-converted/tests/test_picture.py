@@ -0,0 +1,84 @@
+"""
+Unit tests for the PICTURE editing compiler.
+
+Tests zero suppression, insertion, fixed and floating signs and
+currency, check protection and MOVE truncation.
+"""
+from decimal import Decimal
+
+import pytest
+
+from cobol_runtime.layout import load_layout
+from cobol_runtime.picture import compile_mask, compile_picture, edit_value
+
+
+def test_sample_data_row_pictures():
+    """Test the pictures of struct-row in SampleDataRow.cpy."""
+    assert edit_value(1, "9(2)") == "01"
+    assert edit_value(3721, "z(10)") == "      3721"
+    assert edit_value(Decimal("-317.21"), "+z(7).zz") == "-    317.21"
+    assert edit_value(Decimal("317.21"), "+z(7).zz") == "+    317.21"
+    assert edit_value(Decimal("317.21"), "$z(7).zz") == "$    317.21"
+
+
+def test_zero_suppression_and_insertion():
+    """Test Z, comma, B, 0 and / editing."""
+    assert edit_value(0, "zzz.zz") == "      "
+    assert edit_value(0, "zzz.99") == "   .00"
+    assert edit_value(12345, "z,zz9") == "2,345"
+    assert edit_value(45, "z,zz9") == "   45"
+    assert edit_value(123199, "99/99/99") == "12/31/99"
+    assert edit_value(123456, "999B999") == "123 456"
+    assert edit_value(12, "9990") == "0120"
+
+
+def test_floating_insertion():
+    """Test floating currency and sign strings."""
+    assert edit_value(5, "$$,$$9.99") == "    $5.00"
+    assert edit_value(12, "$$,$$9.99") == "   $12.00"
+    assert edit_value(Decimal("1234.56"), "$$,$$9.99") == "$1,234.56"
+    assert edit_value(-1234, "--,--9") == "-1,234"
+    assert edit_value(-5, "---9") == "  -5"
+    assert edit_value(5, "+++9") == "  +5"
+    assert edit_value(-3, "+$$$9.99") == "-  $3.00"
+
+
+def test_credit_debit_and_check_protection():
+    """Test CR/DB and asterisk fill."""
+    assert edit_value(Decimal("-1.5"), "zz9.99CR") == "  1.50CR"
+    assert edit_value(Decimal("1.5"), "zz9.99CR") == "  1.50  "
+    assert edit_value(Decimal("-1.5"), "zz9.99DB") == "  1.50DB"
+    assert edit_value(Decimal("12.5"), "***,***.99") == "*****12.50"
+    assert edit_value(0, "***.**") == "***.**"
+
+
+def test_move_truncation():
+    """Test truncation on both sides of the decimal point and unsigned pictures."""
+    assert edit_value(Decimal("12345.678"), "zz9.99") == "345.67"
+    assert edit_value(-42, "zz9") == " 42"
+    assert edit_value(Decimal("-0.001"), "-zz9") == "   0"
+    assert edit_value(317.21, "zzz.99") == "317.21"
+    assert edit_value("-2.5", "-9.9") == "-2.5"
+
+
+def test_compiled_once():
+    """Test that formatters are cached and sized like the picture."""
+    assert compile_picture("+z(7).zz") is compile_picture("+z(7).zz")
+    mask = compile_mask("$$,$$9.99CR")
+    assert (mask.size, mask.digits, mask.scale, mask.sign) == (11, 6, 2, "CR")
+    assert compile_mask("zz9.99", blank_when_zero=True).zero == "      "
+
+
+def test_unsupported_pictures():
+    """Test that alphanumeric pictures are rejected."""
+    with pytest.raises(ValueError):
+        compile_picture("X(5)")
+    with pytest.raises(ValueError):
+        compile_picture("++$$9")
+
+
+def test_layout_encodes_edited_fields():
+    """Test that record layouts edit numeric-edited fields with their picture."""
+    layout = load_layout("SampleDataRow")
+    record = layout.encode(layout.initial_values())
+    assert record == b"00|          |-    317.21|$    317.21"
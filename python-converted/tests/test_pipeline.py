@@ -0,0 +1,61 @@
+"""
+Unit tests for streaming record pipelines.
+
+Tests lazy stage chaining and terminal operations.
+"""
+from pathlib import Path
+
+from cobol_runtime.person import PERSON_LAYOUT, Person
+from cobol_runtime.pipeline import Pipeline
+
+
+SAMPLE_FILE = Path(__file__).parent.parent.parent / "SampleData" / "persons.txt"
+
+
+def test_pipeline_read_filter_count():
+    """Test reading, filtering and counting records."""
+    pipeline = Pipeline.read(SAMPLE_FILE, PERSON_LAYOUT, Person.from_record)
+    assert pipeline.count() == 19
+    assert pipeline.filter(lambda p: p.person_id > 10).count() == 10
+
+
+def test_pipeline_is_lazy():
+    """Test that stages pull records on demand."""
+    pulled = []
+    
+    def source():
+        for i in range(1000):
+            pulled.append(i)
+            yield i
+    
+    first = next(iter(Pipeline(source()).map(lambda x: x * 2).filter(lambda x: x > 4)))
+    assert first == 6
+    assert pulled == [0, 1, 2, 3]
+
+
+def test_pipeline_sort_and_batches():
+    """Test sorting and batching stages."""
+    pipeline = Pipeline([5, 3, 9, 1, 7]).sort().batch(2)
+    assert pipeline.collect() == [[1, 3], [5, 7], [9]]
+    assert pipeline.flatten().collect() == [1, 3, 5, 7, 9]
+
+
+def test_pipeline_rewrite_job(tmp_path):
+    """Test a read -> rewrite -> write job like 03_rewrite.cbl."""
+    output = tmp_path / "anon.dat"
+    written = (
+        Pipeline.read(SAMPLE_FILE, PERSON_LAYOUT, Person.from_record)
+        .map(lambda p: Person(p.person_id, p.name, "RODO anon."))
+        .write(output, Person.to_record)
+    )
+    assert written == 19
+    lines = output.read_bytes().splitlines()
+    assert len(lines) == 19
+    assert Person.from_record(lines[0]) == Person(1, "Gabriel", "RODO anon.")
+
+
+def test_pipeline_for_each():
+    """Test the for_each terminal, e.g. REWRITE of every record."""
+    seen = []
+    assert Pipeline([3, 1, 2]).map(str).for_each(seen.append) == 3
+    assert seen == ["3", "1", "2"]
@@ -0,0 +1,154 @@
+"""
+Unit tests for the paragraph dispatch table.
+
+Tests fall-through, PERFORM THRU ranges, GO TO (DEPENDING ON) and
+deep transfer chains.
+"""
+import pytest
+
+from cobol_runtime.procedure import STOP_RUN, Procedure, go_to, perform
+
+
+def _procedure(bodies):
+    procedure = Procedure("TEST")
+    for name, body in bodies:
+        procedure.paragraph(name)(body)
+    return procedure
+
+
+def test_fall_through_and_perform_thru():
+    """Test PERFORM THRU n TIMES, then falling through every paragraph."""
+    log = []
+
+    def main():
+        yield perform("b", thru="c", times=2)
+        log.append("main")
+
+    procedure = _procedure([("MAIN", main)] + [
+        (name, lambda name=name: log.append(name)) for name in ("A", "B", "C", "D")
+    ])
+    procedure.run()
+    assert log == ["B", "C", "B", "C", "main", "A", "B", "C", "D"]
+    assert procedure.compile()[2] == {"MAIN": 0, "A": 1, "B": 2, "C": 3, "D": 4}
+
+
+def test_perform_until_and_nesting():
+    """Test PERFORM UNTIL (test before), zero or negative TIMES and nested ranges ending together."""
+    log = []
+    count = [0]
+
+    def main():
+        yield perform("inner", until=lambda: count[0] >= 3)
+        yield perform("inner", times=0)
+        yield perform("inner", times=-1)
+        yield perform("inner", times=-2, until=lambda: False)
+        yield perform("outer", thru="inner")
+        yield STOP_RUN
+        log.append("unreachable")
+
+    def outer():
+        log.append("outer")
+        yield perform("inner")
+        log.append("outer again")
+
+    def inner():
+        count[0] += 1
+        log.append(count[0])
+
+    _procedure([("MAIN", main), ("OUTER", outer), ("INNER", inner)]).run()
+    assert log == [1, 2, 3, "outer", 4, "outer again", 5]
+
+
+def test_go_to_depending_on():
+    """Test GO TO, and DEPENDING ON values in and out of range."""
+    for switch, expected in ((1, ["X", "Y", "Z"]), (3, ["Z"]), (0, ["next", "X", "Y", "Z"])):
+        log = []
+
+        def main():
+            yield go_to("choose")
+            log.append("skipped")
+
+        def choose():
+            yield go_to("x", "y", "z", depending_on=switch)
+            log.append("next")
+
+        bodies = [("MAIN", main), ("SKIP", lambda: log.append("skip")), ("CHOOSE", choose)]
+        bodies += [(name, lambda name=name: log.append(name)) for name in ("X", "Y", "Z")]
+        _procedure(bodies).run()
+        assert log == expected
+
+
+def test_returned_transfers():
+    """Test transfers returned as a paragraph's last statement."""
+    for switch, expected in ((2, ["Y", "Z"]), (9, ["X", "Y", "Z"])):
+        log = []
+        bodies = [("MAIN", lambda: go_to("x", "y", "z", depending_on=switch))]
+        bodies += [(name, lambda name=name: log.append(name)) for name in ("X", "Y", "Z")]
+        _procedure(bodies).run()
+        assert log == expected
+
+    log = []
+
+    def main():
+        yield perform("a", thru="b")
+        log.append("main")
+        yield STOP_RUN
+
+    bodies = [("MAIN", main), ("A", lambda: perform("c", times=2)), ("B", lambda: log.append("B")),
+              ("C", lambda: log.append("C")), ("D", lambda: perform("c", times=0))]
+    _procedure(bodies).run()
+    assert log == ["C", "C", "B", "main"]
+    log.clear()
+    _procedure(bodies[1:]).run()
+    assert log == ["C", "C", "B", "C"]
+
+
+def test_deep_transfers_do_not_recurse():
+    """Test GO TO loops and PERFORM chains far deeper than the recursion limit."""
+    state = {"n": 0}
+
+    def loop(state):
+        state["n"] += 1
+        if state["n"] < 50000:
+            return go_to("loop")
+
+    procedure = Procedure("LOOP")
+    procedure.paragraph("LOOP")(loop)
+    procedure.run(state)
+    assert state["n"] == 50000
+
+    depth = {"n": 0, "max": 0}
+
+    def dive(depth):
+        depth["n"] += 1
+        depth["max"] = max(depth["max"], depth["n"])
+        if depth["n"] < 20000:
+            yield perform("dive")
+        depth["n"] -= 1
+        yield STOP_RUN if depth["n"] == 0 else None
+
+    procedure = Procedure("DIVE")
+    procedure.paragraph()(dive)
+    procedure.run(depth)
+    assert depth == {"n": 0, "max": 20000}
+
+
+def test_errors():
+    """Test unknown targets, bad yields and duplicate names."""
+    procedure = Procedure("BAD")
+
+    @procedure.paragraph()
+    def main():
+        yield go_to("nowhere")
+
+    with pytest.raises(ValueError, match="no paragraph named NOWHERE"):
+        procedure.run()
+    with pytest.raises(ValueError, match="duplicate"):
+        procedure.paragraph("MAIN")(lambda: None)
+    with pytest.raises(ValueError, match="GO TO"):
+        go_to("a", "b")
+
+    procedure = Procedure("BAD")
+    procedure.paragraph("P")(lambda: (yield 42))
+    with pytest.raises(ValueError, match="gave 42"):
+        procedure.run()
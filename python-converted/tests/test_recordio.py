@@ -0,0 +1,58 @@
+"""
+Unit tests for the memory-mapped record reader.
+
+Tests record boundary detection and lazy field access.
+"""
+from cobol_runtime.recordio import MappedRecordFile
+
+
+PERSON_FIELDS = (("person_id", 0, 3), ("name", 3, 19), ("surname", 19, 44))
+
+
+def test_mapped_reader_fields(tmp_path):
+    """Test that fields are sliced at byte offsets and decoded lazily."""
+    data = tmp_path / "persons.txt"
+    data.write_bytes(
+        "001 John            Smith\n"
+        "003 Stanisław      Wojciechowski\n".encode("utf-8")
+    )
+    with MappedRecordFile(data, PERSON_FIELDS) as records:
+        rows = [(r.number("person_id"), r.text("name"), r.text("surname")) for r in records]
+    
+    assert rows == [(1, "John", "Smith"), (3, "Stanisław", "Wojciechowski")]
+
+
+def test_mapped_reader_zero_copy(tmp_path):
+    """Test that fields are memoryview slices, not copies."""
+    data = tmp_path / "persons.txt"
+    data.write_bytes(b"001 John            Smith\n")
+    with MappedRecordFile(data, PERSON_FIELDS) as records:
+        record = next(iter(records))
+        field = record.field("name")
+        assert isinstance(field, memoryview)
+        assert bytes(field) == b" John           "
+
+
+def test_mapped_reader_crlf_and_missing_newline(tmp_path):
+    """Test CRLF terminators and a final record without newline."""
+    data = tmp_path / "persons.txt"
+    data.write_bytes(b"001 John            Smith\r\n002 Jane            Doe")
+    with MappedRecordFile(data, PERSON_FIELDS) as records:
+        assert [r.text("surname") for r in records] == ["Smith", "Doe"]
+
+
+def test_mapped_reader_record_sequential(tmp_path):
+    """Test fixed-length records with no separators."""
+    data = tmp_path / "persons.dat"
+    data.write_bytes(b"001" + b"A".ljust(16) + b"B".ljust(25) + b"002" + b"C".ljust(16) + b"D".ljust(25))
+    with MappedRecordFile(data, PERSON_FIELDS, 44, line_sequential=False) as records:
+        assert list(records.spans()) == [(0, 44), (44, 88)]
+        assert [r.text("name") for r in records] == ["A", "C"]
+
+
+def test_mapped_reader_empty_file(tmp_path):
+    """Test that an empty file yields no records."""
+    data = tmp_path / "empty.txt"
+    data.write_bytes(b"")
+    with MappedRecordFile(data, PERSON_FIELDS) as records:
+        assert list(records) == []
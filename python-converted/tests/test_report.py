@@ -0,0 +1,73 @@
+"""
+Unit tests for batch PICTURE editing.
+
+Tests that column editing matches single-value editing and that report
+rows are built in the record layout.
+"""
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from cobol_runtime.copybook import parse_copybook
+from cobol_runtime.layout import compile_layout, load_layout
+from cobol_runtime.picture import edit_value
+from cobol_runtime.report import edit_column, edit_lines, edit_matrix, edit_rows, scaled_column
+
+PICTURES = ["+z(7).zz", "$z(7).zz", "z(10)", "9(2)", "$$,$$9.99", "zzz.99", "***,***.99",
+            "--,--9", "+++9", "zz9.99CR", "99/99/99", "z,zz9", "-zz9"]
+VALUES = ["0", "1", "-1", "12", "-317.21", "317.21", "1234.56", "-0.004", "99999999.99", "0.07"]
+
+
+@pytest.mark.parametrize("picture", PICTURES)
+def test_batch_matches_single_value(picture):
+    """Test Decimal, float and list inputs against compile_picture."""
+    decimals = [Decimal(v) for v in VALUES]
+    expected = [edit_value(v, picture).encode() for v in decimals]
+    assert list(edit_column(decimals, picture)) == expected
+    assert list(edit_column(np.array([float(v) for v in VALUES]), picture)) == expected
+    assert list(edit_column(VALUES, picture)) == expected
+
+
+def test_scaled_column_truncates():
+    """Test scaling of int, float and Decimal columns."""
+    assert scaled_column(np.array([3, -4]), 2).tolist() == [300, -400]
+    assert scaled_column(np.array([317.21, -1.999, 0.07]), 2).tolist() == [31721, -199, 7]
+    assert scaled_column([Decimal("1.239")], 2).tolist() == [123]
+
+
+def test_edit_lines_and_matrix():
+    """Test the joined buffer and matrix shapes."""
+    assert edit_lines([5, 0, -12], "--9") == b"  5\n  0\n-12\n"
+    assert edit_matrix(range(4), "z9").shape == (4, 2)
+    # Multi-byte currency falls back to single-value editing
+    assert edit_column(["1.5"], "$$9.99", currency="EUR").tolist() == [b" EUR1.50"]
+
+
+def test_edit_rows_struct_row():
+    """Test report lines in the SampleDataRow layout."""
+    layout = load_layout("SampleDataRow")
+    block = edit_rows(layout, {
+        "var-lp": np.arange(1, 3),
+        "var-number": [3721, 0],
+        "var-decimal": [Decimal("-317.21"), 5],
+        "var-currency": np.array([317.21, 0.0]),
+    })
+    assert block == (b"01|      3721|-    317.21|$    317.21\n"
+                     b"02|          |+      5.00|           \n")
+
+
+def test_edit_rows_display_fields():
+    """Test signed DISPLAY numbers and PIC X columns match layout.encode."""
+    (record,) = parse_copybook(
+        "       01  LINE-OUT.\n"
+        "           05  AMOUNT      PIC S9(3)V99.\n"
+        "           05  FILLER      PIC X VALUE '/'.\n"
+        "           05  LABEL       PIC X(4).\n"
+    )
+    layout = compile_layout(record)
+    block = edit_rows(layout, {"AMOUNT": [Decimal("-12.34"), 7], "LABEL": ["ab", "toolong"]},
+                      newline=b"")
+    assert block == layout.encode((Decimal("-12.34"), "ab")) + layout.encode((7, "toolong"))
+    with pytest.raises(ValueError):
+        edit_rows(layout, {"AMOUNT": [1], "LABEL": []})
@@ -0,0 +1,168 @@
+"""
+Unit tests for the external merge sort.
+
+Tests in-memory sorts, spilled runs, multi-pass merges, sort keys on
+DISPLAY and binary fields, and INPUT/OUTPUT PROCEDURE hooks.
+"""
+import random
+from decimal import Decimal
+
+import pytest
+
+from cobol_runtime.copybook import parse_copybook
+from cobol_runtime.layout import compile_layout
+from cobol_runtime.merge import merge_files
+from cobol_runtime.person import PERSON_LAYOUT
+from cobol_runtime.pipeline import Pipeline
+from cobol_runtime.sort import (
+    ExternalSorter,
+    compile_sort_key,
+    external_sort_stage,
+    parallel_sort_file,
+    sort_file,
+    sort_procedure,
+    sort_records,
+)
+
+
+def test_small_sort_stays_in_memory(tmp_path):
+    """Test input within the budget is sorted without work files."""
+    with ExternalSorter(4, work_dir=tmp_path) as sorter:
+        sorter.extend([b"cccc", b"aaaa", b"bb"])
+        assert list(sorter) == [b"aaaa", b"bb  ", b"cccc"]
+        assert sorter.runs == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spilled_runs_merge_stably(tmp_path):
+    """Test spilled runs merge in key order keeping input order for ties."""
+    random.seed(11)
+    records = [b"%03d%05d" % (random.randrange(50), i) for i in range(5000)]
+    sorter = ExternalSorter(8, key=lambda r: r[:3], memory_limit=20000,
+                            work_dir=tmp_path, fan_in=4)
+    with sorter:
+        sorter.extend(records)
+        result = list(sorter)
+        assert sorter.runs > 4
+        assert sorter.merge_passes >= 1
+        with pytest.raises(RuntimeError):
+            list(sorter)
+    assert result == sorted(records, key=lambda r: r[:3])
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sort_records_generator(tmp_path):
+    """Test the generator form cleans up and sorts by the whole record."""
+    records = [b"%06d" % n for n in range(3000, 0, -1)]
+    assert list(sort_records(records, 6, memory_limit=4096, work_dir=tmp_path)) == sorted(records)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sort_file_by_surname(tmp_path):
+    """Test SORT USING/GIVING on the sample person file."""
+    sample = tmp_path / "persons.txt"
+    sample.write_bytes(b"003 Bob             Johnson\n001 John            Smith\n002 Jane            Doe\n")
+    output = tmp_path / "sorted.dat"
+    assert sort_file(sample, output, PERSON_LAYOUT, ["PERSON-SURNAME"], memory_limit=200) == 3
+    assert output.read_bytes().splitlines() == [
+        b"002 Jane            Doe",
+        b"003 Bob             Johnson",
+        b"001 John            Smith",
+    ]
+    key = compile_sort_key(PERSON_LAYOUT, ["PERSON-NAME", "PERSON-ID"])
+    assert key(b"001 John            Smith") == b" John           001"
+
+
+def test_multi_key_ascending_descending():
+    """Test compiled keys order surname ascending, then ID descending."""
+    key = compile_sort_key(PERSON_LAYOUT, ["PERSON-SURNAME", ("PERSON-ID", "DESC")])
+    records = [
+        b"001 Jan             Kowalski".ljust(44),
+        b"003 Anna            Kowalski".ljust(44),
+        b"002 Piotr           Adamski".ljust(44),
+    ]
+    assert [r[:3] for r in sorted(records, key=key)] == [b"002", b"003", b"001"]
+    with pytest.raises(ValueError):
+        compile_sort_key(PERSON_LAYOUT, [("PERSON-ID", "SIDEWAYS")])
+
+
+@pytest.mark.parametrize("usage", ["COMP", "COMP-3", "COMP-5"])
+@pytest.mark.parametrize("signed", ["S", ""])
+def test_binary_and_packed_keys(tmp_path, usage, signed):
+    """Test SORT and MERGE on COMP, COMP-3 and COMP-5 keys, signed or not."""
+    (record,) = parse_copybook(f"       01  ENTRY.\n"
+                               f"           05  AMOUNT  PIC {signed}9(4)V9 {usage}.\n"
+                               f"           05  TAG     PIC X(2).\n")
+    layout = compile_layout(record)
+    values = [Decimal(v) for v in ("12.5", "0", "3000.1", "0.1", "999.9")]
+    if signed:
+        values += [Decimal(v) for v in ("-0.1", "-2000", "-12.5")]
+    records = [layout.encode((value, "%02d" % i)) for i, value in enumerate(values)]
+    for direction in ("ASCENDING", "DESCENDING"):
+        key = compile_sort_key(layout, [("AMOUNT", direction)])
+        ordered = [layout.decode(r)[0] for r in sorted(records, key=key)]
+        assert ordered == sorted(values, reverse=direction == "DESCENDING")
+    source = tmp_path / "entries.dat"
+    source.write_bytes(b"".join(records))
+    output = tmp_path / "sorted.dat"
+    assert sort_file(source, output, layout, ["AMOUNT"], line_sequential=False) == len(values)
+    merged = tmp_path / "merged.dat"
+    merge_files([output, output], merged, layout, ["AMOUNT"], line_sequential=False)
+    data = merged.read_bytes()
+    assert [layout.decode(data[i:i + layout.size])[0] for i in range(0, len(data), layout.size)] == \
+        sorted(values + values)
+
+
+def test_parallel_sort_matches_sequential(tmp_path):
+    """Test parallel run generation gives the same file as sort_file."""
+    random.seed(5)
+    sample = tmp_path / "persons.txt"
+    sample.write_bytes(b"".join(
+        b"%03d%-16s%s\n" % (i % 1000, b"Name%d" % random.randrange(20), b"Surname%d" % random.randrange(30))
+        for i in range(3000)
+    ))
+    keys = ["PERSON-SURNAME", ("PERSON-ID", "DESCENDING")]
+    sort_file(sample, tmp_path / "sequential.dat", PERSON_LAYOUT, keys, memory_limit=20000)
+    count = parallel_sort_file(sample, tmp_path / "parallel.dat", "PersonRecord", keys,
+                               workers=2, memory_limit=20000, work_dir=tmp_path)
+    assert count == 3000
+    assert (tmp_path / "parallel.dat").read_bytes() == (tmp_path / "sequential.dat").read_bytes()
+
+
+def test_sort_procedure_filters_and_returns(tmp_path):
+    """Test INPUT/OUTPUT PROCEDURE hooks without GIVING files."""
+    def input_procedure(records):
+        for record in records:
+            if int(record[:3]) % 2:
+                yield record
+    
+    def output_procedure(returned):
+        return [record[:3] for record in returned]
+    
+    records = [b"%03d" % n for n in range(20, 0, -1)]
+    result = sort_procedure(3, None, input_procedure(records), output_procedure,
+                            memory_limit=512, work_dir=tmp_path)
+    assert result == [b"%03d" % n for n in range(1, 20, 2)]
+    
+    def release_all(release):
+        for record in (b"b", b"c", b"a"):
+            release(record)
+    
+    assert sort_procedure(1, None, release_all, list) == [b"a", b"b", b"c"]
+
+
+def test_release_and_return_record():
+    """Test the RELEASE/RETURN verbs on the sorter."""
+    with ExternalSorter(2) as sorter:
+        sorter.release(b"zz")
+        sorter.release(b"aa")
+        assert sorter.return_record() == b"aa"
+        assert sorter.return_record() == b"zz"
+        assert sorter.return_record() is None
+
+
+def test_external_sort_stage_in_pipeline(tmp_path):
+    """Test the external sort as a pipeline stage."""
+    records = [b"%04d" % n for n in (5, 3, 9, 1)]
+    stage = external_sort_stage(4, memory_limit=256, work_dir=tmp_path)
+    assert Pipeline(records).then(stage).collect() == sorted(records)
@@ -0,0 +1,53 @@
+"""
+Unit tests for sorting programs.
+
+Tests the SORT USING/GIVING program.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+
+SORT_PATH = Path(__file__).parent.parent / "sorting" / "01_sort.py"
+SAMPLE_FILE = Path(__file__).parent.parent.parent / "SampleData" / "persons.txt"
+
+
+def test_sort_by_surname(tmp_path):
+    """Test records are displayed in surname order after 'Finished!'."""
+    output = tmp_path / "sortedOutput.dat"
+    result = subprocess.run(
+        [sys.executable, str(SORT_PATH), str(SAMPLE_FILE), str(output), "--memory", "500",
+         "--work-dir", str(tmp_path)],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    lines = result.stdout.splitlines()
+    assert lines[0] == "Finished!"
+    assert len(lines) == 20
+    surnames = [line.encode()[19:44] for line in lines[1:]]
+    assert surnames == sorted(surnames)
+    assert lines[1].startswith("014")
+
+
+def test_sort_missing_input(tmp_path):
+    """Test a missing input file is reported."""
+    result = subprocess.run(
+        [sys.executable, str(SORT_PATH), str(tmp_path / "missing.txt"), str(tmp_path / "out.dat")],
+        capture_output=True,
+        text=True
+    )
+    assert "not found" in result.stdout
+
+
+def test_sort_without_giving_file(tmp_path):
+    """Test --no-giving displays the sorted records without an output file."""
+    output = tmp_path / "sortedOutput.dat"
+    result = subprocess.run(
+        [sys.executable, str(SORT_PATH), str(SAMPLE_FILE), str(output), "--no-giving"],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    assert len(result.stdout.splitlines()) == 20
+    assert not output.exists()
@@ -0,0 +1,103 @@
+"""
+Unit tests for WORKING-STORAGE fields.
+
+Tests VALUE initialisation, MOVE semantics in place, and group,
+REDEFINES and RENAMES items as views of one buffer.
+"""
+from decimal import Decimal
+
+import pytest
+
+from cobol_runtime.copybook import parse_copybook
+from cobol_runtime.fixed import Fixed
+from cobol_runtime.storage import WorkingStorage
+
+DATA = """
+       01 var-record.
+           02 var-name   PIC X(6) VALUE 'HELLO!'.
+           02 filler     PIC X VALUE SPACE.
+           02 var-num    PIC 9(4).
+           02 var-amount PIC S9(3)V99 VALUE -1.5.
+           02 var-edited PIC z(3)9.99 VALUE ZERO.
+           02 var-packed PIC S9(5) COMP-3 VALUE 7.
+           02 var-stars  PIC X(3) VALUE ALL '*'.
+       66 var-head RENAMES var-name THRU var-num.
+       66 var-alias RENAMES var-num.
+       01 var-raw REDEFINES var-record PIC X(8).
+       77 var-count PIC 99 VALUE 1.
+"""
+
+
+def test_values_and_layout():
+    """Test VALUE clauses, default initialisation and one buffer per record."""
+    storage = WorkingStorage.parse(DATA)
+    assert set(storage.records) == {"VAR-RECORD", "VAR-RAW", "VAR-COUNT"}
+    assert storage.records["VAR-RAW"] is storage.records["VAR-RECORD"]
+    assert bytes(storage.records["VAR-RECORD"][:18]) == b"HELLO! 00000015p  "
+    assert str(storage.var_edited) == "   0.00" and storage.var_stars.value == "***"
+    assert (storage.var_num.value, storage.var_amount.value) == (0, Decimal("-1.50"))
+    assert storage["VAR-PACKED"].value == 7 and storage.var_count.value == 1
+    assert "var-head" in storage and "filler" not in storage
+    with pytest.raises(AttributeError):
+        storage.var_missing
+
+
+def test_move_in_place():
+    """Test alphanumeric and numeric MOVE rules, writing into the record."""
+    storage = WorkingStorage.parse(DATA)
+    record = storage.records["VAR-RECORD"]
+    storage.var_name.move("Jo")
+    assert record[:7] == b"Jo     "
+    storage.var_name.move("Johnathan")
+    assert record[:7] == b"Johnat "
+    storage.var_num.move("12345")
+    storage.var_amount.move(Fixed(-123456, 3))
+    storage.var_edited.move(Decimal("42.5"))
+    assert (storage.var_num.value, storage.var_amount.value) == (2345, Decimal("-123.45"))
+    assert str(storage.var_edited) == "  42.50"
+    storage.var_num.value = -7
+    assert storage.var_num.value == 7
+    storage.var_name.move(storage.var_num)
+    assert storage.var_name.value == "0007  "
+    storage.var_count.move(storage.var_num)
+    assert storage.var_count.value == 7
+    with pytest.raises(ValueError, match="MOVE"):
+        storage.var_num.move("12a")
+
+
+def test_overlapping_views():
+    """Test that groups, REDEFINES and RENAMES see the same bytes."""
+    storage = WorkingStorage.parse(DATA)
+    storage.var_raw.move("ABCDEFGHIJ")
+    assert storage.var_name.value == "ABCDEF" and bytes(storage.var_num) == b"H000"
+    assert str(storage.var_head) == "ABCDEFGH000" and len(storage.var_head) == 11
+    assert bytes(storage.var_alias) == b"H000" and storage.var_alias.picture.text == "9(4)"
+    storage.var_head.move("x")
+    assert str(storage.var_record).startswith("x" + " " * 10)
+    storage.var_alias.move(99)
+    assert storage.var_num.value == 99
+
+
+def test_rebind():
+    """Test that rebinding a record moves every view over it, REDEFINES included."""
+    storage = WorkingStorage.parse(DATA)
+    alias, raw = storage.var_alias, storage.var_raw
+    buffer = bytearray(b"NEWREC 0042" + b" " * 20)
+    storage.rebind("var-record", buffer)
+    assert storage.var_name.value == "NEWREC" and alias.value == 42
+    assert bytes(raw) == b"NEWREC 0" and storage.records["VAR-RAW"] is buffer
+    storage.var_num.move(7)
+    assert buffer[:11] == b"NEWREC 0007"
+    with pytest.raises(ValueError):
+        storage.rebind("var-record", bytearray(4))
+
+
+def test_parse_renames():
+    """Test level-66 parsing and errors."""
+    (record,) = parse_copybook(DATA.split("       01 var-raw")[0])
+    assert [(r.name, r.offset, r.size) for r in record.renamings] == [("var-head", 0, 11), ("var-alias", 7, 4)]
+    for entry in ("66 var-bad RENAMES var-num THRU var-name.", "66 var-bad RENAMES var-nope.",
+                  "66 var-bad RENAMES."):
+        with pytest.raises(ValueError):
+            parse_copybook("       01 var-record.\n           02 var-name PIC X.\n"
+                           "           02 var-num PIC 9.\n       " + entry)
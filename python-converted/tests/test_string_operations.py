@@ -1,17 +1,46 @@
 """
 Unit tests for string manipulation programs.
 
-Tests concatenation and split functionality.
+Tests inspect, concatenation and split functionality.
 """
 import subprocess
 import sys
 from pathlib import Path
 
 
+INSPECT_PATH = Path(__file__).parent.parent / "string" / "01_inspect.py"
 CONCAT_PATH = Path(__file__).parent.parent / "string" / "02_concatenation.py"
 SPLIT_PATH = Path(__file__).parent.parent / "string" / "03_split.py"
 
 
+def test_inspect_tally_and_replace():
+    """Test INSPECT TALLYING and REPLACING on the spec's example."""
+    result = subprocess.run(
+        [sys.executable, str(INSPECT_PATH)],
+        input="banana\n",
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    assert "Length: 6" in result.stdout
+    assert "Spaces: 0" in result.stdout
+    assert "Str: bznznz" in result.stdout
+
+
+def test_inspect_truncates_input():
+    """Test that input is cut to the 10 characters of var-str."""
+    result = subprocess.run(
+        [sys.executable, str(INSPECT_PATH)],
+        input="hello world\n",
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    assert "Length: 10" in result.stdout
+    assert "Spaces: 1" in result.stdout
+    assert "Str: hello worl" in result.stdout
+
+
 def test_concatenation_basic():
     """Test basic string concatenation."""
     result = subprocess.run(
@@ -35,7 +64,8 @@ def test_concatenation_with_space():
     )
     assert result.returncode == 0
     # Should use "John" (up to first space) from first input
-    assert "Result:" in result.stdout
+    assert "Result: DoeJohn" in result.stdout
+    assert "Position: 8" in result.stdout
 
 
 def test_split_basic():
@@ -76,3 +106,16 @@ def test_split_multiple_tokens():
     assert "Name: John" in result.stdout
     assert "Surname: Michael" in result.stdout
     # "Doe" goes to var-rest (not displayed)
+
+
+def test_split_consecutive_delimiters():
+    """Test that two spaces in a row give an empty surname, as in COBOL."""
+    result = subprocess.run(
+        [sys.executable, str(SPLIT_PATH)],
+        input="John  Doe\n",
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    assert "Name: John" in result.stdout
+    assert "Surname: \n" in result.stdout
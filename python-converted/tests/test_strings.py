@@ -0,0 +1,104 @@
+"""
+Unit tests for the STRING and UNSTRING engines.
+
+Tests statement parsing, COBOL semantics on bytearray fields and the
+bulk (column) forms.
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cobol_runtime.strings import StringPlan, UnstringPlan, compile_string, compile_unstring  # noqa: E402
+
+
+def test_parse_statements():
+    """Test operand and phrase parsing, and syntax errors."""
+    plan = compile_string("STRING a b DELIMITED BY SIZE 'x' c DELIMITED BY ', ' INTO out WITH POINTER p")
+    assert plan.sources == ("A", "B", "C") and (plan.target, plan.pointer) == ("OUT", "P")
+    plan = compile_unstring("UNSTRING s DELIMITED BY ALL SPACE OR ',' INTO a COUNT IN n, b "
+                            "WITH POINTER p TALLYING IN t")
+    assert plan.targets == ("A", "B") and plan.counts == ("N", None)
+    assert plan.delimiters == ((b" ", True), (b",", False))
+    assert (plan.pointer, plan.tallying) == ("P", "T")
+    for statement in ("STRING INTO out", "STRING a DELIMITED BY SIZE", "STRING a INTO 'x'"):
+        with pytest.raises(ValueError, match="STRING"):
+            StringPlan(statement)
+    for statement in ("UNSTRING s INTO", "UNSTRING s INTO a DELIMITER IN d", "UNSTRING s INTO 'a'",
+                      "UNSTRING s INTO a TALLYING"):
+        with pytest.raises(ValueError, match="UNSTRING"):
+            UnstringPlan(statement)
+
+
+def test_string_pointer_and_overflow():
+    """Test DELIMITED BY, POINTER and ON OVERFLOW on a fixed-length field."""
+    plan = compile_string("STRING a DELIMITED BY SIZE b DELIMITED BY SPACE INTO out WITH POINTER p")
+    out = bytearray(b"*" * 10)
+    assert plan(out, b"Doe", b"John Smith") == (8, False)
+    assert out == b"DoeJohn***"
+    assert plan(out, b"XY", b"Z", pointer=8) == (11, False) and out == b"DoeJohnXYZ"
+    out = bytearray(b" " * 6)
+    assert plan(out, b"Surname", b"Name") == (7, True) and out == b"Surnam"
+    assert plan(out, b"a", b"b", pointer=0) == (0, True)
+    # Writing through a view into a larger record
+    record = bytearray(b"[" + b" " * 8 + b"]")
+    assert compile_string("STRING 'ab' '-' x DELIMITED BY ',' INTO o")(memoryview(record)[1:9], b"cd,ef")
+    assert record == b"[ab-cd   ]"
+
+
+def test_unstring_fields():
+    """Test receivers, COUNT IN, TALLYING, POINTER and ON OVERFLOW."""
+    plan = compile_unstring("UNSTRING s DELIMITED BY SPACE INTO a b c")
+    a, b, c = bytearray(b"a" * 4), bytearray(b"b" * 4), bytearray(b"c" * 4)
+    assert plan(b"John Doe", a, b, c) == (9, 2, False, (4, 3, 0))
+    assert (a, b, c) == (b"John", b"Doe ", b"cccc")
+    # Each space delimits: the padding gives empty fields, and overflows
+    assert plan(b"Jo  Smithson  ", a, b, c) == (14, 3, True, (2, 0, 8))
+    assert (a, b, c) == (b"Jo  ", b"    ", b"Smit")
+
+    plan = compile_unstring("UNSTRING s DELIMITED BY ALL SPACE OR ',' INTO a b")
+    assert plan(b"x   y,z", a, b, pointer=1) == (7, 2, True, (1, 1))
+    assert plan(b"x   y,z", a, b, pointer=6) == (8, 2, False, (0, 1))
+    assert plan(b"x   y,z", a, b, pointer=7) == (8, 1, False, (1, 0))
+    assert plan(b"x", a, b, pointer=3).overflow
+    assert compile_unstring("UNSTRING s INTO a b")(b"abcdefg", a, b) == (8, 2, False, (4, 3))
+
+
+def _matrix(values, width):
+    return np.frombuffer(b"".join(v.ljust(width) for v in values), dtype=np.uint8).reshape(-1, width)
+
+
+@pytest.mark.parametrize("statement", [
+    "UNSTRING s DELIMITED BY SPACE INTO a b c",
+    "UNSTRING s DELIMITED BY ALL SPACE OR ALL ',' OR '|' INTO a b c",
+    "UNSTRING s DELIMITED BY ', ' OR ALL '-' INTO a b c",
+    "UNSTRING s INTO a b c",
+])
+def test_unstring_rows_match_values(statement):
+    """Test that the bulk UNSTRING gives the per-record results."""
+    values = [b"ab cd ef gh", b"a,,b||c", b"   x", b"a, b--c, d", b"abcdefghijk", b"", b"x-y"]
+    matrix = _matrix(values, 11)
+    plan = UnstringPlan(statement)
+    for pointer in (1, 3):
+        rows = plan.rows(matrix, [3, 5, 2], pointer=pointer)
+        for i, value in enumerate(values):
+            targets = [bytearray(b" " * size) for size in (3, 5, 2)]
+            result = plan(value.ljust(11), *targets, pointer=pointer)
+            assert (rows.pointer[i], rows.tallying[i], rows.overflow[i]) == result[:3]
+            assert tuple(rows.counts[i]) == result.counts
+            assert [t[i].tobytes() for t in rows.targets] == targets
+
+
+def test_string_rows_match_values():
+    """Test that the bulk STRING gives the per-record results."""
+    plan = compile_string("STRING a DELIMITED BY SIZE ', ' b DELIMITED BY ', ' c DELIMITED BY SPACE INTO o")
+    first = [b"Doe", b"Smith-Jone", b"", b"X"]
+    second = [b"John, Jr", b"Anna", b", y", b"Q,R"]
+    third = [b"a b", b"c", b"", b" d"]
+    columns = [_matrix(first, 10), _matrix(second, 8), _matrix(third, 3)]
+    for pointer in (1, 5):
+        rows = plan.rows(columns, 16, pointer=pointer)
+        for i in range(len(first)):
+            out = bytearray(b" " * 16)
+            result = plan(out, first[i].ljust(10), second[i].ljust(8), third[i].ljust(3), pointer=pointer)
+            assert (rows.pointer[i], rows.overflow[i]) == result
+            assert rows.matrix[i].tobytes() == out
@@ -0,0 +1,31 @@
+"""
+Unit tests for subroutine programs.
+
+Tests CALL BY REFERENCE and BY CONTENT between 01_call_main.py and
+01_call_subroutine.py.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+
+CALL_MAIN_PATH = Path(__file__).parent.parent / "subroutines" / "01_call_main.py"
+
+
+def test_call_by_reference_and_by_content():
+    """Test that only the CALL BY REFERENCE changes the caller's number."""
+    result = subprocess.run(
+        [sys.executable, str(CALL_MAIN_PATH)],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    lines = result.stdout.splitlines()
+    assert lines.count("Hello subroutine!") == 2
+    assert lines.count("String data: Some string    ") == 2
+    reference = lines.index("After CALL BY REFERENCE: ")
+    content = lines.index("After CALL BY CONTENT: ")
+    assert lines[1] == "Number: 1234"
+    assert lines[reference + 1] == "Number: 3721"
+    assert lines[content + 1] == "Number: 1234"
+    assert lines[content + 2] == "String: Some string    "
@@ -0,0 +1,83 @@
+"""
+Unit tests for the write-ahead log and bulk mode of indexed files.
+
+Tests group commit, crash recovery and deferred index builds.
+"""
+from cobol_runtime.indexed import IndexedFile
+from cobol_runtime.pagecache import PageCache
+from cobol_runtime.wal import wal_path
+
+
+def make_record(key: int, text: bytes = b"original") -> bytes:
+    return b"%06d" % key + text.ljust(10)
+
+
+def crash(f: IndexedFile) -> None:
+    """Drop an open file without checkpointing, as a crash would."""
+    f._wal.close()
+    f.cache.discard(f)
+    f._file.close()
+
+
+def test_group_commit_shares_fsyncs(tmp_path):
+    """Test many rewrites are committed with few fsyncs."""
+    path = tmp_path / "people.dat"
+    with IndexedFile(path, "output", record_length=16, key_length=6) as f:
+        for key in range(2000):
+            f.write(make_record(key))
+    
+    with IndexedFile(path, "io", wal=True, group_size=500) as f:
+        syncs = f._wal.syncs
+        for key in range(2000):
+            f.rewrite(make_record(key, b"anon"))
+        assert f._wal.commits == 4
+        assert f._wal.syncs - syncs == 4
+    assert not wal_path(path).exists()
+    
+    with IndexedFile(path, "input") as f:
+        assert all(record.endswith(b"anon".ljust(10)) for record in f)
+
+
+def test_recovery_replays_committed_groups_only(tmp_path):
+    """Test a crash keeps committed changes and loses the rest."""
+    path = tmp_path / "people.dat"
+    cache = PageCache(budget=64 * 4096)
+    with IndexedFile(path, "output", record_length=16, key_length=6) as f:
+        for key in range(1000):
+            f.write(make_record(key))
+    
+    f = IndexedFile(path, "io", wal=True, group_size=10 ** 6, cache=cache)
+    for key in range(0, 1000, 2):
+        f.delete(key)
+    f.commit()
+    for key in range(1, 1000, 2):
+        f.rewrite(make_record(key, b"lost"))
+    crash(f)
+    assert wal_path(path).exists()
+    
+    with IndexedFile(path, "input") as f:
+        records = list(f)
+        assert len(f) == 500
+    assert records == [make_record(key) for key in range(1, 1000, 2)]
+    assert not wal_path(path).exists()
+
+
+def test_bulk_mode_builds_index_at_close(tmp_path):
+    """Test bulk WRITEs are merged with existing records at CLOSE."""
+    path = tmp_path / "bulk.dat"
+    with IndexedFile(path, "output", record_length=16, key_length=6, page_size=512) as f:
+        f.write(make_record(5000, b"existing"))
+    
+    with IndexedFile(path, "io", bulk=True, wal=True) as f:
+        for key in range(9999, -1, -1):
+            f.write(make_record(key))
+        assert f._staged
+    assert f.duplicates == [b"005000"]
+    
+    with IndexedFile(path, "io") as f:
+        assert len(f) == 10000
+        assert f.read(5000) == make_record(5000, b"existing")
+        f.start(9990, ">")
+        assert f.read_next() == make_record(9991)
+        f.write(make_record(10000))
+        assert list(f)[-1] == make_record(10000)